@@ -61,3 +61,15 @@ def download_image(conn):
 
         # Response will contain the entire contents of the Image.
         local_image.write(response)
+
+
+def download_image_file(conn):
+    print("Download Image to a file:")
+
+    # Find the image you would like to download.
+    image = conn.image.find_image("myimage")
+
+    # The image is written to the file as it is received, with its
+    # checksum verified along the way, using four concurrent range
+    # requests for the large images.
+    conn.image.download_image(image, path="myimage.qcow2", workers=4)
@@ -0,0 +1,307 @@
+# Licensed under the Apache License, Version 2.0 (the "License"); you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+
+"""
+Awaitable counterparts of the :class:`~openstack.resource2.Resource`
+methods, sending their requests with an
+:class:`~openstack.aiosession.AsyncSession`. The resources are the same
+declarative classes, built from and translated to requests the same way::
+
+    server = await aioproxy.get(session, server.Server.new(id=server_id))
+
+    async for value in aioproxy.AsyncList(session, server.Server,
+                                          paginated=True, status="ACTIVE"):
+        print(value.name)
+
+Resources overriding these methods with service specific requests need
+their own awaitable counterparts. Like :mod:`openstack.aiosession`, this
+module needs Python 3.5 or later and is never imported by the rest of the
+SDK. The requests are built by the same
+:class:`~openstack.resource2.Resource` methods as the synchronous ones.
+"""
+
+import collections
+import functools
+
+from openstack import exceptions
+from openstack import resource2
+
+
+async def create(session, resource, prepend_key=True):
+    """Create a remote resource, see :meth:`Resource.create`
+
+    :param session: The session to use for making this request.
+    :type session: :class:`~openstack.aiosession.AsyncSession`
+    :param resource: The :class:`~openstack.resource2.Resource` to create.
+    :param prepend_key: Whether the resource_key should be prepended to
+                        the body of the request.
+
+    :return: ``resource``.
+    """
+    method, uri, kwargs = resource._create_request(prepend_key=prepend_key)
+    response = await getattr(session, method)(uri, **kwargs)
+
+    resource._translate_response(response)
+    return resource
+
+
+async def get(session, resource, requires_id=True, raw=False):
+    """Get a remote resource, see :meth:`Resource.get`
+
+    :param session: The session to use for making this request.
+    :type session: :class:`~openstack.aiosession.AsyncSession`
+    :param resource: The :class:`~openstack.resource2.Resource` to get.
+    :param bool requires_id: Whether the ID is part of the requested URI.
+    :param bool raw: When ``True``, return the decoded body of the
+                     response instead, leaving ``resource`` untouched.
+
+    :return: ``resource``.
+    """
+    method, uri, kwargs = resource._get_request(requires_id=requires_id)
+    response = await getattr(session, method)(uri, **kwargs)
+
+    if raw:
+        return resource._raw_body(response)
+
+    resource._translate_response(response)
+    return resource
+
+
+async def head(session, resource):
+    """Get the headers of a remote resource, see :meth:`Resource.head`
+
+    :param session: The session to use for making this request.
+    :type session: :class:`~openstack.aiosession.AsyncSession`
+    :param resource: The :class:`~openstack.resource2.Resource` to get.
+
+    :return: ``resource``.
+    """
+    method, uri, kwargs = resource._head_request()
+    response = await getattr(session, method)(uri, **kwargs)
+
+    # responses to HEAD never have a body
+    resource._translate_response(response, has_body=False)
+    return resource
+
+
+async def update(session, resource, prepend_key=True, has_body=True):
+    """Update a remote resource, see :meth:`Resource.update`
+
+    :param session: The session to use for making this request.
+    :type session: :class:`~openstack.aiosession.AsyncSession`
+    :param resource: The :class:`~openstack.resource2.Resource` to update.
+    :param prepend_key: Whether the resource_key should be prepended to
+                        the body of the request.
+    :param bool has_body: Whether the response has a body to translate.
+
+    :return: ``resource``.
+    """
+    request = resource._update_request(prepend_key=prepend_key)
+    if request is None:
+        return resource
+
+    method, uri, kwargs = request
+    response = await getattr(session, method)(uri, **kwargs)
+
+    resource._translate_response(response, has_body=has_body)
+    return resource
+
+
+async def delete(session, resource, params=None, has_body=False):
+    """Delete a remote resource, see :meth:`Resource.delete`
+
+    :param session: The session to use for making this request.
+    :type session: :class:`~openstack.aiosession.AsyncSession`
+    :param resource: The :class:`~openstack.resource2.Resource` to delete.
+    :param params: http params to be sent
+    :param bool has_body: Whether the response has a body to translate.
+
+    :return: ``resource``.
+    """
+    method, uri, kwargs = resource._delete_request(params=params)
+    response = await getattr(session, method)(uri, **kwargs)
+
+    resource._translate_response(response, has_body=has_body)
+    return resource
+
+
+class AsyncList(object):
+
+    def __init__(self, session, resource_type, paginated=False,
+                 compact=False, raw=False, **params):
+        """Iterate asynchronously over a listing, see :meth:`Resource.list`
+
+        Use it with ``async for``. The pages are requested one after the
+        other, when the resources of the previous page were all iterated.
+
+        :param session: The session to use for making the requests.
+        :type session: :class:`~openstack.aiosession.AsyncSession`
+        :param resource_type: The :class:`~openstack.resource2.Resource`
+                              subclass to list.
+        :param bool paginated: Whether the listing goes past one page.
+        :param bool compact: Iterate over read-only
+                             :class:`~openstack.resource2.CompactResource`
+                             views.
+        :param bool raw: Iterate over the dicts the server returned.
+        :param dict params: The query parameters and URI attributes.
+        """
+        if not resource_type.allow_list:
+            raise exceptions.MethodNotSupported(resource_type, "list")
+
+        self.session = session
+        self.resource_type = resource_type
+        self.paginated = paginated
+        self._factory = None
+        if raw:
+            self._factory = resource2._raw_item
+        elif compact:
+            self._factory = functools.partial(resource2.CompactResource,
+                                              resource_type)
+        self._uri = resource_type.get_list_uri(params)
+        self._query = resource_type._query_mapping._transpose(params)
+        self._pending = collections.deque()
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        while not self._pending:
+            if self._query is None:
+                raise StopAsyncIteration
+            await self._next_page()
+        return self._pending.popleft()
+
+    async def _next_page(self):
+        cls = self.resource_type
+        method, uri, kwargs = cls._page_request(self._uri, self._query)
+        response = await getattr(self.session, method)(uri, **kwargs)
+        response_json = response.json()
+        _, page = cls._read_page(response_json, self._factory)
+        self._pending.extend(page)
+        self._query = cls._next_query(response_json, len(page),
+                                      page[-1] if page else None,
+                                      self._query, self.paginated)
+
+    async def all(self):
+        """Return the list of all the items"""
+        result = []
+        while True:
+            result.extend(self._pending)
+            self._pending.clear()
+            if self._query is None:
+                return result
+            await self._next_page()
+
+
+class AsyncProxy(object):
+
+    def __init__(self, session):
+        """Awaitable proxy methods for any resource
+
+        These mirror the methods of :class:`~openstack.proxy2.BaseProxy`,
+        for the resource type passed to them.
+
+        :param session: The session to use for making the requests.
+        :type session: :class:`~openstack.aiosession.AsyncSession`
+        """
+        self._session = session
+
+    def _get_resource(self, resource_type, value, **attrs):
+        if isinstance(value, resource2.CompactResource):
+            value = value.to_resource()
+        if isinstance(value, resource2.Resource) and \
+                not isinstance(value, resource_type):
+            raise ValueError("Expected %s but received %s" % (
+                resource_type.__name__, value.__class__.__name__))
+        if value is None:
+            return resource_type.new(**attrs)
+        elif not isinstance(value, resource_type):
+            return resource_type.new(id=value, **attrs)
+        value._update(**attrs)
+        return value
+
+    @staticmethod
+    def _not_found(resource_type, value, e):
+        return exceptions.ResourceNotFound(
+            message="No %s found for %s" % (resource_type.__name__, value),
+            details=e.details, response=e.response,
+            request_id=e.request_id, url=e.url, method=e.method,
+            http_status=e.http_status, cause=e.cause, code=e.code)
+
+    async def create(self, resource_type, prepend_key=True, **attrs):
+        """Create a resource from attributes
+
+        :returns: The created resource.
+        """
+        res = resource_type.new(**attrs)
+        return await create(self._session, res, prepend_key=prepend_key)
+
+    async def get(self, resource_type, value=None, requires_id=True,
+                  raw=False, **attrs):
+        """Get a resource
+
+        :returns: The resource, or its body with ``raw``.
+        :raises: :class:`~openstack.exceptions.ResourceNotFound` when
+                 the resource does not exist.
+        """
+        res = self._get_resource(resource_type, value, **attrs)
+        try:
+            return await get(self._session, res, requires_id=requires_id,
+                             raw=raw)
+        except exceptions.NotFoundException as e:
+            raise self._not_found(resource_type, value, e)
+
+    async def head(self, resource_type, value=None, **attrs):
+        """Retrieve the headers of a resource
+
+        :returns: The resource.
+        """
+        res = self._get_resource(resource_type, value, **attrs)
+        return await head(self._session, res)
+
+    async def update(self, resource_type, value, prepend_key=True,
+                     has_body=True, **attrs):
+        """Update a resource
+
+        :returns: The updated resource.
+        """
+        res = self._get_resource(resource_type, value, **attrs)
+        return await update(self._session, res, prepend_key=prepend_key,
+                            has_body=has_body)
+
+    async def delete(self, resource_type, value, ignore_missing=True,
+                     has_body=False, params=None, **attrs):
+        """Delete a resource
+
+        :param bool ignore_missing: When set to ``False``
+                    :class:`~openstack.exceptions.ResourceNotFound` will be
+                    raised when the resource does not exist.
+        :returns: The deleted resource, or None when it did not exist and
+                  ``ignore_missing`` is set.
+        """
+        res = self._get_resource(resource_type, value, **attrs)
+        try:
+            return await delete(self._session, res, params=params,
+                                has_body=has_body)
+        except exceptions.NotFoundException as e:
+            if ignore_missing:
+                return None
+            raise self._not_found(resource_type, value, e)
+
+    def list(self, resource_type, paginated=False, compact=False, raw=False,
+             **attrs):
+        """List a resource
+
+        :returns: An :class:`AsyncList` to iterate with ``async for``.
+        """
+        return AsyncList(self._session, resource_type, paginated=paginated,
+                         compact=compact, raw=raw, **attrs)
@@ -0,0 +1,348 @@
+# Licensed under the Apache License, Version 2.0 (the "License"); you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+
+"""
+The :class:`~openstack.aiosession.AsyncSession` sends the requests of an
+:class:`~openstack.aksksession.ASKSession` with aiohttp, so that thousands
+of requests can be in flight from a single thread. The requests are
+resolved and signed by the wrapped session, with its endpoints,
+credentials and headers::
+
+    from openstack import aioproxy
+    from openstack import aiosession
+    from openstack.ecs.v1 import job
+
+    async def wait(conn, job_ids):
+        async with aiosession.AsyncSession(conn.session) as session:
+            proxy = aioproxy.AsyncProxy(session)
+            return await asyncio.gather(
+                *[proxy.get(job.Job, job_id) for job_id in job_ids])
+
+This module needs Python 3.5 or later and aiohttp, which the ``async``
+extra installs::
+
+    pip install openstacksdk[async]
+
+The rest of the SDK never imports it, so that it still runs without them.
+"""
+
+import asyncio
+import ssl
+import time
+
+from keystoneauth1 import exceptions as _ksa_exceptions
+from requests import structures
+
+from openstack import exceptions
+from openstack import instrumentation
+from openstack import throttle
+
+#: The default number of requests in flight at once.
+DEFAULT_LIMIT = 100
+
+# the arguments of ASKSession.request which are not about the request
+# itself, or which aiohttp handles on its own
+_SEND_ARGS = ("log", "connect_retries", "stream", "allow", "original_ip")
+
+
+def _import_aiohttp():
+    try:
+        import aiohttp
+    except ImportError:
+        raise ImportError("AsyncSession needs aiohttp, install the async "
+                          "extra with: pip install openstacksdk[async]")
+    return aiohttp
+
+
+class AsyncResponse(object):
+    """The response to a request of an :class:`AsyncSession`
+
+    It has the attributes of :class:`requests.Response` the resources
+    use, so that they translate it like any other response.
+    """
+
+    def __init__(self, method, url, status_code, reason, headers, content,
+                 json_codec):
+        self.method = method
+        self.url = url
+        self.status_code = status_code
+        self.reason = reason
+        self.headers = structures.CaseInsensitiveDict(headers)
+        self.content = content
+        self._json_codec = json_codec
+
+    def __repr__(self):
+        return "<AsyncResponse [%d]>" % self.status_code
+
+    @property
+    def ok(self):
+        return self.status_code < 400
+
+    @property
+    def encoding(self):
+        content_type = self.headers.get("content-type", "")
+        for param in content_type.split(";")[1:]:
+            key, _, value = param.strip().partition("=")
+            if key.lower() == "charset" and value:
+                return value.strip("\"'")
+        return "utf-8"
+
+    @property
+    def text(self):
+        return self.content.decode(self.encoding, "replace")
+
+    def json(self):
+        return self._json_codec.loads(self.content)
+
+
+class _Chunks(object):
+    """An iterable of chunks sent as the body of a request"""
+
+    def __init__(self, chunks):
+        self._chunks = iter(chunks)
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        try:
+            chunk = next(self._chunks)
+        except StopIteration:
+            raise StopAsyncIteration
+        if isinstance(chunk, str):
+            return chunk.encode("utf-8")
+        return chunk
+
+
+def _payload(data):
+    """Return a request body as aiohttp sends it
+
+    The files are read a chunk at a time while they are sent, the other
+    iterables are sent as chunks, like requests does.
+    """
+    if data is None or hasattr(data, "read") or \
+            isinstance(data, (str, bytes, bytearray, dict)):
+        return data
+    return _Chunks(data)
+
+
+def _query(params):
+    """Return query parameters as aiohttp sends them"""
+    result = []
+    for key, values in (params or {}).items():
+        if isinstance(values, (str, bytes)) or \
+                not hasattr(values, "__iter__"):
+            values = [values]
+        for value in values:
+            # like requests, leave out the parameters set to None
+            if value is not None:
+                result.append((key, str(value)))
+    return result
+
+
+class AsyncSession(object):
+
+    def __init__(self, session, limit=DEFAULT_LIMIT):
+        """Send the requests of a session with aiohttp
+
+        The connections are opened by the first request, within the event
+        loop running it, and must be closed with :meth:`close`, or by
+        using the session with ``async with``. The proxies are taken from
+        the environment, like requests does.
+
+        :param session: The session resolving and signing the requests,
+                        whose endpoints, credentials, headers, timeout,
+                        certificates and redirections are used.
+        :type session: :class:`~openstack.aksksession.ASKSession`
+        :param int limit: The maximum number of requests in flight. The
+                          connections are kept open to be reused.
+
+        The throttled requests are retried and paced with the
+        ``retry_policy`` and the ``rate_limiter`` of ``session``, waiting
+        without blocking the event loop.
+
+        :raises: ``ImportError`` if aiohttp is not installed.
+        """
+        self._aiohttp = _import_aiohttp()
+        self.session = session
+        self.json_codec = session.json_codec
+        self.limit = limit
+        self._client = None
+        self._contexts = {}
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.close()
+
+    async def close(self):
+        """Close the connections kept open"""
+        if self._client is not None:
+            await self._client.close()
+            self._client = None
+
+    def _client_session(self):
+        if self._client is None:
+            aiohttp = self._aiohttp
+            self._client = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=self.limit),
+                trust_env=True)
+        return self._client
+
+    def _ssl(self, verify, cert):
+        """Return the ssl argument of aiohttp for verify and cert"""
+        if verify is False and not cert:
+            return False
+        key = (verify, tuple(cert) if isinstance(cert, list) else cert)
+        context = self._contexts.get(key)
+        if context is None:
+            if isinstance(verify, str):
+                context = ssl.create_default_context(cafile=verify)
+            else:
+                context = ssl.create_default_context()
+            if verify is False:
+                context.check_hostname = False
+                context.verify_mode = ssl.CERT_NONE
+            if isinstance(cert, str):
+                context.load_cert_chain(cert)
+            elif cert:
+                context.load_cert_chain(*cert)
+            self._contexts[key] = context
+        return context
+
+    async def request(self, url, method, raise_exc=True, redirect=None,
+                      **kwargs):
+        """Send a request
+
+        The arguments are those of
+        :meth:`~openstack.aksksession.ASKSession.request`.
+
+        :returns: The :class:`AsyncResponse`.
+        :raises: :class:`~openstack.exceptions.HttpException` for the
+                 responses with an error status when ``raise_exc`` is set,
+                 :class:`~openstack.exceptions.SDKException` when the
+                 request could not be sent.
+        """
+        aiohttp = self._aiohttp
+        for name in _SEND_ARGS:
+            kwargs.pop(name, None)
+        retry = kwargs.pop("retry", None)
+        if redirect is None:
+            redirect = self.session.redirect
+        started = time.time()
+        endpoint_filter = kwargs.get("endpoint_filter")
+        url, kwargs = self.session.sign_request(url, method, **kwargs)
+        info = instrumentation.begin(self.session.instruments,
+                                     endpoint_filter, method, url,
+                                     self.session.project_id, started)
+        if info is not None:
+            info.timings["sign"] = time.time() - started
+        data = kwargs.get("data")
+        try:
+            with instrumentation.timed(info, "send"):
+                response = await self._send(method, url, kwargs, redirect,
+                                            endpoint_filter, retry, info)
+        except asyncio.TimeoutError as e:
+            instrumentation.failed(info, e, data)
+            raise exceptions.SDKException(
+                message="Request to %s timed out" % url, cause=e)
+        except (aiohttp.ClientError, OSError) as e:
+            instrumentation.failed(info, e, data)
+            raise exceptions.SDKException(
+                message="Unable to send the request to %s: %s" % (url, e),
+                cause=e)
+        instrumentation.succeeded(info, response, data)
+        if raise_exc and response.status_code >= 400:
+            error = _ksa_exceptions.from_response(response, method, url)
+            raise exceptions.from_exception(error)
+        return response
+
+    async def _send(self, method, url, kwargs, redirect, endpoint_filter,
+                    retry, info):
+        """Send a request, retrying it while it is throttled
+
+        See :func:`openstack.throttle.send`, the delays are awaited.
+        """
+        client = self._client_session()
+        options = {
+            # like requests, leave out the headers set to None
+            "headers": dict((name, value) for name, value
+                            in kwargs["headers"].items()
+                            if value is not None),
+            "params": _query(kwargs.get("params")),
+            "allow_redirects": bool(redirect),
+        }
+        verify, cert = kwargs.get("verify", True), kwargs.get("cert")
+        if verify is not True or cert:
+            options["ssl"] = self._ssl(verify, cert)
+        if redirect and redirect is not True:
+            options["max_redirects"] = redirect
+        if kwargs.get("timeout") is not None:
+            options["timeout"] = self._aiohttp.ClientTimeout(
+                total=kwargs["timeout"])
+
+        policy = self.session.retry_policy
+        limiter = self.session.rate_limiter
+        bucket = None
+        if limiter is not None:
+            bucket = limiter.bucket(
+                getattr(endpoint_filter, "service_type", None),
+                self.session.region)
+        data = kwargs.get("data")
+        rewind = throttle._rewinder(data)
+        retries = (policy is not None and rewind is not None and
+                   policy.allows(method, retry))
+        attempt = 0
+        while True:
+            if bucket is not None:
+                wait = bucket.reserve()
+                if wait:
+                    await asyncio.sleep(wait)
+            sent = time.time()
+            async with client.request(method, url, data=_payload(data),
+                                      **options) as resp:
+                content = await resp.read()
+            # the raw headers keep their names as sent, like requests
+            headers = [(name.decode("latin-1"), value.decode("latin-1"))
+                       for name, value in resp.raw_headers]
+            response = AsyncResponse(method, str(resp.url), resp.status,
+                                     resp.reason, headers, content,
+                                     self.json_codec)
+            if bucket is not None:
+                bucket.record(response.status_code, sent)
+            delay = policy.delay(attempt, response) if retries else None
+            if delay is None:
+                return response
+            await asyncio.sleep(delay)
+            rewind()
+            attempt += 1
+            if info is not None:
+                info.retries += 1
+
+    def get(self, url, **kwargs):
+        return self.request(url, "GET", **kwargs)
+
+    def head(self, url, **kwargs):
+        return self.request(url, "HEAD", **kwargs)
+
+    def post(self, url, **kwargs):
+        return self.request(url, "POST", **kwargs)
+
+    def put(self, url, **kwargs):
+        return self.request(url, "PUT", **kwargs)
+
+    def patch(self, url, **kwargs):
+        return self.request(url, "PATCH", **kwargs)
+
+    def delete(self, url, **kwargs):
+        return self.request(url, "DELETE", **kwargs)
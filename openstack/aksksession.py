@@ -17,20 +17,27 @@ import hashlib
 import hmac
 import json
 import os
-import urllib
-import urlparse
 
 
 import sys
-reload(sys)
-sys.setdefaultencoding("utf-8")
+import six
+if six.PY2:
+    reload(sys)
+    sys.setdefaultencoding("utf-8")
 import datetime
+import tempfile
+import time
 
 import requests
-from keystoneauth1.session import  TCPKeepAliveAdapter, _JSONEncoder, _determine_user_agent
+from six.moves.urllib import parse as urlparse
+from requests.adapters import DEFAULT_POOLSIZE
+from keystoneauth1.session import  TCPKeepAliveAdapter, _determine_user_agent
 from openstack import exceptions
+from openstack import instrumentation
+from openstack import json_codec as _json_codec
 from openstack import version as openstack_version
 from openstack import  session as osession
+from openstack import throttle
 from keystoneauth1 import _utils as utils
 from openstack.session import map_exceptions
 from openstack.service_endpoint import endpoint as _endpoint
@@ -40,11 +47,37 @@ from keystoneauth1 import exceptions
 EMPTYSTRING = ""
 TERMINATORSTRING = "sdk_request"
 ALGORITHM = "SDK-HMAC-SHA256"
+# a request carrying this header with UNSIGNED_PAYLOAD as value is signed
+# without hashing its body
+CONTENT_SHA256_HEADER = "X-Sdk-Content-Sha256"
+UNSIGNED_PAYLOAD = "UNSIGNED-PAYLOAD"
+# size of the chunks read from file-like request bodies
+CHUNK_SIZE = 64 * 1024
+# bodies that can't be rewound are spooled to disk past this size
+SPOOL_MAX_SIZE = 1024 * 1024
 
 DEFAULT_USER_AGENT = "openstacksdk/%s" % openstack_version.__version__
+# the bodies which are hashed at once
+_STRING_TYPES = six.string_types + (six.binary_type, bytearray)
 _logger = utils.get_logger(__name__)
 
-def construct_session(session_obj=None):
+def construct_session(session_obj=None,
+                      pool_connections=DEFAULT_POOLSIZE,
+                      pool_maxsize=DEFAULT_POOLSIZE,
+                      pool_block=False, pools=None):
+    """Build the requests session used to send the HTTP requests
+
+    :param pool_connections: number of hosts to keep connection pools for
+    :param pool_maxsize: number of connections kept in each host's pool,
+                         which bounds how many requests run concurrently
+                         against a host without opening extra connections
+    :param pool_block: wait for a free connection when a pool is exhausted
+                       instead of opening a connection which is not reused
+    :param pools: a dict mapping URL prefixes (e.g.
+                  ``https://ecs.example.com``) to dicts of
+                  ``pool_connections``, ``pool_maxsize`` and ``pool_block``
+                  overriding the defaults above for these prefixes
+    """
     # NOTE(morganfainberg): if the logic in this function changes be sure to
     # update the betamax fixture's '_construct_session_with_betamax" function
     # as well.
@@ -52,15 +85,108 @@ def construct_session(session_obj=None):
         session_obj = requests.Session()
         # Use TCPKeepAliveAdapter to fix bug 1323862
         for scheme in list(session_obj.adapters):
-            session_obj.mount(scheme, TCPKeepAliveAdapter())
+            session_obj.mount(scheme, TCPKeepAliveAdapter(
+                pool_connections=pool_connections,
+                pool_maxsize=pool_maxsize,
+                pool_block=pool_block))
+        for prefix, options in (pools or {}).items():
+            mount_pool(session_obj, prefix, **options)
     return session_obj
 
+
+def mount_pool(session_obj, prefix, pool_connections=DEFAULT_POOLSIZE,
+               pool_maxsize=DEFAULT_POOLSIZE, pool_block=False):
+    """Give the requests sent to a URL prefix a connection pool of their own
+
+    requests picks the adapter with the longest matching prefix, so the
+    pool mounted here is only used for the URLs under ``prefix``.
+    """
+    session_obj.mount(prefix, TCPKeepAliveAdapter(
+        pool_connections=pool_connections,
+        pool_maxsize=pool_maxsize,
+        pool_block=pool_block))
+
+def _tell(body):
+    """
+    Get the current position of a file-like body
+    :return: the position, or None when the body can't be rewound
+    """
+    try:
+        return body.tell()
+    except (AttributeError, IOError, OSError):
+        return None
+
+
+def is_rewindable(body):
+    """
+    Check whether a request body can be hashed and then still be sent
+    :param body: the request body
+    :return: True for strings and seekable file-like objects
+    """
+    if body is None or isinstance(body, _STRING_TYPES):
+        return True
+    return hasattr(body, 'read') and _tell(body) is not None
+
+
+def _iter_chunks(body):
+    if hasattr(body, 'read'):
+        # text mode files signal the end with an empty unicode string
+        chunks = iter(lambda: body.read(CHUNK_SIZE) or None, None)
+    else:
+        chunks = body
+    for chunk in chunks:
+        if isinstance(chunk, six.text_type):
+            chunk = chunk.encode('utf-8')
+        yield chunk
+
+
+def spool(body):
+    """
+    Copy a body that can't be rewound into a temporary file
+    The copy stays in memory up to SPOOL_MAX_SIZE bytes.
+    :param body: a file-like object or an iterable of chunks
+    :return: the temporary file, positioned at its start
+    """
+    spooled = tempfile.SpooledTemporaryFile(max_size=SPOOL_MAX_SIZE)
+    for chunk in _iter_chunks(body):
+        spooled.write(chunk)
+    spooled.seek(0)
+    return spooled
+
+
+def hash_payload(body):
+    """
+    Get the hex encoded SHA256 of a request body, reading it by chunks
+    Seekable file-like bodies are rewound to where they were so that they
+    can be sent afterwards.
+    :param body: the http request body
+    :type body: string, file-like object or iterable of chunks
+    :return: A string of the hex digest
+    """
+    if not body:
+        return hashlib.sha256(b"").hexdigest()
+    if isinstance(body, six.text_type):
+        body = body.encode('utf-8')
+    if isinstance(body, _STRING_TYPES):
+        return hashlib.sha256(body).hexdigest()
+
+    sha = hashlib.sha256()
+    start = _tell(body) if hasattr(body, 'read') else None
+    for chunk in _iter_chunks(body):
+        sha.update(chunk)
+    if start is not None:
+        body.seek(start)
+    return sha.hexdigest()
+
+
 def get_utf8_bytes(message):
     """
     Get the bytes array encoded by utf-8
     :param message: the string of message
     :type message: string
     """
+    if isinstance(message, six.text_type):
+        return message.encode('utf-8')
     if sys.stdin.encoding is None:
         return message.decode('cp936').encode('utf-8')
     else:
@@ -89,6 +215,11 @@ class AkSksignature(object):
         self.sk = secretkey
         self.region = region
         self.headtosign = ['Host', 'X-Sdk-Date']
+        self.signed_header = ';'.join([k.lower() for k in self.headtosign])
+        # signing key and credential scope per (yyyymmdd, service), only
+        # the entries of the current UTC day are kept
+        self._signing_date = None
+        self._signing_contexts = {}
 
     def _make_canonical_request(self,method = None, url = None, headers = None, params = None, body = EMPTYSTRING ):
         """
@@ -102,7 +233,7 @@ class AkSksignature(object):
         :param params : the http request query parametrers
         :type params : python dict
         :param body : the http request body
-        :type body : python dict
+        :type body : string, file-like object or iterable of chunks
         :return: A string of canonical request
 
         """
@@ -113,7 +244,7 @@ class AkSksignature(object):
         if params:
             result = []
             for k, vs in list(params.items()):
-                if isinstance(vs, basestring) or not hasattr(vs, '__iter__'):
+                if isinstance(vs, six.string_types) or not hasattr(vs, '__iter__'):
                     vs = [vs]
                 for v in vs:
                     if v is not None:
@@ -121,20 +252,21 @@ class AkSksignature(object):
                             (k.encode('utf-8') if isinstance(k, str) else k,
                              v.encode('utf-8') if isinstance(v, str) else v))
             result.sort(key= lambda item: item[0])
-            canonical_querystring  = urllib.urlencode(result, doseq=True)
+            canonical_querystring  = urlparse.urlencode(result, doseq=True)
             #canonical_querystring = 'image' + '=' +  urllib.quote(json.dumps(params.get('image')).replace(' ',''))
         else:
             canonical_querystring = EMPTYSTRING
         #print "query string ", canonical_querystring
-        canonical_header =  [k.lower() + ':' + headers.get(k).strip() for k  in self.headtosign] if all([headers.has_key(k) for k in self.headtosign]) else []
+        canonical_header =  [k.lower() + ':' + headers.get(k).strip() for k  in self.headtosign] if all([k in headers for k in self.headtosign]) else []
         #canonical_header_partb = [k.lower() + ':' + str(v).strip() for k, v in body.items()] if body else []
         canonical_header = '\n'.join(canonical_header)
         canonical_header += '\n'
-        signed_header = ';'.join([k.lower()  for k in self.headtosign])
+        signed_header = self.signed_header
 
-        body = body if body  else ""
-        #print body
-        request_payload = hashlib.sha256(body).hexdigest()
+        if headers.get(CONTENT_SHA256_HEADER) == UNSIGNED_PAYLOAD:
+            request_payload = UNSIGNED_PAYLOAD
+        else:
+            request_payload = hash_payload(body)
         #print request_payload
         return '\n'.join([canonical_method,canonical_uri,canonical_querystring, canonical_header, signed_header, request_payload])
 
@@ -150,13 +282,7 @@ class AkSksignature(object):
         """
         algorithm = ALGORITHM
         request_datetime = dtstamp
-        request_date = dtstamp.split('T')[0]
-        credential_scope = '/'.join([
-                                     request_date,
-                                     self.region,
-                                     svr,
-                                     TERMINATORSTRING
-                                     ])
+        credential_scope = self._get_signing_context(dtstamp, svr)[1]
         hashed_request = hashlib.sha256(get_utf8_bytes(canonical_req)).hexdigest()
         return "\n".join([algorithm, request_datetime, credential_scope, hashed_request]),credential_scope
 
@@ -176,6 +302,37 @@ class AkSksignature(object):
         kservice = hmac.new(kregion.digest(), get_utf8_bytes(svr), digestmod=hashlib.sha256)
         return hmac.new(kservice.digest(), get_utf8_bytes(TERMINATORSTRING), digestmod=hashlib.sha256).digest()
 
+    def _get_signing_context(self, dtstamp, svr):
+        """
+        Get the signing key and the credential scope of a request.
+        Both only depend on the request date and the service, so they
+        are computed once per (yyyymmdd, service) and cached. The cache
+        rolls over when the first request of a new UTC day is signed.
+        :param dtstamp: datetime stamp of UTC
+        :type dtstamp : string
+        :param svr: the name of service defined in  sdk
+        :type svr :string
+        :return: A tuple of the signing key and the credential scope
+        """
+        request_date = dtstamp[0:8]
+        contexts = self._signing_contexts
+        if self._signing_date != request_date:
+            # rebind instead of clearing so that concurrent signers holding
+            # the previous dict are not affected
+            contexts = {}
+            self._signing_contexts = contexts
+            self._signing_date = request_date
+        key = (request_date, svr)
+        context = contexts.get(key)
+        if context is None:
+            credential_scope = '/'.join([request_date,
+                                         self.region,
+                                         svr,
+                                         TERMINATORSTRING])
+            context = (self._make_signing_key(dtstamp, svr), credential_scope)
+            contexts[key] = context
+        return context
+
     def signature(self, url = None, method = None, headers = None, data = None, params = None, svr = None):
         """
         :param method : the request's http method, get/post OR other
@@ -187,17 +344,17 @@ class AkSksignature(object):
         :param params : the http request query parametrers
         :type params : python dict
         :param data : the http request body
-        :type data : python dict
+        :type data : string, file-like object or iterable of chunks
         :param svr: the name of service defined in  sdk
         :type svr :string
         :return: A string of signature
         """
         canonical_request = self._make_canonical_request(method = method, url = url, params = params, headers = headers, body= data)
         #print canonical_request
-        signing_key = self._make_signing_key(headers.get("X-Sdk-Date"), svr)
+        signing_key = self._get_signing_context(headers.get("X-Sdk-Date"), svr)[0]
         string_to_sign, credential_scope = self._make_string_to_sign(canonical_request, headers.get("X-Sdk-Date"), svr)
         signature =  hmac.new(signing_key, get_utf8_bytes(string_to_sign), digestmod=hashlib.sha256).hexdigest()
-        signed_header = ';'.join([k.lower() for k in self.headtosign])
+        signed_header = self.signed_header
         return   "%s Credential=%s/%s, SignedHeaders=%s, Signature=%s"%(ALGORITHM,
                                                                         self.ak,
                                                                         credential_scope,
@@ -232,11 +389,49 @@ class ASKSession(osession.Session):
                  redirect=30, additional_headers=None,
                  app_name=None, app_version=None,
                  additional_user_agent=None,
+                 pool_connections=DEFAULT_POOLSIZE,
+                 pool_maxsize=DEFAULT_POOLSIZE,
+                 pool_block=False, service_pools=None,
+                 json_codec=None, instruments=None,
+                 retry_policy=None, rate_limiter=None,
                  **kwargs
                  ):
+        """Create a session signing its requests with an ak and sk
+
+        An ASKSession may be shared by several threads: ``request`` never
+        modifies the arguments it is given, the signer only caches
+        immutable values and the connection pools are thread-safe.
+        Size the pools to the number of threads sharing the session,
+        requests beyond ``pool_maxsize`` for a host either open
+        connections which are not reused or, with ``pool_block``, wait.
+
+        :param pool_connections: number of hosts to keep connection pools for
+        :param pool_maxsize: number of connections kept per host
+        :param pool_block: wait for a free connection when a pool is
+                           exhausted
+        :param service_pools: a dict mapping service types (e.g. ``ecs``)
+                              or URL prefixes to dicts of
+                              ``pool_connections``, ``pool_maxsize`` and
+                              ``pool_block`` overriding the defaults for
+                              the host of that service
+        :param json_codec: the :class:`~openstack.json_codec.JSONCodec`
+                           encoding the requests and decoding the
+                           responses, the fastest available by default
+        :param instruments: the
+                            :class:`~openstack.instrumentation.Instrument`
+                            objects notified of the requests
+        :param retry_policy: the :class:`~openstack.throttle.RetryPolicy`
+                             of the throttled requests, a default one
+                             retrying the idempotent requests if None
+        :param rate_limiter: the
+                             :class:`~openstack.throttle.AdaptiveRateLimiter`
+                             pacing the requests of each service, they are
+                             not paced if None
+        """
         self.project_id = kwargs.get("project_id")
         self.domain = kwargs.get("domain")
         self.region = kwargs.get("region")
+        self.endpoint = _endpoint
         self.signer = AkSksignature(accesskey= kwargs.get("ak"),
                                     secretkey=kwargs.get("sk"),
                                     region= kwargs.get("region"))
@@ -245,7 +440,12 @@ class ASKSession(osession.Session):
         else:
             self.user_agent = DEFAULT_USER_AGENT
         self.profile = profile
-        self.session = construct_session(None)
+        self.session = construct_session(None,
+                                         pool_connections=pool_connections,
+                                         pool_maxsize=pool_maxsize,
+                                         pool_block=pool_block,
+                                         pools=self._resolve_pools(
+                                             service_pools))
         self.original_ip = original_ip
         self.verify = verify
         self.cert = cert
@@ -256,21 +456,46 @@ class ASKSession(osession.Session):
         self.app_version = app_version
         self.additional_user_agent = additional_user_agent or []
         self._determined_user_agent = None
-        self._json = _JSONEncoder()
+        self.json_codec = json_codec or _json_codec.get_codec()
+        self._json = self.json_codec
+        self.instruments = list(instruments or [])
+        self.retry_policy = retry_policy or throttle.RetryPolicy()
+        self.rate_limiter = rate_limiter
 
 
         if timeout is not None:
             self.timeout = float(timeout)
-        self.endpoint = _endpoint
 
-    @map_exceptions
-    def request(self,url, method, json=None, original_ip=None,
-                user_agent=None, redirect=None, endpoint_filter=None,
-                raise_exc=True, log=True,
-                endpoint_override=None, connect_retries=0,
-                allow=None, client_name=None, client_version=None,
-                **kwargs):
-        headers = kwargs.setdefault('headers', dict())
+    def _resolve_pools(self, service_pools):
+        """Map the service types of ``service_pools`` to their hosts"""
+        pools = {}
+        for key, options in (service_pools or {}).items():
+            if "://" in key:
+                pools[key] = options
+                continue
+            url = urlparse.urlparse(self.get_endpoint(interface="public",
+                                                      service_type=key))
+            if not url.netloc:
+                raise exceptions.EndpointNotFound(
+                    "No endpoint found for service %s" % key)
+            pools["%s://%s" % (url.scheme, url.netloc)] = options
+        return pools
+
+    def sign_request(self, url, method, json=None, user_agent=None,
+                     endpoint_filter=None, endpoint_override=None,
+                     client_name=None, client_version=None,
+                     unsigned_payload=False, **kwargs):
+        """
+        Complete and sign a request without sending it
+        The relative URLs are resolved from the endpoint of the service,
+        the default headers are added and the ``json`` body is encoded.
+        The arguments are those of :meth:`request`, except the ones about
+        sending the request.
+        :return: A tuple of the full URL and of the keyword arguments to
+                 send the request with, including its ``headers``
+        """
+        # work on a copy so callers may share their headers between threads
+        headers = kwargs['headers'] = dict(kwargs.get('headers') or {})
 
         if not urlparse.urlparse(url).netloc:
             if endpoint_override:
@@ -334,7 +559,7 @@ class ASKSession(osession.Session):
                                'for=%s;by=%s' % (self.original_ip, user_agent))
 
         if json is not None:
-            kwargs['data'] = self._json.encode(json)
+            kwargs['data'] = self.json_codec.dumps(json)
         # surpport  maas,map_reduce when without request body
         headers.setdefault('Content-Type', 'application/json')
         # surpport sub-project id for some service the endpoint contain project id
@@ -353,6 +578,11 @@ class ASKSession(osession.Session):
         # (which the requests library handles) need to be explicitly
         # picked out so they can be included in the URL that gets loggged.
         query_params = kwargs.get('params', dict())
+        if unsigned_payload:
+            headers[CONTENT_SHA256_HEADER] = UNSIGNED_PAYLOAD
+        elif (headers.get(CONTENT_SHA256_HEADER) != UNSIGNED_PAYLOAD and
+                not is_rewindable(kwargs.get('data'))):
+            kwargs['data'] = spool(kwargs['data'])
         headers.setdefault("X-Sdk-Date", datetime.datetime.strftime(datetime.datetime.utcnow(),"%Y%m%dT%H%M%SZ"))
         signedstring = self.signer.signature(method = method,
                                              url = url,
@@ -362,6 +592,45 @@ class ASKSession(osession.Session):
                                              data= kwargs.get("data", None))
         #print signedstring
         headers.setdefault("Authorization", signedstring)
+        return url, kwargs
+
+    @map_exceptions
+    def request(self,url, method, json=None, original_ip=None,
+                user_agent=None, redirect=None, endpoint_filter=None,
+                raise_exc=True, log=True,
+                endpoint_override=None, connect_retries=0,
+                allow=None, client_name=None, client_version=None,
+                unsigned_payload=False, retry=None,
+                **kwargs):
+        """
+        Send a request signed with the ak and sk of this session
+        The body given as ``data`` may be a string, a file-like object or
+        an iterable of chunks. It is hashed by chunks, seekable file-like
+        objects are rewound afterwards and other bodies are first spooled
+        to a temporary file, so large uploads run in constant memory.
+        :param unsigned_payload: sign the request without hashing its body,
+                                 for APIs which accept it. Setting the
+                                 X-Sdk-Content-Sha256 header to
+                                 UNSIGNED-PAYLOAD has the same effect.
+        :param retry: whether the request is retried when throttled, by
+                      default only the requests of idempotent methods are,
+                      see :class:`~openstack.throttle.RetryPolicy`
+        """
+        started = time.time()
+        url, kwargs = self.sign_request(url, method, json=json,
+                                        user_agent=user_agent,
+                                        endpoint_filter=endpoint_filter,
+                                        endpoint_override=endpoint_override,
+                                        client_name=client_name,
+                                        client_version=client_version,
+                                        unsigned_payload=unsigned_payload,
+                                        **kwargs)
+        info = instrumentation.begin(self.instruments, endpoint_filter,
+                                     method, url, self.project_id, started)
+        if info is not None:
+            info.timings["sign"] = time.time() - started
+        headers = kwargs['headers']
+        query_params = kwargs.get('params', dict())
         if log:
             self._http_log_request(url, method=method,
                                    data=kwargs.get('data'),
@@ -379,7 +648,20 @@ class ASKSession(osession.Session):
                                  url, method, redirect, log, _logger,
                                  connect_retries)
 
-        resp = send(**kwargs)
+        try:
+            with instrumentation.timed(info, "send"):
+                resp = throttle.send(
+                    functools.partial(send, **kwargs), method,
+                    data=kwargs.get('data'), retry_policy=self.retry_policy,
+                    rate_limiter=self.rate_limiter,
+                    service_type=getattr(endpoint_filter, 'service_type',
+                                         None),
+                    region=self.region, retry=retry, info=info)
+        except Exception as e:
+            instrumentation.failed(info, e, kwargs.get('data'))
+            raise
+        instrumentation.succeeded(info, resp, kwargs.get('data'),
+                                  kwargs.get('stream', False))
 
         # log callee and caller request-id for each api call
         if log:
@@ -416,7 +698,7 @@ class ASKSession(osession.Session):
                      **kwargs):
         base_url = ""
         service_type = service_type.upper().replace('-', '_')
-        if self.endpoint and self.endpoint.has_key(service_type):
+        if self.endpoint and service_type in self.endpoint:
             endpoint = self.endpoint.get(service_type).get(interface, '')
             map = {"project_id": self.project_id, "region": self.region, "domain": self.domain}
             base_url = endpoint % map
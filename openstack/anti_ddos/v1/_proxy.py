@@ -38,15 +38,17 @@ class Proxy(proxy2.BaseProxy):
         return self._create(_antiddos.FloatingIP,
                             floating_ip_id=floating_ip_id, **kwargs)
 
-    def get_floating_ip(self, floating_ip):
+    def get_floating_ip(self, floating_ip, raw=False):
         """Get detail about an EIP policy
 
         :param floating_ip: The EIP id or an instance of
                            :class:`~openstack.anti_ddos.v1.antiddos.FloatingIP`
+        :param bool raw: When set to ``True``, return the decoded body of
+                         the response instead of a resource.
 
         :rtype: :class:`~openstack.anti_ddos.v1.antiddos.FloatingIP`
         """
-        return self._get(_antiddos.FloatingIP, floating_ip)
+        return self._get(_antiddos.FloatingIP, floating_ip, raw=raw)
 
     def delete_floating_ip(self, floating_ip, ignore_missing=True):
         """Disable an EIP
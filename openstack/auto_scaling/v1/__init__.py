@@ -16,3 +16,18 @@ def get_next_marker(response_json, yielded):
     if yielded < limit:
         return -1
     return response_json["start_number"] + yielded
+
+
+def get_offset_queries(response_json, yielded, query_params):
+    limit = response_json["limit"]
+    if yielded < limit:
+        return []
+    total = response_json["total_number"]
+    start = response_json["start_number"] + yielded
+    queries = []
+    for start_number in range(start, total, limit):
+        query = dict(query_params)
+        query["start_number"] = start_number
+        query["limit"] = limit
+        queries.append(query)
+    return queries
@@ -52,15 +52,17 @@ class Proxy(proxy2.BaseProxy):
         config = _config.Config(name=name, instance_config=instance_config)
         return config.create(self._session, prepend_key=False)
 
-    def get_config(self, config):
+    def get_config(self, config, raw=False):
         """Get a config
 
         :param config: The value can be the ID of a config
              or a :class:`~openstack.auto_scaling.v2.config.Config` instance.
+        :param bool raw: When set to ``True``, return the decoded body of
+                         the response instead of a resource.
         :returns: Config instance
         :rtype: :class:`~openstack.auto_scaling.v2.config.Config`
         """
-        return self._get(_config.Config, config)
+        return self._get(_config.Config, config, raw=raw)
 
     def delete_config(self, config, ignore_missing=True):
         """Delete a config
@@ -145,15 +147,17 @@ class Proxy(proxy2.BaseProxy):
         """
         return self._update(_group.Group, group, prepend_key=False, **attrs)
 
-    def get_group(self, group):
+    def get_group(self, group, raw=False):
         """Get a group
 
         :param group: The value can be the ID of a group
              or a :class:`~openstack.auto_scaling.v2.group.Group` instance.
+        :param bool raw: When set to ``True``, return the decoded body of
+                         the response instead of a resource.
         :returns: Group instance
         :rtype: :class:`~openstack.auto_scaling.v2.group.Group`
         """
-        return self._get(_group.Group, group)
+        return self._get(_group.Group, group, raw=raw)
 
     def delete_group(self, group, ignore_missing=True):
         """Delete a group
@@ -246,15 +250,17 @@ class Proxy(proxy2.BaseProxy):
         """
         return self._update(_policy.Policy, policy, prepend_key=False, **attrs)
 
-    def get_policy(self, policy):
+    def get_policy(self, policy, raw=False):
         """Get a policy
 
         :param policy: The value can be the ID of a policy
              or a :class:`~openstack.auto_scaling.v2.policy.Policy` instance.
+        :param bool raw: When set to ``True``, return the decoded body of
+                         the response instead of a resource.
         :returns: Policy instance
         :rtype: :class:`~openstack.auto_scaling.v2.policy.Policy`
         """
-        return self._get(_policy.Policy, policy)
+        return self._get(_policy.Policy, policy, raw=raw)
 
     def delete_policy(self, policy, ignore_missing=True):
         """Delete a policy
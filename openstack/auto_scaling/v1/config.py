@@ -11,6 +11,7 @@
 # under the License.
 from openstack.auto_scaling import auto_scaling_service
 from openstack.auto_scaling.v1 import get_next_marker
+from openstack.auto_scaling.v1 import get_offset_queries
 from openstack import resource2 as resource
 
 
@@ -81,6 +82,10 @@ class Config(resource.Resource):
     def get_next_marker(cls, response_json, yielded, query_params):
         return get_next_marker(response_json, yielded)
 
+    @classmethod
+    def get_offset_queries(cls, response_json, yielded, query_params):
+        return get_offset_queries(response_json, yielded, query_params)
+
     def batch_delete(self, session, configs):
         """batch delete auto-scaling configs
 
@@ -95,6 +95,11 @@ class Group(resource.Resource):
         from openstack.auto_scaling.v1 import get_next_marker
         return get_next_marker(response_json, yielded)
 
+    @classmethod
+    def get_offset_queries(cls, response_json, yielded, query_params):
+        from openstack.auto_scaling.v1 import get_offset_queries
+        return get_offset_queries(response_json, yielded, query_params)
+
     def _action(self, session, body):
         """Preform group actions given the message body."""
         url = utils.urljoin(self.base_path, self.id, "action")
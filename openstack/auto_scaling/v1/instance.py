@@ -62,6 +62,11 @@ class Instance(resource.Resource):
         from openstack.auto_scaling.v1 import get_next_marker
         return get_next_marker(response_json, yielded)
 
+    @classmethod
+    def get_offset_queries(cls, response_json, yielded, query_params):
+        from openstack.auto_scaling.v1 import get_offset_queries
+        return get_offset_queries(response_json, yielded, query_params)
+
     def remove(self, session, delete_instance=False, ignore_missing=True):
         """Remove an instance of auto scaling group
 
@@ -83,17 +83,19 @@ class Proxy(proxy2.BaseProxy):
         return self._find(_chassis.Chassis, name_or_id,
                           ignore_missing=ignore_missing)
 
-    def get_chassis(self, chassis):
+    def get_chassis(self, chassis, raw=False):
         """Get a specific chassis.
 
         :param chassis: The value can be the name or ID of a chassis or a
             :class:`~openstack.bare_metal.v1.chassis.Chassis` instance.
+        :param bool raw: When set to ``True``, return the decoded body of
+                         the response instead of a resource.
 
         :returns: One :class:`~openstack.bare_metal.v1.chassis.Chassis`
         :raises: :class:`~openstack.exceptions.ResourceNotFound` when no
             chassis matching the name or ID could be found.
         """
-        return self._get(_chassis.Chassis, chassis)
+        return self._get(_chassis.Chassis, chassis, raw=raw)
 
     def update_chassis(self, chassis, **attrs):
         """Update a chassis.
@@ -132,17 +134,19 @@ class Proxy(proxy2.BaseProxy):
         """
         return self._list(_driver.Driver, paginated=False)
 
-    def get_driver(self, driver):
+    def get_driver(self, driver, raw=False):
         """Get a specific driver.
 
         :param driver: The value can be the name of a driver or a
             :class:`~openstack.bare_metal.v1.driver.Driver` instance.
+        :param bool raw: When set to ``True``, return the decoded body of
+                         the response instead of a resource.
 
         :returns: One :class:`~openstack.bare_metal.v1.driver.Driver`
         :raises: :class:`~openstack.exceptions.ResourceNotFound` when no
             driver matching the name could be found.
         """
-        return self._get(_driver.Driver, driver)
+        return self._get(_driver.Driver, driver, raw=raw)
 
     def nodes(self, details=False, **query):
         """Retrieve a generator of nodes.
@@ -215,17 +219,19 @@ class Proxy(proxy2.BaseProxy):
         return self._find(_node.Node, name_or_id,
                           ignore_missing=ignore_missing)
 
-    def get_node(self, node):
+    def get_node(self, node, raw=False):
         """Get a specific node.
 
         :param node: The value can be the name or ID of a chassis or a
             :class:`~openstack.bare_metal.v1.node.Node` instance.
+        :param bool raw: When set to ``True``, return the decoded body of
+                         the response instead of a resource.
 
         :returns: One :class:`~openstack.bare_metal.v1.node.Node`
         :raises: :class:`~openstack.exceptions.ResourceNotFound` when no
             node matching the name or ID could be found.
         """
-        return self._get(_node.Node, node)
+        return self._get(_node.Node, node, raw=raw)
 
     def update_node(self, node, **attrs):
         """Update a node.
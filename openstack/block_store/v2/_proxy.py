@@ -35,18 +35,20 @@ from openstack import proxy2
 
 class Proxy(proxy2.BaseProxy):
 
-    def get_snapshot(self, snapshot):
+    def get_snapshot(self, snapshot, raw=False):
         """Get a single snapshot
 
         :param snapshot: The value can be the ID of a snapshot or a
                          :class:`~openstack.volume.v2.snapshot.Snapshot`
                          instance.
+        :param bool raw: When set to ``True``, return the decoded body of
+                         the response instead of a resource.
 
         :returns: One :class:`~openstack.volume.v2.snapshot.Snapshot`
         :raises: :class:`~openstack.exceptions.ResourceNotFound`
                  when no resource can be found.
         """
-        return self._get(_snapshot.Snapshot, snapshot)
+        return self._get(_snapshot.Snapshot, snapshot, raw=raw)
 
     def snapshots(self, details=True, **query):
         """Retrieve a generator of snapshots
@@ -99,17 +101,19 @@ class Proxy(proxy2.BaseProxy):
         self._delete(_snapshot.Snapshot, snapshot,
                      ignore_missing=ignore_missing)
 
-    def get_type(self, type):
+    def get_type(self, type, raw=False):
         """Get a single type
 
         :param type: The value can be the ID of a type or a
                      :class:`~openstack.volume.v2.type.Type` instance.
+        :param bool raw: When set to ``True``, return the decoded body of
+                         the response instead of a resource.
 
         :returns: One :class:`~openstack.volume.v2.type.Type`
         :raises: :class:`~openstack.exceptions.ResourceNotFound`
                  when no resource can be found.
         """
-        return self._get(_type.Type, type)
+        return self._get(_type.Type, type, raw=raw)
 
     def types(self):
         """Retrieve a generator of volume types
@@ -145,17 +149,19 @@ class Proxy(proxy2.BaseProxy):
         """
         self._delete(_type.Type, type, ignore_missing=ignore_missing)
 
-    def get_volume(self, volume):
+    def get_volume(self, volume, raw=False):
         """Get a single volume
 
         :param volume: The value can be the ID of a volume or a
                        :class:`~openstack.volume.v2.volume.Volume` instance.
+        :param bool raw: When set to ``True``, return the decoded body of
+                         the response instead of a resource.
 
         :returns: One :class:`~openstack.volume.v2.volume.Volume`
         :raises: :class:`~openstack.exceptions.ResourceNotFound`
                  when no resource can be found.
         """
-        return self._get(_volume.Volume, volume)
+        return self._get(_volume.Volume, volume, raw=raw)
 
     def volumes(self, details=True, **query):
         """Retrieve a generator of volumes
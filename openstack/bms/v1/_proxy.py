@@ -10,6 +10,7 @@
 # License for the specific language governing permissions and limitations
 # under the License.
 from openstack import proxy2
+from openstack.bms.v1 import job as _job
 from openstack.bms.v1 import server as _server
 
 class Proxy(proxy2.BaseProxy):
@@ -21,3 +22,14 @@ class Proxy(proxy2.BaseProxy):
         """
         return self._create(_server.Servers, **data)
 
+
+    def get_job(self, job, raw=False):
+        """Get an asynchronous job
+
+        :param job: Either the ID of a job or an instance of
+                    :class:`~openstack.bms.v1.job.Job`
+        :param bool raw: When set to ``True``, return the decoded body of
+                         the response instead of a resource.
+        :returns: A :class:`~openstack.bms.v1.job.Job`
+        """
+        return self._get(_job.Job, job, raw=raw)
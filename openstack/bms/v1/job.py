@@ -0,0 +1,34 @@
+# Licensed under the Apache License, Version 2.0 (the "License"); you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+
+from openstack.bms import bms_service
+from openstack import resource2
+
+
+class Job(resource2.Resource):
+    """BMS asynchronous Job Resource"""
+    base_path = "/jobs"
+    service = bms_service.BmsService()
+
+    # capabilities
+    allow_get = True
+
+    #: Properties
+    id = resource2.Body("job_id")
+    type = resource2.Body("job_type")
+    begin_time = resource2.Body("begin_time")
+    end_time = resource2.Body("end_time")
+    #: The entities of the job, including its ``sub_jobs``
+    entities = resource2.Body("entities", type=dict)
+    status = resource2.Body("status")
+    error_code = resource2.Body("error_code")
+    fail_reason = resource2.Body("fail_reason")
@@ -10,7 +10,6 @@
 # License for the specific language governing permissions and limitations
 # under the License.
 
-
 from openstack.cdn.exceptions import CDNException
 from openstack import exceptions
 from openstack import resource2 as resource
@@ -76,77 +75,55 @@ class Resource(resource.Resource):
                                      page_number=query_page_number_key)
 
     @classmethod
-    def list(cls, session, paginated=False, **params):
-        """This method is a generator which yields resource objects.
-
-        This resource object list generator handles pagination and takes query
-        params for response filtering.
-
-        :param session: The session to use for making this request.
-        :type session: :class:`~openstack.session.Session`
-        :param bool paginated: ``True`` if a GET to this resource returns
-                               a paginated series of responses, or ``False``
-                               if a GET returns only one page of data.
-                               **When paginated is False only one
-                               page of data will be returned regardless
-                               of the API's support of pagination.**
-        :param dict params: These keyword arguments are passed through the
-            :meth:`~openstack.resource2.QueryParamter._transpose` method
-            to find if any of them match expected query parameters to be
-            sent in the *params* argument to
-            :meth:`~openstack.session.Session.get`. They are additionally
-            checked against the
-            :data:`~openstack.resource2.Resource.base_path` format string
-            to see if any path fragments need to be filled in by the contents
-            of this argument.
-
-        :return: A generator of :class:`Resource` objects.
-        :raises: :exc:`~openstack.exceptions.MethodNotSupported` if
-                 :data:`Resource.allow_list` is not set to ``True``.
-        """
-        if not cls.allow_list:
-            raise exceptions.MethodNotSupported(cls, "list")
+    def _list_pages(cls, session, paginated=False, max_workers=1,
+                    factory=None, stream=False, **params):
+        """Generate the pages of a listing, see :meth:`list`
+
+        The CDN service pages its listings by number, so both the page
+        size and the page number must be given.
 
-        more_data = True
+        :raises: :exc:`~openstack.exceptions.InvalidRequest` if either of
+                 them is missing.
+        """
         query_params = cls._query_mapping._transpose(params)
-        if cls.query_page_size_key and \
-                cls.query_page_size_key not in query_params:
-            raise exceptions.InvalidRequest('query parameter %s is required.'
-                                            % cls.query_page_size_key)
-        if cls.query_page_number_key and \
-                cls.query_page_number_key not in query_params:
-            raise exceptions.InvalidRequest('query parameter %s is required.'
-                                            % cls.query_page_number_key)
-        uri = cls.get_list_uri(params)
-
-        while more_data:
-            endpoint_override = cls.service.get_endpoint_override()
-            resp = session.get(uri, endpoint_filter=cls.service,
-                               endpoint_override=endpoint_override,
-                               headers={"Accept": "application/json"},
-                               params=query_params)
-            response_json = resp.json()
-            cls.check_error(response_json)
-            if cls.resources_key:
-                resources = cls.find_value_by_accessor(response_json,
-                                                       cls.resources_key)
-            else:
-                resources = response_json
-            if resources is None:
-                resources = []
-
-            if not resources:
-                return
-
-            for data in resources:
-                value = cls.existing(**data)
-                yield value
-
-            if not paginated:
-                return
-            more_data, next_page_num = cls.get_next_pagination(response_json,
-                                                               query_params)
-            query_params[cls.query_page_number_key] = next_page_num
+        for key in (cls.query_page_size_key, cls.query_page_number_key):
+            if key and key not in query_params:
+                raise exceptions.InvalidRequest(
+                    'query parameter %s is required.' % key)
+        return super(Resource, cls)._list_pages(
+            session, paginated=paginated, max_workers=max_workers,
+            factory=factory, stream=stream, **params)
+
+    @classmethod
+    def _next_query(cls, response_json, yielded, last, query_params,
+                    paginated):
+        """Return the query of the next page, by its number"""
+        if not paginated or not yielded:
+            return None
+        more_data, next_page_num = cls.get_next_pagination(response_json,
+                                                           query_params)
+        if not more_data:
+            return None
+        query_params = dict(query_params)
+        query_params[cls.query_page_number_key] = next_page_num
+        return query_params
+
+    @classmethod
+    def _check_page(cls, response_json):
+        cls.check_error(response_json)
+
+    @classmethod
+    def get_offset_queries(cls, response_json, yielded, query_params):
+        total = cls.find_value_by_accessor(response_json, cls.total_path) or 0
+        page_size = int(query_params.get(cls.query_page_size_key))
+        page_number = int(query_params.get(cls.query_page_number_key))
+        last_page = (total + page_size - 1) // page_size
+        queries = []
+        for number in range(page_number + 1, last_page + 1):
+            query = dict(query_params)
+            query[cls.query_page_number_key] = number
+            queries.append(query)
+        return queries
 
     @classmethod
     def get_next_pagination(cls, response, query_params):
@@ -80,17 +80,19 @@ class Proxy(proxy2.BaseProxy):
         """
         return self._create(_domain.Domain, **attrs)
 
-    def get_domain(self, domain):
+    def get_domain(self, domain, raw=False):
         """Get a single acceleration domain name
 
         :param domain: The value can be the ID of a domain name or a
                        :class:`~openstack.cdn.v1.domain.Domain` instance.
+        :param bool raw: When set to ``True``, return the decoded body of
+                         the response instead of a resource.
 
         :returns: One :class:`~openstack.cdn.v1.domain.Domain`
         :raises: :class:`~openstack.exceptions.ResourceNotFound`
                  when no resource can be found.
         """
-        return self._get(_domain.Domain, domain)
+        return self._get(_domain.Domain, domain, raw=raw)
 
     def delete_domain(self, domain, ignore_missing=True):
         """Delete an acceleration domain name
@@ -373,17 +375,19 @@ class Proxy(proxy2.BaseProxy):
                      paginated=True)
         return self._list(_task.Task, **query)
 
-    def get_task(self, task):
+    def get_task(self, task, raw=False):
         """Get details about a cache refreshing or preheating task
 
         :param task: The value can be the ID of a task or a
                        :class:`~openstack.cdn.v1.task.Task` instance.
+        :param bool raw: When set to ``True``, return the decoded body of
+                         the response instead of a resource.
 
         :returns: One :class:`~openstack.cdn.v1.task.Task`
         :raises: :class:`~openstack.exceptions.ResourceNotFound`
                  when no resource can be found.
         """
-        return self._get(_task.Task, task)
+        return self._get(_task.Task, task, raw=raw)
 
     def create_refresh_task(self, **attrs):
         """Create a new cache refresh task from attributes
@@ -44,18 +44,20 @@ class Proxy(proxy2.BaseProxy):
         """
         return self._list(_profile_type.ProfileType, paginated=False, **query)
 
-    def get_profile_type(self, profile_type):
+    def get_profile_type(self, profile_type, raw=False):
         """Get the details about a profile_type.
 
         :param name: The name of the profile_type to retrieve or an object of
                     :class:`~openstack.cluster.v1.profile_type.ProfileType`.
+        :param bool raw: When set to ``True``, return the decoded body of
+                         the response instead of a resource.
 
         :returns: A :class:`~openstack.cluster.v1.profile_type.ProfileType`
                   object.
         :raises: :class:`~openstack.exceptions.ResourceNotFound` when no
             profile_type matching the name could be found.
         """
-        return self._get(_profile_type.ProfileType, profile_type)
+        return self._get(_profile_type.ProfileType, profile_type, raw=raw)
 
     def policy_types(self, **query):
         """Get a generator of policy types.
@@ -65,18 +67,20 @@ class Proxy(proxy2.BaseProxy):
         """
         return self._list(_policy_type.PolicyType, paginated=False, **query)
 
-    def get_policy_type(self, policy_type):
+    def get_policy_type(self, policy_type, raw=False):
         """Get the details about a policy_type.
 
         :param policy_type: The name of a poicy_type or an object of
                 :class:`~openstack.cluster.v1.policy_type.PolicyType`.
+        :param bool raw: When set to ``True``, return the decoded body of
+                         the response instead of a resource.
 
         :returns: A :class:`~openstack.cluster.v1.policy_type.PolicyType`
                   object.
         :raises: :class:`~openstack.exceptions.ResourceNotFound` when no
             policy_type matching the name could be found.
         """
-        return self._get(_policy_type.PolicyType, policy_type)
+        return self._get(_policy_type.PolicyType, policy_type, raw=raw)
 
     def create_profile(self, **attrs):
         """Create a new profile from attributes.
@@ -119,17 +123,19 @@ class Proxy(proxy2.BaseProxy):
         return self._find(_profile.Profile, name_or_id,
                           ignore_missing=ignore_missing)
 
-    def get_profile(self, profile):
+    def get_profile(self, profile, raw=False):
         """Get a single profile.
 
         :param profile: The value can be the name or ID of a profile or a
             :class:`~openstack.cluster.v1.profile.Profile` instance.
+        :param bool raw: When set to ``True``, return the decoded body of
+                         the response instead of a resource.
 
         :returns: One :class:`~openstack.cluster.v1.profile.Profile`
         :raises: :class:`~openstack.exceptions.ResourceNotFound` when no
             profile matching the criteria could be found.
         """
-        return self._get(_profile.Profile, profile)
+        return self._get(_profile.Profile, profile, raw=raw)
 
     def profiles(self, **query):
         """Retrieve a generator of profiles.
@@ -226,17 +232,19 @@ class Proxy(proxy2.BaseProxy):
         return self._find(_cluster.Cluster, name_or_id,
                           ignore_missing=ignore_missing)
 
-    def get_cluster(self, cluster):
+    def get_cluster(self, cluster, raw=False):
         """Get a single cluster.
 
         :param cluster: The value can be the name or ID of a cluster or a
             :class:`~openstack.cluster.v1.cluster.Cluster` instance.
+        :param bool raw: When set to ``True``, return the decoded body of
+                         the response instead of a resource.
 
         :returns: One :class:`~openstack.cluster.v1.cluster.Cluster`
         :raises: :class:`~openstack.exceptions.ResourceNotFound` when no
             cluster matching the criteria could be found.
         """
-        return self._get(_cluster.Cluster, cluster)
+        return self._get(_cluster.Cluster, cluster, raw=raw)
 
     def clusters(self, **query):
         """Retrieve a generator of clusters.
@@ -791,18 +799,20 @@ class Proxy(proxy2.BaseProxy):
         return self._find(_policy.Policy, name_or_id,
                           ignore_missing=ignore_missing)
 
-    def get_policy(self, policy):
+    def get_policy(self, policy, raw=False):
         """Get a single policy.
 
         :param policy: The value can be the name or ID of a policy or a
             :class:`~openstack.cluster.v1.policy.Policy` instance.
+        :param bool raw: When set to ``True``, return the decoded body of
+                         the response instead of a resource.
 
         :returns: A policy object.
         :rtype: :class:`~openstack.cluster.v1.policy.Policy`
         :raises: :class:`~openstack.exceptions.ResourceNotFound` when no
             policy matching the criteria could be found.
         """
-        return self._get(_policy.Policy, policy)
+        return self._get(_policy.Policy, policy, raw=raw)
 
     def policies(self, **query):
         """Retrieve a generator of policies.
@@ -929,18 +939,20 @@ class Proxy(proxy2.BaseProxy):
         return self._find(_receiver.Receiver, name_or_id,
                           ignore_missing=ignore_missing)
 
-    def get_receiver(self, receiver):
+    def get_receiver(self, receiver, raw=False):
         """Get a single receiver.
 
         :param receiver: The value can be the name or ID of a receiver or a
             :class:`~openstack.cluster.v1.receiver.Receiver` instance.
+        :param bool raw: When set to ``True``, return the decoded body of
+                         the response instead of a resource.
 
         :returns: A receiver object.
         :rtype: :class:`~openstack.cluster.v1.receiver.Receiver`
         :raises: :class:`~openstack.exceptions.ResourceNotFound` when no
             receiver matching the criteria could be found.
         """
-        return self._get(_receiver.Receiver, receiver)
+        return self._get(_receiver.Receiver, receiver, raw=raw)
 
     def receivers(self, **query):
         """Retrieve a generator of receivers.
@@ -962,18 +974,20 @@ class Proxy(proxy2.BaseProxy):
         """
         return self._list(_receiver.Receiver, paginated=True, **query)
 
-    def get_action(self, action):
+    def get_action(self, action, raw=False):
         """Get a single action.
 
         :param action: The value can be the name or ID of an action or a
             :class:`~openstack.cluster.v1.action.Action` instance.
+        :param bool raw: When set to ``True``, return the decoded body of
+                         the response instead of a resource.
 
         :returns: an action object.
         :rtype: :class:`~openstack.cluster.v1.action.Action`
         :raises: :class:`~openstack.exceptions.ResourceNotFound` when no
             action matching the criteria could be found.
         """
-        return self._get(_action.Action, action)
+        return self._get(_action.Action, action, raw=raw)
 
     def actions(self, **query):
         """Retrieve a generator of actions.
@@ -1000,18 +1014,20 @@ class Proxy(proxy2.BaseProxy):
         """
         return self._list(_action.Action, paginated=True, **query)
 
-    def get_event(self, event):
+    def get_event(self, event, raw=False):
         """Get a single event.
 
         :param event: The value can be the name or ID of an event or a
             :class:`~openstack.cluster.v1.event.Event` instance.
+        :param bool raw: When set to ``True``, return the decoded body of
+                         the response instead of a resource.
 
         :returns: an event object.
         :rtype: :class:`~openstack.cluster.v1.event.Event`
         :raises: :class:`~openstack.exceptions.ResourceNotFound` when no
             event matching the criteria could be found.
         """
-        return self._get(_event.Event, event)
+        return self._get(_event.Event, event, raw=raw)
 
     def events(self, **query):
         """Retrieve a generator of events.
@@ -93,17 +93,19 @@ class Proxy(proxy2.BaseProxy):
         """
         self._delete(_flavor.Flavor, flavor, ignore_missing=ignore_missing)
 
-    def get_flavor(self, flavor):
+    def get_flavor(self, flavor, raw=False):
         """Get a single flavor
 
         :param flavor: The value can be the ID of a flavor or a
                        :class:`~openstack.compute.v2.flavor.Flavor` instance.
+        :param bool raw: When set to ``True``, return the decoded body of
+                         the response instead of a resource.
 
         :returns: One :class:`~openstack.compute.v2.flavor.Flavor`
         :raises: :class:`~openstack.exceptions.ResourceNotFound`
                  when no resource can be found.
         """
-        return self._get(_flavor.Flavor, flavor)
+        return self._get(_flavor.Flavor, flavor, raw=raw)
 
     def flavors(self, details=True, **query):
         """Return a generator of flavors
@@ -149,17 +151,19 @@ class Proxy(proxy2.BaseProxy):
         return self._find(_image.Image, name_or_id,
                           ignore_missing=ignore_missing)
 
-    def get_image(self, image):
+    def get_image(self, image, raw=False):
         """Get a single image
 
         :param image: The value can be the ID of an image or a
                       :class:`~openstack.compute.v2.image.Image` instance.
+        :param bool raw: When set to ``True``, return the decoded body of
+                         the response instead of a resource.
 
         :returns: One :class:`~openstack.compute.v2.image.Image`
         :raises: :class:`~openstack.exceptions.ResourceNotFound`
                  when no resource can be found.
         """
-        return self._get(_image.Image, image)
+        return self._get(_image.Image, image, raw=raw)
 
     def images(self, details=True, **query):
         """Return a generator of images
@@ -267,18 +271,20 @@ class Proxy(proxy2.BaseProxy):
         """
         self._delete(_keypair.Keypair, keypair, ignore_missing=ignore_missing)
 
-    def get_keypair(self, keypair):
+    def get_keypair(self, keypair, raw=False):
         """Get a single keypair
 
         :param keypair: The value can be the ID of a keypair or a
                         :class:`~openstack.compute.v2.keypair.Keypair`
                         instance.
+        :param bool raw: When set to ``True``, return the decoded body of
+                         the response instead of a resource.
 
         :returns: One :class:`~openstack.compute.v2.keypair.Keypair`
         :raises: :class:`~openstack.exceptions.ResourceNotFound`
                  when no resource can be found.
         """
-        return self._get(_keypair.Keypair, keypair)
+        return self._get(_keypair.Keypair, keypair, raw=raw)
 
     def find_keypair(self, name_or_id, ignore_missing=True):
         """Find a single keypair
@@ -359,17 +365,19 @@ class Proxy(proxy2.BaseProxy):
         return self._find(_server.Server, name_or_id,
                           ignore_missing=ignore_missing)
 
-    def get_server(self, server):
+    def get_server(self, server, raw=False):
         """Get a single server
 
         :param server: The value can be the ID of a server or a
                        :class:`~openstack.compute.v2.server.Server` instance.
+        :param bool raw: When set to ``True``, return the decoded body of
+                         the response instead of a resource.
 
         :returns: One :class:`~openstack.compute.v2.server.Server`
         :raises: :class:`~openstack.exceptions.ResourceNotFound`
                  when no resource can be found.
         """
-        return self._get(_server.Server, server)
+        return self._get(_server.Server, server, raw=raw)
 
     def servers(self, details=True, **query):
         """Retrieve a generator of servers
@@ -780,6 +788,33 @@ class Proxy(proxy2.BaseProxy):
         return resource2.wait_for_status(self._session, server, status,
                                          failures, interval, wait)
 
+    def wait_for_servers(self, servers, status='ACTIVE', failures=['ERROR'],
+                         interval=2, wait=120, **query):
+        """Wait for many servers to be in a particular status
+
+        The servers are refreshed by listing them, see
+        :func:`~openstack.resource2.wait_for_many`.
+
+        :param servers: A list of
+                        :class:`~openstack.compute.v2.server.Server`
+                        instances.
+        :param status: Desired status of the servers, or None to wait for
+                       them to be deleted.
+        :param list failures: Statuses that would indicate the transition
+                              failed such as 'ERROR'.
+        :param interval: Number of seconds to wait after the first check.
+        :param wait: Maximum number of seconds to wait for all the servers.
+        :param kwargs \*\*query: Optional query parameters narrowing the
+                                 listings, such as the ``name`` the servers
+                                 were created with.
+
+        :returns: A generator of done futures, one per server, in the order
+                  the servers complete.
+        """
+        return resource2.wait_for_many(self._session, servers, status,
+                                       failures, interval, wait=wait,
+                                       query=query)
+
     def create_server_interface(self, server, **attrs):
         """Create a new server interface from attributes
 
@@ -995,19 +1030,21 @@ class Proxy(proxy2.BaseProxy):
         return self._find(_server_group.ServerGroup, name_or_id,
                           ignore_missing=ignore_missing)
 
-    def get_server_group(self, server_group):
+    def get_server_group(self, server_group, raw=False):
         """Get a single server group
 
         :param server_group: The value can be the ID of a server group or a
                :class:`~openstack.compute.v2.server_group.ServerGroup`
                instance.
+        :param bool raw: When set to ``True``, return the decoded body of
+                         the response instead of a resource.
 
         :returns:
             A :class:`~openstack.compute.v2.server_group.ServerGroup` object.
         :raises: :class:`~openstack.exceptions.ResourceNotFound`
                  when no resource can be found.
         """
-        return self._get(_server_group.ServerGroup, server_group)
+        return self._get(_server_group.ServerGroup, server_group, raw=raw)
 
     def server_groups(self, **query):
         """Return a generator of server groups
@@ -1042,33 +1079,37 @@ class Proxy(proxy2.BaseProxy):
         return self._find(_hypervisor.Hypervisor, name_or_id,
                           ignore_missing=ignore_missing)
 
-    def get_hypervisor(self, hypervisor):
+    def get_hypervisor(self, hypervisor, raw=False):
         """Get a single hypervisor
 
         :param hypervisor: The value can be the ID of a hypervisor or a
                :class:`~openstack.compute.v2.hypervisor.Hypervisor`
                instance.
+        :param bool raw: When set to ``True``, return the decoded body of
+                         the response instead of a resource.
 
         :returns:
             A :class:`~openstack.compute.v2.hypervisor.Hypervisor` object.
         :raises: :class:`~openstack.exceptions.ResourceNotFound`
                  when no resource can be found.
         """
-        return self._get(_hypervisor.Hypervisor, hypervisor)
+        return self._get(_hypervisor.Hypervisor, hypervisor, raw=raw)
 
-    def get_service(self, service):
+    def get_service(self, service, raw=False):
         """Get a single service
 
         :param service: The value can be the ID of a serivce or a
                :class:`~openstack.compute.v2.service.Service`
                instance.
+        :param bool raw: When set to ``True``, return the decoded body of
+                         the response instead of a resource.
 
         :returns:
             A :class:`~openstack.compute.v2.serivce.Service` object.
         :raises: :class:`~openstack.exceptions.ResourceNotFound`
                  when no resource can be found.
         """
-        return self._get(_service.Service, service)
+        return self._get(_service.Service, service, raw=raw)
 
     def force_service_down(self, service, host, binary):
         """Force a service down
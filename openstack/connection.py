@@ -75,6 +75,7 @@ try to find it and if that fails, you would create it::
 """
 import logging
 import sys
+import threading
 
 import os
 import os_client_config
@@ -115,7 +116,7 @@ def from_config(cloud_name=None, cloud_config=None, options=None):
     # TODO(thowe): I proposed that service name defaults to None in OCC
     defaults = {}
     prof = _profile.Profile()
-    services = [service.service_type for service in prof.get_services()]
+    services = prof.get_service_types()
     for service in services:
         defaults[service + '_service_name'] = None
     # TODO(thowe): default is 2 which turns into v2 which doesn't work
@@ -131,7 +132,6 @@ def from_config(cloud_name=None, cloud_config=None, options=None):
     # TODO(mordred) we need to add service_type setting to openstacksdk.
     # Some clouds have type overridden as well as name.
 
-    services = [service.service_type for service in prof.get_services()]
     for service in cloud_config.get_services():
         if service in services:
             version = cloud_config.get_api_version(service)
@@ -149,8 +149,7 @@ def from_config(cloud_name=None, cloud_config=None, options=None):
 
     region = cloud_config.get_region_name(service)
     if region:
-        for service in services:
-            prof.set_region(service, region)
+        prof.set_region(prof.ALL, region)
 
     # Auth
     auth = cloud_config.config['auth']
@@ -175,7 +174,10 @@ def from_config(cloud_name=None, cloud_config=None, options=None):
 class Connection(object):
     def __init__(self, session=None, authenticator=None, profile=None,
                  verify=True, timeout=None, cert=None, user_agent=None,
-                 auth_plugin="password",
+                 auth_plugin="password", pool_connections=None,
+                 pool_maxsize=None, pool_block=None, service_pools=None,
+                 discovery_cache=None, token_cache=None, instruments=None,
+                 retry_policy=None, rate_limiter=None, name_index_ttl=None,
                  **auth_args):
         """Create a context for a connection to a cloud provider.
 
@@ -222,12 +224,57 @@ class Connection(object):
             HTTP header.
         :param str auth_plugin: The name of authentication plugin to use.
             The default value is ``password``.
+        :param int pool_connections: If a transport is not provided to the
+            connection, the number of hosts to keep connection pools for.
+        :param int pool_maxsize: If a transport is not provided to the
+            connection, the number of connections kept per host. Size it to
+            the number of threads sharing the connection, which is safe.
+        :param bool pool_block: If a transport is not provided to the
+            connection, whether to wait for a free connection when a pool is
+            exhausted instead of opening one which is not reused.
+        :param dict service_pools: If a transport is not provided to the
+            connection, a dict mapping URL prefixes to dicts of
+            ``pool_connections``, ``pool_maxsize`` and ``pool_block``
+            overriding the defaults for these prefixes. Service types
+            (e.g. ``ecs``) may be used as keys with ak/sk authentication.
+        :param discovery_cache: If a transport is not provided to the
+            connection, the
+            :class:`~openstack.discovery_cache.DiscoveryCache` of the
+            versions discovered at the service endpoints, e.g. one kept in
+            a file shared by the processes of a host. Unused with ak/sk
+            authentication, whose endpoints are not discovered.
+        :param token_cache: The :class:`~openstack.token_cache.TokenCache`
+            sharing the tokens of the authenticator with other processes,
+            which then authenticate once for all. Unused with ak/sk
+            authentication, which has no tokens.
+        :param instruments: If a transport is not provided to the
+            connection, the :class:`~openstack.instrumentation.Instrument`
+            objects notified of its requests, e.g. a
+            :class:`~openstack.instrumentation.LatencyAggregator`.
+        :param retry_policy: If a transport is not provided to the
+            connection, the :class:`~openstack.throttle.RetryPolicy` of its
+            throttled requests. By default the requests of the idempotent
+            methods are retried.
+        :param rate_limiter: If a transport is not provided to the
+            connection, the :class:`~openstack.throttle.AdaptiveRateLimiter`
+            pacing its requests to each service, possibly shared with other
+            connections. The requests are not paced by default.
+        :param name_index_ttl: The seconds the resources found by name or
+            id with the ``find_*`` methods of the proxies are kept, so that
+            finding them again needs no request. See
+            :meth:`~openstack.proxy2.BaseProxy.enable_name_index`. They
+            are not kept by default.
         :param auth_args: The rest of the parameters provided are assumed to be
             authentication arguments that are used by the authentication
             plugin.
         """
 
         self.profile = profile if profile else _profile.Profile()
+        self.name_index_ttl = name_index_ttl
+        pool_args = dict((k, v) for k, v in (
+            ("pool_connections", pool_connections),
+            ("pool_maxsize", pool_maxsize),
+            ("pool_block", pool_block)) if v is not None)
         if session:
             # Make sure it is the right kind of session. A keystoneauth1
             # session would work in some ways but show strange errors in
@@ -263,16 +310,35 @@ class Connection(object):
                                                 sk = auth_args.get('sk',None),
                                                 project_id = auth_args.get('project_id',None),
                                                 region= auth_args.get("region",None),
-                                                domain = auth_args.get('domain',None)
+                                                domain = auth_args.get('domain',None),
+                                                service_pools=service_pools,
+                                                instruments=instruments,
+                                                retry_policy=retry_policy,
+                                                rate_limiter=rate_limiter,
+                                                **pool_args
                                                 #endpoint_file= endpointfile
                                                 )
         else:
             self.authenticator = self._create_authenticator(authenticator,
                                                             auth_plugin,
                                                             **auth_args)
+            if token_cache is not None:
+                token_cache.attach(self.authenticator)
+            session_args = {}
+            if discovery_cache is not None:
+                session_args["discovery_cache"] = discovery_cache
+            if instruments:
+                session_args["instruments"] = instruments
+            if retry_policy is not None:
+                session_args["retry_policy"] = retry_policy
+            if rate_limiter is not None:
+                session_args["rate_limiter"] = rate_limiter
+            if pool_args or service_pools:
+                session_args["session"] = aksession.construct_session(
+                    pools=service_pools, **pool_args)
             self.session = _session.Session(
                 self.profile, auth=self.authenticator, verify=verify, timeout=timeout,
-                cert=cert, user_agent=user_agent)
+                cert=cert, user_agent=user_agent, **session_args)
 
         self._open()
 
@@ -292,22 +358,51 @@ class Connection(object):
     def _open(self):
         """Open the connection.
 
-        NOTE(thowe): Have this set up some lazy loader instead.
+        The service proxies are not loaded here: the type of each service
+        in the profile is recorded, and its proxy module is imported and
+        instantiated on the first access to the service attribute, e.g.
+        ``conn.compute``, which then keeps the proxy.
         """
-        for service in self.profile.get_services():
-            self._load(service)
-
-    def _load(self, service):
-        attr_name = service.get_service_module()
-        module = service.get_module() + "._proxy"
+        self._proxies = {}
+        self._proxies_lock = threading.Lock()
+        for service_type in self.profile.get_service_types():
+            attr_name = self.profile.get_service_module(service_type)
+            self._proxies[attr_name] = service_type
+
+    def __getattr__(self, name):
+        # only called when the attribute is missing, so the services
+        # which are already loaded don't go through here.
+        proxies = self.__dict__.get("_proxies", {})
+        if name in proxies:
+            with self._proxies_lock:
+                service_type = proxies.pop(name, None)
+                if service_type is not None:
+                    self._load(name, service_type)
+            if name in self.__dict__:
+                return self.__dict__[name]
+        raise AttributeError("'%s' object has no attribute '%s'" %
+                             (self.__class__.__name__, name))
+
+    def __dir__(self):
+        names = set(dir(self.__class__)) | set(self.__dict__)
+        return sorted(names | set(self.__dict__.get("_proxies", {})))
+
+    def _load(self, attr_name, service_type):
+        module = service_type
         try:
+            service = self.profile.get_filter(service_type)
+            module = service.get_module() + "._proxy"
             __import__(module)
             proxy_class = getattr(sys.modules[module], "Proxy")
             if not (issubclass(proxy_class, proxy.BaseProxy) or
                     issubclass(proxy_class, proxy2.BaseProxy)):
                 raise TypeError("%s.Proxy must inherit from BaseProxy" %
                                 proxy_class.__module__)
-            setattr(self, attr_name, proxy_class(self.session))
+            service_proxy = proxy_class(self.session)
+            if (self.name_index_ttl is not None and
+                    isinstance(service_proxy, proxy2.BaseProxy)):
+                service_proxy.enable_name_index(self.name_index_ttl)
+            setattr(self, attr_name, service_proxy)
         except Exception as e:
             _logger.warn("Unable to load %s: %s" % (module, e))
 
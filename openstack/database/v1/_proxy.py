@@ -122,17 +122,19 @@ class Proxy(proxy2.BaseProxy):
         return self._find(_flavor.Flavor, name_or_id,
                           ignore_missing=ignore_missing)
 
-    def get_flavor(self, flavor):
+    def get_flavor(self, flavor, raw=False):
         """Get a single flavor
 
         :param flavor: The value can be the ID of a flavor or a
                        :class:`~openstack.database.v1.flavor.Flavor` instance.
+        :param bool raw: When set to ``True``, return the decoded body of
+                         the response instead of a resource.
 
         :returns: One :class:`~openstack.database.v1.flavor.Flavor`
         :raises: :class:`~openstack.exceptions.ResourceNotFound`
                  when no resource can be found.
         """
-        return self._get(_flavor.Flavor, flavor)
+        return self._get(_flavor.Flavor, flavor, raw=raw)
 
     def flavors(self, **query):
         """Return a generator of flavors
@@ -187,18 +189,20 @@ class Proxy(proxy2.BaseProxy):
         return self._find(_instance.Instance, name_or_id,
                           ignore_missing=ignore_missing)
 
-    def get_instance(self, instance):
+    def get_instance(self, instance, raw=False):
         """Get a single instance
 
         :param instance: The value can be the ID of an instance or a
                          :class:`~openstack.database.v1.instance.Instance`
                          instance.
+        :param bool raw: When set to ``True``, return the decoded body of
+                         the response instead of a resource.
 
         :returns: One :class:`~openstack.database.v1.instance.Instance`
         :raises: :class:`~openstack.exceptions.ResourceNotFound`
                  when no resource can be found.
         """
-        return self._get(_instance.Instance, instance)
+        return self._get(_instance.Instance, instance, raw=raw)
 
     def instances(self, **query):
         """Return a generator of instances
@@ -0,0 +1,154 @@
+# Licensed under the Apache License, Version 2.0 (the "License"); you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+
+"""
+The :class:`~openstack.discovery_cache.DiscoveryCache` keeps what the
+:class:`~openstack.session.Session` discovered about the endpoints of
+the services, their versions or the lack of a version document, for a
+limited time. It may be kept in a file shared by the processes of a host
+so that they skip the discovery requests, including on a cold start::
+
+    cache = discovery_cache.DiscoveryCache("/var/cache/myapp/endpoints")
+    conn = connection.Connection(discovery_cache=cache, **auth_args)
+"""
+
+import json
+import logging
+import os
+import tempfile
+import threading
+import time
+
+_logger = logging.getLogger(__name__)
+
+#: Seconds an endpoint and its versions are kept by default.
+DEFAULT_TTL = 24 * 3600
+#: Seconds an endpoint without any version document is kept by default.
+DEFAULT_NEGATIVE_TTL = 600
+
+
+class DiscoveryCache(object):
+
+    def __init__(self, path=None, ttl=DEFAULT_TTL,
+                 negative_ttl=DEFAULT_NEGATIVE_TTL):
+        """Cache the results of the endpoint discovery
+
+        The entries are JSON values, ``None`` recording that nothing was
+        discovered. A cache may be shared by several sessions and threads.
+
+        :param str path: The file the entries are kept in, shared by the
+                         caches of all the processes using it. It is read
+                         again whenever another process changed it. The
+                         entries are only kept in memory without it.
+        :param ttl: The seconds after which the discovered entries expire.
+        :param negative_ttl: The seconds after which ``None`` entries
+                             expire, so that a service publishing its
+                             versions later gets discovered.
+        """
+        self.path = path
+        self.ttl = ttl
+        self.negative_ttl = negative_ttl
+        self._entries = {}
+        self._lock = threading.Lock()
+        self._loaded = None
+
+    def get(self, key):
+        """Return the value of an entry which has not expired
+
+        :param str key: The key of the entry.
+        :raises: ``KeyError`` when there is no such entry.
+        """
+        with self._lock:
+            self._load()
+            expires, value = self._entries[key]
+            if expires < time.time():
+                del self._entries[key]
+                raise KeyError(key)
+            return value
+
+    def set(self, key, value):
+        """Add or replace an entry, and save the file
+
+        :param str key: The key of the entry.
+        :param value: A value which can be encoded to JSON, or ``None``
+                      when nothing was discovered.
+        """
+        ttl = self.ttl if value is not None else self.negative_ttl
+        with self._lock:
+            self._load()
+            self._entries[key] = (time.time() + ttl, value)
+            self._save()
+
+    def clear(self):
+        """Remove all the entries, including from the file"""
+        with self._lock:
+            self._entries.clear()
+            self._loaded = None
+            if self.path is not None and os.path.exists(self.path):
+                os.remove(self.path)
+
+    def _stat(self):
+        try:
+            stat = os.stat(self.path)
+        except OSError:
+            return None
+        return stat.st_mtime, stat.st_size, stat.st_ino
+
+    def _load(self):
+        """Merge the entries of the file if it changed since last read"""
+        if self.path is None:
+            return
+        stat = self._stat()
+        if stat is None or stat == self._loaded:
+            return
+        try:
+            with open(self.path) as f:
+                entries = json.load(f)
+        except (IOError, OSError, ValueError) as e:
+            _logger.debug("Ignoring the discovery cache %s: %s",
+                          self.path, e)
+            return
+        self._loaded = stat
+        now = time.time()
+        for key, (expires, value) in entries.items():
+            if expires < now:
+                continue
+            current = self._entries.get(key)
+            if current is None or current[0] < expires:
+                self._entries[key] = (expires, value)
+
+    def _save(self):
+        """Replace the file by one with the entries of this cache
+
+        The file is written aside and renamed, so readers never see it
+        partially written. Entries saved meanwhile by another process
+        may be lost, their discovery is then only made again.
+        """
+        if self.path is None:
+            return
+        now = time.time()
+        entries = dict((key, entry) for key, entry in self._entries.items()
+                       if entry[0] >= now)
+        directory = os.path.dirname(os.path.abspath(self.path))
+        temp = None
+        try:
+            fd, temp = tempfile.mkstemp(dir=directory, prefix=".discovery")
+            with os.fdopen(fd, "w") as f:
+                json.dump(entries, f)
+            os.rename(temp, self.path)
+        except (IOError, OSError) as e:
+            _logger.warning("Unable to save the discovery cache %s: %s",
+                            self.path, e)
+            if temp is not None and os.path.exists(temp):
+                os.remove(temp)
+            return
+        self._loaded = self._stat()
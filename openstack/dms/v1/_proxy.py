@@ -33,15 +33,17 @@ class Proxy(proxy2.BaseProxy):
         """
         return self._list(_queue.Queue, paginated=False)
 
-    def get_queue(self, queue):
+    def get_queue(self, queue, raw=False):
         """Get detail about a given queue id
 
         :param queue: The queue id or an instance of
                       :class:`~openstack.dms.v1.queue.Queue`
+        :param bool raw: When set to ``True``, return the decoded body of
+                         the response instead of a resource.
         :returns: one object of class :class:`~openstack.dms.v1.queue.Queue`
         ::rtype: :class:`~openstack.dms.v1.queue.Queue`
         """
-        return self._get(_queue.Queue, queue)
+        return self._get(_queue.Queue, queue, raw=raw)
 
     def delete_queue(self, queue, ignore_missing=True):
         """Delete queue
@@ -45,15 +45,17 @@ class Proxy(proxy2.BaseProxy):
         """
         return self._create(_zone.Zone, prepend_key=False, **attrs)
 
-    def get_zone(self, zone):
+    def get_zone(self, zone, raw=False):
         """Get a zone
 
         :param zone: The value can be the ID of a zone
              or a :class:`~openstack.dns.v2.zone.Zone` instance.
+        :param bool raw: When set to ``True``, return the decoded body of
+                         the response instead of a resource.
         :returns: Zone instance
         :rtype: :class:`~openstack.dns.v2.zone.Zone`
         """
-        return self._get(_zone.Zone, zone)
+        return self._get(_zone.Zone, zone, raw=raw)
 
     def delete_zone(self, zone, ignore_missing=True):
         """Delete a zone
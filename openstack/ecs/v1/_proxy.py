@@ -10,6 +10,7 @@
 # License for the specific language governing permissions and limitations
 # under the License.
 from openstack import proxy2
+from openstack.ecs.v1 import job as _job
 from openstack.ecs.v1 import server as _server
 from openstack.ecs.v1 import server_ext as _server_ext
 
@@ -80,3 +81,14 @@ class Proxy(proxy2.BaseProxy):
         :return: :class:`~openstack.ecs.v1.server.ServerAction`
         """
         return self._create(_server.DeleteServer, **data)
+
+    def get_job(self, job, raw=False):
+        """Get an asynchronous job
+
+        :param job: Either the ID of a job or an instance of
+                    :class:`~openstack.ecs.v1.job.Job`
+        :param bool raw: When set to ``True``, return the decoded body of
+                         the response instead of a resource.
+        :returns: A :class:`~openstack.ecs.v1.job.Job`
+        """
+        return self._get(_job.Job, job, raw=raw)
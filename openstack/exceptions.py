@@ -112,6 +112,19 @@ class ResourceFailure(SDKException):
     pass
 
 
+class JobFailure(ResourceFailure):
+    """An asynchronous job failed."""
+    def __init__(self, job, error_code=None, fail_reason=None):
+        self.job = job
+        self.error_code = error_code
+        self.fail_reason = fail_reason
+        message = "Job %s failed" % job.id
+        if error_code or fail_reason:
+            message = "%s: %s %s" % (message, error_code or "",
+                                     fail_reason or "")
+        super(JobFailure, self).__init__(message.strip())
+
+
 code_key_list = ["code", "errorCode", "errCode"]
 message_ley_list = ["message", "error_message", "externalMessage", "details",
                     "NeutronError", "computeFault", "TackerError"]
@@ -191,3 +204,7 @@ def from_exception(exc):
         return cls(details=details, message=exc.message, response=exc.response,
                    request_id=exc.request_id, url=exc.url, method=exc.method,
                    http_status=exc.http_status, cause=exc)
+
+    return cls(details=details, message=exc.message, response=exc.response,
+               request_id=exc.request_id, url=exc.url, method=exc.method,
+               http_status=exc.http_status, cause=exc)
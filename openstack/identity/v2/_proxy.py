@@ -27,18 +27,20 @@ class Proxy(proxy.BaseProxy):
         """
         return self._list(_extension.Extension, paginated=False)
 
-    def get_extension(self, extension):
+    def get_extension(self, extension, raw=False):
         """Get a single extension
 
         :param extension: The value can be the ID of an extension or a
                           :class:`~openstack.identity.v2.extension.Extension`
                           instance.
+        :param bool raw: When set to ``True``, return the decoded body of
+                         the response instead of a resource.
 
         :returns: One :class:`~openstack.identity.v2.extension.Extension`
         :raises: :class:`~openstack.exceptions.ResourceNotFound`
                  when no extension can be found.
         """
-        return self._get(_extension.Extension, extension)
+        return self._get(_extension.Extension, extension, raw=raw)
 
     def create_role(self, **attrs):
         """Create a new role from attributes
@@ -81,17 +83,19 @@ class Proxy(proxy.BaseProxy):
         return self._find(_role.Role, name_or_id,
                           ignore_missing=ignore_missing)
 
-    def get_role(self, role):
+    def get_role(self, role, raw=False):
         """Get a single role
 
         :param role: The value can be the ID of a role or a
                      :class:`~openstack.identity.v2.role.Role` instance.
+        :param bool raw: When set to ``True``, return the decoded body of
+                         the response instead of a resource.
 
         :returns: One :class:`~openstack.identity.v2.role.Role`
         :raises: :class:`~openstack.exceptions.ResourceNotFound`
                  when no resource can be found.
         """
-        return self._get(_role.Role, role)
+        return self._get(_role.Role, role, raw=raw)
 
     def roles(self, **query):
         """Retrieve a generator of roles
@@ -158,17 +162,19 @@ class Proxy(proxy.BaseProxy):
         return self._find(_tenant.Tenant, name_or_id,
                           ignore_missing=ignore_missing)
 
-    def get_tenant(self, tenant):
+    def get_tenant(self, tenant, raw=False):
         """Get a single tenant
 
         :param tenant: The value can be the ID of a tenant or a
                        :class:`~openstack.identity.v2.tenant.Tenant` instance.
+        :param bool raw: When set to ``True``, return the decoded body of
+                         the response instead of a resource.
 
         :returns: One :class:`~openstack.identity.v2.tenant.Tenant`
         :raises: :class:`~openstack.exceptions.ResourceNotFound`
                  when no resource can be found.
         """
-        return self._get(_tenant.Tenant, tenant)
+        return self._get(_tenant.Tenant, tenant, raw=raw)
 
     def tenants(self, **query):
         """Retrieve a generator of tenants
@@ -235,17 +241,19 @@ class Proxy(proxy.BaseProxy):
         return self._find(_user.User, name_or_id,
                           ignore_missing=ignore_missing)
 
-    def get_user(self, user):
+    def get_user(self, user, raw=False):
         """Get a single user
 
         :param user: The value can be the ID of a user or a
                      :class:`~openstack.identity.v2.user.User` instance.
+        :param bool raw: When set to ``True``, return the decoded body of
+                         the response instead of a resource.
 
         :returns: One :class:`~openstack.identity.v2.user.User`
         :raises: :class:`~openstack.exceptions.ResourceNotFound`
                  when no resource can be found.
         """
-        return self._get(_user.User, user)
+        return self._get(_user.User, user, raw=raw)
 
     def users(self, **query):
         """Retrieve a generator of users
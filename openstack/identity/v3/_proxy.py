@@ -79,17 +79,19 @@ class Proxy(proxy.BaseProxy):
         return self._find(_credential.Credential, name_or_id,
                           ignore_missing=ignore_missing)
 
-    def get_credential(self, credential):
+    def get_credential(self, credential, raw=False):
         """Get a single credential
 
         :param credential: The value can be the ID of a credential or a
             :class:`~openstack.identity.v3.credential.Credential` instance.
+        :param bool raw: When set to ``True``, return the decoded body of
+                         the response instead of a resource.
 
         :returns: One :class:`~openstack.identity.v3.credential.Credential`
         :raises: :class:`~openstack.exceptions.ResourceNotFound`
                  when no resource can be found.
         """
-        return self._get(_credential.Credential, credential)
+        return self._get(_credential.Credential, credential, raw=raw)
 
     def credentials(self, **query):
         """Retrieve a generator of credentials
@@ -157,17 +159,19 @@ class Proxy(proxy.BaseProxy):
         return self._find(_domain.Domain, name_or_id,
                           ignore_missing=ignore_missing)
 
-    def get_domain(self, domain):
+    def get_domain(self, domain, raw=False):
         """Get a single domain
 
         :param domain: The value can be the ID of a domain or a
                        :class:`~openstack.identity.v3.domain.Domain` instance.
+        :param bool raw: When set to ``True``, return the decoded body of
+                         the response instead of a resource.
 
         :returns: One :class:`~openstack.identity.v3.domain.Domain`
         :raises: :class:`~openstack.exceptions.ResourceNotFound`
                  when no resource can be found.
         """
-        return self._get(_domain.Domain, domain)
+        return self._get(_domain.Domain, domain, raw=raw)
 
     def domains(self, **query):
         """Retrieve a generator of domains
@@ -236,18 +240,20 @@ class Proxy(proxy.BaseProxy):
         return self._find(_endpoint.Endpoint, name_or_id,
                           ignore_missing=ignore_missing)
 
-    def get_endpoint(self, endpoint):
+    def get_endpoint(self, endpoint, raw=False):
         """Get a single endpoint
 
         :param endpoint: The value can be the ID of an endpoint or a
                          :class:`~openstack.identity.v3.endpoint.Endpoint`
                          instance.
+        :param bool raw: When set to ``True``, return the decoded body of
+                         the response instead of a resource.
 
         :returns: One :class:`~openstack.identity.v3.endpoint.Endpoint`
         :raises: :class:`~openstack.exceptions.ResourceNotFound`
                  when no resource can be found.
         """
-        return self._get(_endpoint.Endpoint, endpoint)
+        return self._get(_endpoint.Endpoint, endpoint, raw=raw)
 
     def endpoints(self, **query):
         """Retrieve a generator of endpoints
@@ -316,18 +322,20 @@ class Proxy(proxy.BaseProxy):
         return self._find(_group.Group, name_or_id,
                           ignore_missing=ignore_missing)
 
-    def get_group(self, group):
+    def get_group(self, group, raw=False):
         """Get a single group
 
         :param group: The value can be the ID of a group or a
                       :class:`~openstack.identity.v3.group.Group`
                       instance.
+        :param bool raw: When set to ``True``, return the decoded body of
+                         the response instead of a resource.
 
         :returns: One :class:`~openstack.identity.v3.group.Group`
         :raises: :class:`~openstack.exceptions.ResourceNotFound`
                  when no resource can be found.
         """
-        return self._get(_group.Group, group)
+        return self._get(_group.Group, group, raw=raw)
 
     def groups(self, **query):
         """Retrieve a generator of groups
@@ -395,17 +403,19 @@ class Proxy(proxy.BaseProxy):
         return self._find(_policy.Policy, name_or_id,
                           ignore_missing=ignore_missing)
 
-    def get_policy(self, policy):
+    def get_policy(self, policy, raw=False):
         """Get a single policy
 
         :param policy: The value can be the ID of a policy or a
                        :class:`~openstack.identity.v3.policy.Policy` instance.
+        :param bool raw: When set to ``True``, return the decoded body of
+                         the response instead of a resource.
 
         :returns: One :class:`~openstack.identity.v3.policy.Policy`
         :raises: :class:`~openstack.exceptions.ResourceNotFound`
                  when no resource can be found.
         """
-        return self._get(_policy.Policy, policy)
+        return self._get(_policy.Policy, policy, raw=raw)
 
     def policies(self, **query):
         """Retrieve a generator of policies
@@ -473,17 +483,19 @@ class Proxy(proxy.BaseProxy):
         return self._find(_project.Project, name_or_id,
                           ignore_missing=ignore_missing)
 
-    def get_project(self, project):
+    def get_project(self, project, raw=False):
         """Get a single project
 
         :param project: The value can be the ID of a project or a
             :class:`~openstack.identity.v3.project.Project` instance.
+        :param bool raw: When set to ``True``, return the decoded body of
+                         the response instead of a resource.
 
         :returns: One :class:`~openstack.identity.v3.project.Project`
         :raises: :class:`~openstack.exceptions.ResourceNotFound`
                  when no resource can be found.
         """
-        return self._get(_project.Project, project)
+        return self._get(_project.Project, project, raw=raw)
 
     def projects(self, **query):
         """Retrieve a generator of projects
@@ -551,17 +563,19 @@ class Proxy(proxy.BaseProxy):
         return self._find(_service.Service, name_or_id,
                           ignore_missing=ignore_missing)
 
-    def get_service(self, service):
+    def get_service(self, service, raw=False):
         """Get a single service
 
         :param service: The value can be the ID of a service or a
             :class:`~openstack.identity.v3.service.Service` instance.
+        :param bool raw: When set to ``True``, return the decoded body of
+                         the response instead of a resource.
 
         :returns: One :class:`~openstack.identity.v3.service.Service`
         :raises: :class:`~openstack.exceptions.ResourceNotFound`
                  when no resource can be found.
         """
-        return self._get(_service.Service, service)
+        return self._get(_service.Service, service, raw=raw)
 
     def services(self, **query):
         """Retrieve a generator of services
@@ -629,17 +643,19 @@ class Proxy(proxy.BaseProxy):
         return self._find(_user.User, name_or_id,
                           ignore_missing=ignore_missing)
 
-    def get_user(self, user):
+    def get_user(self, user, raw=False):
         """Get a single user
 
         :param user: The value can be the ID of a user or a
                      :class:`~openstack.identity.v3.user.User` instance.
+        :param bool raw: When set to ``True``, return the decoded body of
+                         the response instead of a resource.
 
         :returns: One :class:`~openstack.identity.v3.user.User`
         :raises: :class:`~openstack.exceptions.ResourceNotFound`
                  when no resource can be found.
         """
-        return self._get(_user.User, user)
+        return self._get(_user.User, user, raw=raw)
 
     def users(self, **query):
         """Retrieve a generator of users
@@ -707,17 +723,19 @@ class Proxy(proxy.BaseProxy):
         return self._find(_trust.Trust, name_or_id,
                           ignore_missing=ignore_missing)
 
-    def get_trust(self, trust):
+    def get_trust(self, trust, raw=False):
         """Get a single trust
 
         :param trust: The value can be the ID of a trust or a
                       :class:`~openstack.identity.v3.trust.Trust` instance.
+        :param bool raw: When set to ``True``, return the decoded body of
+                         the response instead of a resource.
 
         :returns: One :class:`~openstack.identity.v3.trust.Trust`
         :raises: :class:`~openstack.exceptions.ResourceNotFound`
                  when no resource can be found.
         """
-        return self._get(_trust.Trust, trust)
+        return self._get(_trust.Trust, trust, raw=raw)
 
     def trusts(self, **query):
         """Retrieve a generator of trusts
@@ -772,17 +790,19 @@ class Proxy(proxy.BaseProxy):
         return self._find(_region.Region, name_or_id,
                           ignore_missing=ignore_missing)
 
-    def get_region(self, region):
+    def get_region(self, region, raw=False):
         """Get a single region
 
         :param region: The value can be the ID of a region or a
                        :class:`~openstack.identity.v3.region.Region` instance.
+        :param bool raw: When set to ``True``, return the decoded body of
+                         the response instead of a resource.
 
         :returns: One :class:`~openstack.identity.v3.region.Region`
         :raises: :class:`~openstack.exceptions.ResourceNotFound`
                  when no matching region can be found.
         """
-        return self._get(_region.Region, region)
+        return self._get(_region.Region, region, raw=raw)
 
     def regions(self, **query):
         """Retrieve a generator of regions
@@ -850,17 +870,19 @@ class Proxy(proxy.BaseProxy):
         return self._find(_role.Role, name_or_id,
                           ignore_missing=ignore_missing)
 
-    def get_role(self, role):
+    def get_role(self, role, raw=False):
         """Get a single role
 
         :param role: The value can be the ID of a role or a
                        :class:`~openstack.identity.v3.role.Role` instance.
+        :param bool raw: When set to ``True``, return the decoded body of
+                         the response instead of a resource.
 
         :returns: One :class:`~openstack.identity.v3.role.Role`
         :raises: :class:`~openstack.exceptions.ResourceNotFound`
                  when no matching role can be found.
         """
-        return self._get(_role.Role, role)
+        return self._get(_role.Role, role, raw=raw)
 
     def roles(self, **query):
         """Retrieve a generator of roles
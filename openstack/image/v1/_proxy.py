@@ -57,17 +57,19 @@ class Proxy(proxy.BaseProxy):
         return self._find(_image.Image, name_or_id,
                           ignore_missing=ignore_missing)
 
-    def get_image(self, image):
+    def get_image(self, image, raw=False):
         """Get a single image
 
         :param image: The value can be the ID of an image or a
                       :class:`~openstack.image.v1.image.Image` instance.
+        :param bool raw: When set to ``True``, return the decoded body of
+                         the response instead of a resource.
 
         :returns: One :class:`~openstack.image.v1.image.Image`
         :raises: :class:`~openstack.exceptions.ResourceNotFound`
                  when no resource can be found.
         """
-        return self._get(_image.Image, image)
+        return self._get(_image.Image, image, raw=raw)
 
     def images(self, **query):
         """Return a generator of images
@@ -20,7 +20,7 @@ from openstack import resource2
 class Proxy(proxy2.BaseProxy):
 
     def upload_image(self, container_format=None, disk_format=None,
-                     data=None, **attrs):
+                     data=None, filename=None, **attrs):
         """Upload a new image from attributes
 
         :param container_format: Format of the container.
@@ -29,6 +29,10 @@ class Proxy(proxy2.BaseProxy):
         :param disk_format: The format of the disk. A valid value is ami,
                             ari, aki, vhd, vmdk, raw, qcow2, vdi, or iso.
         :param data: The data to be uploaded as an image.
+        :param str filename: The path of a file to upload as the image
+                             instead of ``data``. It is sent as it is read
+                             and its checksum is compared to the one of
+                             the image once uploaded.
         :param dict attrs: Keyword arguments which will be used to create
                            a :class:`~openstack.image.v2.image.Image`,
                            comprised of the properties on the Image class.
@@ -55,12 +59,18 @@ class Proxy(proxy2.BaseProxy):
         # self._create, especially because the upload_image call doesn't
         # return anything anyway. Otherwise this blocks while uploading
         # significant amounts of image data.
+        if filename is not None:
+            img.upload_file(self._session, filename)
+            return img
+
         img.data = data
         img.upload(self._session)
 
         return img
 
-    def download_image(self, image, stream=False):
+    def download_image(self, image, stream=False, path=None,
+                       chunk_size=_image.DEFAULT_CHUNK_SIZE, workers=1,
+                       range_size=_image.DEFAULT_RANGE_SIZE):
         """Download an image
 
         This will download an image to memory when ``stream=False``, or allow
@@ -69,6 +79,11 @@ class Proxy(proxy2.BaseProxy):
         :ref:`download_image-stream-true` and the Requests documentation
         :ref:`body-content-workflow`.
 
+        With a ``path``, the image is written to that file as it is
+        received and its checksum verified along the way, so that the
+        memory used does not depend on the size of the image. See
+        :meth:`~openstack.image.v2.image.Image.download_file`.
+
         :param image: The value can be either the ID of an image or a
                       :class:`~openstack.image.v2.image.Image` instance.
 
@@ -86,13 +101,26 @@ class Proxy(proxy2.BaseProxy):
 
                             When ``False``, return the entire
                             contents of the response.
+        :param str path: The file to write the image to, ``stream`` being
+                         ignored.
+        :param int chunk_size: The size of the chunks written, with a
+                               ``path``.
+        :param int workers: The number of concurrent range requests the
+                            image is downloaded with, with a ``path``.
+        :param int range_size: The size of the ranges, with several
+                               ``workers``.
 
         :returns: The bytes comprising the given Image when stream is
                   False, otherwise a :class:`requests.Response`
-                  instance.
+                  instance. ``None`` with a ``path``.
         """
 
         image = self._get_resource(_image.Image, image)
+        if path is not None:
+            return image.download_file(self._session, path,
+                                       chunk_size=chunk_size,
+                                       workers=workers,
+                                       range_size=range_size)
         return image.download(self._session, stream=stream)
 
     def delete_image(self, image, ignore_missing=True):
@@ -124,17 +152,19 @@ class Proxy(proxy2.BaseProxy):
         return self._find(_image.Image, name_or_id,
                           ignore_missing=ignore_missing)
 
-    def get_image(self, image):
+    def get_image(self, image, raw=False):
         """Get a single image
 
         :param image: The value can be the ID of a image or a
                       :class:`~openstack.image.v2.image.Image` instance.
+        :param bool raw: When set to ``True``, return the decoded body of
+                         the response instead of a resource.
 
         :returns: One :class:`~openstack.image.v2.image.Image`
         :raises: :class:`~openstack.exceptions.ResourceNotFound`
                  when no resource can be found.
         """
-        return self._get(_image.Image, image)
+        return self._get(_image.Image, image, raw=raw)
 
     def images(self, **query):
         """Return a generator of images
@@ -12,6 +12,7 @@
 
 import hashlib
 import logging
+import os
 
 import jsonpatch
 
@@ -22,6 +23,48 @@ from openstack import utils
 
 _logger = logging.getLogger(__name__)
 
+#: The size of the chunks an image is read and written in by default.
+DEFAULT_CHUNK_SIZE = 64 * 1024
+#: The size of the ranges an image is split in for parallel downloads.
+DEFAULT_RANGE_SIZE = 32 * 1024 * 1024
+
+
+class _HashingFile(object):
+    """A file computing the MD5 checksum of the content read from it
+
+    Seeking back, as the sessions do after hashing a body to sign it or
+    before retrying a request, computes the checksum again from the
+    position the file was at first.
+    """
+
+    def __init__(self, fileobj):
+        self._file = fileobj
+        self._start = fileobj.tell()
+        self.digest = hashlib.md5()
+
+    def read(self, size=-1):
+        chunk = self._file.read(size)
+        self.digest.update(chunk)
+        return chunk
+
+    def tell(self):
+        return self._file.tell()
+
+    def seek(self, offset, whence=os.SEEK_SET):
+        self._file.seek(offset, whence)
+        position = self._file.tell()
+        self._file.seek(self._start)
+        self.digest = hashlib.md5()
+        while self._file.tell() < position:
+            # past the end, the position is left at the end of the file
+            if not self.read(min(DEFAULT_CHUNK_SIZE,
+                                 position - self._file.tell())):
+                break
+
+    def __getattr__(self, name):
+        # the mode, fileno and name the requests use to find the size
+        return getattr(self._file, name)
+
 
 class Image(resource2.Resource):
     resources_key = 'images'
@@ -263,6 +306,103 @@ class Image(resource2.Resource):
                              "Accept": ""},
                     endpoint_override = endpoint_override)
 
+    def upload_file(self, session, filename):
+        """Upload the content of a file into an existing image
+
+        The file is sent as it is read, and its MD5 checksum computed along
+        the way is compared to the ``checksum`` of the image once uploaded.
+
+        :param session: The session to use for making this request.
+        :param str filename: The path of the file.
+
+        :raises: :class:`~openstack.exceptions.InvalidResponse` when the
+                 checksum of the image is not the one of the file.
+        """
+        url = utils.urljoin(self.base_path, self.id, 'file')
+        endpoint_override = self.service.get_endpoint_override()
+        with open(filename, "rb") as data:
+            hashing = _HashingFile(data)
+            session.put(url, endpoint_filter=self.service, data=hashing,
+                        headers={"Content-Type": "application/octet-stream",
+                                 "Accept": ""},
+                        endpoint_override=endpoint_override)
+        self.get(session)
+        self._verify_checksum(self.checksum, hashing.digest.hexdigest())
+
+    def _verify_checksum(self, checksum, digest):
+        if checksum is not None:
+            if digest != checksum:
+                raise exceptions.InvalidResponse(
+                    "checksum mismatch: %s != %s" % (checksum, digest))
+        else:
+            _logger.warn(
+                "Unable to verify the integrity of image %s" % (self.id))
+
+    def download_file(self, session, path, chunk_size=DEFAULT_CHUNK_SIZE,
+                      workers=1, range_size=DEFAULT_RANGE_SIZE):
+        """Download the data contained in an image to a file
+
+        The data is written as it is received, one chunk at a time, and
+        its MD5 checksum computed along the way is compared to the
+        checksum of the image. With several ``workers``, an image larger
+        than ``range_size`` is downloaded with as many concurrent range
+        requests, see :func:`~openstack.utils.download_ranges`. When the
+        first range is answered with the whole data, as Glance does for
+        the stores it cannot read ranges from, that response is saved
+        instead.
+
+        :param session: The session to use for making this request.
+        :param str path: The file to write, replaced if it exists.
+        :param int chunk_size: The size of the chunks read and written.
+        :param int workers: The number of ranges downloaded at once.
+        :param int range_size: The size of the ranges, with several
+                               ``workers``.
+
+        :raises: :class:`~openstack.exceptions.InvalidResponse` when the
+                 data does not match the checksum of the image.
+        """
+        url = utils.urljoin(self.base_path, self.id, 'file')
+        endpoint_override = self.service.get_endpoint_override()
+
+        def get_range(start, end):
+            return session.get(url, endpoint_filter=self.service,
+                               stream=True,
+                               headers={"Range": "bytes=%d-%d" % (start,
+                                                                  end)},
+                               endpoint_override=endpoint_override)
+
+        digest = hashlib.md5()
+        resp = None
+        if workers > 1:
+            self.get(session)
+            if self.size and self.size > range_size:
+                resp = get_range(0, range_size - 1)
+                if resp.status_code != 200:
+                    first = {0: resp}
+
+                    def get_ranges(start, end):
+                        if start in first:
+                            return first.pop(start)
+                        return get_range(start, end)
+
+                    utils.download_ranges(get_ranges, path, self.size,
+                                          range_size, workers, chunk_size,
+                                          digest)
+                    self._verify_checksum(self.checksum, digest.hexdigest())
+                    return
+
+        if resp is None:
+            resp = session.get(url, endpoint_filter=self.service,
+                               stream=True,
+                               endpoint_override=endpoint_override)
+        utils.save_response(resp, path, chunk_size, digest)
+        # See the bug report in download about the second GET call.
+        checksum = resp.headers.get("Content-MD5")
+        if checksum is None:
+            checksum = (self.checksum if workers > 1
+                        else self.get(session).checksum)
+        self._verify_checksum(checksum, digest.hexdigest())
+
     def download(self, session, stream=False):
         """Download the data contained in an image"""
         # TODO(briancurtin): This method should probably offload the get
@@ -292,14 +432,10 @@ class Image(resource2.Resource):
             resp.headers['content-md5'] = checksum
             return resp
 
+        digest = None
         if checksum is not None:
             digest = hashlib.md5(resp.content).hexdigest()
-            if digest != checksum:
-                raise exceptions.InvalidResponse(
-                    "checksum mismatch: %s != %s" % (checksum, digest))
-        else:
-            _logger.warn(
-                "Unable to verify the integrity of image %s" % (self.id))
+        self._verify_checksum(checksum, digest)
 
         return resp.content
 
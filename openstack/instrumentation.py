@@ -0,0 +1,422 @@
+# Licensed under the Apache License, Version 2.0 (the "License"); you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+
+"""
+Instruments observe the requests sent by the sessions. They are notified
+before each request, after its response or error, and once its body was
+decoded, with a :class:`~openstack.instrumentation.RequestInfo` about the
+request::
+
+    metrics = instrumentation.LatencyAggregator()
+    conn = connection.Connection(instruments=[metrics], **auth_args)
+    ...
+    print(metrics.report())
+
+The :class:`~openstack.instrumentation.LatencyAggregator` keeps the
+latencies of the requests per service, method and URL template.
+"""
+
+import collections
+import contextlib
+import datetime
+import logging
+import re
+import threading
+import time
+
+import six
+from six.moves.urllib import parse
+
+_logger = logging.getLogger(__name__)
+
+# path segments which identify a resource rather than a collection
+_ID_PATTERN = re.compile(
+    r"^([0-9a-fA-F]{8}-?[0-9a-fA-F]{4}-?[0-9a-fA-F]{4}-?[0-9a-fA-F]{4}-?"
+    r"[0-9a-fA-F]{12}|[0-9a-fA-F]{16,}|[0-9]+|(?=.*[0-9])[\w-]{24,})$")
+
+
+def url_template(url, project_id=None):
+    """Return the path of a URL with its ids replaced by placeholders
+
+    Requests to different resources of the same kind then share their
+    template, e.g. ``/v2/{project_id}/servers/{id}``.
+    """
+    path = parse.urlsplit(url).path
+    segments = []
+    for segment in path.split("/"):
+        if project_id and segment == project_id:
+            segment = "{project_id}"
+        elif _ID_PATTERN.match(segment):
+            segment = "{id}"
+        segments.append(segment)
+    return "/".join(segments)
+
+
+def _length(data):
+    if data is None:
+        return 0
+    if isinstance(data, six.text_type):
+        return len(data.encode("utf-8"))
+    if isinstance(data, (six.binary_type, bytearray)):
+        return len(data)
+    return None
+
+
+class RequestInfo(object):
+    """What is known about a request, filled as it goes
+
+    :ivar service_type: The type of the service requested, if known.
+    :ivar method: The HTTP method.
+    :ivar url: The URL requested.
+    :ivar url_template: The path of the URL with the ids replaced, see
+                        :func:`url_template`.
+    :ivar status: The status of the response, None before it or when the
+                  request failed without any.
+    :ivar bytes_out: The size of the body sent, None when it was streamed
+                     from a file or an iterator.
+    :ivar bytes_in: The size of the body received, None when it is
+                    streamed and of unknown length.
+    :ivar retries: The number of times the request was retried.
+    :ivar timings: A dict of the seconds spent in the steps of the
+                   request: ``sign`` to resolve and sign it, ``send`` until
+                   the headers of the response were received, ``transfer``
+                   to then receive its body and ``decode`` to decode it.
+    :ivar last_decode: The seconds spent in the last decoding of the body,
+                       which may be decoded several times.
+    :ivar elapsed: The seconds from the start of the request until its
+                   response or error.
+    :ivar error: The exception the request failed with.
+    """
+
+    def __init__(self, instruments, service_type, method, url,
+                 project_id=None):
+        self.instruments = instruments
+        self.service_type = service_type
+        self.method = method
+        self.url = url
+        self.project_id = project_id
+        self.url_template = url_template(url, project_id)
+        self.status = None
+        self.bytes_out = None
+        self.bytes_in = None
+        self.retries = 0
+        self.timings = {}
+        self.last_decode = None
+        self.elapsed = None
+        self.error = None
+        self.started = time.time()
+
+    def __repr__(self):
+        return "<RequestInfo %s %s %s %s>" % (
+            self.service_type, self.method, self.url_template, self.status)
+
+    @contextlib.contextmanager
+    def timed(self, step):
+        """Add the time spent in the block to a step of :attr:`timings`"""
+        started = time.time()
+        try:
+            yield
+        finally:
+            self.timings[step] = (self.timings.get(step, 0) +
+                                  time.time() - started)
+
+    def notify(self, hook):
+        for instrument in self.instruments:
+            try:
+                getattr(instrument, hook)(self)
+            except Exception:
+                _logger.exception("Instrument %r failed in %s",
+                                  instrument, hook)
+
+
+def begin(instruments, endpoint_filter, method, url, project_id=None,
+          started=None):
+    """Start observing a request, notifying ``before_request``
+
+    :param started: When the request started, if before now.
+    :returns: The :class:`RequestInfo` of the request, or None when there
+              are no instruments.
+    """
+    if not instruments:
+        return None
+    service_type = getattr(endpoint_filter, "service_type", None)
+    if service_type is None and endpoint_filter:
+        service_type = endpoint_filter.get("service_type")
+    info = RequestInfo(instruments, service_type, method, url, project_id)
+    if started is not None:
+        info.started = started
+    info.notify("before_request")
+    return info
+
+
+@contextlib.contextmanager
+def timed(info, step):
+    """Time a step of a request in the block, if it is observed"""
+    if info is None:
+        yield
+        return
+    with info.timed(step):
+        yield
+
+
+def succeeded(info, response, data=None, stream=False):
+    """Record the response of a request, notifying ``after_response``"""
+    if info is None:
+        return
+    info.elapsed = time.time() - info.started
+    info.status = response.status_code
+    # the body actually sent, e.g. encoded from json
+    body = getattr(getattr(response, "request", None), "body", None)
+    info.bytes_out = _length(data if body is None else body)
+    length = response.headers.get("content-length")
+    if not stream:
+        info.bytes_in = len(response.content or b"")
+    elif length and length.isdigit():
+        info.bytes_in = int(length)
+    elapsed = getattr(response, "elapsed", None)
+    if isinstance(elapsed, datetime.timedelta) and "send" in info.timings:
+        # requests measures the time until the headers were parsed
+        send = min(elapsed.total_seconds(), info.timings["send"])
+        info.timings["transfer"] = info.timings["send"] - send
+        info.timings["send"] = send
+    response.request_info = info
+    decode = response.json
+
+    def json(**kwargs):
+        with decoding(response):
+            return decode(**kwargs)
+
+    response.json = json
+    info.notify("after_response")
+
+
+def failed(info, error, data=None):
+    """Record the error of a request, notifying ``on_error``"""
+    if info is None:
+        return
+    info.elapsed = time.time() - info.started
+    info.error = error
+    info.bytes_out = _length(data)
+    info.notify("on_error")
+
+
+@contextlib.contextmanager
+def decoding(response):
+    """Time the decoding of the body of a response in the block
+
+    It is added to the ``decode`` timing of the request, and notified to
+    ``after_decode``, when the request was observed.
+    """
+    info = getattr(response, "request_info", None)
+    if info is None:
+        yield
+        return
+    started = time.time()
+    yield
+    info.last_decode = time.time() - started
+    info.timings["decode"] = info.timings.get("decode", 0) + info.last_decode
+    info.notify("after_decode")
+
+
+class Instrument(object):
+    """The hooks of an instrument, which all do nothing here
+
+    Subclasses override the hooks they need. They are called in the
+    thread sending the request, the exceptions they raise are logged and
+    ignored.
+    """
+
+    def before_request(self, info):
+        """Called before the request is signed and sent"""
+
+    def after_response(self, info):
+        """Called once the response was received, whatever its status"""
+
+    def on_error(self, info):
+        """Called when no response was received, its ``error`` is set"""
+
+    def after_decode(self, info):
+        """Called once the body of the response was decoded"""
+
+
+class Histogram(object):
+
+    def __init__(self, precision=7):
+        """Count values in buckets of bounded relative width
+
+        Like an HDR histogram, the values are counted in buckets whose
+        width is proportional to their magnitude, so the percentiles are
+        known within a relative error of ``2 ** -precision`` (under 1% by
+        default) whatever the range of the values, in little memory.
+
+        :param int precision: The number of significant bits of the
+                              bucket of a value.
+        """
+        self.precision = precision
+        self.buckets = collections.Counter()
+        self.count = 0
+        self.total = 0.0
+        self.min = None
+        self.max = None
+
+    def _bucket(self, micros):
+        shift = max(micros.bit_length() - self.precision, 0)
+        return (micros >> shift) << shift, shift
+
+    def record(self, seconds):
+        """Count a value, in seconds with a microsecond resolution"""
+        self.buckets[self._bucket(int(seconds * 1e6))] += 1
+        self.count += 1
+        self.total += seconds
+        self.min = seconds if self.min is None else min(self.min, seconds)
+        self.max = seconds if self.max is None else max(self.max, seconds)
+
+    def merge(self, other):
+        """Count the values of another histogram of the same precision"""
+        self.buckets.update(other.buckets)
+        self.count += other.count
+        self.total += other.total
+        for value in (other.min, other.max):
+            if value is not None:
+                self.min = value if self.min is None else min(self.min, value)
+                self.max = value if self.max is None else max(self.max, value)
+
+    @property
+    def mean(self):
+        return self.total / self.count if self.count else None
+
+    def percentile(self, percent):
+        """Return a value, in seconds, which ``percent`` of them are under
+
+        :returns: The middle of the bucket of that value, or None when
+                  nothing was counted.
+        """
+        if not self.count:
+            return None
+        rank = max(percent / 100.0 * self.count, 1)
+        seen = 0
+        for (low, shift), count in sorted(self.buckets.items()):
+            seen += count
+            if seen >= rank:
+                middle = low + ((1 << shift) - 1) / 2.0
+                return min(max(middle / 1e6, self.min), self.max)
+        return self.max
+
+
+class _Stats(object):
+
+    def __init__(self):
+        self.latency = Histogram()
+        self.errors = 0
+        self.statuses = collections.Counter()
+        self.bytes_in = 0
+        self.bytes_out = 0
+        self.retries = 0
+        self.timings = collections.Counter()
+
+    def summary(self):
+        result = {
+            "count": self.latency.count,
+            "errors": self.errors,
+            "statuses": dict(self.statuses),
+            "bytes_in": self.bytes_in,
+            "bytes_out": self.bytes_out,
+            "retries": self.retries,
+            "timings": dict(self.timings),
+            "total": self.latency.total,
+            "mean": self.latency.mean,
+            "max": self.latency.max,
+        }
+        for percent in (50, 90, 99):
+            result["p%d" % percent] = self.latency.percentile(percent)
+        return result
+
+
+class LatencyAggregator(Instrument):
+
+    def __init__(self):
+        """Aggregate the latencies and counters of the requests in memory
+
+        The requests are grouped by service type, method and URL template.
+        An aggregator may be shared by several sessions and threads.
+        """
+        self._lock = threading.Lock()
+        self._stats = collections.defaultdict(_Stats)
+
+    def _record(self, info):
+        with self._lock:
+            stats = self._stats[(info.service_type, info.method,
+                                 info.url_template)]
+            stats.latency.record(info.elapsed)
+            if info.status is not None:
+                stats.statuses[info.status] += 1
+            if info.error is not None or (info.status or 0) >= 400:
+                stats.errors += 1
+            stats.bytes_in += info.bytes_in or 0
+            stats.bytes_out += info.bytes_out or 0
+            stats.retries += info.retries
+            stats.timings.update(dict((step, seconds) for step, seconds
+                                      in info.timings.items()
+                                      if step != "decode"))
+
+    after_response = _record
+    on_error = _record
+
+    def after_decode(self, info):
+        with self._lock:
+            stats = self._stats[(info.service_type, info.method,
+                                 info.url_template)]
+            stats.timings["decode"] += info.last_decode
+
+    def stats(self, service_type=None):
+        """Return the summaries of the requests
+
+        :param service_type: Only return the requests of this service.
+        :returns: A dict mapping tuples of service type, method and URL
+                  template to dicts of ``count``, ``errors``, ``statuses``,
+                  ``bytes_in``, ``bytes_out``, ``retries``, ``timings`` (the
+                  total seconds of each step), ``total``, ``mean``, ``max``,
+                  ``p50``, ``p90`` and ``p99`` latencies in seconds.
+        """
+        with self._lock:
+            return dict((key, stats.summary())
+                        for key, stats in self._stats.items()
+                        if service_type is None or key[0] == service_type)
+
+    def services(self):
+        """Return the latency histograms of the requests per service"""
+        with self._lock:
+            result = collections.defaultdict(Histogram)
+            for (service_type, _, _), stats in self._stats.items():
+                result[service_type].merge(stats.latency)
+            return dict(result)
+
+    def reset(self):
+        """Forget all the requests recorded"""
+        with self._lock:
+            self._stats.clear()
+
+    def report(self):
+        """Return a table of the requests, those taking the most time first
+        """
+        rows = sorted(self.stats().items(),
+                      key=lambda item: -item[1]["total"])
+        lines = ["%-16s %-6s %-48s %7s %6s %9s %9s %9s %9s" % (
+            "service", "method", "url", "count", "errors", "total",
+            "p50", "p99", "max")]
+        for (service_type, method, template), summary in rows:
+            lines.append("%-16s %-6s %-48s %7d %6d %8.3fs %8.3fs %8.3fs "
+                         "%8.3fs" % (service_type, method, template,
+                                     summary["count"], summary["errors"],
+                                     summary["total"], summary["p50"],
+                                     summary["p99"], summary["max"]))
+        return "\n".join(lines)
@@ -0,0 +1,304 @@
+# Licensed under the Apache License, Version 2.0 (the "License"); you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+
+"""
+The :class:`~openstack.job_tracker.JobTracker` follows the asynchronous
+jobs the Huawei services return the ID of, such as the ``job_id`` of the
+ECS, EVS and BMS servers and volumes, of the volume backups and of the
+load balancers::
+
+    from concurrent import futures
+    from openstack.ecs.v1 import job
+    from openstack import job_tracker
+
+    with job_tracker.JobTracker(conn.session) as tracker:
+        jobs = [tracker.track(job.Job, server.job_id)
+                for server in servers]
+        for done in futures.as_completed(jobs):
+            print(done.result().entity_ids)
+
+One scheduler thread polls every job of a tracker when it is due, with a
+small pool of threads sending the requests, so a tracker follows
+thousands of jobs with a few threads.
+"""
+
+import collections
+import heapq
+import itertools
+import threading
+import time
+
+from concurrent import futures
+
+from openstack import exceptions
+from openstack import resource2
+
+#: The statuses of the jobs which succeeded.
+SUCCESS = ("SUCCESS",)
+#: The statuses of the jobs which failed, ELB jobs use ``ERROR``.
+FAILURES = ("FAIL", "ERROR")
+
+#: The result of a successful job: the job and the IDs of the entities,
+#: e.g. servers or volumes, it and its sub jobs produced.
+JobResult = collections.namedtuple("JobResult", ["job", "entity_ids"])
+
+
+def sub_jobs(job):
+    """Return the sub jobs of a job, as dicts
+
+    They're found in the ``sub_jobs`` attribute of the volume backup jobs
+    and in the ``entities`` of the others.
+    """
+    found = getattr(job, "sub_jobs", None)
+    if not found and isinstance(job.entities, dict):
+        found = job.entities.get("sub_jobs")
+    return found or []
+
+
+def entity_ids(job):
+    """Return the IDs of the entities a job produced
+
+    The IDs are the ``*_id`` values, or ``id`` of nested dicts, found in
+    the entities of the sub jobs of the job, or in its own entities when
+    it has no sub job.
+    """
+    jobs = sub_jobs(job)
+    if jobs:
+        sources = [sub.get("entities") for sub in jobs]
+    else:
+        sources = [job.entities]
+    ids = []
+    for entities in sources:
+        if not isinstance(entities, dict):
+            continue
+        for key, value in sorted(entities.items()):
+            if isinstance(value, dict):
+                value = value.get("id")
+            elif not key.endswith("_id") or key == "job_id":
+                continue
+            if value and value not in ids:
+                ids.append(value)
+    return ids
+
+
+def job_failure(job):
+    """Return the :class:`~openstack.exceptions.JobFailure` of a job
+
+    The error code and reason of the first failed sub job are used when
+    the job has none of its own.
+    """
+    error_code, fail_reason = job.error_code, job.fail_reason
+    if not (error_code or fail_reason):
+        for sub in sub_jobs(job):
+            if sub.get("status") in FAILURES:
+                error_code = sub.get("error_code")
+                fail_reason = sub.get("fail_reason")
+                break
+    return exceptions.JobFailure(job, error_code, fail_reason)
+
+
+def _set_exception(future, exception):
+    if not future.cancelled():
+        future.set_exception(exception)
+
+
+class _Entry(object):
+    """A job being tracked"""
+
+    def __init__(self, job, future, interval, deadline):
+        self.job = job
+        self.future = future
+        self.interval = interval
+        self.deadline = deadline
+        self.status = None
+
+
+class JobTracker(object):
+
+    def __init__(self, session, interval=2, max_interval=30, timeout=3600,
+                 max_workers=8):
+        """Track asynchronous jobs until they end
+
+        Each job is first polled ``interval`` seconds after it's tracked.
+        While its status doesn't change, the interval grows by half up to
+        ``max_interval``, it goes back to ``interval`` when it does.
+
+        :param session: The session to use for polling the jobs.
+        :type session: :class:`~openstack.session.Session`
+        :param interval: Number of seconds between the first polls.
+        :param max_interval: Maximum number of seconds between two polls
+                             of a job.
+        :param timeout: Default number of seconds to wait for a job.
+        :param int max_workers: Maximum number of concurrent polls.
+        """
+        self.session = session
+        self.interval = interval
+        self.max_interval = max_interval
+        self.timeout = timeout
+        self._executor = futures.ThreadPoolExecutor(max_workers=max_workers)
+        self._condition = threading.Condition()
+        self._queue = []
+        self._counter = itertools.count()
+        self._futures = set()
+        self._thread = None
+        self._closed = False
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if exc_type is None:
+            self.wait()
+        self.close()
+
+    def track(self, job_type, job_id=None, callback=None, timeout=None):
+        """Track a job
+
+        :param job_type: The class of the job, such as
+                         :class:`~openstack.ecs.v1.job.Job`, or an
+                         instance of it.
+        :param job_id: The ID of the job, when ``job_type`` is a class.
+        :param callback: A callable called with the future once the job
+                         ended.
+        :param timeout: Number of seconds to wait for the job, the
+                        tracker's timeout by default.
+
+        :returns: A :class:`concurrent.futures.Future` with the job as
+                  ``job`` attribute. Its result is a :class:`JobResult`,
+                  or it raises
+                  :class:`~openstack.exceptions.JobFailure` if the job
+                  failed, :class:`~openstack.exceptions.ResourceTimeout`
+                  if it didn't end in time, or the error which prevented
+                  polling it.
+        :raises: ``RuntimeError`` if the tracker was closed.
+        """
+        if isinstance(job_type, resource2.CompactResource):
+            job = job_type.to_resource()
+        elif isinstance(job_type, resource2.Resource):
+            job = job_type
+        else:
+            job = job_type.existing(id=job_id)
+        future = futures.Future()
+        future.job = job
+        now = time.time()
+        if timeout is None:
+            timeout = self.timeout
+        entry = _Entry(job, future, self.interval, now + timeout)
+        with self._condition:
+            if self._closed:
+                raise RuntimeError("The job tracker is closed")
+            self._futures.add(future)
+            self._schedule(entry, now + self.interval)
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run,
+                                                name="JobTracker")
+                self._thread.daemon = True
+                self._thread.start()
+        future.add_done_callback(self._discard)
+        if callback is not None:
+            future.add_done_callback(callback)
+        return future
+
+    def wait(self, timeout=None):
+        """Block until the jobs tracked so far ended
+
+        :param timeout: Maximum number of seconds to wait.
+        :returns: A named 2-tuple of sets of futures, ``done`` and
+                  ``not_done``, like :func:`concurrent.futures.wait`.
+        """
+        with self._condition:
+            pending = list(self._futures)
+        return futures.wait(pending, timeout)
+
+    def close(self):
+        """Stop tracking, cancelling the futures of the pending jobs"""
+        with self._condition:
+            self._closed = True
+            entries = [entry for _, _, entry in self._queue]
+            self._queue = []
+            self._condition.notify()
+        for entry in entries:
+            entry.future.cancel()
+        self._executor.shutdown(wait=True)
+
+    def _discard(self, future):
+        with self._condition:
+            self._futures.discard(future)
+
+    def _schedule(self, entry, when):
+        # the caller holds the condition
+        when = min(when, entry.deadline)
+        heapq.heappush(self._queue, (when, next(self._counter), entry))
+        self._condition.notify()
+
+    def _run(self):
+        while True:
+            with self._condition:
+                while not self._closed:
+                    now = time.time()
+                    if self._queue and self._queue[0][0] <= now:
+                        break
+                    delay = self._queue[0][0] - now if self._queue else None
+                    self._condition.wait(delay)
+                if self._closed:
+                    return
+                due = []
+                while self._queue and self._queue[0][0] <= now:
+                    due.append(heapq.heappop(self._queue)[2])
+            for entry in due:
+                self._executor.submit(self._poll, entry)
+
+    def _poll(self, entry):
+        job, future = entry.job, entry.future
+        # the futures stay pending until the job ends, so that they can
+        # be cancelled meanwhile
+        if future.cancelled():
+            return
+        try:
+            job.get(self.session)
+        except exceptions.HttpException as e:
+            if e.http_status is not None and e.http_status < 500:
+                _set_exception(future, e)
+                return
+            # the service may be busy, poll again later
+            self._reschedule(entry, entry.status, e)
+            return
+        except Exception as e:
+            _set_exception(future, e)
+            return
+        if job.status in SUCCESS:
+            if not future.cancelled():
+                future.set_result(JobResult(job, entity_ids(job)))
+        elif job.status in FAILURES:
+            _set_exception(future, job_failure(job))
+        else:
+            self._reschedule(entry, job.status)
+
+    def _reschedule(self, entry, status, error=None):
+        now = time.time()
+        if now >= entry.deadline:
+            if error is None:
+                error = exceptions.ResourceTimeout(
+                    "Timeout waiting for job %s, last status %s" %
+                    (entry.job.id, status))
+            _set_exception(entry.future, error)
+            return
+        if status == entry.status:
+            entry.interval = min(entry.interval * 1.5, self.max_interval)
+        else:
+            entry.interval = self.interval
+            entry.status = status
+        with self._condition:
+            if self._closed:
+                entry.future.cancel()
+                return
+            self._schedule(entry, now + entry.interval)
@@ -0,0 +1,335 @@
+# Licensed under the Apache License, Version 2.0 (the "License"); you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+
+"""
+The :class:`~openstack.json_codec.JSONCodec` encodes the JSON bodies of the
+requests and decodes the responses with the fastest JSON library available.
+The sessions keep theirs as ``json_codec``::
+
+    from openstack import json_codec
+    conn.session.json_codec = json_codec.get_codec("simplejson")
+
+The :class:`~openstack.json_codec.ListDecoder` decodes a document received
+in chunks, returning the items of one of its lists as soon as they are
+complete. :meth:`~openstack.resource2.Resource.list` uses it to yield the
+resources of a page while the page is still being received.
+"""
+
+import codecs
+import importlib
+import json
+import re
+
+from keystoneauth1.session import _JSONEncoder
+
+#: The backends :func:`get_codec` picks from, fastest first. ujson is
+#: left out as it rounds floats, it can still be picked by name.
+BACKENDS = ("orjson", "simplejson", "json")
+
+#: The size of the chunks read from streamed responses.
+CHUNK_SIZE = 64 * 1024
+
+_WHITESPACE = re.compile(r"[ \t\n\r]*")
+# what may follow the part of a number decoded so far, when it's cut after
+# its "." or its exponent
+_NUMBER_START = "-0123456789"
+_NUMBER_TAIL = re.compile(r"(?:\.[0-9]*)?(?:[eE][-+]?[0-9]*)?")
+
+# states of ListDecoder
+_VALUE = "value"
+_KEY = "key"
+_ITEM = "item"
+_DONE = "done"
+
+
+class JSONCodec(object):
+
+    def __init__(self, backend="json"):
+        """Encode and decode JSON with a given library
+
+        :param str backend: The name of the module providing ``dumps`` and
+                            ``loads``, e.g. ``json``, ``simplejson``,
+                            ``orjson`` or ``ujson``.
+        :raises: ``ImportError`` if the module is not installed.
+        """
+        self.backend = backend
+        self._module = importlib.import_module(backend)
+        # the standard library knows the types keystoneauth adds, like
+        # datetime and UUID, and takes over what a backend can't encode.
+        self._encoder = _JSONEncoder()
+        if hasattr(self._module, "JSONDecoder"):
+            self._decoder = self._module.JSONDecoder()
+        else:
+            self._decoder = json.JSONDecoder()
+
+    def __repr__(self):
+        return "%s(%r)" % (self.__class__.__name__, self.backend)
+
+    def dumps(self, obj):
+        """Encode an object to a JSON string"""
+        if self.backend == "json":
+            return self._encoder.encode(obj)
+        try:
+            if self.backend == "orjson":
+                return self._module.dumps(
+                    obj, default=self._encoder.default).decode("utf-8")
+            if self.backend == "ujson":
+                return self._module.dumps(obj, escape_forward_slashes=False)
+            return self._module.dumps(obj, default=self._encoder.default)
+        except (TypeError, OverflowError):
+            return self._encoder.encode(obj)
+
+    # keystoneauth encodes the request bodies with ``session._json.encode``
+    encode = dumps
+
+    def loads(self, data):
+        """Decode a JSON document, given as text or UTF-8 bytes"""
+        # orjson decodes bytes faster, json only accepts them from py3.6
+        if isinstance(data, bytes) and self.backend != "orjson":
+            data = data.decode("utf-8")
+        return self._module.loads(data)
+
+    def list_decoder(self, path=None, keep=True):
+        """Return a :class:`ListDecoder` using this codec"""
+        return ListDecoder(path, decoder=self._decoder, keep=keep)
+
+
+def get_codec(backend=None):
+    """Return a codec for a backend, or for the fastest one available
+
+    :param str backend: The name of the backend, see :class:`JSONCodec`.
+                        When None, the first of :data:`BACKENDS` which can
+                        be imported is used.
+    """
+    if backend is not None:
+        return JSONCodec(backend)
+    for name in BACKENDS:
+        try:
+            return JSONCodec(name)
+        except ImportError:
+            continue
+    return JSONCodec()
+
+
+class ListDecoder(object):
+
+    def __init__(self, path=None, decoder=None, keep=True):
+        """Decode a JSON document fed in chunks
+
+        The items of the list found at ``path`` are returned by
+        :meth:`feed` as soon as they are complete, the rest of the
+        document is returned by :meth:`close`, with the decoded items
+        at ``path``.
+
+        :param str path: The dotted path of the list in the document, e.g.
+                         ``servers`` or ``data.items``. When None, the
+                         document itself is the list.
+        :param decoder: A decoder with a ``raw_decode`` method like
+                        :class:`json.JSONDecoder`, which it defaults to.
+        :param bool keep: When False, the items are only returned by
+                          :meth:`feed` and the list at ``path`` is left
+                          empty, so they can be freed once used.
+        """
+        self.path = path.split(".") if path else []
+        self.items = []
+        self.keep = keep
+        self.count = 0
+        self.document = None
+        self._decoder = decoder or json.JSONDecoder()
+        self._text = codecs.getincrementaldecoder("utf-8")()
+        self._buffer = u""
+        self._pos = 0
+        self._closed = False
+        # the chunks fed since the last parse, and how much more text is
+        # needed before parsing again: a value which could not be decoded
+        # is only decoded again once the text after it doubled, and a
+        # document without the list at all only in close(), so that big
+        # values are not decoded over and over.
+        self._pending = []
+        self._pending_size = 0
+        self._wait = 0
+        # the containers being filled, from the document down to the list
+        self._stack = []
+        self._key = None
+        self._state = _VALUE
+        self._found = False
+
+    def feed(self, chunk):
+        """Decode a chunk of the document
+
+        :param chunk: The following bytes, or text, of the document.
+        :return: The list of the items completed by this chunk.
+        """
+        if isinstance(chunk, bytes):
+            chunk = self._text.decode(chunk)
+        self._pending.append(chunk)
+        self._pending_size += len(chunk)
+        if self._wait is None or self._pending_size < self._wait:
+            return []
+        return self.flush()
+
+    def flush(self):
+        """Decode all of the chunks fed so far
+
+        :meth:`feed` may keep the chunks completing a value until enough of
+        them are received, this returns the items they complete right away.
+        Call it before :meth:`close` when the items are not kept.
+
+        :return: The list of the items completed by these chunks.
+        """
+        self._read_pending()
+        return self._parse()
+
+    def close(self):
+        """Signal the end of the document and return it
+
+        :raises: ``ValueError`` if the document is invalid or truncated.
+        """
+        self._pending.append(self._text.decode(b"", final=True))
+        self._closed = True
+        self.flush()
+        if self._skip(self._pos) != len(self._buffer):
+            raise ValueError("Extra data after the JSON document")
+        return self.document
+
+    def _read_pending(self):
+        self._buffer = self._buffer[self._pos:] + u"".join(self._pending)
+        self._pos = 0
+        self._pending = []
+        self._pending_size = 0
+        self._wait = 0
+
+    def _skip(self, pos):
+        return _WHITESPACE.match(self._buffer, pos).end()
+
+    def _decode(self, pos):
+        """Decode the value at pos, return None if it's incomplete"""
+        try:
+            value, end = self._decoder.raw_decode(self._buffer, pos)
+        except ValueError:
+            if self._closed:
+                raise
+            self._wait = len(self._buffer) - pos
+            return None
+        # a number may go on in the next chunk, it may also have been cut
+        # right after its "." or "e", which raw_decode leaves out
+        if not self._closed and self._buffer[pos] in _NUMBER_START and \
+                _NUMBER_TAIL.match(self._buffer, end).end() >= \
+                len(self._buffer):
+            return None
+        return value, end
+
+    def _attach(self, value):
+        if self._stack:
+            self._stack[-1][self._key] = value
+        else:
+            self.document = value
+
+    def _pop(self):
+        self._stack.pop()
+        self._state = _KEY if self._stack else _DONE
+
+    def _truncated(self):
+        if self._closed:
+            raise ValueError("Truncated JSON document")
+
+    def _parse(self):
+        items = []
+        buf = self._buffer
+        while self._state != _DONE:
+            pos = self._skip(self._pos)
+            if pos >= len(buf):
+                self._truncated()
+                break
+            char = buf[pos]
+
+            if self._state == _VALUE:
+                on_path = len(self._stack) < len(self.path)
+                if not on_path and char == "[":
+                    self._attach(self.items)
+                    self._stack.append(self.items)
+                    self._found = True
+                    self._state = _ITEM
+                    self._pos = pos + 1
+                elif on_path and char == "{":
+                    container = {}
+                    self._attach(container)
+                    self._stack.append(container)
+                    self._state = _KEY
+                    self._pos = pos + 1
+                else:
+                    # not the expected structure, decode it as a whole,
+                    # and the whole document only once complete
+                    if not self._stack and not self._closed:
+                        self._wait = None
+                        break
+                    decoded = self._decode(pos)
+                    if decoded is None:
+                        break
+                    self._attach(decoded[0])
+                    self._found = True
+                    self._state = _KEY if self._stack else _DONE
+                    self._pos = decoded[1]
+
+            elif self._state == _KEY:
+                if char == ",":
+                    self._pos = pos + 1
+                    continue
+                if char == "}":
+                    self._pos = pos + 1
+                    self._pop()
+                    continue
+                if char != '"':
+                    raise ValueError("Expecting property name at %d" % pos)
+                decoded = self._decode(pos)
+                if decoded is None:
+                    break
+                key, pos = decoded
+                pos = self._skip(pos)
+                if pos >= len(buf):
+                    self._truncated()
+                    break
+                if buf[pos] != ":":
+                    raise ValueError("Expecting ':' at %d" % pos)
+                pos = self._skip(pos + 1)
+                if pos >= len(buf):
+                    self._truncated()
+                    break
+                depth = len(self._stack) - 1
+                if not self._found and key == self.path[depth]:
+                    self._key = key
+                    self._state = _VALUE
+                    self._pos = pos
+                    continue
+                decoded = self._decode(pos)
+                if decoded is None:
+                    break
+                self._stack[-1][key] = decoded[0]
+                self._pos = decoded[1]
+
+            elif self._state == _ITEM:
+                if char == ",":
+                    self._pos = pos + 1
+                    continue
+                if char == "]":
+                    self._pos = pos + 1
+                    self._pop()
+                    continue
+                decoded = self._decode(pos)
+                if decoded is None:
+                    break
+                if self.keep:
+                    self.items.append(decoded[0])
+                items.append(decoded[0])
+                self.count += 1
+                self._pos = decoded[1]
+        return items
@@ -62,18 +62,20 @@ class Proxy(proxy2.BaseProxy):
         return self._find(_container.Container, name_or_id,
                           ignore_missing=ignore_missing)
 
-    def get_container(self, container):
+    def get_container(self, container, raw=False):
         """Get a single container
 
         :param container: The value can be the ID of a container or a
                       :class:`~openstack.key_manager.v1.container.Container`
                       instance.
+        :param bool raw: When set to ``True``, return the decoded body of
+                         the response instead of a resource.
 
         :returns: One :class:`~openstack.key_manager.v1.container.Container`
         :raises: :class:`~openstack.exceptions.ResourceNotFound`
                  when no resource can be found.
         """
-        return self._get(_container.Container, container)
+        return self._get(_container.Container, container, raw=raw)
 
     def containers(self, **query):
         """Return a generator of containers
@@ -142,18 +144,20 @@ class Proxy(proxy2.BaseProxy):
         return self._find(_order.Order, name_or_id,
                           ignore_missing=ignore_missing)
 
-    def get_order(self, order):
+    def get_order(self, order, raw=False):
         """Get a single order
 
         :param order: The value can be the ID of an order or a
                       :class:`~openstack.key_manager.v1.order.Order`
                       instance.
+        :param bool raw: When set to ``True``, return the decoded body of
+                         the response instead of a resource.
 
         :returns: One :class:`~openstack.key_manager.v1.order.Order`
         :raises: :class:`~openstack.exceptions.ResourceNotFound`
                  when no resource can be found.
         """
-        return self._get(_order.Order, order)
+        return self._get(_order.Order, order, raw=raw)
 
     def orders(self, **query):
         """Return a generator of orders
@@ -223,18 +227,20 @@ class Proxy(proxy2.BaseProxy):
         return self._find(_secret.Secret, name_or_id,
                           ignore_missing=ignore_missing)
 
-    def get_secret(self, secret):
+    def get_secret(self, secret, raw=False):
         """Get a single secret
 
         :param secret: The value can be the ID of a secret or a
                        :class:`~openstack.key_manager.v1.secret.Secret`
                        instance.
+        :param bool raw: When set to ``True``, return the decoded body of
+                         the response instead of a resource.
 
         :returns: One :class:`~openstack.key_manager.v1.secret.Secret`
         :raises: :class:`~openstack.exceptions.ResourceNotFound`
                  when no resource can be found.
         """
-        return self._get(_secret.Secret, secret)
+        return self._get(_secret.Secret, secret, raw=raw)
 
     def secrets(self, **query):
         """Return a generator of secrets
@@ -33,15 +33,17 @@ class Proxy(proxy2.BaseProxy):
         """
         return self._create(_lb.LoadBalancerJob, prepend_key=False, **attrs)
 
-    def get_load_balancer(self, load_balancer):
+    def get_load_balancer(self, load_balancer, raw=False):
         """Get load balancer
 
         :param load_balancer: Either the ID of a load_balancer or an instance
             of :class:`~openstack.load_balancer.v1.load_balancer.LoadBalancer`
+        :param bool raw: When set to ``True``, return the decoded body of
+                         the response instead of a resource.
         :returns: One
              :class:`~openstack.load_balancer.v1.load_balancer.LoadBalancer`
         """
-        return self._get(_lb.LoadBalancer, load_balancer)
+        return self._get(_lb.LoadBalancer, load_balancer, raw=raw)
 
     def update_load_balancer(self, load_balancer, **attrs):
         """Update a load balancer
@@ -201,15 +203,17 @@ class Proxy(proxy2.BaseProxy):
         """
         return self._create(_listener.Listener, prepend_key=False, **attrs)
 
-    def get_listener(self, listener):
+    def get_listener(self, listener, raw=False):
         """Get a load balance listener
 
         :param listener: Either the ID of a listener or an instance of
                 :class:`~openstack.load_balancer.v1.listener.Listener`
+        :param bool raw: When set to ``True``, return the decoded body of
+                         the response instead of a resource.
         :returns: One
              :class:`~openstack.load_balancer.v1.listener.Listener`
         """
-        return self._get(_listener.Listener, listener)
+        return self._get(_listener.Listener, listener, raw=raw)
 
     def update_listener(self, listener, **attrs):
         """Update a load balance listener
@@ -302,15 +306,17 @@ class Proxy(proxy2.BaseProxy):
         """
         return self._create(_hc.HealthCheck, prepend_key=False, **attrs)
 
-    def get_health_check(self, health_check):
+    def get_health_check(self, health_check, raw=False):
         """Get a health check
 
         :param health_check: Either the ID of a health check or an instance of
                 :class:`~openstack.load_balancer.v1.health_check.HealthCheck`
+        :param bool raw: When set to ``True``, return the decoded body of
+                         the response instead of a resource.
         :returns: A health check instance
         :rtype: `:class: ~openstack.load_balancer.v1.health_check.HealthCheck`
         """
-        return self._get(_hc.HealthCheck, health_check)
+        return self._get(_hc.HealthCheck, health_check, raw=raw)
 
     def update_health_check(self, health_check, **attrs):
         """Update a health check
@@ -410,14 +416,16 @@ class Proxy(proxy2.BaseProxy):
                           listener_id=listener.id,
                           **query)
 
-    def get_job(self, job):
+    def get_job(self, job, raw=False):
         """Get a health check
 
         :param job: Either the ID of a health check or an instance of
                 :class:`~openstack.load_balancer.v1.job.Job`
+        :param bool raw: When set to ``True``, return the decoded body of
+                         the response instead of a resource.
         :returns: A :class:`~openstack.load_balancer.v1.job.Job`
         """
-        return self._get(_job.Job, job)
+        return self._get(_job.Job, job, raw=raw)
 
     def quotas(self):
         """Retrieve a generator of Quota
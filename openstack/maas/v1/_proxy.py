@@ -57,15 +57,17 @@ class Proxy(proxy2.BaseProxy):
         """
         self._delete(_task.Task, task, ignore_missing=ignore_missing)
 
-    def get_task(self, task_id):
+    def get_task(self, task_id, raw=False):
         """Get detail about a given migration task id
 
         :param task_id: The task id or an instance of
                         :class:`~openstack.maas.v1.task.Task`
+        :param bool raw: When set to ``True``, return the decoded body of
+                         the response instead of a resource.
 
         :rtype: :class:`~openstack.maas.v1.task.Task`
         """
-        return self._get(_task.Task, task_id)
+        return self._get(_task.Task, task_id, raw=raw)
 
     def start_task(self, task, source_ak, source_sk, target_ak, target_sk):
         """Start a migration task
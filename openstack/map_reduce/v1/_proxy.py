@@ -60,15 +60,17 @@ class Proxy(proxy2.BaseProxy):
         return self._update(_ds.DataSource, data_source, prepend_key=False,
                             **attrs)
 
-    def get_data_source(self, data_source):
+    def get_data_source(self, data_source, raw=False):
         """Get a data_source
 
         :param data_source: value can be the ID of a data_source or an instance
             of :class:`~openstack.map_reduce.v1.data_source.DataSource`
+        :param bool raw: When set to ``True``, return the decoded body of
+                         the response instead of a resource.
         :returns: DataSource instance
         :rtype: :class:`~openstack.map_reduce.v1.data_source.DataSource`
         """
-        return self._get(_ds.DataSource, data_source)
+        return self._get(_ds.DataSource, data_source, raw=raw)
 
     def delete_data_source(self, data_source, ignore_missing=True):
         """Delete a data_source
@@ -144,15 +146,17 @@ class Proxy(proxy2.BaseProxy):
         return self._update(_jb.JobBinary, job_binary, prepend_key=False,
                             **attrs)
 
-    def get_job_binary(self, job_binary):
+    def get_job_binary(self, job_binary, raw=False):
         """Get a Job-Binary
 
         :param job_binary: value can be the ID of a Job-Binary or an instance
             of :class:`~openstack.map_reduce.v1.job_binary.JobBinary`
+        :param bool raw: When set to ``True``, return the decoded body of
+                         the response instead of a resource.
         :returns: Job-Binary instance
         :rtype: :class:`~openstack.map_reduce.v1.job_binary.JobBinary`
         """
-        return self._get(_jb.JobBinary, job_binary)
+        return self._get(_jb.JobBinary, job_binary, raw=raw)
 
     def delete_job_binary(self, job_binary, ignore_missing=True):
         """Delete a Job-Binary
@@ -240,15 +244,17 @@ class Proxy(proxy2.BaseProxy):
         return self._update(_job.Job, job, prepend_key=False,
                             **attrs)
 
-    def get_job(self, job):
+    def get_job(self, job, raw=False):
         """Get a Job
 
         :param job: value can be the ID of a Job or an instance
             of :class:`~openstack.map_reduce.v1.job.Job`
+        :param bool raw: When set to ``True``, return the decoded body of
+                         the response instead of a resource.
         :returns: Job instance
         :rtype: :class:`~openstack.map_reduce.v1.job.Job`
         """
-        return self._get(_job.Job, job)
+        return self._get(_job.Job, job, raw=raw)
 
     def execute_job(self, job, **job_execution):
         """Execute a Job
@@ -311,16 +317,18 @@ class Proxy(proxy2.BaseProxy):
         """
         return self._list(_execution.JobExecution, paginated=True, **query)
 
-    def get_job_execution(self, job_execution):
+    def get_job_execution(self, job_execution, raw=False):
         """Get a Job-Executions
 
         :param job_execution: value can be the ID of a JobExecution or an
                 instance of :class:`~openstack.map_reduce.v1.
                 job_execution.JobExecution`
+        :param bool raw: When set to ``True``, return the decoded body of
+                         the response instead of a resource.
         :returns: JobExecution instance
         :rtype: :class:`~openstack.map_reduce.v1.job_execution.JobExecution`
         """
-        return self._get(_execution.JobExecution, job_execution)
+        return self._get(_execution.JobExecution, job_execution, raw=raw)
 
     def delete_job_execution(self, job_execution, ignore_missing=True):
         """Delete a JobExecution
@@ -391,15 +399,17 @@ class Proxy(proxy2.BaseProxy):
         """
         return self._list(_exe.JobExe, paginated=True, **query)
 
-    def get_job_exe(self, job_exe):
+    def get_job_exe(self, job_exe, raw=False):
         """Get a Job-Exe
 
         :param job_exe: value can be the ID of a JobExe or an
                 instance of :class:`~openstack.map_reduce.v1.job_exe.JobExe`
+        :param bool raw: When set to ``True``, return the decoded body of
+                         the response instead of a resource.
         :returns: JobExe instance
         :rtype: :class:`~openstack.map_reduce.v1.job_execution.JobExe`
         """
-        return self._get(_exe.JobExe, job_exe)
+        return self._get(_exe.JobExe, job_exe, raw=raw)
 
     def create_cluster_and_run_job(self, cluster, job):
         """Create a new cluster and run a job on the created cluster
@@ -449,15 +459,17 @@ class Proxy(proxy2.BaseProxy):
         cluster_info = self._get_resource(_cluster.ClusterInfo, cluster)
         return cluster_info.expand(self._session, amount)
 
-    def get_cluster(self, cluster):
+    def get_cluster(self, cluster, raw=False):
         """Get a cluster details
 
         :param cluster: value can be the ID of a cluster or an instance
             of :class:`~openstack.map_reduce.v1.cluster.ClusterDetail`
+        :param bool raw: When set to ``True``, return the decoded body of
+                         the response instead of a resource.
         :returns: Cluster Detail instance
         :rtype: :class:`~openstack.map_reduce.v1.cluster.ClusterDetail`
         """
-        return self._get(_cluster.ClusterDetail, cluster)
+        return self._get(_cluster.ClusterDetail, cluster, raw=raw)
 
     def delete_cluster(self, cluster, ignore_missing=True):
         """Delete a cluster
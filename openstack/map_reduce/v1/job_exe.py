@@ -25,6 +25,7 @@ class JobExe(resource.Resource):
     base_path = "/job-exes"
     query_marker_key = "current_page"
     query_limit_key = "page_size"
+    total_path = "totalRecord"
     service = map_reduce_service.MapReduceService()
 
     # capabilities
@@ -160,6 +161,28 @@ class JobExe(resource.Resource):
         current_page = int(query_params.get("current_page", 1))
         return current_page + 1
 
+    @classmethod
+    def get_offset_queries(cls, response_json, yielded, query_params):
+        # Without an explicit page size the pages can't be addressed
+        if "page_size" not in query_params:
+            return None
+        page_size = int(query_params["page_size"])
+        if yielded < page_size:
+            return []
+
+        total = cls.find_value_by_accessor(response_json, cls.total_path)
+        if not total:
+            return None
+        total = int(total)
+        current_page = int(query_params.get("current_page", 1))
+        last_page = (total + page_size - 1) // page_size
+        queries = []
+        for page in range(current_page + 1, last_page + 1):
+            query = dict(query_params)
+            query["current_page"] = page
+            queries.append(query)
+        return queries
+
     def execute(self, session):
         """execute a job-exe
 
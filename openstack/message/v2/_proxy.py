@@ -32,17 +32,19 @@ class Proxy(proxy2.BaseProxy):
         """
         return self._create(_queue.Queue, **attrs)
 
-    def get_queue(self, queue):
+    def get_queue(self, queue, raw=False):
         """Get a queue
 
         :param queue: The value can be the name of a queue or a
             :class:`~openstack.message.v2.queue.Queue` instance.
+        :param bool raw: When set to ``True``, return the decoded body of
+                         the response instead of a resource.
 
         :returns: One :class:`~openstack.message.v2.queue.Queue`
         :raises: :class:`~openstack.exceptions.ResourceNotFound` when no
             queue matching the name could be found.
         """
-        return self._get(_queue.Queue, queue)
+        return self._get(_queue.Queue, queue, raw=raw)
 
     def queues(self, **query):
         """Retrieve a generator of queues
@@ -103,17 +103,19 @@ class Proxy(proxy2.BaseProxy):
         return self._find(_address_scope.AddressScope, name_or_id,
                           ignore_missing=ignore_missing)
 
-    def get_address_scope(self, address_scope):
+    def get_address_scope(self, address_scope, raw=False):
         """Get a single address scope
 
         :param address_scope: The value can be the ID of an address scope or a
             :class:`~openstack.network.v2.address_scope.AddressScope` instance.
+        :param bool raw: When set to ``True``, return the decoded body of
+                         the response instead of a resource.
 
         :returns: One :class:`~openstack.network.v2.address_scope.AddressScope`
         :raises: :class:`~openstack.exceptions.ResourceNotFound`
                  when no resource can be found.
         """
-        return self._get(_address_scope.AddressScope, address_scope)
+        return self._get(_address_scope.AddressScope, address_scope, raw=raw)
 
     def address_scopes(self, **query):
         """Return a generator of address scopes
@@ -182,18 +184,20 @@ class Proxy(proxy2.BaseProxy):
         """
         self._delete(_agent.Agent, agent, ignore_missing=ignore_missing)
 
-    def get_agent(self, agent):
+    def get_agent(self, agent, raw=False):
         """Get a single network agent
 
         :param agent: The value can be the ID of a agent or a
                      :class:`~openstack.network.v2.agent.Agent` instance.
+        :param bool raw: When set to ``True``, return the decoded body of
+                         the response instead of a resource.
 
         :returns: One :class:`~openstack.network.v2.agent.Agent`
         :rtype: :class:`~openstack.network.v2.agent.Agent`
         :raises: :class:`~openstack.exceptions.ResourceNotFound`
                  when no resource can be found.
         """
-        return self._get(_agent.Agent, agent)
+        return self._get(_agent.Agent, agent, raw=raw)
 
     def update_agent(self, agent, **attrs):
         """Update a network agent
@@ -397,18 +401,20 @@ class Proxy(proxy2.BaseProxy):
         return self._find(_flavor.Flavor, name_or_id,
                           ignore_missing=ignore_missing)
 
-    def get_flavor(self, flavor):
+    def get_flavor(self, flavor, raw=False):
         """Get a single network service flavor
 
         :param flavor:
             The value can be the ID of a flavor or a
             :class:`~openstack.network.v2.flavor.Flavor` instance.
+        :param bool raw: When set to ``True``, return the decoded body of
+                         the response instead of a resource.
 
         :returns: One :class:`~openstack.network.v2.flavor.Flavor`
         :raises: :class:`~openstack.exceptions.ResourceNotFound`
                  when no resource can be found.
         """
-        return self._get(_flavor.Flavor, flavor)
+        return self._get(_flavor.Flavor, flavor, raw=raw)
 
     def update_flavor(self, flavor, **attrs):
         """Update a network service flavor
@@ -530,18 +536,20 @@ class Proxy(proxy2.BaseProxy):
         return self._find(_floating_ip.FloatingIP, name_or_id,
                           ignore_missing=ignore_missing)
 
-    def get_ip(self, floating_ip):
+    def get_ip(self, floating_ip, raw=False):
         """Get a single floating ip
 
         :param floating_ip: The value can be the ID of a floating ip or a
                       :class:`~openstack.network.v2.floating_ip.FloatingIP`
                       instance.
+        :param bool raw: When set to ``True``, return the decoded body of
+                         the response instead of a resource.
 
         :returns: One :class:`~openstack.network.v2.floating_ip.FloatingIP`
         :raises: :class:`~openstack.exceptions.ResourceNotFound`
                  when no resource can be found.
         """
-        return self._get(_floating_ip.FloatingIP, floating_ip)
+        return self._get(_floating_ip.FloatingIP, floating_ip, raw=raw)
 
     def ips(self, **query):
         """Return a generator of ips
@@ -906,19 +914,22 @@ class Proxy(proxy2.BaseProxy):
         return self._find(_metering_label.MeteringLabel, name_or_id,
                           ignore_missing=ignore_missing)
 
-    def get_metering_label(self, metering_label):
+    def get_metering_label(self, metering_label, raw=False):
         """Get a single metering label
 
         :param metering_label: The value can be the ID of a metering label or a
                :class:`~openstack.network.v2.metering_label.MeteringLabel`
                instance.
+        :param bool raw: When set to ``True``, return the decoded body of
+                         the response instead of a resource.
 
         :returns: One
                   :class:`~openstack.network.v2.metering_label.MeteringLabel`
         :raises: :class:`~openstack.exceptions.ResourceNotFound`
                  when no resource can be found.
         """
-        return self._get(_metering_label.MeteringLabel, metering_label)
+        return self._get(_metering_label.MeteringLabel, metering_label,
+                         raw=raw)
 
     def metering_labels(self, **query):
         """Return a generator of metering labels
@@ -1100,18 +1111,20 @@ class Proxy(proxy2.BaseProxy):
         return self._find(_network.Network, name_or_id,
                           ignore_missing=ignore_missing)
 
-    def get_network(self, network):
+    def get_network(self, network, raw=False):
         """Get a single network
 
         :param network:
             The value can be the ID of a network or a
             :class:`~openstack.network.v2.network.Network` instance.
+        :param bool raw: When set to ``True``, return the decoded body of
+                         the response instead of a resource.
 
         :returns: One :class:`~openstack.network.v2.network.Network`
         :raises: :class:`~openstack.exceptions.ResourceNotFound`
                  when no resource can be found.
         """
-        return self._get(_network.Network, network)
+        return self._get(_network.Network, network, raw=raw)
 
     def networks(self, **query):
         """Return a generator of networks
@@ -1459,17 +1472,19 @@ class Proxy(proxy2.BaseProxy):
         return self._find(_port.Port, name_or_id,
                           ignore_missing=ignore_missing)
 
-    def get_port(self, port):
+    def get_port(self, port, raw=False):
         """Get a single port
 
         :param port: The value can be the ID of a port or a
                      :class:`~openstack.network.v2.port.Port` instance.
+        :param bool raw: When set to ``True``, return the decoded body of
+                         the response instead of a resource.
 
         :returns: One :class:`~openstack.network.v2.port.Port`
         :raises: :class:`~openstack.exceptions.ResourceNotFound`
                  when no resource can be found.
         """
-        return self._get(_port.Port, port)
+        return self._get(_port.Port, port, raw=raw)
 
     def ports(self, **query):
         """Return a generator of ports
@@ -1935,18 +1950,20 @@ class Proxy(proxy2.BaseProxy):
         return self._find(_qos_policy.QoSPolicy, name_or_id,
                           ignore_missing=ignore_missing)
 
-    def get_qos_policy(self, qos_policy):
+    def get_qos_policy(self, qos_policy, raw=False):
         """Get a single QoS policy
 
         :param qos_policy: The value can be the ID of a QoS policy or a
                            :class:`~openstack.network.v2.qos_policy.QoSPolicy`
                            instance.
+        :param bool raw: When set to ``True``, return the decoded body of
+                         the response instead of a resource.
 
         :returns: One :class:`~openstack.network.v2.qos_policy.QoSPolicy`
         :raises: :class:`~openstack.exceptions.ResourceNotFound`
                  when no resource can be found.
         """
-        return self._get(_qos_policy.QoSPolicy, qos_policy)
+        return self._get(_qos_policy.QoSPolicy, qos_policy, raw=raw)
 
     def qos_policies(self, **query):
         """Return a generator of QoS policies
@@ -2008,19 +2025,21 @@ class Proxy(proxy2.BaseProxy):
         """
         self._delete(_quota.Quota, quota, ignore_missing=ignore_missing)
 
-    def get_quota(self, quota):
+    def get_quota(self, quota, raw=False):
         """Get a quota
 
         :param quota: The value can be the ID of a quota or a
                       :class:`~openstack.network.v2.quota.Quota` instance.
                       The ID of a quota is the same as the project ID
                       for the quota.
+        :param bool raw: When set to ``True``, return the decoded body of
+                         the response instead of a resource.
 
         :returns: One :class:`~openstack.network.v2.quota.Quota`
         :raises: :class:`~openstack.exceptions.ResourceNotFound`
                  when no resource can be found.
         """
-        return self._get(_quota.Quota, quota)
+        return self._get(_quota.Quota, quota, raw=raw)
 
     def get_quota_default(self, quota):
         """Get a default quota
@@ -2108,17 +2127,19 @@ class Proxy(proxy2.BaseProxy):
         return self._find(_rbac_policy.RBACPolicy, rbac_policy,
                           ignore_missing=ignore_missing)
 
-    def get_rbac_policy(self, rbac_policy):
+    def get_rbac_policy(self, rbac_policy, raw=False):
         """Get a single RBAC policy
 
         :param rbac_policy: The value can be the ID of a RBAC policy or a
             :class:`~openstack.network.v2.rbac_policy.RBACPolicy` instance.
+        :param bool raw: When set to ``True``, return the decoded body of
+                         the response instead of a resource.
 
         :returns: One :class:`~openstack.network.v2.rbac_policy.RBACPolicy`
         :raises: :class:`~openstack.exceptions.ResourceNotFound`
             when no resource can be found.
         """
-        return self._get(_rbac_policy.RBACPolicy, rbac_policy)
+        return self._get(_rbac_policy.RBACPolicy, rbac_policy, raw=raw)
 
     def rbac_policies(self, **query):
         """Return a generator of RBAC policies
@@ -2192,17 +2213,19 @@ class Proxy(proxy2.BaseProxy):
         return self._find(_router.Router, name_or_id,
                           ignore_missing=ignore_missing)
 
-    def get_router(self, router):
+    def get_router(self, router, raw=False):
         """Get a single router
 
         :param router: The value can be the ID of a router or a
                        :class:`~openstack.network.v2.router.Router` instance.
+        :param bool raw: When set to ``True``, return the decoded body of
+                         the response instead of a resource.
 
         :returns: One :class:`~openstack.network.v2.router.Router`
         :raises: :class:`~openstack.exceptions.ResourceNotFound`
                  when no resource can be found.
         """
-        return self._get(_router.Router, router)
+        return self._get(_router.Router, router, raw=raw)
 
     def routers(self, **query):
         """Return a generator of routers
@@ -2401,19 +2424,22 @@ class Proxy(proxy2.BaseProxy):
         return self._find(_security_group.SecurityGroup, name_or_id,
                           ignore_missing=ignore_missing)
 
-    def get_security_group(self, security_group):
+    def get_security_group(self, security_group, raw=False):
         """Get a single security group
 
         :param security_group: The value can be the ID of a security group or a
                :class:`~openstack.network.v2.security_group.SecurityGroup`
                instance.
+        :param bool raw: When set to ``True``, return the decoded body of
+                         the response instead of a resource.
 
         :returns: One
                   :class:`~openstack.network.v2.security_group.SecurityGroup`
         :raises: :class:`~openstack.exceptions.ResourceNotFound`
                  when no resource can be found.
         """
-        return self._get(_security_group.SecurityGroup, security_group)
+        return self._get(_security_group.SecurityGroup, security_group,
+                         raw=raw)
 
     def security_groups(self, **query):
         """Return a generator of security groups
@@ -2604,18 +2630,20 @@ class Proxy(proxy2.BaseProxy):
         return self._find(_segment.Segment, name_or_id,
                           ignore_missing=ignore_missing)
 
-    def get_segment(self, segment):
+    def get_segment(self, segment, raw=False):
         """Get a single segment
 
         :param segment: The value can be the ID of a segment or a
                         :class:`~openstack.network.v2.segment.Segment`
                         instance.
+        :param bool raw: When set to ``True``, return the decoded body of
+                         the response instead of a resource.
 
         :returns: One :class:`~openstack.network.v2.segment.Segment`
         :raises: :class:`~openstack.exceptions.ResourceNotFound`
                  when no resource can be found.
         """
-        return self._get(_segment.Segment, segment)
+        return self._get(_segment.Segment, segment, raw=raw)
 
     def segments(self, **query):
         """Return a generator of segments
@@ -2709,19 +2737,22 @@ class Proxy(proxy2.BaseProxy):
         return self._find(_service_profile.ServiceProfile, name_or_id,
                           ignore_missing=ignore_missing)
 
-    def get_service_profile(self, service_profile):
+    def get_service_profile(self, service_profile, raw=False):
         """Get a single network service flavor profile
 
         :param service_profile: The value can be the ID of a service_profile or
             a :class:`~openstack.network.v2.service_profile.ServiceProfile`
             instance.
+        :param bool raw: When set to ``True``, return the decoded body of
+                         the response instead of a resource.
 
         :returns: One :class:`~openstack.network.v2.service_profile
                       .ServiceProfile`
         :raises: :class:`~openstack.exceptions.ResourceNotFound`
                  when no resource can be found.
         """
-        return self._get(_service_profile.ServiceProfile, service_profile)
+        return self._get(_service_profile.ServiceProfile, service_profile,
+                         raw=raw)
 
     def service_profiles(self, **query):
         """Return a generator of network service flavor profiles
@@ -2796,17 +2827,19 @@ class Proxy(proxy2.BaseProxy):
         return self._find(_subnet.Subnet, name_or_id,
                           ignore_missing=ignore_missing)
 
-    def get_subnet(self, subnet):
+    def get_subnet(self, subnet, raw=False):
         """Get a single subnet
 
         :param subnet: The value can be the ID of a subnet or a
                        :class:`~openstack.network.v2.subnet.Subnet` instance.
+        :param bool raw: When set to ``True``, return the decoded body of
+                         the response instead of a resource.
 
         :returns: One :class:`~openstack.network.v2.subnet.Subnet`
         :raises: :class:`~openstack.exceptions.ResourceNotFound`
                  when no resource can be found.
         """
-        return self._get(_subnet.Subnet, subnet)
+        return self._get(_subnet.Subnet, subnet, raw=raw)
 
     def subnets(self, **query):
         """Return a generator of subnets
@@ -2859,17 +2892,19 @@ class Proxy(proxy2.BaseProxy):
         elb = loadbalancer.LoadBalancer
         return self._list(elb, paginated = False, **query)
 
-    def get_loadbalancer(self, lb):
+    def get_loadbalancer(self, lb, raw=False):
         """Get a single loadbalancer
 
         :param lb: The value can be the ID of a loadbalancer or a
                        :class:`~openstack.network.v2.loadbalancer.LoadBalancer` instance.
+        :param bool raw: When set to ``True``, return the decoded body of
+                         the response instead of a resource.
 
         :returns: One :class:`~openstack.network.v2.loadbalancer.LoadBalancer`
         :raises: :class:`~openstack.exceptions.ResourceNotFound`
                  when no resource can be found.
         """
-        return self._get(loadbalancer.LoadBalancer, lb)
+        return self._get(loadbalancer.LoadBalancer, lb, raw=raw)
 
     def create_loadbalancer(self, **attrs):
         """Create a new loadbalancer from attributes
@@ -2935,17 +2970,19 @@ class Proxy(proxy2.BaseProxy):
         lsn = listener.Listener
         return self._list(lsn, paginated=False, **query)
 
-    def get_listener(self, lsn):
+    def get_listener(self, lsn, raw=False):
         """Get a single listener
 
         :param lsn: The value can be the ID of a listener or a
                        :class:`~openstack.network.v2.listener.Listener` instance.
+        :param bool raw: When set to ``True``, return the decoded body of
+                         the response instead of a resource.
 
         :returns: One :class:`~openstack.network.v2.listener.Listener`
         :raises: :class:`~openstack.exceptions.ResourceNotFound`
                  when no resource can be found.
         """
-        return self._get(listener.Listener, lsn)
+        return self._get(listener.Listener, lsn, raw=raw)
 
     def create_listener(self, **attrs):
         """Create a new listener from attributes
@@ -2997,17 +3034,19 @@ class Proxy(proxy2.BaseProxy):
         pol = pool.Pool
         return self._list(pol, paginated=False, **query)
 
-    def get_pool(self, pol):
+    def get_pool(self, pol, raw=False):
         """Get a single pool
 
         :param pol: The pol can be the ID of a pool or a
                        :class:`~openstack.network.v2.pool.Pool` instance.
+        :param bool raw: When set to ``True``, return the decoded body of
+                         the response instead of a resource.
 
         :returns: One :class:`~openstack.network.v2.pool.Pool`
         :raises: :class:`~openstack.exceptions.ResourceNotFound`
                  when no resource can be found.
         """
-        return self._get(pool.Pool, pol)
+        return self._get(pool.Pool, pol, raw=raw)
 
     def create_pool(self, **attrs):
         """Create a new pool from attributes
@@ -3130,17 +3169,19 @@ class Proxy(proxy2.BaseProxy):
         hlth = healthmonitor.HealthMonitor
         return self._list(hlth, paginated=False, **query)
 
-    def get_healthmonitor(self, hlth):
+    def get_healthmonitor(self, hlth, raw=False):
         """Get a single healthmonitor
 
         :param hlth: The value can be the ID of a healthmonitor or a
                        :class:`~openstack.network.v2.healthmonitor.HealthMonitor` instance.
+        :param bool raw: When set to ``True``, return the decoded body of
+                         the response instead of a resource.
 
         :returns: One :class:`~openstack.network.v2.healthmonitor.HealthMonitor`
         :raises: :class:`~openstack.exceptions.ResourceNotFound`
                  when no resource can be found.
         """
-        return self._get(healthmonitor.HealthMonitor, hlth)
+        return self._get(healthmonitor.HealthMonitor, hlth, raw=raw)
 
     def create_healthmonitor(self, **attrs):
         """Create a new healthmonitor from attributes
@@ -3192,17 +3233,19 @@ class Proxy(proxy2.BaseProxy):
         plc = policy.Policy
         return self._list(plc, paginated=False, **query)
 
-    def get_policy(self, plc):
+    def get_policy(self, plc, raw=False):
         """Get a single policy
 
         :param plc: The value can be the ID of a policy or a
                        :class:`~openstack.network.v2.policy.Policy` instance.
+        :param bool raw: When set to ``True``, return the decoded body of
+                         the response instead of a resource.
 
         :returns: One :class:`~openstack.network.v2.policy.Policy`
         :raises: :class:`~openstack.exceptions.ResourceNotFound`
                  when no resource can be found.
         """
-        return self._get(policy.Policy, plc)
+        return self._get(policy.Policy, plc, raw=raw)
 
 
     def create_policy(self, **attrs):
@@ -3320,17 +3363,19 @@ class Proxy(proxy2.BaseProxy):
         wl = whitelist.WhiteList
         return self._list(wl, paginated=False, **query)
 
-    def get_whitelist(self, wl):
+    def get_whitelist(self, wl, raw=False):
         """Get a single whitelists
 
         :param wl: The value can be the ID of a whitelists or a
                        :class:`~openstack.network.v2.whitelist.Whitelist` instance.
+        :param bool raw: When set to ``True``, return the decoded body of
+                         the response instead of a resource.
 
         :returns: One :class:`~openstack.network.v2.whitelist.Whitelist`
         :raises: :class:`~openstack.exceptions.ResourceNotFound`
                  when no resource can be found.
         """
-        return self._get(whitelist.WhiteList, wl)
+        return self._get(whitelist.WhiteList, wl, raw=raw)
 
     def create_whitelist(self, **attrs):
         """Create a new whitelist from attributes
@@ -3383,17 +3428,19 @@ class Proxy(proxy2.BaseProxy):
         cf = certificate.Certificate
         return self._list(cf, paginated=False, **query)
 
-    def get_certificate(self, cf):
+    def get_certificate(self, cf, raw=False):
         """Get a single certificate
 
         :param cf: The value can be the ID of a certificate or a
                        :class:`~openstack.network.v2.certificate.Certificate` instance.
+        :param bool raw: When set to ``True``, return the decoded body of
+                         the response instead of a resource.
 
         :returns: One :class:`~openstack.network.v2.certificate.Certificate`
         :raises: :class:`~openstack.exceptions.ResourceNotFound`
                  when no resource can be found.
         """
-        return self._get(certificate.Certificate, cf)
+        return self._get(certificate.Certificate, cf, raw=raw)
 
     def create_certificate(self, **attrs):
         """Create a new certificate from attributes
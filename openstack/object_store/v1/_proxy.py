@@ -10,10 +10,162 @@
 # License for the specific language governing permissions and limitations
 # under the License.
 
+import functools
+import hashlib
+import itertools
+import logging
+import os
+
+import six
+
+from openstack import exceptions
 from openstack.object_store.v1 import account as _account
 from openstack.object_store.v1 import container as _container
 from openstack.object_store.v1 import obj as _obj
 from openstack import proxy
+from openstack import utils
+
+_logger = logging.getLogger(__name__)
+
+#: The number of segments of a large object uploaded at once by default.
+DEFAULT_UPLOAD_WORKERS = 4
+#: The number of segments a static large object may have at most by
+#: default, the default ``max_manifest_segments`` of the Object Store.
+DEFAULT_MAX_SEGMENTS = 1000
+#: The size of the chunks an object is downloaded in by default.
+DEFAULT_CHUNK_SIZE = 64 * 1024
+#: The size of the ranges an object is split in for parallel downloads.
+DEFAULT_RANGE_SIZE = 32 * 1024 * 1024
+#: The number of partitions of a container listed at once by default.
+DEFAULT_LIST_WORKERS = 8
+#: The number of objects deleted at once, or of bulk deletes sent at once,
+#: by default.
+DEFAULT_DELETE_WORKERS = 8
+#: The number of objects deleted by one bulk delete request by default, the
+#: default limit of the bulk delete middleware.
+DEFAULT_BULK_DELETE_SIZE = 10000
+
+
+class BulkDeleteResult(object):
+    """The outcome of deleting objects in bulk, updated as they are deleted
+
+    :ivar int deleted: The number of objects deleted.
+    :ivar int not_found: The number of objects which did not exist.
+    :ivar list failures: The ``(name, reason)`` tuples of the objects which
+                         could not be deleted.
+    :ivar bool bulk: Whether the bulk delete middleware was used.
+    """
+
+    def __init__(self):
+        self.deleted = 0
+        self.not_found = 0
+        self.failures = []
+        self.bulk = False
+
+    @property
+    def processed(self):
+        """The number of objects deleted, not found or failed so far"""
+        return self.deleted + self.not_found + len(self.failures)
+
+    def __repr__(self):
+        return ("BulkDeleteResult(deleted=%d, not_found=%d, failures=%d)" %
+                (self.deleted, self.not_found, len(self.failures)))
+
+
+def _batches(iterable, size):
+    batch = []
+    for item in iterable:
+        batch.append(item)
+        if len(batch) >= size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+def _checksum(headers):
+    """Return the MD5 checksum of an object's content, from its headers
+
+    :returns: The checksum, or None when the ``ETag`` of the object is not
+              the checksum of the content returned, as for the large
+              objects and the encoded content.
+    """
+    if (headers.get("x-static-large-object") or
+            headers.get("x-object-manifest") or
+            headers.get("content-encoding")):
+        return None
+    etag = headers.get("etag")
+    return etag.strip('"') if etag else None
+
+
+def _verify_checksum(expected, digest, name):
+    if expected is not None and expected != digest.hexdigest():
+        raise exceptions.InvalidResponse(
+            "checksum mismatch for object %s: %s != %s" %
+            (name, expected, digest.hexdigest()))
+
+
+def _read_segment(stream, size):
+    """Read up to ``size`` bytes, less only at the end of the stream"""
+    parts = []
+    while size > 0:
+        part = stream.read(size)
+        if not part:
+            break
+        parts.append(part)
+        size -= len(part)
+    return b"".join(parts)
+
+
+def _data_size(data):
+    """Return the size of the data left to read, None if it's unknown"""
+    if not hasattr(data, "read"):
+        return len(data) if data else 0
+    try:
+        return os.fstat(data.fileno()).st_size - data.tell()
+    except (AttributeError, EnvironmentError, ValueError):
+        pass
+    try:
+        position = data.tell()
+        data.seek(0, os.SEEK_END)
+        size = data.tell()
+        data.seek(position)
+        return size - position
+    except (AttributeError, EnvironmentError, ValueError):
+        return None
+
+
+def _segments(data, segment_size, max_segments=None):
+    """Split data into segments
+
+    :param data: The bytes, or a binary file-like object which is read one
+                 segment at a time.
+    :param int segment_size: The size of the segments, in bytes.
+    :param int max_segments: The number of segments the data may be split
+                             in at most.
+
+    :return: A generator of ``(index, segment)`` tuples.
+    :raises: ``ValueError`` before reading the segment past
+             ``max_segments``.
+    """
+    if isinstance(data, six.text_type):
+        data = data.encode("utf-8")
+    if hasattr(data, "read"):
+        index = 0
+        while True:
+            segment = _read_segment(data, segment_size)
+            if not segment:
+                return
+            if max_segments is not None and index >= max_segments:
+                raise ValueError(
+                    "the data needs more than %d segments of %d bytes" %
+                    (max_segments, segment_size))
+            yield index, segment
+            index += 1
+    elif data:
+        for index, start in enumerate(six.moves.range(0, len(data),
+                                                      segment_size)):
+            yield index, data[start:start + segment_size]
 
 
 class Proxy(proxy.BaseProxy):
@@ -156,6 +308,213 @@ class Proxy(proxy.BaseProxy):
             obj.container = container.name
             yield obj
 
+    def objects_by_prefix(self, container, prefixes=None, delimiter="/",
+                          workers=DEFAULT_LIST_WORKERS):
+        """Return a generator listing a container in concurrent partitions
+
+        The names of the container are partitioned by prefix, and the
+        partitions are listed concurrently, each page after page. Unless
+        ``prefixes`` are given, the container is first listed with the
+        ``delimiter``, whose pseudo-directories become the partitions
+        while the objects outside of them are yielded right away.
+
+        :param container: A container object or the name of a container
+            that you want to retrieve objects from.
+        :type container:
+            :class:`~openstack.object_store.v1.container.Container`
+        :param list prefixes: The prefixes partitioning the names. They
+                              must not overlap, and the objects matching
+                              none are not listed.
+        :param str delimiter: The delimiter of the pseudo-directories
+                              partitioning the names without ``prefixes``.
+                              None lists the container as one partition.
+        :param int workers: The number of partitions listed at once.
+
+        :rtype: A generator of
+            :class:`~openstack.object_store.v1.obj.Object` objects, in
+            the order of the names within each partition only.
+        """
+        container_name = _container.Container.from_id(container).name
+
+        if prefixes is None:
+            prefixes = []
+            if delimiter is None:
+                prefixes.append("")
+            else:
+                for entry in self._list_entries(container_name,
+                                                delimiter=delimiter):
+                    if "subdir" in entry:
+                        prefixes.append(entry["subdir"])
+                    else:
+                        yield self._listed_object(container_name, entry)
+
+        partitions = [self._list_pages(container_name, prefix=prefix)
+                      for prefix in prefixes]
+        for page in utils.merge_concurrently(partitions, workers):
+            for entry in page:
+                yield self._listed_object(container_name, entry)
+
+    def _list_pages(self, container, **params):
+        """Yield the pages of entries of a container listing
+
+        The entries are the dicts of the objects listed, and of the
+        pseudo-directories with a ``delimiter``, with a ``subdir`` key
+        instead of a ``name``.
+        """
+        url = _obj.Object._get_url({"container": container})
+        headers = {"Accept": "application/json"}
+        while True:
+            response = self._session.get(url,
+                                         endpoint_filter=_obj.Object.service,
+                                         headers=headers, params=params)
+            page = response.json() if response.content else []
+            if not page:
+                return
+            yield page
+            last = page[-1]
+            params["marker"] = last.get("name", last.get("subdir"))
+
+    def _list_entries(self, container, **params):
+        for page in self._list_pages(container, **params):
+            for entry in page:
+                yield entry
+
+    @staticmethod
+    def _listed_object(container, entry):
+        obj = _obj.Object.existing(**entry)
+        obj.container = container
+        return obj
+
+    def delete_objects(self, container, objects=None,
+                       workers=DEFAULT_DELETE_WORKERS,
+                       batch_size=DEFAULT_BULK_DELETE_SIZE, bulk=None,
+                       progress=None):
+        """Delete many objects of a container
+
+        The objects are deleted by batches of ``batch_size`` through the
+        bulk delete middleware of the object store, ``workers`` batches at
+        once. When the middleware is not available, they are deleted one
+        request each, ``workers`` at once. The failures do not stop the
+        deletion, they are reported in the result.
+
+        :param container: The value can be the name of a container or a
+               :class:`~openstack.object_store.v1.container.Container`
+               instance.
+        :param objects: The names of the objects or
+                        :class:`~openstack.object_store.v1.obj.Object`
+                        instances, in any iterable. None deletes all of the
+                        objects of the container, listed with
+                        :meth:`objects_by_prefix`.
+        :param int workers: The number of requests sent at once.
+        :param int batch_size: The number of objects deleted by one bulk
+                               delete request.
+        :param bool bulk: True to only use the bulk delete middleware,
+                          False to never use it, None to use it when the
+                          object store has it.
+        :param progress: A callable called with the
+                         :class:`BulkDeleteResult` after each batch.
+
+        :returns: A :class:`BulkDeleteResult`.
+        :raises: :class:`~openstack.exceptions.HttpException` when ``bulk``
+                 is True and the bulk delete middleware is not available.
+        """
+        container_name = _container.Container.from_id(container).name
+        if objects is None:
+            objects = self.objects_by_prefix(container_name)
+        names = (obj.name if isinstance(obj, _obj.Object) else obj
+                 for obj in objects)
+        batches = _batches(names, batch_size)
+        result = BulkDeleteResult()
+
+        def report():
+            if progress is not None:
+                progress(result)
+
+        if bulk is not False:
+            for batch in batches:
+                # the first batch tells whether the middleware is there
+                outcome = self._bulk_delete(container_name, batch,
+                                            strict=bool(bulk))
+                if outcome is None:
+                    batches = itertools.chain([batch], batches)
+                    break
+                result.bulk = True
+                self._add_bulk_outcome(result, outcome)
+                report()
+                delete = functools.partial(self._bulk_delete,
+                                           container_name, strict=True)
+                for outcome in utils.map_ordered(delete, batches, workers):
+                    self._add_bulk_outcome(result, outcome)
+                    report()
+                return result
+
+        def delete(name):
+            try:
+                self._delete(_obj.Object, name, ignore_missing=False,
+                             path_args={"container": container_name})
+            except exceptions.NotFoundException:
+                return name, False
+            except exceptions.SDKException as e:
+                return name, e
+            return name, True
+
+        for batch in batches:
+            for name, outcome in utils.map_ordered(delete, batch, workers):
+                if outcome is True:
+                    result.deleted += 1
+                elif outcome is False:
+                    result.not_found += 1
+                else:
+                    result.failures.append((name, str(outcome)))
+            report()
+        return result
+
+    def _bulk_delete(self, container, names, strict=True):
+        """Delete objects with one request to the bulk delete middleware
+
+        :param bool strict: When set to ``False``, return None instead of
+                            raising when the middleware is not available.
+        :returns: The names and the decoded report of the middleware.
+        """
+        body = "\n".join(
+            six.moves.urllib.parse.quote(
+                (u"/%s/%s" % (container, name)).encode("utf-8"), safe="/")
+            for name in names)
+        try:
+            response = self._session.post(
+                _account.Account.base_path,
+                endpoint_filter=_account.Account.service,
+                params={"bulk-delete": ""}, data=body.encode("utf-8"),
+                headers={"Content-Type": "text/plain",
+                         "Accept": "application/json"})
+            report = response.json()
+            if "Number Deleted" not in report:
+                raise ValueError("not a bulk delete report")
+        except (exceptions.HttpException, ValueError):
+            if strict:
+                raise
+            _logger.debug("Bulk delete is not available, deleting the "
+                          "objects one by one")
+            return None
+        return names, report
+
+    @staticmethod
+    def _add_bulk_outcome(result, outcome):
+        names, report = outcome
+        errors = report.get("Errors") or []
+        status = report.get("Response Status", "")
+        if not errors and not status.startswith("2"):
+            # the whole request failed, e.g. for too many objects
+            reason = report.get("Response Body") or status
+            result.failures.extend((name, reason) for name in names)
+            return
+        result.deleted += report.get("Number Deleted", 0)
+        result.not_found += report.get("Number Not Found", 0)
+        for path, reason in errors:
+            path = six.moves.urllib.parse.unquote(path)
+            name = path.lstrip("/").split("/", 1)[-1]
+            result.failures.append((name, reason))
+
     def _get_container_name(self, obj, container):
         if isinstance(obj, _obj.Object):
             if obj.container is not None:
@@ -188,45 +547,203 @@ class Proxy(proxy.BaseProxy):
         return self._get(_obj.Object, obj,
                          path_args={"container": container_name})
 
-    def download_object(self, obj, container=None, path=None):
+    def download_object(self, obj, container=None, path=None,
+                        chunk_size=DEFAULT_CHUNK_SIZE, workers=1,
+                        range_size=DEFAULT_RANGE_SIZE):
         """Download the data contained inside an object to disk.
 
+        The content is written to the file as it is received, one chunk at
+        a time, so the memory used does not depend on the size of the
+        object. Its MD5 checksum is computed along the way and compared to
+        the ``ETag`` of the object, except for the large objects, whose
+        ``ETag`` is not the checksum of their content.
+
+        With several ``workers``, an object larger than ``range_size`` is
+        downloaded with as many concurrent range requests, each writing
+        its part at its offset in the file, which is first extended to the
+        size of the object. The ranges are only accepted from the object
+        with the ``ETag`` found first, and the checksum is computed over
+        each part of the file once the parts before it are written.
+
         :param obj: The value can be the name of an object or a
                        :class:`~openstack.object_store.v1.obj.Object` instance.
         :param container: The value can be the name of a container or a
                :class:`~openstack.object_store.v1.container.Container`
                instance.
         :param path str: Location to write the object contents.
+        :param int chunk_size: The size of the chunks read and written.
+        :param int workers: The number of ranges downloaded at once.
+        :param int range_size: The size of the ranges, with several
+                               ``workers``.
 
         :raises: :class:`~openstack.exceptions.ResourceNotFound`
                  when no resource can be found.
+        :raises: :class:`~openstack.exceptions.InvalidResponse` when the
+                 content does not match the checksum of the object.
         """
-        # TODO(briancurtin): download_object should really have the behavior
-        # of get_object, and this writing to a file should not exist.
-        # TODO(briancurtin): This method should probably offload the get
-        # operation into another thread or something of that nature.
-        with open(path, "w") as out:
-            out.write(self.get_object(obj, container))
-
-    def upload_object(self, **attrs):
+        container_name = self._get_container_name(obj, container)
+        res = self._get_resource(_obj.Object, obj,
+                                 path_args={"container": container_name})
+
+        if workers > 1:
+            head = self._head(_obj.Object, res,
+                              path_args={"container": container_name})
+            length = int(head.content_length or 0)
+            if length > range_size:
+                headers = head.get_headers()
+                expected = _checksum(headers)
+                digest = hashlib.md5() if expected is not None else None
+                utils.download_ranges(
+                    functools.partial(res.get_stream, self._session,
+                                      if_match=headers.get("etag")),
+                    path, length, range_size, workers, chunk_size, digest)
+                _verify_checksum(expected, digest, res.name)
+                return
+
+        digest = hashlib.md5()
+        response = res.get_stream(self._session)
+        utils.save_response(response, path, chunk_size, digest)
+        _verify_checksum(_checksum(response.headers), digest, res.name)
+
+    def upload_object(self, segment_size=None,
+                      workers=DEFAULT_UPLOAD_WORKERS, segment_container=None,
+                      resume=False, max_segments=DEFAULT_MAX_SEGMENTS,
+                      **attrs):
         """Upload a new object from attributes
 
+        With a ``segment_size``, the ``data`` is uploaded as a static large
+        object: it is split into segments which are uploaded by
+        ``workers`` concurrent requests to the ``segment_container``,
+        then a manifest listing them is written as the object. The data
+        can then be larger than the memory, only ``workers`` segments
+        being read ahead of the uploads. Every segment is sent with the
+        MD5 checksum of its content as its ``ETag``, which the server
+        verifies, and the ``ETag`` the server returns is checked as well.
+
+        A static large object can only have ``max_segments`` segments,
+        the ``max_manifest_segments`` the Object Store reports in its
+        ``/info``. When the size of the data is known, it is checked
+        before anything is uploaded. Otherwise the upload stops before
+        the segment past the limit, instead of failing when the manifest
+        is written.
+
+        The segments of ``name`` are named ``name/slo/segment_size/index``.
+        When an upload fails, they are left in place so that uploading the
+        same data again with ``resume=True`` only sends the segments which
+        are missing or whose checksum differs.
+
+        :param int segment_size: The size of the segments in bytes, None to
+                                 upload the data with one request.
+        :param int workers: The number of segments uploaded at once.
+        :param segment_container: The name of the container of the
+               segments, or a
+               :class:`~openstack.object_store.v1.container.Container`
+               instance. It defaults to the container of the object with a
+               ``_segments`` suffix, and is created if needed.
+        :param bool resume: When set to ``True``, list the segments already
+                            uploaded and skip the ones whose checksum and
+                            size match.
+        :param int max_segments: The number of segments a static large
+                                 object may have at most, None for no
+                                 limit.
         :param dict attrs: Keyword arguments which will be used to create
                a :class:`~openstack.object_store.v1.obj.Object`,
                comprised of the properties on the Object class.
                **Required**: A `container` argument must be specified,
                which is either the ID of a container or a
                :class:`~openstack.object_store.v1.container.Container`
-               instance.
+               instance. With a ``segment_size``, ``data`` may also be a
+               binary file-like object and a `name` must be specified.
 
         :returns: The results of object creation
         :rtype: :class:`~openstack.object_store.v1.container.Container`
+        :raises: :class:`~openstack.exceptions.InvalidResponse` when the
+                 server returns another ``ETag`` for a segment than the
+                 checksum of its content.
+        :raises: ``ValueError`` when the data needs more than
+                 ``max_segments`` segments.
         """
         container = attrs.pop("container", None)
         container_name = self._get_container_name(None, container)
 
-        return self._create(_obj.Object,
-                            path_args={"container": container_name}, **attrs)
+        if segment_size is None:
+            return self._create(_obj.Object,
+                                path_args={"container": container_name},
+                                **attrs)
+        if not attrs.get("name"):
+            raise ValueError("name must be specified")
+        if segment_size <= 0:
+            raise ValueError("segment_size must be positive")
+        data = attrs.pop("data", None)
+        if isinstance(data, six.text_type):
+            data = data.encode("utf-8")
+        size = _data_size(data)
+        if (max_segments is not None and size is not None and
+                size > segment_size * max_segments):
+            raise ValueError(
+                "the data needs %d segments of %d bytes, more than %d" %
+                (-(-size // segment_size), segment_size, max_segments))
+
+        if segment_container is None:
+            segment_container = container_name + "_segments"
+        else:
+            segment_container = _container.Container.from_id(
+                segment_container).name
+        self._create(_container.Container, name=segment_container)
+
+        prefix = "%s/slo/%d/" % (attrs["name"], segment_size)
+        uploaded = {}
+        if resume:
+            uploaded = self._uploaded_segments(segment_container, prefix)
+
+        def upload(segment):
+            index, content = segment
+            name = "%s%08d" % (prefix, index)
+            etag = hashlib.md5(content).hexdigest()
+            if uploaded.get(name) == (etag, len(content)):
+                _logger.debug("Segment %s is already uploaded", name)
+            else:
+                self._upload_segment(segment_container, name, content, etag)
+            return "/%s/%s" % (segment_container, name), etag, len(content)
+
+        segments = list(utils.map_ordered(
+            upload, _segments(data, segment_size, max_segments),
+            max(1, workers)))
+        if not segments:
+            # a manifest must list at least one segment
+            return self._create(_obj.Object,
+                                path_args={"container": container_name},
+                                data=b"", **attrs)
+
+        manifest = _obj.Object.new(**attrs)
+        manifest.update_attrs({"container": container_name})
+        return manifest.create_manifest(self._session, segments)
+
+    def _uploaded_segments(self, container, prefix):
+        """Return the checksum and size of the segments under a prefix
+
+        :returns: A dict of ``(etag, size)`` tuples by segment name, empty
+                  when the container does not exist.
+        """
+        uploaded = {}
+        try:
+            for segment in _obj.Object.list(
+                    self._session, path_args={"container": container},
+                    paginated=True, params={"prefix": prefix}):
+                uploaded[segment.name] = (segment.hash, segment.bytes)
+        except exceptions.NotFoundException:
+            pass
+        return uploaded
+
+    def _upload_segment(self, container, name, content, etag):
+        segment = _obj.Object.new(container=container, name=name,
+                                  data=content, etag=etag)
+        segment.create(self._session)
+        returned = (segment.etag or "").strip('"')
+        if returned and returned != etag:
+            raise exceptions.InvalidResponse(
+                "checksum mismatch for segment %s: %s != %s" %
+                (name, etag, returned))
 
     def copy_object(self):
         """Copy an object."""
@@ -272,10 +789,12 @@ class Proxy(proxy.BaseProxy):
         return self._head(_obj.Object, obj,
                           path_args={"container": container_name})
 
-    def set_object_metadata(self, obj, container=None, **metadata):
+    def set_object_metadata(self, obj, container=None, current=None,
+                            if_match=None, **metadata):
         """Set metadata for an object.
 
-        Note: This method will do an extra HEAD call.
+        Note: This method will do an extra HEAD call, unless the current
+        metadata of the object are given.
 
         :param obj: The value can be the name of an object or a
                     :class:`~openstack.object_store.v1.obj.Object` instance.
@@ -296,13 +815,28 @@ class Proxy(proxy.BaseProxy):
                                 - `delete_after`
                                 - `delete_at`
                                 - `is_content_type_detected`
+        :param dict current: The metadata the object has, keyed like
+                             ``metadata``, so that they are kept without
+                             reading them first. An empty dict replaces
+                             the metadata of the object.
+        :param str if_match: The ``ETag`` the object must have, for the
+                             metadata not to be set on an object replaced
+                             in the meantime. It is checked by the HEAD
+                             request, a mismatch raising
+                             :class:`~openstack.exceptions.HttpException`
+                             with a ``412`` status, so it can't be given
+                             along with ``current``.
+        :raises: ``ValueError`` when both ``current`` and ``if_match`` are
+                 given.
         """
         container_name = self._get_container_name(obj, container)
         res = self._get_resource(_obj.Object, obj,
                                  path_args={"container": container_name})
-        res.set_metadata(self._session, metadata)
+        res.set_metadata(self._session, metadata, current=current,
+                         if_match=if_match)
 
-    def delete_object_metadata(self, obj, container=None, keys=None):
+    def delete_object_metadata(self, obj, container=None, keys=None,
+                               current=None, if_match=None):
         """Delete metadata for an object.
 
         :param obj: The value can be the name of an object or a
@@ -311,8 +845,15 @@ class Proxy(proxy.BaseProxy):
                :class:`~openstack.object_store.v1.container.Container`
                instance.
         :param keys: The keys of metadata to be deleted.
+        :param dict current: The metadata the object has, so that the others
+                             are kept without reading them first.
+        :param str if_match: The ``ETag`` the object must have. See
+                             :meth:`set_object_metadata`.
+        :raises: ``ValueError`` when both ``current`` and ``if_match`` are
+                 given.
         """
         container_name = self._get_container_name(obj, container)
         res = self._get_resource(_obj.Object, obj,
                                  path_args={"container": container_name})
-        res.delete_metadata(self._session, keys)
+        res.delete_metadata(self._session, keys, current=current,
+                            if_match=if_match)
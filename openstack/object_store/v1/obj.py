@@ -12,6 +12,8 @@
 # under the License.
 
 import copy
+import json
+
 import six
 
 from openstack.object_store import object_store_service
@@ -161,43 +163,106 @@ class Object(_base.BaseResource):
     #: COPY operation to copy an object.
     copy_from = resource.header("x-copy-from")
 
+    def _existing_metadata(self, session, if_match=None):
+        """Get the custom and system metadata of this object
+
+        The metadata are read with a HEAD request, which also refreshes the
+        headers of this instance.
+
+        :param str if_match: The ``ETag`` the object must have, the request
+                             failing with a ``412`` status otherwise.
+
+        :return: A dict of the metadata, keyed like for
+                 :meth:`set_metadata`.
+        """
+        url = self._get_url(self, self.id)
+        headers = {'Accept': ''}
+        if if_match is not None:
+            headers['If-Match'] = if_match
+        resp = session.head(url, endpoint_filter=self.service,
+                            headers=headers)
+        self.set_headers(resp.headers)
+        self._set_metadata()
+
+        metadata = copy.deepcopy(self.metadata)
+        for key in self._system_metadata:
+            value = getattr(self, key)
+            if value:
+                metadata[key] = value
+        return metadata
+
+    def _current_metadata(self, session, current, if_match):
+        if current is None:
+            return self._existing_metadata(session, if_match)
+        # the Object Store only checks If-Match when reading the object
+        if if_match is not None:
+            raise ValueError("if_match can't be checked when the current "
+                             "metadata are given")
+        return current
+
+    def _post_metadata(self, session, metadata):
+        url = self._get_url(self, self.id)
+        session.post(url, endpoint_filter=self.service,
+                     headers=self._calculate_headers(metadata))
+
     # The Object Store treats the metadata for its resources inconsistently so
     # Object.set_metadata must override the BaseResource.set_metadata to
     # account for it.
-    def set_metadata(self, session, metadata):
+    def set_metadata(self, session, metadata, current=None, if_match=None):
+        """Set metadata on this object, keeping its other metadata
+
+        A POST replaces all of the metadata of an object, so the existing
+        metadata are first read with a HEAD request and sent along with the
+        new ones, unless the caller passes them as ``current``, in which
+        case the update is one request.
+
+        :param session: The session to use for making this request.
+        :type session: :class:`~openstack.session.Session`
+        :param dict metadata: The metadata to set, the custom ones and the
+                              system ones keyed by their attribute name.
+        :param dict current: The metadata the object has, keyed the same
+                             way, to skip reading them. An empty dict
+                             replaces the metadata of the object.
+        :param str if_match: The ``ETag`` the object must have. It is sent
+                             with the HEAD request, which fails with a
+                             ``412`` status when the object was replaced.
+                             The Object Store does not check it on POST,
+                             so it can't be given along with ``current``.
+        :raises: ``ValueError`` when both ``current`` and ``if_match`` are
+                 given.
+        """
         # Filter out items with empty values so the create metadata behaviour
         # is the same as account and container
         filtered_metadata = \
             {key: value for key, value in six.iteritems(metadata) if value}
 
-        # Get a copy of the original metadata so it doesn't get erased on POST
-        # and update it with the new metadata values.
-        obj = self.head(session)
-        metadata2 = copy.deepcopy(obj.metadata)
+        # Get a copy of the original metadata, including the system ones, so
+        # they don't get erased on POST and update it with the new values.
+        current = self._current_metadata(session, current, if_match)
+        metadata2 = copy.deepcopy(current)
         metadata2.update(filtered_metadata)
 
-        # Include any original system metadata so it doesn't get erased on POST
-        for key in self._system_metadata:
-            value = getattr(obj, key)
-            if value and key not in metadata2:
-                metadata2[key] = value
-
-        super(Object, self).set_metadata(session, metadata2)
+        self._post_metadata(session, metadata2)
 
     # The Object Store treats the metadata for its resources inconsistently so
     # Object.delete_metadata must override the BaseResource.delete_metadata to
     # account for it.
-    def delete_metadata(self, session, keys):
-        # Get a copy of the original metadata so it doesn't get erased on POST
-        # and update it with the new metadata values.
-        obj = self.head(session)
-        metadata = copy.deepcopy(obj.metadata)
+    def delete_metadata(self, session, keys, current=None, if_match=None):
+        """Delete metadata of this object, keeping its other metadata
 
-        # Include any original system metadata so it doesn't get erased on POST
-        for key in self._system_metadata:
-            value = getattr(obj, key)
-            if value:
-                metadata[key] = value
+        :param session: The session to use for making this request.
+        :type session: :class:`~openstack.session.Session`
+        :param keys: The keys of the metadata to delete.
+        :param dict current: The metadata the object has, to skip reading
+                             them. See :meth:`set_metadata`.
+        :param str if_match: The ``ETag`` the object must have. See
+                             :meth:`set_metadata`.
+        :raises: ``ValueError`` when both ``current`` and ``if_match`` are
+                 given.
+        """
+        # Get a copy of the original metadata so it doesn't get erased on POST
+        current = self._current_metadata(session, current, if_match)
+        metadata = copy.deepcopy(current)
 
         # Remove the metadata
         for key in keys:
@@ -206,9 +271,7 @@ class Object(_base.BaseResource):
             else:
                 del(metadata[key])
 
-        url = self._get_url(self, self.id)
-        session.post(url, endpoint_filter=self.service,
-                     headers=self._calculate_headers(metadata))
+        self._post_metadata(session, metadata)
 
     def get(self, session, include_headers=False, args=None):
         url = self._get_url(self, self.id)
@@ -218,6 +281,31 @@ class Object(_base.BaseResource):
         self._set_metadata()
         return resp
 
+    def get_stream(self, session, start=None, end=None, if_match=None):
+        """Request the content of this object without reading it
+
+        :param session: The session to use for making this request.
+        :type session: :class:`~openstack.session.Session`
+        :param int start: The offset of the first byte to request, None to
+                          request the whole content.
+        :param int end: The offset of the last byte to request, None to
+                        request up to the end of the content.
+        :param str if_match: The ``ETag`` the object must have, the
+                             request failing with a ``412`` status when it
+                             was replaced.
+
+        :return: The response, whose body is read with ``iter_content``.
+        """
+        url = self._get_url(self, self.id)
+        headers = {'Accept': 'bytes'}
+        if start is not None:
+            headers['Range'] = 'bytes=%d-%s' % (
+                start, '' if end is None else end)
+        if if_match:
+            headers['If-Match'] = if_match
+        return session.get(url, endpoint_filter=self.service,
+                           headers=headers, stream=True)
+
     def create(self, session):
         url = self._get_url(self, self.id)
 
@@ -232,3 +320,27 @@ class Object(_base.BaseResource):
                                 headers=headers).headers
         self.set_headers(resp)
         return self
+
+    def create_manifest(self, session, segments):
+        """Create this object as a static large object
+
+        :param session: The session to use for making this request.
+        :type session: :class:`~openstack.session.Session`
+        :param segments: The uploaded segments, in order, as ``(path, etag,
+                         size)`` tuples where ``path`` is the
+                         ``/container/name`` of the segment.
+
+        :return: This instance.
+        """
+        url = self._get_url(self, self.id)
+        manifest = [{"path": path, "etag": etag, "size_bytes": size}
+                    for path, etag, size in segments]
+
+        headers = self.get_headers()
+        headers['Accept'] = ''
+        resp = session.put(url, endpoint_filter=self.service,
+                           params={"multipart-manifest": "put"},
+                           data=json.dumps(manifest),
+                           headers=headers).headers
+        self.set_headers(resp)
+        return self
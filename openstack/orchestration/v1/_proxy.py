@@ -67,17 +67,19 @@ class Proxy(proxy2.BaseProxy):
         """
         return self._list(_stack.Stack, paginated=False, **query)
 
-    def get_stack(self, stack):
+    def get_stack(self, stack, raw=False):
         """Get a single stack
 
         :param stack: The value can be the ID of a stack or a
                :class:`~openstack.orchestration.v1.stack.Stack` instance.
+        :param bool raw: When set to ``True``, return the decoded body of
+                         the response instead of a resource.
 
         :returns: One :class:`~openstack.orchestration.v1.stack.Stack`
         :raises: :class:`~openstack.exceptions.ResourceNotFound`
                  when no resource can be found.
         """
-        return self._get(_stack.Stack, stack)
+        return self._get(_stack.Stack, stack, raw=raw)
 
     def update_stack(self, stack, **attrs):
         """Update a stack
@@ -235,17 +237,19 @@ class Proxy(proxy2.BaseProxy):
         """
         return self._list(_sc.SoftwareConfig, paginated=True, **query)
 
-    def get_software_config(self, software_config):
+    def get_software_config(self, software_config, raw=False):
         """Get details about a specific software config.
 
         :param software_config: The value can be the ID of a software config
             or a instace of
             :class:`~openstack.orchestration.v1.software_config.SoftwareConfig`,
+        :param bool raw: When set to ``True``, return the decoded body of
+                         the response instead of a resource.
 
         :returns: An object of type
             :class:`~openstack.orchestration.v1.software_config.SoftwareConfig`
         """
-        return self._get(_sc.SoftwareConfig, software_config)
+        return self._get(_sc.SoftwareConfig, software_config, raw=raw)
 
     def delete_software_config(self, software_config, ignore_missing=True):
         """Delete a software config
@@ -287,17 +291,19 @@ class Proxy(proxy2.BaseProxy):
         """
         return self._list(_sd.SoftwareDeployment, paginated=False, **query)
 
-    def get_software_deployment(self, software_deployment):
+    def get_software_deployment(self, software_deployment, raw=False):
         """Get details about a specific software deployment resource
 
         :param software_deployment: The value can be the ID of a software
             deployment or an instace of
             :class:`~openstack.orchestration.v1.software_deployment.SoftwareDeployment`,
+        :param bool raw: When set to ``True``, return the decoded body of
+                         the response instead of a resource.
 
         :returns: An object of type
             :class:`~openstack.orchestration.v1.software_deployment.SoftwareDeployment`
         """
-        return self._get(_sd.SoftwareDeployment, software_deployment)
+        return self._get(_sd.SoftwareDeployment, software_deployment, raw=raw)
 
     def delete_software_deployment(self, software_deployment,
                                    ignore_missing=True):
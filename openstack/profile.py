@@ -66,51 +66,91 @@ The resulting preference print out would look something like::
     service_type=identity,region=zion,version=v3
 """
 
+from collections import namedtuple
 import copy
+import importlib
 import logging
 
 import six
 
 from openstack import exceptions
-from openstack import module_loader
-from openstack.anti_ddos import anti_ddos_service
-from openstack.auto_scaling import auto_scaling_service
-from openstack.block_store import block_store_service
-from openstack.cdn import cdn_service
-from openstack.cloud_eye import cloud_eye_service
-from openstack.compute import compute_service
-from openstack.cts import cts_service
-from openstack.dms import dms_service
-from openstack.dns import dns_service
-from openstack.ecs import ecs_service
-from openstack.evs import evs_service
-from openstack.identity import identity_service
-from openstack.image import image_service
-from openstack.kms import kms_service
-from openstack.load_balancer import load_balancer_service as lb_service
-from openstack.maas import maas_service
-from openstack.map_reduce import map_reduce_service
-from openstack.network import network_service
-from openstack.orchestration import orchestration_service
-from openstack.smn import smn_service
-from openstack.volume_backup import volume_backup_service
-from openstack.vpc import vpc_service
-from openstack.bms import bms_service
-
-# from openstack.key_manager import key_manager_service
-# from openstack.bare_metal import bare_metal_service
-# from openstack.cluster import cluster_service
-# from openstack.database import database_service
-# from openstack.message import message_service
-# from openstack.object_store import object_store_service
-from openstack.rds import rds_service
-# from openstack.rds_os import rds_os_service
-# from openstack.telemetry.alarm import alarm_service
-# from openstack.telemetry import telemetry_service
-# from openstack.workflow import workflow_service
 
 _logger = logging.getLogger(__name__)
 
+ServiceDescriptor = namedtuple("ServiceDescriptor",
+                               ["service_type", "module", "class_name",
+                                "version"])
+"""Where to find a service filter, without importing its module.
+
+:param service_type: The type the service filter registers.
+:param module: The module defining the service filter class.
+:param class_name: The name of the service filter class.
+:param version: The default version of the service.
+"""
+
+SERVICES = [
+    ServiceDescriptor("anti-ddos", "openstack.anti_ddos.anti_ddos_service",
+                      "AntiDDosService", "v1"),
+    ServiceDescriptor("volume", "openstack.block_store.block_store_service",
+                      "BlockStoreService", "v2"),
+    ServiceDescriptor("compute", "openstack.compute.compute_service",
+                      "ComputeService", "v2"),
+    ServiceDescriptor("cts", "openstack.cts.cts_service", "CTSService", "v1"),
+    ServiceDescriptor("dms", "openstack.dms.dms_service", "DMSService", "v1"),
+    ServiceDescriptor("identity", "openstack.identity.identity_service",
+                      "IdentityService", "v3"),
+    ServiceDescriptor("image", "openstack.image.image_service",
+                      "ImageService", "v2"),
+    ServiceDescriptor("kms", "openstack.kms.kms_service", "KMSService", "v1"),
+    ServiceDescriptor("maas", "openstack.maas.maas_service",
+                      "MaaSService", "v1"),
+    ServiceDescriptor("network", "openstack.network.network_service",
+                      "NetworkService", "v2.0"),
+    ServiceDescriptor("orchestration",
+                      "openstack.orchestration.orchestration_service",
+                      "OrchestrationService", "v1"),
+    ServiceDescriptor("smn", "openstack.smn.smn_service", "SMNService", "v2"),
+    # QianBiao.NG HuaWei Services
+    ServiceDescriptor("dns", "openstack.dns.dns_service", "DNSService", "v2"),
+    ServiceDescriptor("cloud-eye", "openstack.cloud_eye.cloud_eye_service",
+                      "CloudEyeService", "v1"),
+    ServiceDescriptor("auto-scaling",
+                      "openstack.auto_scaling.auto_scaling_service",
+                      "AutoScalingService", "v1"),
+    ServiceDescriptor("volume-backup",
+                      "openstack.volume_backup.volume_backup_service",
+                      "VolumeBackupService", "v2"),
+    ServiceDescriptor("map-reduce", "openstack.map_reduce.map_reduce_service",
+                      "MapReduceService", "v1"),
+    ServiceDescriptor("evsv2.1", "openstack.evs.evs_service",
+                      "EvsServiceV2_1", "v2.1"),
+    ServiceDescriptor("evs", "openstack.evs.evs_service", "EvsService", "v2"),
+    ServiceDescriptor("ecs", "openstack.ecs.ecs_service", "EcsService", "v1"),
+    ServiceDescriptor("ecsv1.1", "openstack.ecs.ecs_service",
+                      "EcsServiceV1_1", "v1.1"),
+    ServiceDescriptor("vpcv2.0", "openstack.vpc.vpc_service",
+                      "VpcService", "v2.0"),
+    ServiceDescriptor("bms", "openstack.bms.bms_service", "BmsService", "v1"),
+    ServiceDescriptor("load-balancer",
+                      "openstack.load_balancer.load_balancer_service",
+                      "LoadBalancerService", "v1"),
+    # not support below service
+    # message_service.MessageService(version="v1")
+    # cluster_service.ClusterService(version="v1")
+    # database_service.DatabaseService(version="v1")
+    # alarm_service.AlarmService(version="v2")
+    # bare_metal_service.BareMetalService(version="v1")
+    # key_manager_service.KeyManagerService(version="v1")
+    # object_store_service.ObjectStoreService(version="v1")
+    ServiceDescriptor("rdsv1", "openstack.rds.rds_service",
+                      "RDSService", "v1"),
+    ServiceDescriptor("cdn", "openstack.cdn.cdn_service", "CDNService", "v1"),
+    # rds_os_service.RDSService(version="v1")
+    # telemetry_service.TelemetryService(version="v2")
+    # workflow_service.WorkflowService(version="v2")
+]
+"""The services known to every :class:`~openstack.profile.Profile`."""
+
 
 class Profile(object):
 
@@ -126,52 +166,18 @@ class Profile(object):
         object with no preferences defined, but knowledge of the services.
         Services are identified by their service type, e.g.: 'identity',
         'compute', etc.
+
+        The services are registered by their
+        :class:`~openstack.profile.ServiceDescriptor`, their modules are
+        only imported when their filter is first requested.
         """
         self._services = {}
+        # preferences set for all the services, applied to the services
+        # which are not loaded yet when they are.
+        self._defaults = {}
 
-        self._add_service(anti_ddos_service.AntiDDosService(version="v1"))
-        self._add_service(block_store_service.BlockStoreService(version="v2"))
-        self._add_service(compute_service.ComputeService(version="v2"))
-        self._add_service(cts_service.CTSService(version="v1"))
-        self._add_service(dms_service.DMSService(version="v1"))
-        self._add_service(identity_service.IdentityService(version="v3"))
-        self._add_service(image_service.ImageService(version="v2"))
-        self._add_service(kms_service.KMSService(version="v1"))
-        self._add_service(maas_service.MaaSService(version="v1"))
-        self._add_service(network_service.NetworkService(version="v2.0"))
-        self._add_service(orchestration_service.OrchestrationService(version="v1"))
-        self._add_service(smn_service.SMNService(version="v2"))
-        # QianBiao.NG HuaWei Services
-        self._add_service(dns_service.DNSService(version="v2"))
-        self._add_service(cloud_eye_service.CloudEyeService(version="v1"))
-        ass = auto_scaling_service.AutoScalingService(version="v1")
-        self._add_service(ass)
-        vbs_v2 = volume_backup_service.VolumeBackupService(version="v2")
-        self._add_service(vbs_v2)
-        self._add_service(map_reduce_service.MapReduceService(version="v1"))
-        self._add_service(evs_service.EvsServiceV2_1(version='v2.1'))
-        self._add_service(evs_service.EvsService(version='v2'))
-        self._add_service(ecs_service.EcsService(version='v1'))
-        self._add_service(ecs_service.EcsServiceV1_1(version='v1.1'))
-        self._add_service(vpc_service.VpcService(version='v2.0'))
-        self._add_service(bms_service.BmsService(version='v1'))
-        self._add_service(lb_service.LoadBalancerService(version='v1'))
-        # not support below service
-        # self._add_service(message_service.MessageService(version="v1"))
-        # self._add_service(cluster_service.ClusterService(version="v1"))
-        # self._add_service(database_service.DatabaseService(version="v1"))
-        # self._add_service(alarm_service.AlarmService(version="v2"))
-        # self._add_service(bare_metal_service.BareMetalService(version="v1"))
-        # self._add_service(key_manager_service.KeyManagerService(version="v1"))
-        # self._add_service(
-            # object_store_service.ObjectStoreService(version="v1"))
-
-        self._add_service(rds_service.RDSService(version="v1"))
-        self._add_service(cdn_service.CDNService(version='v1'))
-
-        # self._add_service(rds_os_service.RDSService(version="v1"))
-        # self._add_service(telemetry_service.TelemetryService(version="v2"))
-        # self._add_service(workflow_service.WorkflowService(version="v2"))
+        for descriptor in SERVICES:
+            self._services[descriptor.service_type] = descriptor
         if plugins:
             for plugin in plugins:
                 self._load_plugin(plugin)
@@ -184,11 +190,23 @@ class Profile(object):
         serv.interface = None
         self._services[serv.service_type] = serv
 
+    def _materialize(self, descriptor):
+        module = importlib.import_module(descriptor.module)
+        serv = getattr(module, descriptor.class_name)(
+            version=descriptor.version)
+        self._add_service(serv)
+        for attr, value in six.iteritems(self._defaults):
+            setattr(serv, attr, value)
+        return serv
+
     def _load_plugin(self, namespace):
         """Load a service plugin.
 
         :param str namespace: Entry point namespace
         """
+        # stevedore scans the installed distributions on import, only pay
+        # for it when plugins are used.
+        from openstack import module_loader
         services = module_loader.load_service_plugins(namespace)
         for service_type in services:
             if service_type in self._services:
@@ -209,6 +227,8 @@ class Profile(object):
         :param str service: Desired service type.
         """
         serv = self._services.get(service, None)
+        if isinstance(serv, ServiceDescriptor):
+            return self._materialize(serv)
         if serv is not None:
             return serv
         msg = ("Service %s not in list of valid services: %s" %
@@ -219,16 +239,46 @@ class Profile(object):
         return self.service_keys if service == self.ALL else [service]
 
     def _setter(self, service, attr, value):
+        # the API versions are collected from the loaded services only
+        # (see Session._get_api_requests), so they load all of them.
+        if service == self.ALL and attr != "api_version":
+            self._defaults[attr] = value
+            for serv in self.get_services(loaded_only=True):
+                setattr(serv, attr, value)
+            return
         for service in self._get_services(service):
             setattr(self._get_filter(service), attr, value)
 
-    def get_services(self):
-        """Get a list of all the known services."""
+    def get_services(self, loaded_only=False):
+        """Get a list of all the known services.
+
+        :param bool loaded_only: Only return the services whose filter was
+                                 already requested, without importing the
+                                 modules of the others.
+        """
         services = []
-        for name, service in six.iteritems(self._services):
+        for name, service in list(six.iteritems(self._services)):
+            if isinstance(service, ServiceDescriptor):
+                if loaded_only:
+                    continue
+                service = self._materialize(service)
             services.append(service)
         return services
 
+    def get_service_types(self):
+        """Get the types of all the known services, without loading them."""
+        return list(self._services)
+
+    def get_service_module(self, service):
+        """Get the module name of a service, without loading it.
+
+        :param str service: Service type.
+        """
+        serv = self._services.get(service, None)
+        if isinstance(serv, ServiceDescriptor):
+            return serv.module.split('.')[-2]
+        return self._get_filter(service).get_service_module()
+
     def set_name(self, service, name):
         """Set the desired name for the specified service.
 
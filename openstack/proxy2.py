@@ -10,10 +10,18 @@
 # License for the specific language governing permissions and limitations
 # under the License.
 
+import copy
+import threading
+import time
+
 from openstack import exceptions
 from openstack import resource2
 from openstack import utils
 
+#: Seconds the resources found by a proxy are kept in its name index by
+#: default.
+DEFAULT_NAME_INDEX_TTL = 60
+
 
 # The _check_resource decorator is used on BaseProxy methods to ensure that
 # the `actual` argument is in fact the type of the `expected` argument.
@@ -26,6 +34,8 @@ from openstack import utils
 def _check_resource(strict=False):
     def wrap(method):
         def check(self, expected, actual=None, *args, **kwargs):
+            if isinstance(actual, resource2.CompactResource):
+                actual = actual.to_resource()
             is_resource = isinstance(actual, resource2.Resource)
             if strict and actual is not None and not is_resource:
                 raise ValueError("A %s must be passed" % expected.__name__)
@@ -40,10 +50,89 @@ def _check_resource(strict=False):
     return wrap
 
 
+class NameIndex(object):
+
+    def __init__(self, ttl=DEFAULT_NAME_INDEX_TTL):
+        """Keep the resources found by their name or id for a while
+
+        The entries of a resource type are all dropped when a resource of
+        that type is created, updated or deleted through the proxy, whose
+        names may then resolve differently. The changes made otherwise are
+        only seen once the entries expire.
+
+        :param ttl: The seconds after which the entries expire.
+        """
+        self.ttl = ttl
+        self._entries = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _key(resource_type, name_or_id, attrs):
+        try:
+            key = (resource_type, name_or_id, frozenset(attrs.items()))
+            hash(key)
+        except TypeError:
+            # unhashable attributes, the lookup is not indexed
+            return None
+        return key
+
+    def get(self, resource_type, name_or_id, attrs):
+        """Return a copy of the resource found, or None"""
+        key = self._key(resource_type, name_or_id, attrs)
+        with self._lock:
+            expires, found = self._entries.get(key, (0, None))
+            if expires < time.time():
+                self._entries.pop(key, None)
+                return None
+        return copy.deepcopy(found)
+
+    def set(self, resource_type, name_or_id, attrs, found):
+        """Keep a copy of the resource found"""
+        key = self._key(resource_type, name_or_id, attrs)
+        if key is None:
+            return
+        found = copy.deepcopy(found)
+        with self._lock:
+            self._entries[key] = (time.time() + self.ttl, found)
+
+    def invalidate(self, resource_type=None):
+        """Drop the entries of a resource type, or all of them"""
+        with self._lock:
+            if resource_type is None:
+                self._entries.clear()
+                return
+            for key in [key for key in self._entries
+                        if key[0] is resource_type]:
+                del self._entries[key]
+
+
 class BaseProxy(object):
+
+    #: The :class:`NameIndex` of the resources found, None when the
+    #: lookups are not indexed.
+    name_index = None
+
     def __init__(self, session):
         self._session = session
 
+    def enable_name_index(self, ttl=DEFAULT_NAME_INDEX_TTL):
+        """Index the resources found by their name or id
+
+        The ``find_*`` methods then return the resource found by a
+        previous lookup of the same name or id, without any request,
+        during ``ttl`` seconds or until a resource of the same type is
+        created, updated or deleted through this proxy.
+
+        :param ttl: The seconds the resources found are kept.
+        :returns: The :class:`NameIndex`.
+        """
+        self.name_index = NameIndex(ttl)
+        return self.name_index
+
+    def _invalidate(self, resource_type):
+        if self.name_index is not None:
+            self.name_index.invalidate(resource_type)
+
     def _get_resource(self, resource_type, value, **attrs):
         """Get a resource object to work on
 
@@ -57,6 +146,8 @@ class BaseProxy(object):
         :param path_args: A dict containing arguments for forming the request
                           URL, if needed.
         """
+        if isinstance(value, resource2.CompactResource):
+            value = value.to_resource()
         if value is None:
             # Create a bare resource
             res = resource_type.new(**attrs)
@@ -101,9 +192,17 @@ class BaseProxy(object):
 
         :returns: An instance of ``resource_type`` or None
         """
-        return resource_type.find(self._session, name_or_id,
-                                  ignore_missing=ignore_missing,
-                                  **attrs)
+        index = self.name_index
+        if index is not None:
+            found = index.get(resource_type, name_or_id, attrs)
+            if found is not None:
+                return found
+        found = resource_type.find(self._session, name_or_id,
+                                   ignore_missing=ignore_missing,
+                                   **attrs)
+        if index is not None and found is not None:
+            index.set(resource_type, name_or_id, attrs, found)
+        return found
 
     @_check_resource(strict=False)
     def _delete(self, resource_type, value, ignore_missing=True,
@@ -151,6 +250,8 @@ class BaseProxy(object):
                     details=e.details, response=e.response,
                     request_id=e.request_id, url=e.url, method=e.method,
                     http_status=e.http_status, cause=e.cause,code=e.code)
+        finally:
+            self._invalidate(resource_type)
 
         return rv
 
@@ -175,8 +276,11 @@ class BaseProxy(object):
         :rtype: :class:`~openstack.resource2.Resource`
         """
         res = self._get_resource(resource_type, value, **attrs)
-        return res.update(self._session, prepend_key=prepend_key,
-                          has_body=has_body)
+        try:
+            return res.update(self._session, prepend_key=prepend_key,
+                              has_body=has_body)
+        finally:
+            self._invalidate(resource_type)
 
     def _create(self, resource_type, prepend_key=True, **attrs):
         """Create a resource from attributes
@@ -197,10 +301,14 @@ class BaseProxy(object):
         :rtype: :class:`~openstack.resource2.Resource`
         """
         res = resource_type.new(**attrs)
-        return res.create(self._session, prepend_key=prepend_key)
+        try:
+            return res.create(self._session, prepend_key=prepend_key)
+        finally:
+            self._invalidate(resource_type)
 
     @_check_resource(strict=False)
-    def _get(self, resource_type, value=None, requires_id=True, **attrs):
+    def _get(self, resource_type, value=None, requires_id=True, raw=False,
+             **attrs):
         """Get a resource
 
         :param resource_type: The type of resource to get.
@@ -208,6 +316,9 @@ class BaseProxy(object):
         :param value: The value to get. Can be either the ID of a
                       resource or a :class:`~openstack.resource2.Resource`
                       subclass.
+        :param bool raw: When set to ``True``, return the decoded body of
+                         the response instead of a resource. See
+                         :meth:`~openstack.resource2.Resource.get`.
         :param dict attrs: Attributes to be passed onto the
                            :meth:`~openstack.resource2.Resource.get`
                            method. These should correspond
@@ -220,8 +331,11 @@ class BaseProxy(object):
         """
         res = self._get_resource(resource_type, value, **attrs)
 
+        # Only pass raw on when asked for, some resources override
+        # ``get`` with a narrower signature.
+        kwargs = {"raw": raw} if raw else {}
         try:
-            return res.get(self._session, requires_id=requires_id)
+            return res.get(self._session, requires_id=requires_id, **kwargs)
         except exceptions.NotFoundException as e:
             raise exceptions.ResourceNotFound(
                 message="No %s found for %s" %
@@ -230,7 +344,9 @@ class BaseProxy(object):
                 request_id=e.request_id, url=e.url, method=e.method,
                 http_status=e.http_status, cause=e.cause,code=e.code)
 
-    def _list(self, resource_type, value=None, paginated=False, **attrs):
+    def _list(self, resource_type, value=None, paginated=False, prefetch=0,
+              max_workers=1, compact=False, raw=False, stream=False,
+              **attrs):
         """List a resource
 
         :param resource_type: The type of resource to delete. This should
@@ -243,6 +359,28 @@ class BaseProxy(object):
                                to be returned in one response. When set to
                                ``True``, the resource supports data being
                                returned across multiple pages.
+        :param int prefetch: When greater than zero on a paginated listing,
+                             request up to ``prefetch`` following pages in a
+                             background thread while the current page is
+                             consumed. See
+                             :meth:`~openstack.resource2.Resource.list`.
+        :param int max_workers: When greater than one on a paginated listing
+                                of a resource paginated by offset, request
+                                the remaining pages with up to
+                                ``max_workers`` concurrent requests. See
+                                :meth:`~openstack.resource2.Resource.list`.
+        :param bool compact: When set to ``True``, yield read-only
+                             :class:`~openstack.resource2.CompactResource`
+                             views, which take less memory than full
+                             resources. See
+                             :meth:`~openstack.resource2.Resource.list`.
+        :param bool raw: When set to ``True``, yield the dicts the server
+                         returned instead of resources. See
+                         :meth:`~openstack.resource2.Resource.list`.
+        :param bool stream: When set to ``True``, yield the resources of a
+                            page while its response is still being
+                            received. See
+                            :meth:`~openstack.resource2.Resource.list`.
         :param dict attrs: Attributes to be passed onto the
             :meth:`~openstack.resource2.Resource.list` method. These should
             correspond to either :class:`~openstack.resource2.URI` values
@@ -254,6 +392,18 @@ class BaseProxy(object):
                  the ``resource_type``.
         """
         res = self._get_resource(resource_type, value, **attrs)
+        # Only pass these on when asked for, some resources override
+        # ``list`` with a narrower signature.
+        if prefetch:
+            attrs["prefetch"] = prefetch
+        if max_workers > 1:
+            attrs["max_workers"] = max_workers
+        if compact:
+            attrs["compact"] = compact
+        if raw:
+            attrs["raw"] = raw
+        if stream:
+            attrs["stream"] = stream
         return res.list(self._session, paginated=paginated, **attrs)
 
     def _head(self, resource_type, value=None, **attrs):
@@ -27,15 +27,17 @@ class Proxy(proxy2.BaseProxy):
         """
         return self._list(_instance.Instance, paginated=False)
 
-    def get_instance(self, instance):
+    def get_instance(self, instance, raw=False):
         """Get instance by id
 
         :param instance: The value can be the ID of a instance or a object of
                          :class:`~openstack.rds_os.v1.instance.Instance`.
+        :param bool raw: When set to ``True``, return the decoded body of
+                         the response instead of a resource.
         :returns: The results of instance
         :rtype: :class:`~openstack.rds_os.v1.instance.Instance`.
         """
-        return self._get(_instance.Instance, instance)
+        return self._get(_instance.Instance, instance, raw=raw)
 
     def delete_instance(self, instance, ignore_missing=True):
         """Delete an instance
@@ -147,15 +149,17 @@ class Proxy(proxy2.BaseProxy):
         }
         return self._list(_flavor.Flavor, paginated=False, **query)
 
-    def get_flavor(self, id):
+    def get_flavor(self, id, raw=False):
         """Get the detail of a flavor
 
         :param id: Flavor id or an object of class
                    :class:`~openstack.rds_os.v1.flavor.Flavor
+        :param bool raw: When set to ``True``, return the decoded body of
+                         the response instead of a resource.
         :returns: Detail of flavor
         :rtype: :class:`~openstack.rds_os.v1.flavor.Flavor
         """
-        return self._get(_flavor.Flavor, id)
+        return self._get(_flavor.Flavor, id, raw=raw)
 
     def parameters(self, datastore_version_id):
         """List parameters of a datastore
@@ -215,16 +219,18 @@ class Proxy(proxy2.BaseProxy):
         """
         return self._create(_configuration.Configurations, **kwargs)
 
-    def get_configuration_group(self, cg):
+    def get_configuration_group(self, cg, raw=False):
         """Obtaining a Parameter Group
 
         :param cg: The value can be the ID of a Parameter Group or a object of
                    :class:`~openstack.rds_os.v1.configuration.Configurations`.
+        :param bool raw: When set to ``True``, return the decoded body of
+                         the response instead of a resource.
         :returns: A Parameter Group Object
         :rtype: :class:`~openstack.rds_os.v1.configuration.Configurations`.
 
         """
-        return self._get(_configuration.Configurations, cg)
+        return self._get(_configuration.Configurations, cg, raw=raw)
 
     def delete_configuration_group(self, cg, ignore_missing=True):
         """Deleting a Parameter Group
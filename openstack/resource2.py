@@ -47,13 +47,31 @@ and then returned to the caller.
 """
 
 import collections
+import functools
 import itertools
+import logging
+import random
 import time
 
+from concurrent import futures
+
 from openstack import exceptions
 from openstack import format
+from openstack import instrumentation
+from openstack import json_codec
 from openstack import utils
 
+_logger = logging.getLogger(__name__)
+
+#: How many entries per resource :func:`wait_for_many` reads at most from
+#: a listing not filtered by the ids of the resources, before getting them
+#: one by one instead.
+LISTING_SHARE = 4
+
+# reads the attributes of the resources without going through the
+# __getattribute__ of Resource, in the descriptors read in loops
+_getattribute = object.__getattribute__
+
 
 class _BaseComponent(object):
     # The name this component is being tracked as in the Resource
@@ -79,12 +97,14 @@ class _BaseComponent(object):
         self.type = type
         self.default = default
         self.alternate_id = alternate_id
+        # the key of the decoded value in the cache of the instances
+        self._cache_key = (self.key, name)
 
     def __get__(self, instance, owner):
         if instance is None:
             return None
 
-        attributes = getattr(instance, self.key)
+        attributes = _getattribute(instance, self.key)
 
         try:
             value = attributes[self.name]
@@ -96,6 +116,22 @@ class _BaseComponent(object):
             return None
 
         if self.type and not isinstance(value, self.type):
+            # the decoded values are kept with the value they were
+            # decoded from, and decoded again once it was replaced
+            try:
+                decoded = _getattribute(instance, "_decoded")
+            except AttributeError:
+                decoded = None
+            else:
+                if decoded is None:
+                    # created on the first decoded value of an instance
+                    decoded = {}
+                    object.__setattr__(instance, "_decoded", decoded)
+                cached = decoded.get(self._cache_key)
+                if cached is not None and cached[0] is value:
+                    return cached[1]
+
+            raw = value
             if issubclass(self.type, format.Formatter):
                 value = self.type.deserialize(value)
             elif issubclass(self.type, Resource):
@@ -103,6 +139,9 @@ class _BaseComponent(object):
             else:
                 value = self.type(value)
 
+            if decoded is not None:
+                decoded[self._cache_key] = (raw, value)
+
         return value
 
     def __set__(self, instance, value):
@@ -117,6 +156,7 @@ class _BaseComponent(object):
 
         attributes = getattr(instance, self.key)
         attributes[self.name] = value
+        self._forget(instance)
 
     def __delete__(self, instance):
         try:
@@ -124,6 +164,13 @@ class _BaseComponent(object):
             del attributes[self.name]
         except KeyError:
             pass
+        self._forget(instance)
+
+    def _forget(self, instance):
+        """Drop the decoded value of an instance"""
+        decoded = getattr(instance, "_decoded", None)
+        if decoded:
+            decoded.pop(self._cache_key, None)
 
 
 class Body(_BaseComponent):
@@ -246,6 +293,8 @@ class Resource(object):
     #: marker key in query, default is `marker`
     query_marker_key = "marker"
     query_limit_key = "limit"
+    #: dotted json path to get the total number of resources
+    total_path = None
 
     #: The ID of this resource.
     id = Body("id")
@@ -302,6 +351,8 @@ class Resource(object):
                                          synchronized=_synchronized)
         self._uri = _ComponentManager(attributes=uri,
                                       synchronized=_synchronized)
+        # the typed values decoded by the descriptors, see _BaseComponent
+        self._decoded = None
 
     def __repr__(self):
         pairs = ["%s=%s" % (k, v) for k, v in dict(itertools.chain(
@@ -315,6 +366,8 @@ class Resource(object):
 
     def __eq__(self, comparand):
         """Return True if another resource has the same contents"""
+        if isinstance(comparand, CompactResource):
+            comparand = comparand.to_resource()
         return all([self._body.attributes == comparand._body.attributes,
                     self._header.attributes == comparand._header.attributes,
                     self._uri.attributes == comparand._uri.attributes])
@@ -330,7 +383,7 @@ class Resource(object):
             if name in self._body:
                 return self._body[name]
 
-            real_id_name = self._body_mapping()[name]
+            real_id_name = self._server_names(Body)[name]
             if real_id_name in self._body:
                 return self._body[real_id_name]
             else:
@@ -353,6 +406,7 @@ class Resource(object):
         self._body.update(body)
         self._header.update(header)
         self._uri.update(uri)
+        self._decoded = None
 
     def _collect_attrs(self, attrs):
         """Given attributes, return a dict per type of attribute
@@ -367,6 +421,65 @@ class Resource(object):
 
         return body, header, uri
 
+    @classmethod
+    def _field_maps(cls):
+        """Return the cache of the field maps of this class
+
+        The maps are computed once per class and kept in its own
+        ``__dict__``, so subclasses don't share the maps of their parents.
+        """
+        try:
+            return cls.__dict__["_field_maps_cache"]
+        except KeyError:
+            maps = {}
+            setattr(cls, "_field_maps_cache", maps)
+            return maps
+
+    @classmethod
+    def _fields(cls, components):
+        """Return the (name, component) pairs of the class
+
+        :param components: A component type, or a tuple of them.
+
+        Since we're looking at class definitions we need to include
+        subclasses, so check the whole MRO. The pairs are computed once
+        per class and must not be modified.
+        """
+        maps = cls._field_maps()
+        try:
+            return maps[components]
+        except KeyError:
+            pass
+        fields = []
+        seen = set()
+        for klass in cls.__mro__:
+            for key, value in klass.__dict__.items():
+                if isinstance(value, components):
+                    # Make sure base classes don't end up overwriting
+                    # mappings we've found previously in subclasses.
+                    if key not in seen:
+                        seen.add(key)
+                        fields.append((key, value))
+        maps[components] = fields
+        return fields
+
+    @classmethod
+    def _server_names(cls, component):
+        """Return a cached dict of attribute name to server-side name
+
+        The dict is computed once per class and must not be modified, see
+        :meth:`~openstack.resource2.Resource._get_mapping` for a copy.
+        """
+        maps = cls._field_maps()
+        key = ("server_names", component)
+        try:
+            return maps[key]
+        except KeyError:
+            names = dict((key, value.name)
+                         for key, value in cls._fields(component))
+            maps[key] = names
+            return names
+
     @classmethod
     def _consume_attrs(cls, component_type, attrs):
         """Given a mapping and attributes, return relevant matches
@@ -378,16 +491,16 @@ class Resource(object):
         type of Resource component one time, rather than looking at the
         same source dict several times.
         """
-
-        fields = {}
-        for klass in cls.__mro__:
-            for key, component in klass.__dict__.items():
-                if isinstance(component, component_type):
-                    # Make sure base classes don't end up overwriting
-                    # mappings we've found previously in subclasses.
-                    if key not in fields:
-                        fields[key] = component
-                        fields[component.name] = component
+        maps = cls._field_maps()
+        try:
+            fields = maps[("consume", component_type)]
+        except KeyError:
+            fields = {}
+            for key, component in cls._fields(component_type):
+                if key not in fields:
+                    fields[key] = component
+                    fields[component.name] = component
+            maps[("consume", component_type)] = fields
 
         relevant_attrs = {}
         attr_keys = list(attrs.keys())
@@ -440,17 +553,7 @@ class Resource(object):
         """Return a dict of attributes of a given component on the class
 
         """
-        mapping = {}
-        # Since we're looking at class definitions we need to include
-        # subclasses, so check the whole MRO.
-        for klass in cls.__mro__:
-            for key, value in klass.__dict__.items():
-                if isinstance(value, component):
-                    # Make sure base classes don't end up overwriting
-                    # mappings we've found previously in subclasses.
-                    if key not in mapping:
-                        mapping[key] = value.name
-        return mapping
+        return dict(cls._server_names(component))
 
     @classmethod
     def _body_mapping(cls):
@@ -477,11 +580,33 @@ class Resource(object):
         Returns an empty string if no name exists, as this method is
         consumed by _get_id and passed to getattr.
         """
+        maps = cls._field_maps()
+        try:
+            return maps["alternate_id"]
+        except KeyError:
+            pass
+        alternate_id = ""
         for value in cls.__dict__.values():
             if isinstance(value, Body):
                 if value.alternate_id:
-                    return value.name
-        return ""
+                    alternate_id = value.name
+                    break
+        maps["alternate_id"] = alternate_id
+        return alternate_id
+
+    @classmethod
+    def _id_from_body(cls, body):
+        """Return the ID found in a dict of server-side attributes
+
+        This follows the same rules as the ``id`` attribute of instances,
+        for when no instance was built from the dict.
+        """
+        if "id" in body:
+            return body["id"]
+        real_id_name = cls._server_names(Body)["id"]
+        if real_id_name in body:
+            return body[real_id_name]
+        return body.get(cls._alternate_id())
 
     @staticmethod
     def _get_id(value):
@@ -489,10 +614,11 @@ class Resource(object):
 
         This will return either the value specified by `id` or
         `alternate_id` in that order if `value` is a Resource.
+        A :class:`CompactResource` view is handled like its resource.
         If `value` is anything other than a Resource, likely to
         be a string already representing an ID, it is returned.
         """
-        if isinstance(value, Resource):
+        if isinstance(value, (Resource, CompactResource)):
             return value.id
         else:
             return value
@@ -560,18 +686,11 @@ class Resource(object):
         # but is slightly different in that we're looking at an instance
         # and we're mapping names on this class to their actual stored
         # values.
-        # Since we're looking at class definitions we need to include
-        # subclasses, so check the whole MRO.
-        for klass in self.__class__.__mro__:
-            for key, value in klass.__dict__.items():
-                if isinstance(value, components):
-                    # Make sure base classes don't end up overwriting
-                    # mappings we've found previously in subclasses.
-                    if key not in mapping:
-                        value = getattr(self, key, None)
-                        if ignore_none and value is None:
-                            continue
-                        mapping[key] = value
+        for key, _ in self._fields(components):
+            value = getattr(self, key, None)
+            if ignore_none and value is None:
+                continue
+            mapping[key] = value
 
         return mapping
 
@@ -605,13 +724,102 @@ class Resource(object):
 
         return _Request(uri, body, headers)
 
+    @classmethod
+    def _endpoint_args(cls):
+        """Return the arguments sending a request to the service"""
+        return {"endpoint_filter": cls.service,
+                "endpoint_override": cls.service.get_endpoint_override()}
+
+    def _create_request(self, prepend_key=True):
+        """Build the request of :meth:`create`
+
+        The requests of :meth:`create`, :meth:`get`, :meth:`head`,
+        :meth:`update` and :meth:`delete` are built apart from sending
+        them, so that :mod:`openstack.aioproxy` sends the same requests.
+
+        :return: A tuple of the name of the session method sending the
+                 request, of its URI and of its keyword arguments.
+        """
+        if not self.allow_create:
+            raise exceptions.MethodNotSupported(self, "create")
+
+        if self.put_create:
+            request = self._prepare_request(requires_id=True,
+                                            prepend_key=prepend_key)
+            method = "put"
+        else:
+            request = self._prepare_request(requires_id=False,
+                                            prepend_key=prepend_key)
+            method = "post"
+        return method, request.uri, dict(self._endpoint_args(),
+                                         json=request.body,
+                                         headers=request.headers)
+
+    def _get_request(self, requires_id=True):
+        """Build the request of :meth:`get`, see :meth:`_create_request`"""
+        if not self.allow_get:
+            raise exceptions.MethodNotSupported(self, "get")
+
+        request = self._prepare_request(requires_id=requires_id)
+        return "get", request.uri, self._endpoint_args()
+
+    def _head_request(self):
+        """Build the request of :meth:`head`, see :meth:`_create_request`"""
+        if not self.allow_head:
+            raise exceptions.MethodNotSupported(self, "head")
+
+        request = self._prepare_request()
+        return "head", request.uri, dict(self._endpoint_args(),
+                                         headers={"Accept": ""})
+
+    def _update_request(self, prepend_key=True):
+        """Build the request of :meth:`update`, see :meth:`_create_request`
+
+        :return: The request, or None when nothing is to be updated.
+        """
+        # The id cannot be dirty for an update
+        self._body._dirty.discard("id")
+        id_mapping_name = self._body_mapping()["id"]
+        self._body._dirty.discard(id_mapping_name)
+
+        # Only try to update if we actually have anything to update.
+        if not any([self._body.dirty, self._header.dirty]):
+            return None
+
+        if not self.allow_update:
+            raise exceptions.MethodNotSupported(self, "update")
+
+        request = self._prepare_request(prepend_key=prepend_key)
+        method = "patch" if self.patch_update else "put"
+        return method, request.uri, dict(self._endpoint_args(),
+                                         json=request.body,
+                                         headers=request.headers)
+
+    def _delete_request(self, params=None):
+        """Build the request of :meth:`delete`, see :meth:`_create_request`"""
+        if not self.allow_delete:
+            raise exceptions.MethodNotSupported(self, "delete")
+
+        request = self._prepare_request()
+        return "delete", request.uri, dict(self._endpoint_args(),
+                                           headers={"Accept": ""},
+                                           params=params)
+
+    def _raw_body(self, response):
+        """Return the body of a response unwrapped from its resource_key"""
+        body = response.json()
+        if self.resource_key and self.resource_key in body:
+            body = body[self.resource_key]
+        return body
+
     def _filter_component(self, component, mapping):
         """Filter the keys in component based on a mapping
 
         This method converts a dict of server-side data to contain
         only the appropriate keys for attributes on this instance.
         """
-        return {k: v for k, v in component.items() if k in mapping.values()}
+        names = set(mapping.values())
+        return {k: v for k, v in component.items() if k in names}
 
     def _translate_response(self, response, has_body=True):
         """Given a KSA response, inflate this instance with its data
@@ -627,14 +835,24 @@ class Resource(object):
             if self.resource_key and self.resource_key in body:
                 body = body[self.resource_key]
 
-            body = self._filter_component(body, self._body_mapping())
-            self._body.attributes.update(body)
-            self._body.clean()
+            self._update_from_body(body)
 
         headers = self._filter_component(response.headers,
                                          self._header_mapping())
         self._header.attributes.update(headers)
         self._header.clean()
+        self._decoded = None
+
+    def _update_from_body(self, body):
+        """Inflate this instance with a dict of server-side attributes
+
+        Like :meth:`_translate_response` with a body already decoded,
+        such as one item of a listing.
+        """
+        body = self._filter_component(body, self._body_mapping())
+        self._body.attributes.update(body)
+        self._body.clean()
+        self._decoded = None
 
     def create(self, session, prepend_key=True):
         """Create a remote resource based on this instance.
@@ -649,44 +867,32 @@ class Resource(object):
         :raises: :exc:`~openstack.exceptions.MethodNotSupported` if
                  :data:`Resource.allow_create` is not set to ``True``.
         """
-        if not self.allow_create:
-            raise exceptions.MethodNotSupported(self, "create")
-
-        endpoint_override = self.service.get_endpoint_override()
-        if self.put_create:
-            request = self._prepare_request(requires_id=True,
-                                            prepend_key=prepend_key)
-            response = session.put(request.uri, endpoint_filter=self.service,
-                                   endpoint_override=endpoint_override,
-                                   json=request.body, headers=request.headers)
-        else:
-            request = self._prepare_request(requires_id=False,
-                                            prepend_key=prepend_key)
-            response = session.post(request.uri, endpoint_filter=self.service,
-                                    endpoint_override=endpoint_override,
-                                    json=request.body, headers=request.headers)
+        method, uri, kwargs = self._create_request(prepend_key=prepend_key)
+        response = getattr(session, method)(uri, **kwargs)
 
         self._translate_response(response)
         return self
 
-    def get(self, session, requires_id=True):
+    def get(self, session, requires_id=True, raw=False):
         """Get a remote resource based on this instance.
 
         :param session: The session to use for making this request.
         :type session: :class:`~openstack.session.Session`
         :param boolean requires_id: A boolean indicating whether resource ID
                                     should be part of the requested URI.
+        :param bool raw: When ``True``, return the decoded body of the
+                         response, unwrapped from
+                         :data:`Resource.resource_key`, and leave this
+                         instance untouched.
         :return: This :class:`Resource` instance.
         :raises: :exc:`~openstack.exceptions.MethodNotSupported` if
                  :data:`Resource.allow_get` is not set to ``True``.
         """
-        if not self.allow_get:
-            raise exceptions.MethodNotSupported(self, "get")
+        method, uri, kwargs = self._get_request(requires_id=requires_id)
+        response = getattr(session, method)(uri, **kwargs)
 
-        request = self._prepare_request(requires_id=requires_id)
-        endpoint_override = self.service.get_endpoint_override()
-        response = session.get(request.uri, endpoint_filter=self.service,
-                               endpoint_override=endpoint_override)
+        if raw:
+            return self._raw_body(response)
 
         self._translate_response(response)
         return self
@@ -701,15 +907,8 @@ class Resource(object):
         :raises: :exc:`~openstack.exceptions.MethodNotSupported` if
                  :data:`Resource.allow_head` is not set to ``True``.
         """
-        if not self.allow_head:
-            raise exceptions.MethodNotSupported(self, "head")
-
-        request = self._prepare_request()
-
-        endpoint_override = self.service.get_endpoint_override()
-        response = session.head(request.uri, endpoint_filter=self.service,
-                                endpoint_override=endpoint_override,
-                                headers={"Accept": ""})
+        method, uri, kwargs = self._head_request()
+        response = getattr(session, method)(uri, **kwargs)
 
         self._translate_response(response)
         return self
@@ -727,30 +926,12 @@ class Resource(object):
         :raises: :exc:`~openstack.exceptions.MethodNotSupported` if
                  :data:`Resource.allow_update` is not set to ``True``.
         """
-        # The id cannot be dirty for an update
-        self._body._dirty.discard("id")
-        id_mapping_name = self._body_mapping()["id"]
-        self._body._dirty.discard(id_mapping_name)
-
-        # Only try to update if we actually have anything to update.
-        if not any([self._body.dirty, self._header.dirty]):
+        request = self._update_request(prepend_key=prepend_key)
+        if request is None:
             return self
 
-        if not self.allow_update:
-            raise exceptions.MethodNotSupported(self, "update")
-
-        request = self._prepare_request(prepend_key=prepend_key)
-
-        endpoint_override = self.service.get_endpoint_override()
-        if self.patch_update:
-            response = session.patch(request.uri, endpoint_filter=self.service,
-                                     endpoint_override=endpoint_override,
-                                     json=request.body,
-                                     headers=request.headers)
-        else:
-            response = session.put(request.uri, endpoint_filter=self.service,
-                                   endpoint_override=endpoint_override,
-                                   json=request.body, headers=request.headers)
+        method, uri, kwargs = request
+        response = getattr(session, method)(uri, **kwargs)
 
         self._translate_response(response, has_body=has_body)
         return self
@@ -767,16 +948,8 @@ class Resource(object):
         :raises: :exc:`~openstack.exceptions.MethodNotSupported` if
                  :data:`Resource.allow_update` is not set to ``True``.
         """
-        if not self.allow_delete:
-            raise exceptions.MethodNotSupported(self, "delete")
-
-        request = self._prepare_request()
-
-        endpoint_override = self.service.get_endpoint_override()
-        response = session.delete(request.uri, endpoint_filter=self.service,
-                                  endpoint_override=endpoint_override,
-                                  headers={"Accept": ""},
-                                  params=params)
+        method, uri, kwargs = self._delete_request(params=params)
+        response = getattr(session, method)(uri, **kwargs)
 
         self._translate_response(response, has_body=has_body)
         return self
@@ -788,6 +961,24 @@ class Resource(object):
                                               cls.next_marker_path)
         return None
 
+    @classmethod
+    def get_offset_queries(cls, response_json, yielded, query_params):
+        """Return the queries of all the pages following a response
+
+        APIs paginated by offset can address every page independently, so
+        once the first response reveals the total number of resources the
+        queries of the remaining pages are all known. Such resources
+        override this method so those pages can be requested concurrently.
+
+        :param dict response_json: The decoded body of the first page.
+        :param int yielded: The number of resources in the first page.
+        :param dict query_params: The query sent for the first page.
+
+        :return: A list of query dicts, one per remaining page, or ``None``
+                 when the next page can only be found from a marker.
+        """
+        return None
+
     @staticmethod
     def find_value_by_accessor(input_dict, accessor):
         """Gets value from a dictionary using a dotted accessor"""
@@ -804,7 +995,8 @@ class Resource(object):
         return cls.base_path % params
 
     @classmethod
-    def list(cls, session, paginated=False, **params):
+    def list(cls, session, paginated=False, prefetch=0, max_workers=1,
+             compact=False, raw=False, stream=False, **params):
         """This method is a generator which yields resource objects.
 
         This resource object list generator handles pagination and takes query
@@ -818,6 +1010,30 @@ class Resource(object):
                                **When paginated is False only one
                                page of data will be returned regardless
                                of the API's support of pagination.**
+        :param int prefetch: When greater than zero and ``paginated`` is
+                             ``True``, following pages are requested in a
+                             background thread while the current page is
+                             still being consumed. At most ``prefetch``
+                             pages are buffered ahead of the caller.
+        :param int max_workers: When greater than one and ``paginated`` is
+                                ``True``, resources paginated by offset
+                                (see :meth:`get_offset_queries`) request
+                                the pages after the first one with up to
+                                ``max_workers`` concurrent requests. The
+                                resources are still yielded in order.
+        :param bool compact: When ``True``, yield read-only
+                             :class:`~openstack.resource2.CompactResource`
+                             views of the listed resources, which turn into
+                             full resources on their first write.
+        :param bool raw: When ``True``, yield the dicts the server returned
+                         for each resource, without building any object.
+                         This takes precedence over ``compact``.
+        :param bool stream: When ``True``, the resources of a page are
+                            decoded and yielded while the response is
+                            still being received, instead of once it was
+                            entirely read and decoded. Ignored with
+                            ``prefetch``, and for the pages requested
+                            concurrently with ``max_workers``.
         :param dict params: These keyword arguments are passed through the
             :meth:`~openstack.resource2.QueryParamter._transpose` method
             to find if any of them match expected query parameters to be
@@ -835,68 +1051,201 @@ class Resource(object):
         if not cls.allow_list:
             raise exceptions.MethodNotSupported(cls, "list")
 
+        factory = None
+        if raw:
+            factory = _raw_item
+        elif compact:
+            factory = functools.partial(CompactResource, cls)
+        prefetched = paginated and prefetch
+        pages = cls._list_pages(session, paginated=paginated,
+                                max_workers=max_workers, factory=factory,
+                                stream=stream and not prefetched, **params)
+        if prefetched:
+            pages = utils.prefetch(pages, depth=prefetch)
+
+        for page in pages:
+            for value in page:
+                yield value
+
+    @classmethod
+    def _list_pages(cls, session, paginated=False, max_workers=1,
+                    factory=None, stream=False, **params):
+        """Generate the pages of resource objects behind :meth:`list`
+
+        Each page is a list of the :class:`Resource` objects found in one
+        response, or of what ``factory`` builds from the raw resources.
+        The marker of a page is only known once the previous page has
+        been read, so such pages are requested one after another.
+        Pages of offset paginated resources are requested concurrently
+        when ``max_workers`` allows it. With ``stream``, the pages are
+        :class:`_StreamedPage` objects filled while they are iterated.
+        """
         more_data = True
         query_params = cls._query_mapping._transpose(params)
         uri = cls.get_list_uri(params)
+        # Only pass stream on when asked for, like the other options
+        page_args = {"stream": True} if stream else {}
 
         while more_data:
-            endpoint_override = cls.service.get_endpoint_override()
-            resp = session.get(uri, endpoint_filter=cls.service,
-                               endpoint_override=endpoint_override,
-                               headers={"Accept": "application/json"},
-                               params=query_params)
-            response_json = resp.json()
-            if cls.resources_key:
-                resources = cls.find_value_by_accessor(response_json,
-                                                       cls.resources_key)
-            else:
-                resources = response_json
-
-            if not resources:
-                more_data = False
-
+            response_json, resources, page = cls._get_page(session, uri,
+                                                           query_params,
+                                                           factory=factory,
+                                                           **page_args)
+            yield page
             # Keep track of how many items we've yielded. If we yielded
             # less than our limit, we don't need to do an extra request
             # to get back an empty data set, which acts as a sentinel.
-            yielded = 0
-            new_marker = None
-            for data in resources:
-                # Do not allow keys called "self" through. Glance chose
-                # to name a key "self", so we need to pop it out because
-                # we can't send it through cls.existing and into the
-                # Resource initializer. "self" is already the first
-                # argument and is practically a reserved word.
-                data.pop("self", None)
-
-                value = cls.existing(**data)
-                new_marker = value.id
-                yielded += 1
-                yield value
+            if stream:
+                page.drain()
+                response_json = page.response_json
+                yielded, last = page.count, page.last
+            else:
+                yielded, last = len(page), page[-1] if page else None
+            if not yielded:
+                more_data = False
 
-            query_params = dict(query_params)
-            # if `next marker path` is explicit specified, use it as marker
-            next_marker = cls.get_next_marker(response_json,
-                                              yielded,
-                                              query_params)
-            if next_marker:
-                new_marker = next_marker if next_marker != -1 else None
-
-            # if cls.next_marker_path:
-            #     if isinstance(cls.next_marker_path, six.string_types):
-            #         new_marker = cls.find_value_by_accessor(response_json,
-            #                                                 cls.next_marker_path)
-            #     elif callable(cls.next_marker_path):
-            #         new_marker = cls.next_marker_path(response_json, yielded)
-
-            if not new_marker:
-                return
-            if not paginated:
-                return
-            if cls.query_limit_key in query_params:
-                if yielded < query_params["limit"]:
+            if paginated and max_workers > 1:
+                queries = cls.get_offset_queries(response_json, yielded,
+                                                 query_params)
+                if queries is not None:
+                    fetch = functools.partial(cls._get_page, session, uri,
+                                              factory=factory)
+                    for _, _, page in utils.map_ordered(fetch, queries,
+                                                        max_workers):
+                        yield page
                     return
-            query_params[cls.query_limit_key] = yielded
-            query_params[cls.query_marker_key] = new_marker
+
+            query_params = cls._next_query(response_json, yielded, last,
+                                           query_params, paginated)
+            if query_params is None:
+                return
+
+    @classmethod
+    def _next_query(cls, response_json, yielded, last, query_params,
+                    paginated):
+        """Return the query of the page following a page of a listing
+
+        :param dict response_json: The decoded body of the page.
+        :param int yielded: The number of resources in the page.
+        :param last: The last item of the page, or None if it's empty.
+        :param dict query_params: The query sent for the page.
+        :param bool paginated: Whether the listing goes past one page.
+
+        :return: A new query dict, or None when the page was the last.
+        """
+        query_params = dict(query_params)
+        if last is None:
+            new_marker = None
+        elif isinstance(last, dict):
+            new_marker = cls._id_from_body(last)
+        else:
+            new_marker = last.id
+        # if `next marker path` is explicit specified, use it as marker
+        next_marker = cls.get_next_marker(response_json,
+                                          yielded,
+                                          query_params)
+        if next_marker:
+            new_marker = next_marker if next_marker != -1 else None
+
+        # if cls.next_marker_path:
+        #     if isinstance(cls.next_marker_path, six.string_types):
+        #         new_marker = cls.find_value_by_accessor(response_json,
+        #                                                 cls.next_marker_path)
+        #     elif callable(cls.next_marker_path):
+        #         new_marker = cls.next_marker_path(response_json, yielded)
+
+        if not new_marker:
+            return None
+        if not paginated:
+            return None
+        if cls.query_limit_key in query_params:
+            if yielded < query_params["limit"]:
+                return None
+        query_params[cls.query_limit_key] = yielded
+        query_params[cls.query_marker_key] = new_marker
+        return query_params
+
+    @classmethod
+    def _get_page(cls, session, uri, query_params, factory=None,
+                  stream=False):
+        """Request one page of a listing
+
+        :param factory: A callable building the item of the page from a
+                        raw resource, :meth:`existing` by default.
+        :param bool stream: Return the page before its response is read,
+                            as a :class:`_StreamedPage` decoding the
+                            resources as they are received. The decoded
+                            body and raw resources are then None.
+        :return: A tuple of the decoded response body, the raw resources
+                 found in it and the list of :class:`Resource` objects
+                 built from them.
+        """
+        method, uri, kwargs = cls._page_request(uri, query_params)
+        if stream:
+            kwargs["stream"] = True
+        resp = getattr(session, method)(uri, **kwargs)
+        codec = _get_json_codec(session)
+        if stream:
+            if factory is None:
+                factory = functools.partial(_existing, cls)
+            decoder = (codec or json_codec.get_codec()).list_decoder(
+                cls.resources_key, keep=False)
+            return None, None, _StreamedPage(resp, decoder, factory,
+                                             check=cls._check_page)
+
+        if codec is not None:
+            with instrumentation.decoding(resp):
+                response_json = codec.loads(resp.content)
+        else:
+            response_json = resp.json()
+        resources, page = cls._read_page(response_json, factory)
+        return response_json, resources, page
+
+    @classmethod
+    def _page_request(cls, uri, query_params):
+        """Build the request of a page, see :meth:`_create_request`"""
+        return "get", uri, dict(cls._endpoint_args(),
+                                headers={"Accept": "application/json"},
+                                params=query_params)
+
+    @classmethod
+    def _check_page(cls, response_json):
+        """Check the decoded body of a page of a listing
+
+        Nothing is checked by default. Services answering some errors
+        with a success status override it to raise them.
+        """
+
+    @classmethod
+    def _read_page(cls, response_json, factory=None):
+        """Build the items of a page from its decoded response body
+
+        :return: A tuple of the raw resources found in the body and the
+                 list of items built from them, see :meth:`_get_page`.
+        """
+        cls._check_page(response_json)
+        if cls.resources_key:
+            resources = cls.find_value_by_accessor(response_json,
+                                                   cls.resources_key)
+        else:
+            resources = response_json
+        if resources is None:
+            resources = []
+
+        page = []
+        for data in resources:
+            # Do not allow keys called "self" through. Glance chose
+            # to name a key "self", so we need to pop it out because
+            # we can't send it through cls.existing and into the
+            # Resource initializer. "self" is already the first
+            # argument and is practically a reserved word.
+            data.pop("self", None)
+            if factory is None:
+                page.append(cls.existing(**data))
+            else:
+                page.append(factory(data))
+
+        return resources, page
 
     @classmethod
     def _get_one_match(cls, name_or_id, results):
@@ -922,6 +1271,11 @@ class Resource(object):
     def find(cls, session, name_or_id, ignore_missing=True, **params):
         """Find a resource by its name or id.
 
+        The resource is first requested as if ``name_or_id`` was its id.
+        Otherwise it is looked up among the listed resources, which the
+        server filters by name when ``name`` is one of the
+        ``_query_mapping`` parameters.
+
         :param session: The session to use for making this request.
         :type session: :class:`~openstack.session.Session`
         :param name_or_id: This resource's identifier, if needed by
@@ -950,6 +1304,10 @@ class Resource(object):
         except exceptions.NotFoundException:
             pass
 
+        if "name" in cls._query_mapping._mapping and "name" not in params:
+            # only the resources of that name are listed, they are still
+            # matched below since some services filter by prefix or regex
+            params = dict(params, name=name_or_id)
         data = cls.list(session, **params)
 
         result = cls._get_one_match(name_or_id, data)
@@ -962,6 +1320,170 @@ class Resource(object):
             "No %s found for %s" % (cls.__name__, name_or_id))
 
 
+def _raw_item(data):
+    """Build the item of a raw listing: the server-side dict itself"""
+    return data
+
+
+def _existing(resource_type, data):
+    """Build the item of a listing: an existing resource"""
+    return resource_type.existing(**data)
+
+
+def _get_json_codec(session):
+    """Return the JSON codec of a session, if it has one"""
+    codec = getattr(session, "json_codec", None)
+    if isinstance(codec, json_codec.JSONCodec):
+        return codec
+    return None
+
+
+class _StreamedPage(object):
+    """A page of a listing decoded while its response is received
+
+    Iterating the page yields its items as soon as they are decoded, and
+    lets them go once yielded, so the page can only be iterated once.
+    Once the response is entirely read, the page holds the decoded body,
+    without the resources, as ``response_json``, the number of items as
+    ``count`` and the last item as ``last``. That body is then passed to
+    ``check``, see :meth:`Resource._check_page`.
+    """
+
+    def __init__(self, response, decoder, factory, check=None):
+        self._response = response
+        self._chunks = response.iter_content(json_codec.CHUNK_SIZE)
+        self._decoder = decoder
+        self._factory = factory
+        self._check = check
+        self._pending = collections.deque()
+        self.count = 0
+        self.last = None
+        self.response_json = None
+
+    def __iter__(self):
+        try:
+            while True:
+                while self._pending:
+                    yield self._pending.popleft()
+                if self.response_json is not None:
+                    return
+                self._read()
+        finally:
+            if self.response_json is None:
+                # the listing was abandoned, free the connection
+                self._response.close()
+
+    def _read(self):
+        try:
+            chunk = next(self._chunks)
+        except StopIteration:
+            items = self._decoder.flush()
+            self.response_json = self._decoder.close()
+            if self._check is not None:
+                self._check(self.response_json)
+        else:
+            items = self._decoder.feed(chunk)
+        for data in items:
+            # see Resource._get_page
+            data.pop("self", None)
+            self.last = self._factory(data)
+            self._pending.append(self.last)
+            self.count += 1
+
+    def drain(self):
+        """Read and decode the rest of the response"""
+        while self.response_json is None:
+            self._read()
+        self._pending.clear()
+
+
+class CompactResource(object):
+    """A read-only view of a listed resource
+
+    Listing with ``compact=True`` yields these views instead of
+    :class:`Resource` objects. A view only keeps the resource class and
+    the dict the server returned, without copying it nor tracking its
+    changes, and reads the attributes through the descriptors of the
+    resource class.
+
+    A view is not an instance of its resource class, but the proxies
+    and :meth:`Resource._get_id` accept it in place of a resource. The
+    first write, or call of a method, builds the full resource from the
+    dict, see :meth:`to_resource`, and the view forwards everything to it
+    from then on.
+    """
+
+    __slots__ = ("_resource_type", "_body", "_resource", "_decoded")
+
+    # views only hold body attributes
+    _header = {}
+    _uri = {}
+
+    def __init__(self, resource_type, body):
+        object.__setattr__(self, "_resource_type", resource_type)
+        object.__setattr__(self, "_body", body)
+        object.__setattr__(self, "_resource", None)
+        object.__setattr__(self, "_decoded", None)
+
+    @property
+    def resource_type(self):
+        """The :class:`Resource` subclass this view was listed as"""
+        return self._resource_type
+
+    def to_resource(self):
+        """Return the full resource of this view, building it once"""
+        if self._resource is None:
+            object.__setattr__(self, "_resource",
+                               self._resource_type.existing(**self._body))
+        return self._resource
+
+    def _components(self):
+        resource_type = self._resource_type
+        maps = resource_type._field_maps()
+        try:
+            return maps["compact"]
+        except KeyError:
+            components = dict(resource_type._fields((Body, Header, URI)))
+            maps["compact"] = components
+            return components
+
+    def __getattr__(self, name):
+        # only called for the names which are not slots
+        if name.startswith("__"):
+            raise AttributeError(name)
+        if self._resource is not None:
+            return getattr(self._resource, name)
+
+        if name == "id":
+            return self._resource_type._id_from_body(self._body)
+
+        component = self._components().get(name)
+        if component is not None:
+            return component.__get__(self, self._resource_type)
+        return getattr(self.to_resource(), name)
+
+    def __setattr__(self, name, value):
+        setattr(self.to_resource(), name, value)
+
+    def __delattr__(self, name):
+        delattr(self.to_resource(), name)
+
+    def __eq__(self, comparand):
+        if isinstance(comparand, CompactResource):
+            comparand = comparand.to_resource()
+        return self.to_resource() == comparand
+
+    def __ne__(self, comparand):
+        return not self == comparand
+
+    def __repr__(self):
+        if self._resource is not None:
+            return repr(self._resource)
+        args = ", ".join("%s=%s" % (k, v) for k, v in self._body.items())
+        return "%s.%s(%s)" % (self._resource_type.__module__,
+                              self._resource_type.__name__, args)
+
+
 def wait_for_status(session, resource, status,
                     failures=[], interval=5, wait=120):
     """Wait for the resource to be in a particular status.
@@ -1030,3 +1552,198 @@ def wait_for_delete(session, resource, interval, wait):
         total_sleep += interval
     msg = "Timeout waiting for %s delete" % (resource.id)
     raise exceptions.ResourceTimeout(msg)
+
+
+def wait_for_many(session, resources, status=None, failures=None,
+                  interval=2, max_interval=30, wait=120, query=None):
+    """Wait for many resources to reach a status, or to be deleted.
+
+    Unlike :func:`wait_for_status` and :func:`wait_for_delete`, the
+    resources are refreshed together: the ones of a same class and
+    parent, when more than one of them is left and their class allows
+    listing with :meth:`Resource.list`, by listing that class once per
+    round instead of getting each resource. The listings are filtered by
+    the ids of the resources when the class accepts an ``id`` query
+    parameter, and ``query`` narrows them further, e.g. to the name
+    prefix the resources were created with. Otherwise a listing stops
+    after :data:`LISTING_SHARE` times as many entries as resources, so a
+    few resources of a big collection are got on their own from then on.
+    A resource missing from a listing, or whose listing failed, is got on
+    its own.
+
+    The interval between rounds doubles up to ``max_interval`` while no
+    resource completes, and goes back to ``interval`` when one does. A
+    random jitter takes up to half of it, so that concurrent waiters
+    spread their requests.
+
+    :param session: The session to use for making this request.
+    :type session: :class:`~openstack.session.Session`
+    :param resources: The resources to wait on. Each resource must have
+                      a status attribute, unless waiting for deletes.
+    :type resources: list of :class:`~openstack.resource2.Resource`
+    :param status: Desired status of the resources, or None to wait for
+                   them to be deleted.
+    :param list failures: Statuses that would indicate the transition
+                          failed such as 'ERROR'.
+    :param interval: Number of seconds to wait after the first check.
+    :param max_interval: Maximum number of seconds between two checks.
+    :param wait: Maximum number of seconds to wait for all transitions.
+    :param dict query: Query parameters for the listings.
+
+    :return: A generator of done :class:`concurrent.futures.Future`
+             objects, one per resource, in the order the resources
+             complete. Each has the resource as ``resource`` attribute.
+             Its result is the resource, or it raises
+             :class:`~openstack.exceptions.ResourceFailure` if the
+             resource transitioned to one of the failure states, and
+             :class:`~openstack.exceptions.ResourceTimeout` if it didn't
+             complete in ``wait`` seconds, or
+             :class:`~openstack.exceptions.NotFoundException` if it was
+             deleted while waiting for a status, or the error of the
+             request getting it.
+    """
+    if failures is None:
+        failures = []
+    deadline = time.time() + wait
+    pending = {}
+    # the groups whose listings were cut or failed, got resource by resource
+    unlisted = set()
+    for resource in resources:
+        future = futures.Future()
+        future.resource = resource
+        pending[id(resource)] = future
+
+    def complete(future, exception=None):
+        del pending[id(future.resource)]
+        if exception is None:
+            future.set_result(future.resource)
+        else:
+            future.set_exception(exception)
+        return future
+
+    def check(future):
+        resource = future.resource
+        if status is None or resource.status == status:
+            return complete(future)
+        if resource.status in failures:
+            msg = ("Resource %s transitioned to failure state %s" %
+                   (resource.id, resource.status))
+            return complete(future, exceptions.ResourceFailure(msg))
+        return None
+
+    def get(future):
+        try:
+            future.resource.get(session)
+        except exceptions.NotFoundException as e:
+            return complete(future, None if status is None else e)
+        except exceptions.SDKException as e:
+            return complete(future, e)
+        return None if status is None else check(future)
+
+    if status is not None:
+        for future in list(pending.values()):
+            if check(future):
+                yield future
+
+    delay = interval
+    while pending:
+        left = len(pending)
+        for key, group in _group_for_listing(pending.values()):
+            if len(group) == 1 or key in unlisted:
+                for future in group:
+                    done = get(future)
+                    if done:
+                        yield done
+                continue
+            if not _refresh_by_listing(session, group, query):
+                unlisted.add(key)
+            for future in group:
+                if not future.listed:
+                    done = get(future)
+                elif status is not None:
+                    done = check(future)
+                else:
+                    done = None
+                if done:
+                    yield done
+
+        remaining = deadline - time.time()
+        if not pending or remaining <= 0:
+            break
+        time.sleep(min(delay * (1 - random.random() / 2), remaining))
+        # back off while nothing changes, poll at the pace of the
+        # completions otherwise
+        if len(pending) == left:
+            delay = min(delay * 2, max_interval)
+        else:
+            delay = interval
+
+    for future in list(pending.values()):
+        msg = "Timeout waiting for %s to transition to %s" % (
+            future.resource.id, status if status is not None else "deleted")
+        yield complete(future, exceptions.ResourceTimeout(msg))
+
+
+def _group_for_listing(pending):
+    """Group the futures of resources which one listing can refresh
+
+    :return: A list of ``(key, futures)`` tuples.
+    """
+    groups = collections.OrderedDict()
+    for future in pending:
+        resource = future.resource
+        resource_type = type(resource)
+        list_method = getattr(getattr(resource_type, "list", None),
+                              "__func__", None)
+        if (getattr(resource_type, "allow_list", False) and
+                list_method is Resource.list.__func__):
+            key = (resource_type,
+                   tuple(sorted(resource._uri.attributes.items())))
+        else:
+            key = id(resource)
+        groups.setdefault(key, []).append(future)
+    return list(groups.items())
+
+
+def _refresh_by_listing(session, group, query):
+    """Refresh the resources of a group with one listing
+
+    The futures of the group get a ``listed`` attribute telling whether
+    their resource was found in the listing.
+
+    :return: False when the listing was cut, as it went on past
+             :data:`LISTING_SHARE` entries per resource, or failed, so
+             that the group is better got resource by resource.
+    """
+    first = group[0].resource
+    resource_type = type(first)
+    by_id = {}
+    for future in group:
+        future.listed = False
+        by_id[future.resource.id] = future
+    params = dict(query or {})
+    params.update(first._uri.attributes)
+    budget = None
+    if "id" in resource_type._query_mapping._mapping:
+        params.setdefault("id", sorted(by_id))
+    else:
+        # without an id filter, only list collections the group is a
+        # large share of
+        budget = LISTING_SHARE * len(group)
+        params.setdefault(resource_type.query_limit_key, budget)
+    left = len(by_id)
+    try:
+        for count, body in enumerate(resource_type.list(
+                session, paginated=True, raw=True, **params)):
+            future = by_id.get(resource_type._id_from_body(body))
+            if future is not None and not future.listed:
+                future.resource._update_from_body(body)
+                future.listed = True
+                left -= 1
+            if left and budget is not None and count + 1 >= budget:
+                return False
+    except exceptions.SDKException as e:
+        _logger.debug("Listing %s failed, getting them one by one: %s",
+                      resource_type.__name__, e)
+        return False
+    return True
@@ -59,7 +59,11 @@ except ImportError:
 from keystoneauth1 import exceptions as _exceptions
 from keystoneauth1 import session as _session
 
+from openstack import discovery_cache as _discovery_cache
 from openstack import exceptions
+from openstack import instrumentation
+from openstack import json_codec as _json_codec
+from openstack import throttle
 from openstack import utils
 from openstack import version as openstack_version
 
@@ -87,7 +91,13 @@ def map_exceptions(func):
 
 class Session(_session.Session):
 
-    def __init__(self, profile, user_agent=None, **kwargs):
+    #: The :class:`~openstack.json_codec.JSONCodec` of the requests and
+    #: responses.
+    json_codec = None
+
+    def __init__(self, profile, user_agent=None, json_codec=None,
+                 discovery_cache=None, instruments=None, retry_policy=None,
+                 rate_limiter=None, **kwargs):
         """Create a new Keystone auth session with a profile.
 
         :param profile: If the user has any special profiles such as the
@@ -100,6 +110,24 @@ class Session(_session.Session):
                            is used, which contains the openstacksdk version
                            When a non-None value is passed, it will be
                            prepended to the default.
+        :param json_codec: The :class:`~openstack.json_codec.JSONCodec`
+                           encoding the requests and decoding the
+                           responses. The fastest available is used by
+                           default.
+        :param discovery_cache: The
+            :class:`~openstack.discovery_cache.DiscoveryCache` keeping the
+            versions discovered at the service endpoints, and the endpoints
+            without any, possibly shared with other sessions or in a file.
+            A cache of this session only is used by default.
+        :param instruments: The
+            :class:`~openstack.instrumentation.Instrument` objects notified
+            of the requests.
+        :param retry_policy: The :class:`~openstack.throttle.RetryPolicy`
+            of the throttled requests. A default one retrying the idempotent
+            requests is used if None.
+        :param rate_limiter: The
+            :class:`~openstack.throttle.AdaptiveRateLimiter` pacing the
+            requests of each service. The requests are not paced if None.
         :type profile: :class:`~openstack.profile.Profile`
         """
         if user_agent is not None:
@@ -110,10 +138,18 @@ class Session(_session.Session):
         self.profile = profile
         api_version_header = self._get_api_requests()
         self.endpoint_cache = {}
+        self.discovery_cache = (discovery_cache or
+                                _discovery_cache.DiscoveryCache())
+        self.instruments = list(instruments or [])
+        self.retry_policy = retry_policy or throttle.RetryPolicy()
+        self.rate_limiter = rate_limiter
 
         super(Session, self).__init__(user_agent=self.user_agent,
                                       additional_headers=api_version_header,
                                       **kwargs)
+        self.json_codec = json_codec or _json_codec.get_codec()
+        # keystoneauth encodes the request bodies with it
+        self._json = self.json_codec
 
     def _get_api_requests(self):
         """Get API micro-version requests.
@@ -127,8 +163,9 @@ class Session(_session.Session):
         if self.profile is None:
             return None
 
+        # only the services which were requested may have an API version
         req = []
-        for svc in self.profile.get_services():
+        for svc in self.profile.get_services(loaded_only=True):
             if svc.service_type and svc.api_version:
                 req.append(" ".join([svc.service_type, svc.api_version]))
         if req:
@@ -349,8 +386,7 @@ class Session(_session.Session):
         # no response from endpoint or version not matched), we just use
         # service endpoint directly
         try:
-            endpoint = self._get_endpoint_versions(service_type,
-                                                   sc_endpoint)
+            endpoint = self._discover_endpoint(service_type, sc_endpoint)
 
             profile_version = self._parse_version(filt.version)
             match = self._get_version_match(endpoint, profile_version,
@@ -364,9 +400,68 @@ class Session(_session.Session):
         except exceptions.EndpointNotFound:
             return sc_endpoint
 
+    def _discover_endpoint(self, service_type, endpoint):
+        """Get the versions of an endpoint through the discovery cache
+
+        Both the versions found and their absence are cached, so the
+        paths of an endpoint are only probed again once the entry of the
+        :attr:`discovery_cache` expired.
+        """
+        try:
+            found = self.discovery_cache.get(endpoint)
+        except KeyError:
+            try:
+                found = self._get_endpoint_versions(service_type, endpoint)
+            except exceptions.EndpointNotFound:
+                self.discovery_cache.set(endpoint, None)
+                raise
+            self.discovery_cache.set(endpoint, {
+                "uri": found.uri, "versions": found.versions,
+                "needs_project_id": found.needs_project_id,
+                "project_id": found.project_id})
+            return found
+
+        if found is None:
+            raise exceptions.EndpointNotFound(
+                "Unable to parse endpoints for %s" % service_type)
+        return self._Endpoint(**found)
+
     @map_exceptions
-    def request(self, *args, **kwargs):
+    def request(self, url, method, **kwargs):
         # Fix MRS service require *Content-Type* header in GET request
-        headers = kwargs.setdefault('headers', dict())
+        # work on a copy so callers may share their headers between threads
+        headers = kwargs['headers'] = dict(kwargs.get('headers') or {})
         headers.setdefault('Content-Type', 'application/json')
-        return super(Session, self).request(*args, **kwargs)
+        retry = kwargs.pop('retry', None)
+        raise_exc = kwargs.pop('raise_exc', True)
+        endpoint_filter = kwargs.get('endpoint_filter')
+        info = instrumentation.begin(self.instruments, endpoint_filter,
+                                     method, url)
+        send = super(Session, self).request
+        try:
+            # authenticating and resolving the endpoint are part of it
+            with instrumentation.timed(info, "send"):
+                resp = throttle.send(
+                    lambda: send(url, method, raise_exc=False, **kwargs),
+                    method, data=kwargs.get('data'),
+                    retry_policy=self.retry_policy,
+                    rate_limiter=self.rate_limiter,
+                    service_type=getattr(endpoint_filter, 'service_type',
+                                         None),
+                    region=getattr(endpoint_filter, 'region', None),
+                    retry=retry, info=info)
+            if raise_exc and resp.status_code >= 400:
+                raise _exceptions.from_response(resp, method, url)
+        except _exceptions.HttpError as e:
+            if e.response is None:
+                instrumentation.failed(info, e, kwargs.get('data'))
+            else:
+                instrumentation.succeeded(info, e.response,
+                                          kwargs.get('data'))
+            raise
+        except Exception as e:
+            instrumentation.failed(info, e, kwargs.get('data'))
+            raise
+        instrumentation.succeeded(info, resp, kwargs.get('data'),
+                                  kwargs.get('stream', False))
+        return resp
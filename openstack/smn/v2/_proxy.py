@@ -60,16 +60,18 @@ class Proxy(proxy2.BaseProxy):
         """
         return self._list(_topic.Topic, paginated=False, **query)
 
-    def get_topic(self, topic):
+    def get_topic(self, topic, raw=False):
         """Get detail about a given topic
 
         :param topic: The topic urn or an instance of
                       :class:`~openstack.smn.v2.topic.Topic`
+        :param bool raw: When set to ``True``, return the decoded body of
+                         the response instead of a resource.
 
         :returns: A Topic object
         :rtype: :class:`~openstack.smn.v2.topic.Topic`
         """
-        return self._get(_topic.Topic, topic)
+        return self._get(_topic.Topic, topic, raw=raw)
 
     def get_topic_attr(self, topic, attrname=None):
         """Get topic attr
@@ -87,18 +87,20 @@ class Proxy(proxy2.BaseProxy):
         return self._find(_resource.Resource, name_or_id,
                           ignore_missing=ignore_missing)
 
-    def get_resource(self, resource):
+    def get_resource(self, resource, raw=False):
         """Get a single resource
 
         :param resource: The value can be the ID of a resource or a
                          :class:`~openstack.telemetry.v2.resource.Resource`
                          instance.
+        :param bool raw: When set to ``True``, return the decoded body of
+                         the response instead of a resource.
 
         :returns: One :class:`~openstack.telemetry.v2.resource.Resource`
         :raises: :class:`~openstack.exceptions.ResourceNotFound`
                  when no resource can be found.
         """
-        return self._get(_resource.Resource, resource)
+        return self._get(_resource.Resource, resource, raw=raw)
 
     def resources(self, **query):
         """Return a generator of resources
@@ -10,6 +10,8 @@
 # License for the specific language governing permissions and limitations
 # under the License.
 
+import mock
+
 from openstack.auto_scaling import auto_scaling_service
 from openstack.auto_scaling.v1 import _proxy
 from openstack.auto_scaling.v1 import activity as _activity_log
@@ -596,6 +598,33 @@ class TestAutoScalingInstance(TestAutoScalingProxy):
                 "instance_delete": "yes"
             })
 
+    def test_list_instance_max_workers(self):
+        def page(start_number):
+            return {
+                "limit": 1,
+                "total_number": 3,
+                "start_number": start_number,
+                "scaling_group_instances": [{
+                    "instance_id": "instance-%d" % start_number
+                }]
+            }
+
+        def get(uri, params=None, **kwargs):
+            response = mock.Mock()
+            response.json.return_value = page(params["start_number"])
+            return response
+
+        self.session.get.side_effect = get
+        instances = list(self.proxy.instances("group-id", marker=0,
+                                              max_workers=2))
+
+        self.assertEqual(["instance-0", "instance-1", "instance-2"],
+                         [instance.id for instance in instances])
+        self.assertEqual(3, self.session.get.call_count)
+        queried = sorted(call[1]["params"]["start_number"]
+                         for call in self.session.get.call_args_list)
+        self.assertEqual([0, 1, 2], queried)
+
     def test_list_instance(self):
         query = {
             "health_status": "INITIALIZING",
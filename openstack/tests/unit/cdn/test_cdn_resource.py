@@ -275,6 +275,88 @@ class TestCDNResource(testtools.TestCase):
 
         self.assertRaises(StopIteration, next, results)
 
+    def test_list_multi_page_response_max_workers(self):
+        def get(uri, params=None, **kwargs):
+            number = params['page_number']
+            response = mock.Mock()
+            response.json.return_value = {'total': 3,
+                                          'resources': [{'id': number}]}
+            return response
+
+        self.session.get.side_effect = get
+        query_params = {'page_size': 1, 'page_number': 1}
+
+        results = list(self.sot.list(self.session, paginated=True,
+                                     max_workers=2, **query_params))
+
+        self.assertEqual([1, 2, 3], [result.id for result in results])
+        self.assertEqual(3, self.session.get.call_count)
+
+    def test_list_multi_page_response_prefetch(self):
+        resp1 = mock.Mock()
+        resp1.json.return_value = {'total': 2, 'resources': [{'id': 1}]}
+        resp2 = mock.Mock()
+        resp2.json.return_value = {'total': 2, 'resources': [{'id': 2}]}
+        self.session.get.side_effect = [resp1, resp2]
+        query_params = {'page_size': 1, 'page_number': 1}
+
+        results = list(self.sot.list(self.session, paginated=True,
+                                     prefetch=1, **query_params))
+
+        self.assertEqual([1, 2], [result.id for result in results])
+        self.assertEqual({'page_size': 1, 'page_number': 2},
+                         self.session.get.call_args_list[1][1]['params'])
+
+    def test_list_stream(self):
+        resp1 = mock.Mock()
+        resp1.iter_content.return_value = iter(
+            [b'{"total": 2, "resources": [{"id": 1}]}'])
+        resp2 = mock.Mock()
+        resp2.iter_content.return_value = iter(
+            [b'{"total": 2, "resources": [{"id": 2}]}'])
+        self.session.get.side_effect = [resp1, resp2]
+        query_params = {'page_size': 1, 'page_number': 1}
+
+        results = list(self.sot.list(self.session, paginated=True,
+                                     stream=True, **query_params))
+
+        self.assertEqual([1, 2], [result.id for result in results])
+        self.assertTrue(self.session.get.call_args_list[0][1]['stream'])
+        self.assertEqual({'page_size': 1, 'page_number': 2},
+                         self.session.get.call_args_list[1][1]['params'])
+
+    def test_list_error(self):
+        mock_response = mock.Mock()
+        mock_response.json.return_value = {
+            'error': {'error_code': 'CDN.0001', 'error_msg': 'failed'}}
+        self.session.get.return_value = mock_response
+        query_params = {'page_size': 10, 'page_number': 1}
+
+        results = self.sot.list(self.session, **query_params)
+
+        self.assertRaises(CDNException, list, results)
+
+    def test_list_stream_error(self):
+        mock_response = mock.Mock()
+        mock_response.iter_content.return_value = iter(
+            [b'{"error": {"error_code": "CDN.0001", "error_msg": "failed"}}'])
+        self.session.get.return_value = mock_response
+        query_params = {'page_size': 10, 'page_number': 1}
+
+        results = self.sot.list(self.session, stream=True, **query_params)
+
+        self.assertRaises(CDNException, list, results)
+
+    def test_get_offset_queries(self):
+        resp = {'total': 25, 'domains': []}
+        query_params = {'page_size': 10, 'page_number': 1, 'name': 'x'}
+
+        sot = cdn_resource.Resource()
+        queries = sot.get_offset_queries(resp, 10, query_params)
+        self.assertEqual([{'page_size': 10, 'page_number': 2, 'name': 'x'},
+                          {'page_size': 10, 'page_number': 3, 'name': 'x'}],
+                         queries)
+
 
 class TestQueryParameters(testtools.TestCase):
     def test_basic(self):
@@ -244,6 +244,16 @@ class TestComputeProxy(test_proxy_base2.TestProxyBase):
             method_args=[value],
             expected_args=[value, 'ACTIVE', ['ERROR'], 2, 120])
 
+    def test_wait_for_servers(self):
+        value = [server.Server(id='1234')]
+        self.verify_wait_for_status(
+            self.proxy.wait_for_servers,
+            mock_method="openstack.resource2.wait_for_many",
+            method_args=[value],
+            method_kwargs={'name': 'batch'},
+            expected_args=[value, 'ACTIVE', ['ERROR'], 2],
+            expected_kwargs={'wait': 120, 'query': {'name': 'batch'}})
+
     def test_server_resize(self):
         self._verify("openstack.compute.v2.server.Server.resize",
                      self.proxy.resize_server,
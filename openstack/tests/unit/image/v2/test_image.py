@@ -10,8 +10,12 @@
 # License for the specific language governing permissions and limitations
 # under the License.
 
+import hashlib
+import io
 import json
+import os
 
+import fixtures
 import mock
 import testtools
 
@@ -331,3 +335,115 @@ class TestImage(testtools.TestCase):
         self.assertEqual(url, call_args[0])
         self.assertItemsEqual(json.loads(value),
                               json.loads(call_kwargs['data']))
+
+
+class TestImageFile(testtools.TestCase):
+
+    def setUp(self):
+        super(TestImageFile, self).setUp()
+        self.path = os.path.join(self.useFixture(fixtures.TempDir()).path,
+                                 "image.qcow2")
+        self.content = b"0123456789"
+        self.checksum = hashlib.md5(self.content).hexdigest()
+        self.file_headers = {}
+        self.ranges = []
+        self.accept_ranges = True
+        self.sess = mock.Mock()
+        self.sess.get.side_effect = self._get
+        self.sot = image.Image(id=IDENTIFIER)
+
+    def _get(self, url, stream=False, headers=None, **kwargs):
+        if not url.endswith("/file"):
+            body = {"id": IDENTIFIER, "checksum": self.checksum,
+                    "size": len(self.content)}
+            return mock.Mock(headers={}, json=mock.Mock(return_value=body))
+
+        self.assertTrue(stream)
+        content, status = self.content, 200
+        if headers and "Range" in headers and self.accept_ranges:
+            start, end = headers["Range"][len("bytes="):].split("-")
+            self.ranges.append((int(start), int(end)))
+            content, status = content[int(start):int(end) + 1], 206
+
+        def iter_content(chunk_size):
+            for start in range(0, len(content), chunk_size):
+                yield content[start:start + chunk_size]
+
+        return mock.Mock(status_code=status, headers=self.file_headers,
+                         iter_content=iter_content)
+
+    def download(self, **kwargs):
+        self.sot.download_file(self.sess, self.path, chunk_size=3, **kwargs)
+        with open(self.path, "rb") as result:
+            return result.read()
+
+    def test_download_file(self):
+        self.file_headers["Content-MD5"] = self.checksum
+
+        self.assertEqual(self.content, self.download())
+        self.assertEqual(1, self.sess.get.call_count)
+
+    def test_download_file_checksum_from_details(self):
+        self.assertEqual(self.content, self.download())
+        self.assertEqual(2, self.sess.get.call_count)
+
+    def test_download_file_checksum_mismatch(self):
+        self.file_headers["Content-MD5"] = "the wrong checksum"
+
+        self.assertRaises(exceptions.InvalidResponse, self.download)
+
+    def test_download_file_ranges(self):
+        self.assertEqual(self.content, self.download(workers=2,
+                                                     range_size=4))
+        self.assertEqual([(0, 3), (4, 7), (8, 9)], sorted(self.ranges))
+
+    def test_download_file_ranges_checksum_mismatch(self):
+        self.checksum = "the wrong checksum"
+
+        self.assertRaises(exceptions.InvalidResponse, self.download,
+                          workers=2, range_size=4)
+
+    def test_download_file_ranges_ignored(self):
+        self.accept_ranges = False
+
+        self.assertEqual(self.content, self.download(workers=2,
+                                                     range_size=4))
+        # the whole data answered to the first range is saved
+        self.assertEqual(2, self.sess.get.call_count)
+
+    def test_download_file_small_image(self):
+        self.assertEqual(self.content, self.download(workers=2))
+        self.assertEqual([], self.ranges)
+
+    def upload(self, content):
+        with open(self.path, "wb") as data:
+            data.write(content)
+        sent = []
+
+        def put(url, data=None, **kwargs):
+            # the sessions read the body to sign it, then rewind it
+            data.read()
+            data.seek(0)
+            sent.append(data.read())
+            return mock.Mock()
+
+        self.sess.put.side_effect = put
+        self.sot.upload_file(self.sess, self.path)
+        return sent
+
+    def test_upload_file(self):
+        self.assertEqual([self.content], self.upload(self.content))
+        self.assertEqual("images/IDENTIFIER/file",
+                         self.sess.put.call_args[0][0])
+
+    def test_upload_file_checksum_mismatch(self):
+        self.assertRaises(exceptions.InvalidResponse, self.upload,
+                          b"other")
+
+    def test_hashing_file_seek_past_end(self):
+        data = image._HashingFile(io.BytesIO(self.content))
+        data.read()
+
+        data.seek(len(self.content) + 10)
+
+        self.assertEqual(self.checksum, data.digest.hexdigest())
@@ -50,6 +50,29 @@ class TestImageProxy(test_proxy_base2.TestProxyBase):
         created_image.upload.assert_called_with(self.session)
         self.assertEqual(rv, created_image)
 
+    def test_image_create_filename(self):
+        created_image = mock.Mock(spec=image.Image(id="id"))
+        self.proxy._create = mock.Mock(return_value=created_image)
+
+        rv = self.proxy.upload_image(filename="image.qcow2",
+                                     container_format="x", disk_format="y")
+
+        created_image.upload_file.assert_called_with(self.session,
+                                                     "image.qcow2")
+        self.assertFalse(created_image.upload.called)
+        self.assertEqual(rv, created_image)
+
+    def test_image_download_path(self):
+        self._verify2("openstack.image.v2.image.Image.download_file",
+                      self.proxy.download_image,
+                      method_args=["image"],
+                      method_kwargs={"path": "image.qcow2", "workers": 4},
+                      expected_args=[self.session, "image.qcow2"],
+                      expected_kwargs={
+                          "chunk_size": image.DEFAULT_CHUNK_SIZE,
+                          "workers": 4,
+                          "range_size": image.DEFAULT_RANGE_SIZE})
+
     def test_image_delete(self):
         self.verify_delete(self.proxy.delete_image, image.Image, False)
 
@@ -135,3 +135,86 @@ class TestObject(testtools.TestCase):
 
     def test_create_no_data(self):
         self._test_create(self.sess.post, None, None)
+
+    def test_set_metadata(self):
+        sot = obj.Object.new(container=CONTAINER_NAME, name=OBJECT_NAME)
+        self.resp.headers = {"content-type": "text/plain",
+                             "X-Object-Meta-Color": "red",
+                             "X-Object-Meta-Size": "big"}
+        self.sess.head = mock.Mock(return_value=self.resp)
+
+        sot.set_metadata(self.sess, {"color": "blue"})
+
+        url = "%s/%s" % (CONTAINER_NAME, OBJECT_NAME)
+        self.sess.head.assert_called_once_with(
+            url, endpoint_filter=sot.service, headers={"Accept": ""})
+        self.sess.post.assert_called_once_with(
+            url, endpoint_filter=sot.service,
+            headers={"content-type": "text/plain",
+                     "X-Object-Meta-color": "blue",
+                     "X-Object-Meta-size": "big"})
+
+    def test_set_metadata_current(self):
+        sot = obj.Object.new(container=CONTAINER_NAME, name=OBJECT_NAME)
+        self.sess.head = mock.Mock()
+
+        sot.set_metadata(self.sess, {"color": "blue"},
+                         current={"size": "big"})
+
+        self.sess.head.assert_not_called()
+        self.sess.post.assert_called_once_with(
+            "%s/%s" % (CONTAINER_NAME, OBJECT_NAME),
+            endpoint_filter=sot.service,
+            headers={"X-Object-Meta-color": "blue",
+                     "X-Object-Meta-size": "big"})
+
+    def test_set_metadata_if_match(self):
+        sot = obj.Object.new(container=CONTAINER_NAME, name=OBJECT_NAME)
+        self.resp.headers = {"X-Object-Meta-Size": "big"}
+        self.sess.head = mock.Mock(return_value=self.resp)
+
+        sot.set_metadata(self.sess, {"color": "blue"}, if_match="etag")
+
+        url = "%s/%s" % (CONTAINER_NAME, OBJECT_NAME)
+        self.sess.head.assert_called_once_with(
+            url, endpoint_filter=sot.service,
+            headers={"Accept": "", "If-Match": "etag"})
+        self.sess.post.assert_called_once_with(
+            url, endpoint_filter=sot.service,
+            headers={"X-Object-Meta-color": "blue",
+                     "X-Object-Meta-size": "big"})
+
+    def test_set_metadata_current_if_match(self):
+        sot = obj.Object.new(container=CONTAINER_NAME, name=OBJECT_NAME)
+
+        self.assertRaises(ValueError, sot.set_metadata, self.sess,
+                          {"color": "blue"}, current={}, if_match="etag")
+        self.sess.post.assert_not_called()
+
+    def test_delete_metadata(self):
+        sot = obj.Object.new(container=CONTAINER_NAME, name=OBJECT_NAME)
+        self.resp.headers = {"content-type": "text/plain",
+                             "X-Object-Meta-Color": "red",
+                             "X-Object-Meta-Size": "big"}
+        self.sess.head = mock.Mock(return_value=self.resp)
+
+        sot.delete_metadata(self.sess, ["color"])
+
+        self.sess.post.assert_called_once_with(
+            "%s/%s" % (CONTAINER_NAME, OBJECT_NAME),
+            endpoint_filter=sot.service,
+            headers={"content-type": "text/plain",
+                     "X-Object-Meta-size": "big"})
+
+    def test_delete_metadata_current(self):
+        sot = obj.Object.new(container=CONTAINER_NAME, name=OBJECT_NAME)
+        self.sess.head = mock.Mock()
+
+        sot.delete_metadata(self.sess, ["color"],
+                            current={"color": "red", "size": "big"})
+
+        self.sess.head.assert_not_called()
+        self.sess.post.assert_called_once_with(
+            "%s/%s" % (CONTAINER_NAME, OBJECT_NAME),
+            endpoint_filter=sot.service,
+            headers={"X-Object-Meta-size": "big"})
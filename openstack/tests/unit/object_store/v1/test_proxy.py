@@ -10,9 +10,16 @@
 # License for the specific language governing permissions and limitations
 # under the License.
 
+import hashlib
+import io
+import json
+import os
+
+import fixtures
 import mock
 import six
 
+from openstack import exceptions
 from openstack.object_store.v1 import _proxy
 from openstack.object_store.v1 import account
 from openstack.object_store.v1 import container
@@ -48,6 +55,25 @@ class TestObjectStoreProxy(test_proxy_base.TestProxyBase):
         self.verify_head(self.proxy.get_object_metadata, obj.Object,
                          value="object", container="container")
 
+    def test_object_metadata_set(self):
+        self._verify2("openstack.object_store.v1.obj.Object.set_metadata",
+                      self.proxy.set_object_metadata,
+                      method_args=["object"],
+                      method_kwargs={"container": "container",
+                                     "if_match": "etag", "color": "blue"},
+                      expected_args=[self.session, {"color": "blue"}],
+                      expected_kwargs={"current": None,
+                                       "if_match": "etag"})
+
+    def test_object_metadata_delete(self):
+        self._verify2("openstack.object_store.v1.obj.Object.delete_metadata",
+                      self.proxy.delete_object_metadata,
+                      method_args=["object"],
+                      method_kwargs={"container": "container",
+                                     "keys": ["color"]},
+                      expected_args=[self.session, ["color"]],
+                      expected_kwargs={"current": None, "if_match": None})
+
     def _test_object_delete(self, ignore):
         expected_kwargs = {"path_args": {"container": "name"}}
         expected_kwargs["ignore_missing"] = ignore
@@ -254,21 +280,409 @@ class Test_objects(TestObjectStoreProxy):
 
 class Test_download_object(TestObjectStoreProxy):
 
-    @mock.patch("openstack.object_store.v1._proxy.Proxy.get_object")
-    def test_download(self, mock_get):
-        the_data = "here's some data"
-        mock_get.return_value = the_data
-        ob = mock.Mock()
-
-        fake_open = mock.mock_open()
-        file_path = "blarga/somefile"
-        with mock.patch("openstack.object_store.v1._proxy.open",
-                        fake_open, create=True):
-            self.proxy.download_object(ob, container="tainer", path=file_path)
-
-        fake_open.assert_called_once_with(file_path, "w")
-        fake_handle = fake_open()
-        fake_handle.write.assert_called_once_with(the_data)
+    def setUp(self):
+        super(Test_download_object, self).setUp()
+        self.session = mock.Mock()
+        self.session.get.side_effect = self._get
+        self.session.head.side_effect = self._head
+        self.proxy = _proxy.Proxy(self.session)
+        self.path = os.path.join(self.useFixture(fixtures.TempDir()).path,
+                                 "object")
+        self.content = b"0123456789"
+        self.headers = {"etag": _md5(self.content)}
+        self.ranges = []
+
+    def _head(self, url, **kwargs):
+        headers = dict(self.headers, **{"content-length":
+                                        str(len(self.content))})
+        return mock.Mock(headers=headers)
+
+    def _get(self, url, headers=None, stream=False, **kwargs):
+        self.assertTrue(stream)
+        content, status = self.content, 200
+        if "Range" in headers:
+            self.assertEqual(self.headers["etag"], headers["If-Match"])
+            start, end = headers["Range"][len("bytes="):].split("-")
+            self.ranges.append((int(start), int(end)))
+            content, status = content[int(start):int(end) + 1], 206
+
+        def iter_content(chunk_size):
+            for start in range(0, len(content), chunk_size):
+                yield content[start:start + chunk_size]
+
+        return mock.Mock(status_code=status, headers=self.headers,
+                         iter_content=iter_content)
+
+    def download(self, **kwargs):
+        self.proxy.download_object("object", container="tainer",
+                                   path=self.path, chunk_size=3, **kwargs)
+        with open(self.path, "rb") as result:
+            return result.read()
+
+    def test_download(self):
+        self.assertEqual(self.content, self.download())
+
+        self.session.get.assert_called_once_with(
+            "tainer/object", endpoint_filter=obj.Object.service,
+            headers={"Accept": "bytes"}, stream=True)
+        self.assertFalse(self.session.head.called)
+
+    def test_download_checksum_mismatch(self):
+        self.headers["etag"] = _md5(b"other")
+
+        self.assertRaises(exceptions.InvalidResponse, self.download)
+
+    def test_download_large_object(self):
+        self.headers = {"etag": '"%s"' % _md5(b"etags"),
+                        "x-static-large-object": "True"}
+
+        self.assertEqual(self.content, self.download())
+
+    def test_download_ranges(self):
+        self.assertEqual(self.content, self.download(workers=2,
+                                                     range_size=4))
+
+        self.assertEqual([(0, 3), (4, 7), (8, 9)], sorted(self.ranges))
+
+    def test_download_ranges_checksum_mismatch(self):
+        self.headers["etag"] = _md5(b"other")
+
+        self.assertRaises(exceptions.InvalidResponse, self.download,
+                          workers=2, range_size=4)
+
+    def test_download_ranges_ignored(self):
+        get = self._get
+
+        def ignore_range(url, headers=None, **kwargs):
+            headers.pop("Range", None)
+            return get(url, headers=headers, **kwargs)
+
+        self.session.get.side_effect = ignore_range
+
+        self.assertRaises(exceptions.InvalidResponse, self.download,
+                          workers=2, range_size=4)
+
+    def test_download_small_object(self):
+        self.assertEqual(self.content, self.download(workers=2))
+
+        self.assertEqual([], self.ranges)
+
+
+def _md5(data):
+    return hashlib.md5(data).hexdigest()
+
+
+class Test_upload_large_object(TestObjectStoreProxy):
+
+    def setUp(self):
+        super(Test_upload_large_object, self).setUp()
+        self.session = mock.Mock()
+        self.session.put.side_effect = self._put
+        self.proxy = _proxy.Proxy(self.session)
+        self.puts = {}
+        self.listed = []
+
+    def _put(self, url, data=None, headers=None, params=None, **kwargs):
+        self.puts[url] = (data, dict(headers or {}), params)
+        response_headers = {}
+        if data is not None and not params:
+            response_headers["etag"] = _md5(data)
+        return mock.Mock(headers=response_headers)
+
+    def upload(self, data, **kwargs):
+        return self.proxy.upload_object(container="backups", name="disk",
+                                        data=data, segment_size=4, **kwargs)
+
+    def assertSegments(self, expected):
+        uploaded = dict((url, self.puts[url][0]) for url in self.puts
+                        if url.startswith("backups_segments/disk"))
+        self.assertEqual(expected, uploaded)
+
+    def test_upload(self):
+        result = self.upload(io.BytesIO(b"0123456789"), workers=2,
+                             content_type="application/octet-stream")
+
+        self.assertIn("/backups_segments", self.puts)
+        self.assertSegments({
+            "backups_segments/disk/slo/4/00000000": b"0123",
+            "backups_segments/disk/slo/4/00000001": b"4567",
+            "backups_segments/disk/slo/4/00000002": b"89"})
+        segment_headers = self.puts["backups_segments/disk/slo/4/00000002"][1]
+        self.assertEqual(_md5(b"89"), segment_headers["etag"])
+
+        data, headers, params = self.puts["backups/disk"]
+        self.assertEqual({"multipart-manifest": "put"}, params)
+        self.assertEqual("application/octet-stream",
+                         headers["content-type"])
+        self.assertEqual([
+            {"path": "/backups_segments/disk/slo/4/00000000",
+             "etag": _md5(b"0123"), "size_bytes": 4},
+            {"path": "/backups_segments/disk/slo/4/00000001",
+             "etag": _md5(b"4567"), "size_bytes": 4},
+            {"path": "/backups_segments/disk/slo/4/00000002",
+             "etag": _md5(b"89"), "size_bytes": 2}], json.loads(data))
+        self.assertEqual("backups", result.container)
+        self.assertEqual("disk", result.name)
+
+    def test_upload_bytes(self):
+        self.upload(b"01234567", segment_container="segments")
+
+        self.assertEqual(b"4567",
+                         self.puts["segments/disk/slo/4/00000001"][0])
+        manifest = json.loads(self.puts["backups/disk"][0])
+        self.assertEqual(2, len(manifest))
+
+    def test_upload_empty(self):
+        self.upload(io.BytesIO(b""))
+
+        self.assertEqual((b"", None), (self.puts["backups/disk"][0],
+                                       self.puts["backups/disk"][2]))
+
+    def test_upload_resume(self):
+        listing = mock.Mock()
+        listing.json.return_value = [
+            {"name": "disk/slo/4/00000000", "hash": _md5(b"0123"),
+             "bytes": 4},
+            {"name": "disk/slo/4/00000001", "hash": _md5(b"xxxx"),
+             "bytes": 4}]
+        end = mock.Mock()
+        end.json.return_value = []
+        self.session.get.side_effect = [listing, end]
+
+        self.upload(io.BytesIO(b"0123456789"), resume=True)
+
+        self.assertEqual("disk/slo/4/",
+                         self.session.get.call_args[1]["params"]["prefix"])
+        self.assertSegments({
+            "backups_segments/disk/slo/4/00000001": b"4567",
+            "backups_segments/disk/slo/4/00000002": b"89"})
+        manifest = json.loads(self.puts["backups/disk"][0])
+        self.assertEqual(_md5(b"0123"), manifest[0]["etag"])
+
+    def test_upload_resume_no_segment_container(self):
+        self.session.get.side_effect = exceptions.NotFoundException()
+
+        self.upload(io.BytesIO(b"0123"), resume=True)
+
+        self.assertSegments({"backups_segments/disk/slo/4/00000000": b"0123"})
+
+    def test_upload_etag_mismatch(self):
+        def put(url, data=None, headers=None, params=None, **kwargs):
+            return mock.Mock(headers={"etag": '"%s"' % _md5(b"other")})
+
+        self.session.put.side_effect = put
+
+        self.assertRaises(exceptions.InvalidResponse, self.upload,
+                          io.BytesIO(b"0123456789"))
+
+    def test_upload_too_many_segments(self):
+        self.assertRaises(ValueError, self.upload, b"0123456789",
+                          max_segments=2)
+        self.assertRaises(ValueError, self.upload, io.BytesIO(b"0123456789"),
+                          max_segments=2)
+
+        self.assertEqual({}, self.puts)
+
+    def test_upload_too_many_segments_from_file(self):
+        path = self.useFixture(fixtures.TempDir()).join("disk")
+        with open(path, "wb") as f:
+            f.write(b"0123456789")
+
+        with open(path, "rb") as f:
+            f.read(4)
+            self.upload(f, max_segments=2)
+
+        self.assertSegments({
+            "backups_segments/disk/slo/4/00000000": b"4567",
+            "backups_segments/disk/slo/4/00000001": b"89"})
+
+    def test_upload_too_many_segments_unknown_size(self):
+        stream = mock.Mock(spec=["read"])
+        stream.read.side_effect = [b"0123", b"4567", b"89", b""]
+
+        self.assertRaises(ValueError, self.upload, stream, workers=1,
+                          max_segments=2)
+
+        self.assertNotIn("backups/disk", self.puts)
+
+    def test_upload_no_name(self):
+        self.assertRaises(ValueError, self.proxy.upload_object,
+                          container="backups", data=b"data",
+                          segment_size=4)
+
+
+class FakeListing(object):
+    """The listing of a container, answering like the object store"""
+
+    def __init__(self, names):
+        self.names = sorted(names)
+        self.requests = []
+
+    def __call__(self, url, params=None, **kwargs):
+        params = dict(params)
+        self.requests.append(params)
+        prefix = params.get("prefix", "")
+        delimiter = params.get("delimiter")
+        marker = params.get("marker", "")
+        entries = []
+        for name in self.names:
+            if not name.startswith(prefix):
+                continue
+            if delimiter and delimiter in name[len(prefix):]:
+                subdir = name[:name.index(delimiter, len(prefix)) + 1]
+                if subdir > marker and {"subdir": subdir} not in entries:
+                    entries.append({"subdir": subdir})
+            elif name > marker:
+                entries.append({"name": name, "bytes": 1})
+        # pages of two entries
+        entries = entries[:2]
+        return mock.Mock(content=json.dumps(entries),
+                         json=mock.Mock(return_value=entries))
+
+
+class Test_objects_by_prefix(TestObjectStoreProxy):
+
+    def setUp(self):
+        super(Test_objects_by_prefix, self).setUp()
+        self.names = ["a/1", "a/2", "a/3", "b/1", "b/c/1", "top1", "top2",
+                      "top3"]
+        self.listing = FakeListing(self.names)
+        self.session = mock.Mock()
+        self.session.get.side_effect = self.listing
+        self.proxy = _proxy.Proxy(self.session)
+
+    def test_delimiter(self):
+        objects = list(self.proxy.objects_by_prefix("tainer", workers=2))
+
+        self.assertEqual(self.names, sorted(o.name for o in objects))
+        self.assertEqual(set(["tainer"]), set(o.container for o in objects))
+        prefixes = set(r.get("prefix") for r in self.listing.requests)
+        self.assertEqual(set([None, "a/", "b/"]), prefixes)
+
+    def test_prefixes(self):
+        objects = self.proxy.objects_by_prefix("tainer", prefixes=["a", "t"])
+
+        self.assertEqual(["a/1", "a/2", "a/3", "top1", "top2", "top3"],
+                         sorted(o.name for o in objects))
+        self.assertNotIn(None, [r.get("prefix")
+                                for r in self.listing.requests])
+
+    def test_no_delimiter(self):
+        objects = self.proxy.objects_by_prefix("tainer", delimiter=None)
+
+        self.assertEqual(self.names, [o.name for o in objects])
+
+    def test_error(self):
+        self.session.get.side_effect = exceptions.HttpException("boom")
+
+        self.assertRaises(exceptions.HttpException, list,
+                          self.proxy.objects_by_prefix("tainer"))
+
+
+class Test_delete_objects(TestObjectStoreProxy):
+
+    def setUp(self):
+        super(Test_delete_objects, self).setUp()
+        self.session = mock.Mock()
+        self.proxy = _proxy.Proxy(self.session)
+        self.bodies = []
+
+    def bulk(self, report):
+        def post(url, data=None, params=None, **kwargs):
+            self.assertEqual({"bulk-delete": ""}, params)
+            self.bodies.append(data.decode("utf-8").split("\n"))
+            names = self.bodies[-1]
+            result = dict({"Number Deleted": len(names),
+                           "Number Not Found": 0, "Errors": [],
+                           "Response Status": "200 OK"}, **report(names))
+            return mock.Mock(json=mock.Mock(return_value=result))
+
+        self.session.post.side_effect = post
+
+    def test_bulk(self):
+        self.bulk(lambda names: {})
+        progress = []
+
+        result = self.proxy.delete_objects(
+            "tainer", ["a", obj.Object.new(name="b c"), "d"], batch_size=2,
+            progress=lambda r: progress.append(r.processed))
+
+        self.assertTrue(result.bulk)
+        self.assertEqual(3, result.deleted)
+        self.assertEqual([["/tainer/a", "/tainer/b%20c"], ["/tainer/d"]],
+                         self.bodies)
+        self.assertEqual([2, 3], progress)
+        self.assertFalse(self.session.delete.called)
+
+    def test_bulk_failures(self):
+        self.bulk(lambda names: {
+            "Number Deleted": len(names) - 2, "Number Not Found": 1,
+            "Errors": [[names[0], "409 Conflict"]]})
+
+        result = self.proxy.delete_objects("tainer", ["a", "b", "c"])
+
+        self.assertEqual(1, result.deleted)
+        self.assertEqual(1, result.not_found)
+        self.assertEqual([("a", "409 Conflict")], result.failures)
+
+    def test_bulk_request_failed(self):
+        self.bulk(lambda names: {"Number Deleted": 0,
+                                 "Response Status": "400 Bad Request",
+                                 "Response Body": "Max delete failures"})
+
+        result = self.proxy.delete_objects("tainer", ["a", "b"])
+
+        self.assertEqual([("a", "Max delete failures"),
+                          ("b", "Max delete failures")], result.failures)
+
+    def test_fallback(self):
+        # without the middleware, the account metadata is updated instead
+        self.session.post.return_value = mock.Mock(
+            json=mock.Mock(side_effect=ValueError))
+
+        def delete(url, **kwargs):
+            if url.endswith("/missing"):
+                raise exceptions.NotFoundException()
+            if url.endswith("/locked"):
+                raise exceptions.HttpException("409 Conflict")
+            return mock.Mock()
+
+        self.session.delete.side_effect = delete
+        progress = []
+
+        result = self.proxy.delete_objects(
+            "tainer", ["a", "missing", "locked", "b"], batch_size=3,
+            progress=lambda r: progress.append(r.processed))
+
+        self.assertFalse(result.bulk)
+        self.assertEqual(2, result.deleted)
+        self.assertEqual(1, result.not_found)
+        self.assertEqual(["locked"], [name for name, _ in result.failures])
+        self.assertEqual([3, 4], progress)
+        self.assertEqual(1, self.session.post.call_count)
+
+    def test_bulk_required(self):
+        self.session.post.side_effect = exceptions.HttpException("403")
+
+        self.assertRaises(exceptions.HttpException,
+                          self.proxy.delete_objects, "tainer", ["a"],
+                          bulk=True)
+
+    def test_no_bulk(self):
+        result = self.proxy.delete_objects("tainer", ["a"], bulk=False)
+
+        self.assertEqual(1, result.deleted)
+        self.assertFalse(self.session.post.called)
+
+    def test_all_objects(self):
+        self.session.get.side_effect = FakeListing(["a/1", "a/2", "b"])
+        self.bulk(lambda names: {})
+
+        result = self.proxy.delete_objects("tainer")
+
+        self.assertEqual(3, result.deleted)
+        self.assertEqual(["/tainer/a/1", "/tainer/a/2", "/tainer/b"],
+                         sorted(self.bodies[0]))
 
 
 class Test_copy_object(TestObjectStoreProxy):
@@ -0,0 +1,502 @@
+# Licensed under the Apache License, Version 2.0 (the "License"); you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+
+import io
+import json
+import os
+import sys
+
+import fixtures
+import testtools
+
+from openstack import aksksession
+from openstack import exceptions
+from openstack import instrumentation
+from openstack import resource2
+from openstack import service_filter
+from openstack import throttle
+
+try:
+    import aiohttp
+except ImportError:
+    aiohttp = None
+
+if aiohttp is not None and sys.version_info >= (3, 5):
+    import asyncio
+
+    from openstack import aioproxy
+    from openstack import aiosession
+
+    class StandIn(asyncio.Protocol):
+        """A local HTTP server answering with its ``handler``"""
+
+        def __init__(self, server):
+            self.server = server
+            self.buffer = b""
+
+        def connection_made(self, transport):
+            self.transport = transport
+            self.server.connections += 1
+            self.server.transports.append(transport)
+
+        def data_received(self, data):
+            self.buffer += data
+            while b"\r\n\r\n" in self.buffer:
+                head, _, rest = self.buffer.partition(b"\r\n\r\n")
+                lines = head.decode("latin-1").split("\r\n")
+                headers = dict((name.lower(), value.strip()) for name, _,
+                               value in (line.partition(":")
+                                         for line in lines[1:]))
+                if "chunked" in headers.get("transfer-encoding", ""):
+                    body, rest = self.read_chunks(rest)
+                    if body is None:
+                        return
+                    self.buffer = rest
+                else:
+                    length = int(headers.get("content-length", 0))
+                    if len(rest) < length:
+                        return
+                    body, self.buffer = rest[:length], rest[length:]
+                method, target, _ = lines[0].split(" ")
+                request = {"method": method, "target": target,
+                           "headers": headers, "body": body}
+                self.server.requests.append(request)
+                self.server.active += 1
+                self.server.peak = max(self.server.peak, self.server.active)
+                asyncio.get_event_loop().call_later(
+                    self.server.delay, self.respond, request)
+
+        @staticmethod
+        def read_chunks(data):
+            chunks = []
+            while True:
+                size, found, rest = data.partition(b"\r\n")
+                if not found:
+                    return None, data
+                size = int(size, 16)
+                if len(rest) < size + 2:
+                    return None, data
+                if size == 0:
+                    return b"".join(chunks), rest[2:]
+                chunks.append(rest[:size])
+                data = rest[size + 2:]
+
+        def respond(self, request):
+            self.server.active -= 1
+            status, headers, body = self.server.handler(request)
+            if isinstance(body, (dict, list)):
+                body = json.dumps(body).encode("utf-8")
+                headers.setdefault("Content-Type", "application/json")
+            if "Transfer-Encoding" in headers:
+                body = b"".join(b"%x\r\n%s\r\n" % (len(body[i:i + 3]),
+                                                   body[i:i + 3])
+                                for i in range(0, len(body), 3)) + \
+                    b"0\r\n\r\n"
+            elif request["method"] != "HEAD":
+                headers.setdefault("Content-Length", str(len(body)))
+            lines = ["HTTP/1.1 %d Status" % status]
+            lines.extend("%s: %s" % item for item in headers.items())
+            self.transport.write(
+                ("\r\n".join(lines) + "\r\n\r\n").encode("latin-1") +
+                (body if request["method"] != "HEAD" else b""))
+            if headers.get("Connection") == "close":
+                self.transport.close()
+
+
+class Server(resource2.Resource):
+    base_path = "/servers"
+    resource_key = "server"
+    resources_key = "servers"
+    service = service_filter.ServiceFilter(service_type="test")
+
+    allow_create = True
+    allow_get = True
+    allow_head = True
+    allow_update = True
+    allow_delete = True
+    allow_list = True
+
+    _query_mapping = resource2.QueryParameters("status")
+
+    name = resource2.Body("name")
+    status = resource2.Body("status")
+    etag = resource2.Header("etag")
+
+
+class AsyncTestCase(testtools.TestCase):
+
+    def setUp(self):
+        super(AsyncTestCase, self).setUp()
+        if aiohttp is None or sys.version_info < (3, 5):
+            self.skipTest("aiohttp is not available")
+        for name in ("http_proxy", "HTTP_PROXY", "no_proxy", "NO_PROXY"):
+            self.useFixture(fixtures.EnvironmentVariable(name))
+        self.loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(self.loop)
+        self.addCleanup(self.loop.close)
+        self.requests = []
+        self.transports = []
+        self.connections = 0
+        self.active = self.peak = 0
+        self.delay = 0
+        self.handler = lambda request: (200, {}, {"ok": True})
+        server = self.run_async(self.loop.create_server(
+            lambda: StandIn(self), "127.0.0.1", 0))
+        self.addCleanup(server.close)
+        self.addCleanup(self._close_transports)
+        self.port = server.sockets[0].getsockname()[1]
+        self.session = aksksession.ASKSession(None, ak="ak", sk="sk",
+                                              project_id="project",
+                                              region="region",
+                                              domain="domain")
+        self.session.endpoint = {"TEST": {
+            "public": "http://127.0.0.1:%d/v1/%%(project_id)s" % self.port}}
+        self.sot = aiosession.AsyncSession(self.session)
+        self.addCleanup(lambda: self.run_async(self.sot.close()))
+
+    def _close_transports(self):
+        for transport in self.transports:
+            transport.close()
+        # let the loop run the callbacks closing them
+        self.run_async(asyncio.sleep(0))
+
+    def run_async(self, awaitable):
+        return self.loop.run_until_complete(awaitable)
+
+
+class TestAsyncSession(AsyncTestCase):
+
+    def _get(self, **kwargs):
+        return self.run_async(self.sot.get(
+            "/servers", endpoint_filter=Server.service, **kwargs))
+
+    def test_get_signed(self):
+        response = self._get(params={"limit": 2, "status": None})
+
+        self.assertEqual(200, response.status_code)
+        self.assertEqual({"ok": True}, response.json())
+        request = self.requests[0]
+        self.assertEqual("GET", request["method"])
+        self.assertEqual("/v1/project/servers?limit=2", request["target"])
+        self.assertTrue(request["headers"]["authorization"].startswith(
+            "SDK-HMAC-SHA256 Credential=ak/"))
+        self.assertEqual("project", request["headers"]["x-project-id"])
+
+    def test_post_json(self):
+        self.run_async(self.sot.post("/servers", json={"a": 1},
+                                     endpoint_filter=Server.service))
+
+        self.assertEqual({"a": 1}, json.loads(
+            self.requests[0]["body"].decode("utf-8")))
+        self.assertEqual(str(len(self.requests[0]["body"])),
+                         self.requests[0]["headers"]["content-length"])
+
+    def test_connection_reused(self):
+        for _ in range(3):
+            self._get()
+
+        self.assertEqual(3, len(self.requests))
+        self.assertEqual(1, self.connections)
+
+    def test_connection_closed(self):
+        self.handler = lambda request: (200, {"Connection": "close"}, {})
+
+        for _ in range(2):
+            self._get()
+
+        self.assertEqual(2, self.connections)
+
+    def test_chunked(self):
+        self.handler = lambda request: (
+            200, {"Transfer-Encoding": "chunked"}, {"servers": [1, 2, 3]})
+
+        response = self._get()
+
+        self.assertEqual({"servers": [1, 2, 3]}, response.json())
+        self._get()
+        self.assertEqual(1, self.connections)
+
+    def test_limit(self):
+        self.sot = aiosession.AsyncSession(self.session, limit=3)
+        self.delay = 0.01
+
+        responses = self.run_async(asyncio.gather(
+            *[self.sot.get("/servers", endpoint_filter=Server.service)
+              for _ in range(20)]))
+
+        self.assertEqual(20, len(responses))
+        self.assertEqual(3, self.peak)
+        self.assertEqual(3, self.connections)
+
+    def test_instrumented(self):
+        metrics = instrumentation.LatencyAggregator()
+        self.session.instruments = [metrics]
+
+        self._get().json()
+
+        stats = metrics.stats()[("test", "GET", "/v1/{project_id}/servers")]
+        self.assertEqual(1, stats["count"])
+        self.assertEqual({"sign", "send", "decode"}, set(stats["timings"]))
+
+    def test_throttled_retried(self):
+        statuses = [429, 503, 200]
+        self.handler = lambda request: (statuses.pop(0),
+                                        {"Retry-After": "0"}, {})
+        self.session.rate_limiter = throttle.AdaptiveRateLimiter(min_rate=50)
+
+        response = self._get()
+
+        self.assertEqual(200, response.status_code)
+        self.assertEqual(3, len(self.requests))
+        self.assertIsNotNone(self.session.rate_limiter.rate("test",
+                                                            "region"))
+
+    def test_throttled_post_not_retried(self):
+        self.handler = lambda request: (429, {"Retry-After": "0"}, {})
+
+        error = self.assertRaises(
+            exceptions.HttpException, self.run_async,
+            self.sot.post("/servers", endpoint_filter=Server.service,
+                          json={}))
+
+        self.assertEqual(429, error.http_status)
+        self.assertEqual(1, len(self.requests))
+
+    def test_not_found(self):
+        self.handler = lambda request: (404, {}, {"code": "E.404",
+                                                  "message": "missing"})
+
+        error = self.assertRaises(exceptions.NotFoundException, self._get)
+
+        self.assertEqual("E.404", error.code)
+        self.assertEqual(404, error.http_status)
+
+    def test_error_not_raised(self):
+        self.handler = lambda request: (500, {}, b"oops")
+
+        response = self._get(raise_exc=False)
+
+        self.assertEqual(500, response.status_code)
+        self.assertEqual("oops", response.text)
+
+    def test_timeout(self):
+        self.delay = 1
+
+        self.assertRaises(exceptions.SDKException, self._get, timeout=0.01)
+
+    def test_redirect_followed(self):
+        self.handler = lambda request: (
+            (200, {}, {"ok": True}) if request["target"].endswith("/moved")
+            else (302, {"Location": "/v1/project/moved"}, b""))
+
+        response = self._get()
+
+        self.assertEqual(200, response.status_code)
+        self.assertEqual(["/v1/project/servers", "/v1/project/moved"],
+                         [request["target"] for request in self.requests])
+
+    def test_redirect_not_followed(self):
+        self.handler = lambda request: (
+            302, {"Location": "/v1/project/moved"}, b"")
+
+        response = self._get(redirect=False)
+
+        self.assertEqual(302, response.status_code)
+        self.assertEqual(1, len(self.requests))
+
+    def test_proxy_from_environment(self):
+        self.useFixture(fixtures.EnvironmentVariable(
+            "http_proxy", "http://127.0.0.1:%d" % self.port))
+
+        self.run_async(self.sot.get(
+            "http://sdk.invalid/servers", endpoint_filter=Server.service))
+
+        self.assertEqual("http://sdk.invalid/servers",
+                         self.requests[0]["target"])
+
+    def test_upload_file_streamed(self):
+        sizes = []
+
+        class Reader(io.BytesIO):
+            def read(self, size=-1):
+                sizes.append(size)
+                return super(Reader, self).read(size)
+
+        content = os.urandom(1024 * 1024)
+
+        self.run_async(self.sot.put("/objects", data=Reader(content),
+                                    endpoint_filter=Server.service,
+                                    unsigned_payload=True))
+
+        self.assertEqual(content, self.requests[0]["body"])
+        self.assertTrue(sizes)
+        self.assertTrue(all(0 < size < len(content) for size in sizes))
+
+    def test_upload_chunks(self):
+        self.run_async(self.sot.put("/objects", data=iter([b"ab", "cd"]),
+                                    endpoint_filter=Server.service,
+                                    unsigned_payload=True))
+
+        self.assertEqual(b"abcd", self.requests[0]["body"])
+
+    def test_cancelled(self):
+        self.delay = 1
+        future = asyncio.ensure_future(
+            self.sot.get("/servers", endpoint_filter=Server.service),
+            loop=self.loop)
+        self.loop.call_later(0.01, future.cancel)
+
+        self.assertRaises(asyncio.CancelledError, self.run_async, future)
+        # the slot of the cancelled request was released
+        self.delay = 0
+        self._get()
+
+
+class TestAioProxy(AsyncTestCase):
+
+    def setUp(self):
+        super(TestAioProxy, self).setUp()
+        self.proxy = aioproxy.AsyncProxy(self.sot)
+
+    def test_get(self):
+        self.handler = lambda request: (
+            200, {"etag": "abc"},
+            {"server": {"id": "1", "name": "one", "status": "ACTIVE"}})
+
+        result = self.run_async(self.proxy.get(Server, "1"))
+
+        self.assertIsInstance(result, Server)
+        self.assertEqual(("1", "one", "ACTIVE", "abc"),
+                         (result.id, result.name, result.status,
+                          result.etag))
+        self.assertEqual("/v1/project/servers/1", self.requests[0]["target"])
+
+    def test_get_raw(self):
+        self.handler = lambda request: (200, {}, {"server": {"id": "1"}})
+
+        result = self.run_async(self.proxy.get(Server, "1", raw=True))
+
+        self.assertEqual({"id": "1"}, result)
+
+    def test_get_not_found(self):
+        self.handler = lambda request: (404, {}, {"message": "missing"})
+
+        self.assertRaises(exceptions.ResourceNotFound, self.run_async,
+                          self.proxy.get(Server, "1"))
+
+    def test_create(self):
+        self.handler = lambda request: (
+            200, {}, {"server": {"id": "1", "name": "one"}})
+
+        result = self.run_async(self.proxy.create(Server, name="one"))
+
+        self.assertEqual("1", result.id)
+        request = self.requests[0]
+        self.assertEqual(("POST", "/v1/project/servers"),
+                         (request["method"], request["target"]))
+        self.assertEqual({"server": {"name": "one"}},
+                         json.loads(request["body"].decode("utf-8")))
+
+    def test_update(self):
+        self.handler = lambda request: (
+            200, {}, {"server": {"id": "1", "name": "two"}})
+
+        result = self.run_async(self.proxy.update(Server, "1", name="two"))
+
+        self.assertEqual("two", result.name)
+        self.assertEqual("PUT", self.requests[0]["method"])
+
+    def test_update_unchanged(self):
+        value = Server.existing(id="1", name="one")
+
+        self.run_async(self.proxy.update(Server, value))
+
+        self.assertEqual([], self.requests)
+
+    def test_head(self):
+        self.handler = lambda request: (200, {"etag": "abc",
+                                              "Content-Length": "10"}, b"")
+
+        result = self.run_async(self.proxy.head(Server, "1"))
+
+        self.assertEqual("abc", result.etag)
+        self.assertEqual("HEAD", self.requests[0]["method"])
+
+    def test_delete(self):
+        self.handler = lambda request: (204, {}, b"")
+
+        result = self.run_async(self.proxy.delete(Server, "1"))
+
+        self.assertEqual("1", result.id)
+        self.assertEqual("DELETE", self.requests[0]["method"])
+
+    def test_delete_missing(self):
+        self.handler = lambda request: (404, {}, {"message": "missing"})
+
+        self.assertIsNone(self.run_async(self.proxy.delete(Server, "1")))
+        self.assertRaises(exceptions.ResourceNotFound, self.run_async,
+                          self.proxy.delete(Server, "1",
+                                            ignore_missing=False))
+
+    def test_wrong_type(self):
+        self.assertRaises(ValueError, self.run_async,
+                          self.proxy.head(Server, resource2.Resource()))
+
+    def _pages(self, request):
+        if "marker=2" in request["target"]:
+            return 200, {}, {"servers": [{"id": "3", "name": "c"}]}
+        return 200, {}, {"servers": [{"id": "1", "name": "a"},
+                                     {"id": "2", "name": "b"}]}
+
+    def _iterate(self, listing):
+        result = []
+        iterator = listing.__aiter__()
+        while True:
+            try:
+                result.append(self.run_async(iterator.__anext__()))
+            except StopAsyncIteration:
+                return result
+
+    def test_list(self):
+        self.handler = self._pages
+
+        result = self._iterate(self.proxy.list(Server, paginated=True,
+                                               status="ACTIVE"))
+
+        self.assertEqual(["1", "2", "3"], [value.id for value in result])
+        self.assertIsInstance(result[0], Server)
+        # the last page is shorter than the first, no request follows it
+        self.assertEqual(2, len(self.requests))
+        self.assertEqual("/v1/project/servers?status=ACTIVE",
+                         self.requests[0]["target"])
+        self.assertIn("marker=2", self.requests[1]["target"])
+
+    def test_list_one_page(self):
+        self.handler = self._pages
+
+        result = self._iterate(self.proxy.list(Server, raw=True))
+
+        self.assertEqual([{"id": "1", "name": "a"}, {"id": "2", "name": "b"}],
+                         result)
+        self.assertEqual(1, len(self.requests))
+
+    def test_list_all(self):
+        self.handler = self._pages
+
+        result = self.run_async(self.proxy.list(Server, paginated=True,
+                                                compact=True).all())
+
+        self.assertEqual(["a", "b", "c"], [value.name for value in result])
+
+    def test_list_not_supported(self):
+        self.assertRaises(exceptions.MethodNotSupported, aioproxy.AsyncList,
+                          self.sot, resource2.Resource)
@@ -0,0 +1,240 @@
+# Licensed under the Apache License, Version 2.0 (the "License"); you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+
+import hashlib
+import io
+
+import mock
+import testtools
+
+from openstack import aksksession
+from openstack import instrumentation
+
+
+class TestAkSksignature(testtools.TestCase):
+
+    def setUp(self):
+        super(TestAkSksignature, self).setUp()
+        self.signer = aksksession.AkSksignature(accesskey="ak",
+                                                secretkey="sk",
+                                                region="region")
+        self.headers = {"Host": "example.com",
+                        "X-Sdk-Date": "20180101T120000Z"}
+
+    def _sign(self, svr="ecs"):
+        return self.signer.signature(url="https://example.com/v1/servers",
+                                     method="GET",
+                                     headers=self.headers,
+                                     params={"limit": 10},
+                                     svr=svr)
+
+    def test_signature(self):
+        signature = self._sign()
+        self.assertTrue(signature.startswith(
+            "SDK-HMAC-SHA256 Credential=ak/20180101/region/ecs/sdk_request, "
+            "SignedHeaders=host;x-sdk-date, Signature="))
+
+    def test_signing_key_cached(self):
+        with mock.patch.object(self.signer, "_make_signing_key",
+                               wraps=self.signer._make_signing_key) as make:
+            first = self._sign()
+            self.headers["X-Sdk-Date"] = "20180101T235959Z"
+            self._sign()
+            self.assertEqual(1, make.call_count)
+
+            self._sign(svr="evs")
+            self.assertEqual(2, make.call_count)
+
+        # the memoized key must not change what gets signed
+        self.headers["X-Sdk-Date"] = "20180101T120000Z"
+        signer = aksksession.AkSksignature(accesskey="ak", secretkey="sk",
+                                           region="region")
+        self.assertEqual(first, signer.signature(
+            url="https://example.com/v1/servers", method="GET",
+            headers=self.headers, params={"limit": 10}, svr="ecs"))
+
+    def test_signing_key_rollover(self):
+        self._sign()
+        self.headers["X-Sdk-Date"] = "20180102T000001Z"
+        signature = self._sign()
+
+        self.assertIn("Credential=ak/20180102/region/ecs/sdk_request",
+                      signature)
+        self.assertEqual([("20180102", "ecs")],
+                         list(self.signer._signing_contexts))
+
+
+class TestHashPayload(testtools.TestCase):
+
+    def setUp(self):
+        super(TestHashPayload, self).setUp()
+        self.data = b"x" * (aksksession.CHUNK_SIZE * 2 + 10)
+        self.digest = hashlib.sha256(self.data).hexdigest()
+
+    def test_empty(self):
+        self.assertEqual(hashlib.sha256(b"").hexdigest(),
+                         aksksession.hash_payload(None))
+
+    def test_string(self):
+        self.assertEqual(self.digest, aksksession.hash_payload(self.data))
+
+    def test_file_rewound(self):
+        body = io.BytesIO(b"head" + self.data)
+        body.seek(4)
+
+        self.assertEqual(self.digest, aksksession.hash_payload(body))
+        self.assertEqual(4, body.tell())
+
+    def test_chunks(self):
+        chunks = (self.data[i:i + 100] for i in range(0, len(self.data), 100))
+        self.assertEqual(self.digest, aksksession.hash_payload(chunks))
+
+    def test_is_rewindable(self):
+        self.assertTrue(aksksession.is_rewindable(None))
+        self.assertTrue(aksksession.is_rewindable(self.data))
+        self.assertTrue(aksksession.is_rewindable(io.BytesIO(self.data)))
+        self.assertFalse(aksksession.is_rewindable(iter([self.data])))
+
+    def test_spool(self):
+        spooled = aksksession.spool(iter([b"a", b"b", u"c"]))
+        self.assertEqual(b"abc", spooled.read())
+
+    def test_unsigned_payload(self):
+        signer = aksksession.AkSksignature("ak", "sk", "region")
+        headers = {"Host": "example.com",
+                   "X-Sdk-Date": "20180101T120000Z",
+                   aksksession.CONTENT_SHA256_HEADER:
+                       aksksession.UNSIGNED_PAYLOAD}
+        body = mock.Mock()
+
+        canonical = signer._make_canonical_request(
+            method="PUT", url="https://example.com/v1/file",
+            headers=headers, body=body)
+
+        self.assertTrue(canonical.endswith("\n" +
+                                           aksksession.UNSIGNED_PAYLOAD))
+        body.read.assert_not_called()
+
+
+class TestASKSession(testtools.TestCase):
+
+    def setUp(self):
+        super(TestASKSession, self).setUp()
+        self.sot = aksksession.ASKSession(None, ak="ak", sk="sk",
+                                          project_id="project",
+                                          region="region", domain="domain")
+        self.sot._send_request = mock.Mock()
+        self.sot._send_request.return_value.status_code = 200
+        self.filter = mock.Mock(service_type="image", interface="public")
+
+    def _put(self, data, **kwargs):
+        self.sot.request("https://example.com/v2/file", "PUT",
+                         endpoint_filter=self.filter, data=data,
+                         log=False, **kwargs)
+        return self.sot._send_request.call_args[1]
+
+    def test_request_file_body(self):
+        body = io.BytesIO(b"data")
+
+        sent = self._put(body)
+
+        self.assertIs(body, sent["data"])
+        self.assertEqual(0, body.tell())
+
+    def test_request_chunked_body_spooled(self):
+        sent = self._put(iter([b"da", b"ta"]))
+
+        self.assertEqual(b"data", sent["data"].read())
+
+    def test_request_unsigned_payload(self):
+        chunks = iter([b"data"])
+
+        sent = self._put(chunks, unsigned_payload=True)
+
+        self.assertIs(chunks, sent["data"])
+        self.assertEqual(aksksession.UNSIGNED_PAYLOAD,
+                         sent["headers"][aksksession.CONTENT_SHA256_HEADER])
+
+    def test_request_json_codec(self):
+        self.sot.json_codec = mock.Mock()
+        self.sot.json_codec.dumps.return_value = '{"a": 1}'
+
+        self.sot.request("https://example.com/v2/file", "PUT",
+                         endpoint_filter=self.filter, json={"a": 1},
+                         log=False)
+
+        self.sot.json_codec.dumps.assert_called_once_with({"a": 1})
+        self.assertEqual('{"a": 1}',
+                         self.sot._send_request.call_args[1]["data"])
+
+    def test_request_instrumented(self):
+        instrument = mock.Mock(spec=instrumentation.Instrument)
+        self.sot.instruments = [instrument]
+        self.sot._send_request.return_value.content = b"{}"
+
+        self._put(b"data")
+
+        info = instrument.after_response.call_args[0][0]
+        self.assertEqual(("image", "PUT", "/v2/file", 200),
+                         (info.service_type, info.method, info.url_template,
+                          info.status))
+        self.assertEqual({"sign", "send"}, set(info.timings))
+        instrument.before_request.assert_called_once_with(info)
+
+    def test_request_does_not_modify_headers(self):
+        headers = {"X-Custom": "value"}
+
+        sent = self._put(b"data", headers=headers)
+
+        self.assertEqual({"X-Custom": "value"}, headers)
+        self.assertIn("Authorization", sent["headers"])
+        self.assertEqual("value", sent["headers"]["X-Custom"])
+
+
+class TestConstructSession(testtools.TestCase):
+
+    def test_default_pools(self):
+        sot = aksksession.construct_session()
+
+        adapter = sot.get_adapter("https://example.com")
+        self.assertEqual(aksksession.DEFAULT_POOLSIZE,
+                         adapter._pool_maxsize)
+        self.assertFalse(adapter._pool_block)
+
+    def test_pool_sizes(self):
+        sot = aksksession.construct_session(
+            pool_connections=2, pool_maxsize=20, pool_block=True,
+            pools={"https://ecs.example.com": {"pool_maxsize": 50}})
+
+        adapter = sot.get_adapter("https://example.com")
+        self.assertEqual(2, adapter._pool_connections)
+        self.assertEqual(20, adapter._pool_maxsize)
+        self.assertTrue(adapter._pool_block)
+        adapter = sot.get_adapter("https://ecs.example.com/v1/servers")
+        self.assertEqual(50, adapter._pool_maxsize)
+        self.assertFalse(adapter._pool_block)
+
+    def test_service_pools(self):
+        sot = aksksession.ASKSession(
+            None, ak="ak", sk="sk", project_id="project",
+            region="region", domain="example.com", pool_maxsize=20,
+            service_pools={"ecs": {"pool_maxsize": 50},
+                           "https://other.com": {"pool_maxsize": 5}})
+
+        adapter = sot.session.get_adapter(
+            "https://ecs.region.example.com/v1/project/servers")
+        self.assertEqual(50, adapter._pool_maxsize)
+        adapter = sot.session.get_adapter("https://other.com/v1")
+        self.assertEqual(5, adapter._pool_maxsize)
+        adapter = sot.session.get_adapter(
+            "https://evs.region.example.com/v2/project/cloudvolumes")
+        self.assertEqual(20, adapter._pool_maxsize)
@@ -66,16 +66,52 @@ class TestConnection(base.TestCase):
         mock_session_init.return_value = mock_session_init
         mock_profile = mock.Mock()
         mock_profile.get_services = mock.Mock(return_value=[])
+        mock_profile.get_service_types = mock.Mock(return_value=[])
         conn = connection.Connection(profile=mock_profile, authenticator='2',
                                      verify=True, cert='cert', user_agent='1')
         args = {'auth': '2', 'user_agent': '1', 'verify': True, 'cert': 'cert'}
         mock_session_init.assert_called_with(mock_profile, **args)
         self.assertEqual(mock_session_init, conn.session)
 
+    @mock.patch("openstack.session.Session")
+    def test_pool_parameters(self, mock_session_init):
+        mock_profile = mock.Mock()
+        mock_profile.get_services = mock.Mock(return_value=[])
+        mock_profile.get_service_types = mock.Mock(return_value=[])
+        connection.Connection(profile=mock_profile, authenticator='2',
+                              pool_maxsize=20, pool_block=True)
+        requests_session = mock_session_init.call_args[1]['session']
+        adapter = requests_session.get_adapter('https://example.com')
+        self.assertEqual(20, adapter._pool_maxsize)
+        self.assertTrue(adapter._pool_block)
+
+    @mock.patch("openstack.session.Session")
+    def test_discovery_cache(self, mock_session_init):
+        mock_profile = mock.Mock()
+        mock_profile.get_services = mock.Mock(return_value=[])
+        mock_profile.get_service_types = mock.Mock(return_value=[])
+        cache = mock.Mock()
+        connection.Connection(profile=mock_profile, authenticator='2',
+                              discovery_cache=cache)
+        self.assertIs(cache,
+                      mock_session_init.call_args[1]['discovery_cache'])
+
+    @mock.patch("openstack.session.Session")
+    def test_token_cache(self, mock_session_init):
+        mock_profile = mock.Mock()
+        mock_profile.get_services = mock.Mock(return_value=[])
+        mock_profile.get_service_types = mock.Mock(return_value=[])
+        cache = mock.Mock()
+        conn = connection.Connection(profile=mock_profile, authenticator='2',
+                                     token_cache=cache)
+        cache.attach.assert_called_once_with('2')
+        self.assertEqual('2', conn.authenticator)
+
     def test_session_provided(self):
         mock_session = mock.Mock(spec=session.Session)
         mock_profile = mock.Mock()
         mock_profile.get_services = mock.Mock(return_value=[])
+        mock_profile.get_service_types = mock.Mock(return_value=[])
         conn = connection.Connection(session=mock_session,
                                      profile=mock_profile,
                                      user_agent='1')
@@ -85,10 +121,40 @@ class TestConnection(base.TestCase):
         mock_session = mock.Mock(spec=ksa_session.Session)
         mock_profile = mock.Mock()
         mock_profile.get_services = mock.Mock(return_value=[])
+        mock_profile.get_service_types = mock.Mock(return_value=[])
         self.assertRaises(exceptions.SDKException, connection.Connection,
                           session=mock_session, profile=mock_profile,
                           user_agent='1')
 
+    def test_lazy_load(self):
+        conn = connection.Connection(authenticator=mock.Mock(),
+                                     profile=profile.Profile())
+        self.assertNotIn('compute', conn.__dict__)
+        self.assertIn('compute', dir(conn))
+
+        compute = conn.compute
+
+        self.assertEqual('openstack.compute.v2._proxy',
+                         compute.__class__.__module__)
+        self.assertIs(compute, conn.__dict__['compute'])
+        self.assertIs(compute, conn.compute)
+        self.assertNotIn('network', conn.__dict__)
+
+    def test_lazy_load_name_index(self):
+        conn = connection.Connection(authenticator=mock.Mock(),
+                                     profile=profile.Profile(),
+                                     name_index_ttl=30)
+
+        self.assertEqual(30, conn.compute.name_index.ttl)
+        self.assertIsNone(connection.Connection(
+            authenticator=mock.Mock(),
+            profile=profile.Profile()).compute.name_index)
+
+    def test_lazy_load_unknown(self):
+        conn = connection.Connection(authenticator=mock.Mock(),
+                                     profile=profile.Profile())
+        self.assertRaises(AttributeError, getattr, conn, 'no_such_service')
+
     @mock.patch("keystoneauth1.loading.base.get_plugin_loader")
     def test_create_authenticator(self, mock_get_plugin):
         mock_plugin = mock.Mock()
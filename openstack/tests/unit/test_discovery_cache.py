@@ -0,0 +1,105 @@
+# Licensed under the Apache License, Version 2.0 (the "License"); you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+
+import os
+import shutil
+import tempfile
+
+import mock
+import testtools
+
+from openstack import discovery_cache
+
+
+class TestDiscoveryCache(testtools.TestCase):
+
+    def setUp(self):
+        super(TestDiscoveryCache, self).setUp()
+        self.now = 1000.0
+        patcher = mock.patch("time.time", lambda: self.now)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.directory)
+        self.path = os.path.join(self.directory, "endpoints")
+
+    def test_get_missing(self):
+        sot = discovery_cache.DiscoveryCache()
+
+        self.assertRaises(KeyError, sot.get, "http://a")
+
+    def test_expiry(self):
+        sot = discovery_cache.DiscoveryCache(ttl=100, negative_ttl=10)
+        sot.set("http://a", {"uri": "http://a"})
+        sot.set("http://b", None)
+
+        self.now += 50
+        self.assertEqual({"uri": "http://a"}, sot.get("http://a"))
+        self.assertRaises(KeyError, sot.get, "http://b")
+
+        self.now += 51
+        self.assertRaises(KeyError, sot.get, "http://a")
+
+    def test_negative(self):
+        sot = discovery_cache.DiscoveryCache(negative_ttl=10)
+        sot.set("http://b", None)
+
+        self.assertIsNone(sot.get("http://b"))
+
+    def test_shared_file(self):
+        first = discovery_cache.DiscoveryCache(self.path)
+        second = discovery_cache.DiscoveryCache(self.path)
+
+        first.set("http://a", {"uri": "http://a"})
+        self.assertEqual({"uri": "http://a"}, second.get("http://a"))
+
+        # the entries of both are kept in the file
+        second.set("http://b", None)
+        third = discovery_cache.DiscoveryCache(self.path)
+        self.assertEqual({"uri": "http://a"}, third.get("http://a"))
+        self.assertIsNone(third.get("http://b"))
+        self.assertEqual(["endpoints"], os.listdir(self.directory))
+
+    def test_expired_not_loaded(self):
+        discovery_cache.DiscoveryCache(self.path, ttl=10).set("http://a", 1)
+        self.now += 11
+
+        sot = discovery_cache.DiscoveryCache(self.path)
+
+        self.assertRaises(KeyError, sot.get, "http://a")
+
+    def test_invalid_file(self):
+        with open(self.path, "w") as f:
+            f.write("{not json")
+        sot = discovery_cache.DiscoveryCache(self.path)
+
+        self.assertRaises(KeyError, sot.get, "http://a")
+        sot.set("http://a", 1)
+        self.assertEqual(1, discovery_cache.DiscoveryCache(
+            self.path).get("http://a"))
+
+    def test_unwritable(self):
+        sot = discovery_cache.DiscoveryCache(
+            os.path.join(self.directory, "missing", "endpoints"))
+
+        sot.set("http://a", 1)
+
+        self.assertEqual(1, sot.get("http://a"))
+
+    def test_clear(self):
+        sot = discovery_cache.DiscoveryCache(self.path)
+        sot.set("http://a", 1)
+
+        sot.clear()
+
+        self.assertRaises(KeyError, sot.get, "http://a")
+        self.assertFalse(os.path.exists(self.path))
@@ -0,0 +1,201 @@
+# Licensed under the Apache License, Version 2.0 (the "License"); you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+
+import random
+
+import mock
+import testtools
+
+from openstack import instrumentation
+
+
+def make_info(service_type="ecs", method="GET",
+              url="https://ecs.cloud/v1/project/servers", elapsed=0.1,
+              status=200, error=None):
+    info = instrumentation.RequestInfo([], service_type, method, url,
+                                       "project")
+    info.elapsed = elapsed
+    info.status = status
+    info.error = error
+    info.bytes_in = 10
+    info.bytes_out = 5
+    info.timings = {"sign": 0.01, "send": elapsed}
+    return info
+
+
+class TestUrlTemplate(testtools.TestCase):
+
+    def test_ids(self):
+        self.assertEqual(
+            "/v2/{project_id}/servers/{id}/os-interface/{id}",
+            instrumentation.url_template(
+                "https://ecs.cloud/v2/0605767ea0ae/servers/"
+                "2c7d1b6a-53b6-4d6e-8c77-1d1d6e7d3f4b/os-interface/"
+                "9d5f0bf2c1b24b0e9c6f4f1c1c2f0b7e?limit=10",
+                project_id="0605767ea0ae"))
+
+    def test_no_ids(self):
+        self.assertEqual("/v1.0/os-availability-zone/detail",
+                         instrumentation.url_template(
+                             "/v1.0/os-availability-zone/detail"))
+
+    def test_numbers(self):
+        self.assertEqual("/v2/images/{id}/file",
+                         instrumentation.url_template(
+                             "https://ims.cloud/v2/images/12345/file"))
+
+
+class TestHistogram(testtools.TestCase):
+
+    def test_percentiles(self):
+        random.seed(0)
+        values = sorted(random.expovariate(10) for _ in range(10000))
+        sot = instrumentation.Histogram()
+        for value in values:
+            sot.record(value)
+
+        for percent in (50, 90, 99):
+            expected = values[int(len(values) * percent / 100.0) - 1]
+            self.assertAlmostEqual(expected, sot.percentile(percent),
+                                   delta=expected * 0.01 + 1e-6)
+        self.assertEqual(values[-1], sot.max)
+        self.assertEqual(values[0], sot.min)
+        self.assertAlmostEqual(sum(values) / len(values), sot.mean)
+        # the buckets are few for the range of values
+        self.assertLess(len(sot.buckets), 1500)
+
+    def test_empty(self):
+        sot = instrumentation.Histogram()
+
+        self.assertIsNone(sot.percentile(50))
+        self.assertIsNone(sot.mean)
+
+    def test_merge(self):
+        first = instrumentation.Histogram()
+        first.record(1)
+        second = instrumentation.Histogram()
+        second.record(3)
+
+        first.merge(second)
+
+        self.assertEqual((2, 1, 3), (first.count, first.min, first.max))
+
+
+class TestLatencyAggregator(testtools.TestCase):
+
+    def test_stats(self):
+        sot = instrumentation.LatencyAggregator()
+        for elapsed in (0.1, 0.2, 0.3):
+            sot.after_response(make_info(elapsed=elapsed))
+        sot.after_response(make_info(
+            url="https://ecs.cloud/v1/project/servers/"
+                "2c7d1b6a-53b6-4d6e-8c77-1d1d6e7d3f4b", status=404))
+        sot.on_error(make_info(service_type="evs", status=None,
+                               error=ValueError()))
+
+        stats = sot.stats("ecs")
+
+        self.assertEqual({("ecs", "GET", "/v1/{project_id}/servers"),
+                          ("ecs", "GET", "/v1/{project_id}/servers/{id}")},
+                         set(stats))
+        servers = stats[("ecs", "GET", "/v1/{project_id}/servers")]
+        self.assertEqual(3, servers["count"])
+        self.assertEqual(0, servers["errors"])
+        self.assertEqual({200: 3}, servers["statuses"])
+        self.assertEqual(30, servers["bytes_in"])
+        self.assertAlmostEqual(0.6, servers["total"])
+        self.assertAlmostEqual(0.2, servers["p50"], delta=0.002)
+        self.assertAlmostEqual(0.03, servers["timings"]["sign"])
+        self.assertEqual(1, stats[("ecs", "GET",
+                                   "/v1/{project_id}/servers/{id}")]["errors"])
+        self.assertEqual(1, sot.stats("evs")[
+            ("evs", "GET", "/v1/{project_id}/servers")]["errors"])
+
+        services = sot.services()
+        self.assertEqual(4, services["ecs"].count)
+        self.assertEqual(1, services["evs"].count)
+
+        report = sot.report().splitlines()
+        self.assertEqual(4, len(report))
+        self.assertIn("/v1/{project_id}/servers ", report[1])
+
+        sot.reset()
+        self.assertEqual({}, sot.stats())
+
+    def test_decode(self):
+        sot = instrumentation.LatencyAggregator()
+        response = mock.Mock(status_code=200, content=b"{}", headers={})
+        info = instrumentation.begin([sot], {"service_type": "ecs"}, "GET",
+                                     "https://ecs.cloud/v1/servers")
+        instrumentation.succeeded(info, response)
+
+        with mock.patch("time.time", side_effect=[1.0, 1.5, 2.0, 2.25]):
+            response.json()
+            with instrumentation.decoding(response):
+                pass
+
+        stats = sot.stats()[("ecs", "GET", "/v1/servers")]
+        self.assertEqual(0.75, stats["timings"]["decode"])
+        self.assertEqual(0.75, info.timings["decode"])
+
+
+class TestHooks(testtools.TestCase):
+
+    def test_not_observed(self):
+        self.assertIsNone(instrumentation.begin([], None, "GET", "/"))
+        with instrumentation.timed(None, "send"):
+            pass
+        instrumentation.succeeded(None, mock.Mock())
+        instrumentation.failed(None, ValueError())
+        with instrumentation.decoding(object()):
+            pass
+
+    def test_hooks(self):
+        instrument = mock.Mock(spec=instrumentation.Instrument)
+        response = mock.Mock(status_code=201, content=b"abc",
+                             headers={"content-length": "3"})
+        response.request.body = b"body"
+
+        info = instrumentation.begin([instrument], {"service_type": "ecs"},
+                                     "POST", "https://ecs.cloud/v1/servers",
+                                     started=1.0)
+        instrument.before_request.assert_called_once_with(info)
+        with instrumentation.timed(info, "send"):
+            pass
+        instrumentation.succeeded(info, response, stream=True)
+
+        instrument.after_response.assert_called_once_with(info)
+        self.assertEqual(("ecs", 201, 4, 3),
+                         (info.service_type, info.status, info.bytes_out,
+                          info.bytes_in))
+        self.assertIn("send", info.timings)
+        self.assertIs(info, response.request_info)
+
+    def test_failed(self):
+        instrument = mock.Mock(spec=instrumentation.Instrument)
+        info = instrumentation.begin([instrument], None, "GET", "/")
+        error = ValueError()
+
+        instrumentation.failed(info, error, data=u"\u00e9")
+
+        instrument.on_error.assert_called_once_with(info)
+        self.assertIs(error, info.error)
+        self.assertEqual(2, info.bytes_out)
+
+    def test_instrument_failure_ignored(self):
+        failing = mock.Mock(spec=instrumentation.Instrument)
+        failing.before_request.side_effect = RuntimeError
+        other = mock.Mock(spec=instrumentation.Instrument)
+
+        instrumentation.begin([failing, other], None, "GET", "/")
+
+        other.before_request.assert_called_once_with(mock.ANY)
@@ -0,0 +1,170 @@
+# Licensed under the Apache License, Version 2.0 (the "License"); you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+
+import threading
+
+import mock
+import testtools
+
+from openstack.ecs.v1 import job
+from openstack import exceptions
+from openstack import job_tracker
+from openstack.volume_backup.v2 import job as backup_job
+
+
+class ScriptedJob(job.Job):
+    """A job going through a list of states, one per get"""
+
+    def get(self, session, requires_id=True):
+        state = self.states.pop(0)
+        if isinstance(state, Exception):
+            raise state
+        self._update_from_body(state)
+        return self
+
+
+def scripted(*states):
+    sot = ScriptedJob.existing(id="job")
+    sot.states = list(states)
+    return sot
+
+
+class TestEntityIds(testtools.TestCase):
+
+    def test_sub_jobs(self):
+        sot = job.Job.existing(id="job", entities={
+            "sub_jobs_total": 2,
+            "sub_jobs": [
+                {"status": "SUCCESS", "job_id": "a",
+                 "entities": {"server_id": "server1"}},
+                {"status": "SUCCESS", "job_id": "b",
+                 "entities": {"server_id": "server2"}},
+            ]})
+
+        self.assertEqual(["server1", "server2"],
+                         job_tracker.entity_ids(sot))
+
+    def test_sub_jobs_attribute(self):
+        sot = backup_job.Job.existing(id="job", sub_jobs=[
+            {"status": "SUCCESS", "entities": {"backup_id": "backup1"}}])
+
+        self.assertEqual(["backup1"], job_tracker.entity_ids(sot))
+
+    def test_own_entities(self):
+        sot = job.Job.existing(id="job", entities={
+            "elb": {"id": "lb1", "name": "lb"}, "job_id": "job"})
+
+        self.assertEqual(["lb1"], job_tracker.entity_ids(sot))
+
+    def test_failure_of_sub_job(self):
+        sot = job.Job.existing(id="job", status="FAIL", entities={
+            "sub_jobs": [
+                {"status": "SUCCESS", "entities": {}},
+                {"status": "FAIL", "error_code": "Ecs.0001",
+                 "fail_reason": "quota exceeded"},
+            ]})
+
+        failure = job_tracker.job_failure(sot)
+
+        self.assertIsInstance(failure, exceptions.ResourceFailure)
+        self.assertIs(sot, failure.job)
+        self.assertEqual("Ecs.0001", failure.error_code)
+        self.assertEqual("quota exceeded", failure.fail_reason)
+
+
+class TestJobTracker(testtools.TestCase):
+
+    def setUp(self):
+        super(TestJobTracker, self).setUp()
+        self.sot = job_tracker.JobTracker("session", interval=0.001,
+                                          max_interval=0.01, timeout=5)
+        self.addCleanup(self.sot.close)
+
+    def test_success(self):
+        done = threading.Event()
+        sot = scripted({"status": "INIT"}, {"status": "RUNNING"},
+                       {"status": "SUCCESS",
+                        "entities": {"volume_id": "volume"}})
+
+        future = self.sot.track(sot, callback=lambda f: done.set())
+
+        result = future.result(5)
+        self.assertIs(sot, future.job)
+        self.assertIs(sot, result.job)
+        self.assertEqual(["volume"], result.entity_ids)
+        self.assertTrue(done.wait(5))
+
+    def test_track_id(self):
+        with mock.patch.object(ScriptedJob, "existing",
+                               return_value=scripted({"status": "SUCCESS"})
+                               ) as existing:
+            future = self.sot.track(ScriptedJob, "job")
+
+        self.assertEqual("job", future.result(5).job.id)
+        existing.assert_called_once_with(id="job")
+
+    def test_failure(self):
+        sot = scripted({"status": "FAIL", "error_code": "Ecs.0001",
+                        "fail_reason": "no capacity"})
+
+        future = self.sot.track(sot)
+
+        error = future.exception(5)
+        self.assertIsInstance(error, exceptions.JobFailure)
+        self.assertEqual("Ecs.0001", error.error_code)
+        self.assertEqual("no capacity", error.fail_reason)
+
+    def test_timeout(self):
+        sot = scripted(*[{"status": "RUNNING"}] * 1000)
+
+        future = self.sot.track(sot, timeout=0.05)
+
+        self.assertIsInstance(future.exception(5),
+                              exceptions.ResourceTimeout)
+
+    def test_server_error_retried(self):
+        sot = scripted(exceptions.HttpException(http_status=503),
+                       {"status": "SUCCESS"})
+
+        future = self.sot.track(sot)
+
+        self.assertEqual([], future.result(5).entity_ids)
+
+    def test_client_error(self):
+        error = exceptions.NotFoundException(http_status=404)
+        sot = scripted(error)
+
+        future = self.sot.track(sot)
+
+        self.assertIs(error, future.exception(5))
+
+    def test_many_jobs(self):
+        jobs = [scripted({"status": "RUNNING"}, {"status": "SUCCESS"})
+                for _ in range(200)]
+        threads = threading.active_count()
+
+        tracked = [self.sot.track(sot) for sot in jobs]
+        done, not_done = self.sot.wait(5)
+
+        self.assertEqual(set(), not_done)
+        self.assertTrue(all(future.done() for future in tracked))
+        # one scheduler thread, and at most max_workers pollers
+        self.assertTrue(threading.active_count() <= threads + 9)
+
+    def test_close(self):
+        sot = scripted(*[{"status": "RUNNING"}] * 1000)
+        future = self.sot.track(sot)
+
+        self.sot.close()
+
+        self.assertTrue(future.cancelled())
+        self.assertRaises(RuntimeError, self.sot.track, sot)
@@ -0,0 +1,196 @@
+# Licensed under the Apache License, Version 2.0 (the "License"); you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+
+import datetime
+import json
+
+import mock
+import testtools
+
+from openstack import json_codec
+
+
+class TestJSONCodec(testtools.TestCase):
+
+    def test_dumps_datetime(self):
+        sot = json_codec.JSONCodec()
+
+        result = sot.dumps({"at": datetime.datetime(2018, 1, 1)})
+
+        self.assertEqual('{"at": "2018-01-01T00:00:00"}', result)
+        self.assertEqual(result, sot.encode({"at": datetime.datetime(
+            2018, 1, 1)}))
+
+    def test_loads(self):
+        sot = json_codec.JSONCodec()
+
+        self.assertEqual({"a": [1]}, sot.loads(b'{"a": [1]}'))
+
+    def test_loads_bytes_as_text(self):
+        sot = json_codec.JSONCodec()
+
+        with mock.patch.object(sot, "_module") as module:
+            sot.loads(b'{"a": "\xc3\xa9"}')
+
+        module.loads.assert_called_once_with(u'{"a": "\u00e9"}')
+
+    def test_get_codec_fallback(self):
+        real = json_codec.importlib.import_module
+
+        def import_module(name):
+            if name != "json":
+                raise ImportError(name)
+            return real(name)
+
+        with mock.patch.object(json_codec.importlib, "import_module",
+                               side_effect=import_module):
+            sot = json_codec.get_codec()
+
+        self.assertEqual("json", sot.backend)
+
+    def test_get_codec_missing(self):
+        self.assertRaises(ImportError, json_codec.get_codec, "no_such_json")
+
+
+class TestListDecoder(testtools.TestCase):
+
+    def setUp(self):
+        super(TestListDecoder, self).setUp()
+        self.document = {
+            "count": 3,
+            "servers": [{"id": i, "values": [1.5, "a\"]b", None, 12345]}
+                        for i in range(20)],
+            "links": [{"href": "next"}],
+        }
+        self.text = json.dumps(self.document).encode("utf-8")
+
+    def _decode(self, sot, text, size):
+        items = []
+        for start in range(0, len(text), size):
+            items.extend(sot.feed(text[start:start + size]))
+        items.extend(sot.flush())
+        return items, sot.close()
+
+    def test_chunks(self):
+        for size in (1, 2, 7, 64, len(self.text)):
+            sot = json_codec.ListDecoder("servers")
+
+            items, document = self._decode(sot, self.text, size)
+
+            self.assertEqual(self.document["servers"], items)
+            self.assertEqual(self.document, document)
+
+    def test_items_before_end(self):
+        sot = json_codec.ListDecoder("servers")
+
+        items = sot.feed(self.text[:len(self.text) // 2])
+
+        self.assertTrue(items)
+        self.assertEqual(self.document["servers"][:len(items)], items)
+
+    def test_split_at_every_offset(self):
+        document = {"count": 2, "servers": [{"id": 1, "size": 1.5e-3},
+                                            {"id": 2, "size": -20.25}],
+                    "n": 12500.0}
+        text = json.dumps(document).encode("utf-8")
+        for offset in range(len(text) + 1):
+            sot = json_codec.ListDecoder("servers")
+
+            items = (sot.feed(text[:offset]) + sot.feed(text[offset:]) +
+                     sot.flush())
+
+            self.assertEqual(document["servers"], items)
+            self.assertEqual(document, sot.close())
+
+    def test_number_cut_after_dot(self):
+        sot = json_codec.ListDecoder()
+
+        items = sot.feed(b"[1.") + sot.feed(b"5]")
+
+        self.assertEqual([1.5], items)
+        self.assertEqual([1.5], sot.close())
+
+    def test_nested_path(self):
+        text = json.dumps({"x": 1, "a": {"c": 2, "b": [1, 22, 333]}})
+        sot = json_codec.ListDecoder("a.b")
+
+        items, document = self._decode(sot, text.encode("utf-8"), 1)
+
+        self.assertEqual([1, 22, 333], items)
+        self.assertEqual({"x": 1, "a": {"c": 2, "b": [1, 22, 333]}},
+                         document)
+
+    def test_not_kept(self):
+        text = json.dumps({"x": 1, "b": [1, 22, 333]})
+        sot = json_codec.ListDecoder("b", keep=False)
+
+        items, document = self._decode(sot, text.encode("utf-8"), 2)
+
+        self.assertEqual([1, 22, 333], items)
+        self.assertEqual(3, sot.count)
+        self.assertEqual({"x": 1, "b": []}, document)
+
+    def test_top_level_list(self):
+        sot = json_codec.ListDecoder()
+
+        items, document = self._decode(sot, b'[1, {"a": 2}, 3]', 1)
+
+        self.assertEqual([1, {"a": 2}, 3], items)
+        self.assertEqual(items, document)
+
+    def test_missing_path(self):
+        sot = json_codec.ListDecoder("servers")
+
+        items, document = self._decode(sot, b'{"other": 1}', 3)
+
+        self.assertEqual([], items)
+        self.assertEqual({"other": 1}, document)
+
+    def test_unexpected_document_decoded_once(self):
+        decoder = mock.Mock(wraps=json.JSONDecoder())
+        sot = json_codec.ListDecoder(decoder=decoder)
+
+        items, document = self._decode(sot, self.text, 7)
+
+        self.assertEqual([], items)
+        self.assertEqual(self.document, document)
+        self.assertEqual(1, decoder.raw_decode.call_count)
+
+    def test_big_value_not_decoded_at_every_chunk(self):
+        decoder = mock.Mock(wraps=json.JSONDecoder())
+        sot = json_codec.ListDecoder("other", decoder=decoder)
+
+        items, document = self._decode(sot, self.text, 7)
+
+        self.assertEqual(self.document, document)
+        self.assertLess(decoder.raw_decode.call_count, 40)
+
+    def test_utf8_split(self):
+        text = json.dumps({"servers": [u"\u00e9t\u00e9"]},
+                          ensure_ascii=False).encode("utf-8")
+        sot = json_codec.ListDecoder("servers")
+
+        items, document = self._decode(sot, text, 1)
+
+        self.assertEqual([u"\u00e9t\u00e9"], items)
+
+    def test_truncated(self):
+        sot = json_codec.ListDecoder("servers")
+        sot.feed(b'{"servers": [1, 2')
+
+        self.assertRaises(ValueError, sot.close)
+
+    def test_invalid(self):
+        sot = json_codec.ListDecoder("servers")
+        sot.feed(b'{"servers": [1, }')
+
+        self.assertRaises(ValueError, sot.close)
@@ -119,3 +119,22 @@ class TestProfile(base.TestCase):
             self.assertEqual('fee', prof.get_filter(service).service_name)
             self.assertEqual('fie', prof.get_filter(service).region)
             self.assertEqual('public', prof.get_filter(service).interface)
+
+    def test_lazy_services(self):
+        prof = profile.Profile()
+        self.assertIsInstance(prof._services['compute'],
+                              profile.ServiceDescriptor)
+        self.assertEqual([], prof.get_services(loaded_only=True))
+        self.assertEqual('cloud_eye', prof.get_service_module('cloud-eye'))
+        self.assertIn('compute', prof.get_service_types())
+
+        prof.set_region(prof.ALL, 'fie')
+        svc = prof.get_filter('compute')
+
+        self.assertEqual('v2', svc.version)
+        self.assertEqual('fie', svc.region)
+        self.assertIsNone(svc.interface)
+        self.assertEqual(['compute'], [s.service_type for s in
+                                       prof.get_services(loaded_only=True)])
+        self.assertIsInstance(prof._services['network'],
+                              profile.ServiceDescriptor)
@@ -68,6 +68,14 @@ class TestProxyPrivate(testtools.TestCase):
     def test__check_resource_notstrict_id(self):
         self._test_correct("abc123-id")
 
+    def test__check_resource_compact(self):
+        view = resource2.CompactResource(HeadableResource, {"id": "1"})
+        decorated = proxy2._check_resource(strict=True)(self.sot.method)
+
+        rv = decorated(self.sot, HeadableResource, view)
+
+        self.assertIs(view.to_resource(), rv)
+
     def test__check_resource_strict_id(self):
         decorated = proxy2._check_resource(strict=True)(self.sot.method)
         self.assertRaisesRegexp(ValueError, "A Resource must be passed",
@@ -157,6 +165,15 @@ class TestProxyPrivate(testtools.TestCase):
         res._update.assert_called_once_with(**attrs)
         self.assertEqual(result, res)
 
+    def test__get_resource_from_compact(self):
+        view = resource2.CompactResource(HeadableResource, {"id": "1"})
+
+        result = self.fake_proxy._get_resource(HeadableResource, view)
+
+        self.assertIsInstance(result, HeadableResource)
+        self.assertIs(view.to_resource(), result)
+        self.assertEqual("1", result.id)
+
 
 class TestProxyDelete(testtools.TestCase):
 
@@ -278,6 +295,99 @@ class TestProxyCreate(testtools.TestCase):
         self.res.create.assert_called_once_with(self.session, prepend_key=True)
 
 
+class TestProxyNameIndex(testtools.TestCase):
+
+    def setUp(self):
+        super(TestProxyNameIndex, self).setUp()
+        self.now = 1000.0
+        patcher = mock.patch("time.time", lambda: self.now)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.session = mock.Mock()
+        self.sot = proxy2.BaseProxy(self.session)
+        self.sot.enable_name_index(ttl=60)
+        self.found = ListableResource.existing(id="1", name="web")
+        patcher = mock.patch.object(ListableResource, "find",
+                                    return_value=self.found)
+        self.mock_find = patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_not_enabled(self):
+        sot = proxy2.BaseProxy(self.session)
+
+        sot._find(ListableResource, "web")
+        sot._find(ListableResource, "web")
+
+        self.assertIsNone(sot.name_index)
+        self.assertEqual(2, self.mock_find.call_count)
+
+    def test_find_indexed(self):
+        first = self.sot._find(ListableResource, "web", ignore_missing=False)
+        second = self.sot._find(ListableResource, "web")
+
+        self.mock_find.assert_called_once_with(self.session, "web",
+                                               ignore_missing=False)
+        self.assertEqual(("1", "web"), (second.id, second.name))
+        self.assertIsNot(first, second)
+
+    def test_find_by_attributes(self):
+        self.sot._find(ListableResource, "web", project_id="a")
+        self.sot._find(ListableResource, "web", project_id="b")
+        self.sot._find(ListableResource, "web", project_id="a")
+
+        self.assertEqual(2, self.mock_find.call_count)
+
+    def test_not_found_not_indexed(self):
+        self.mock_find.return_value = None
+
+        self.assertIsNone(self.sot._find(ListableResource, "web"))
+        self.sot._find(ListableResource, "web")
+
+        self.assertEqual(2, self.mock_find.call_count)
+
+    def test_expired(self):
+        self.sot._find(ListableResource, "web")
+        self.now += 61
+        self.sot._find(ListableResource, "web")
+
+        self.assertEqual(2, self.mock_find.call_count)
+
+    def _assert_invalidated(self, change, resource_type):
+        find = mock.patch.object(resource_type, "find",
+                                 return_value=self.found)
+
+        with find as mock_other_find:
+            self.sot._find(ListableResource, "web")
+            self.sot._find(resource_type, "web")
+            change(resource_type)
+            self.sot._find(ListableResource, "web")
+            self.sot._find(resource_type, "web")
+
+        # only the entries of the changed resource type are dropped
+        self.assertEqual(1, self.mock_find.call_count)
+        self.assertEqual(2, mock_other_find.call_count)
+
+    def test_invalidated_on_create(self):
+        res = mock.Mock()
+        with mock.patch.object(CreateableResource, "new", return_value=res):
+            self._assert_invalidated(
+                lambda resource_type: self.sot._create(resource_type,
+                                                       name="web"),
+                CreateableResource)
+
+    def test_invalidated_on_delete(self):
+        self._assert_invalidated(
+            lambda resource_type: self.sot._delete(
+                resource_type, mock.Mock(spec=resource_type)),
+            CreateableResource)
+
+    def test_invalidated_on_update(self):
+        self._assert_invalidated(
+            lambda resource_type: self.sot._update(
+                resource_type, mock.Mock(spec=resource_type)),
+            CreateableResource)
+
+
 class TestProxyGet(testtools.TestCase):
 
     def setUp(self):
@@ -301,6 +411,13 @@ class TestProxyGet(testtools.TestCase):
         self.res.get.assert_called_with(self.session, requires_id=True)
         self.assertEqual(rv, self.fake_result)
 
+    def test_get_resource_raw(self):
+        rv = self.sot._get(RetrieveableResource, self.res, raw=True)
+
+        self.res.get.assert_called_with(self.session, requires_id=True,
+                                        raw=True)
+        self.assertEqual(rv, self.fake_result)
+
     def test_get_resource_with_args(self):
         args = {"key": "value"}
         rv = self.sot._get(RetrieveableResource, self.res, **args)
@@ -353,6 +470,38 @@ class TestProxyList(testtools.TestCase):
     def test_list_non_paginated(self):
         self._test_list(False)
 
+    def test_list_prefetch(self):
+        rv = self.sot._list(ListableResource, paginated=True, prefetch=2,
+                            **self.args)
+
+        self.assertEqual(self.fake_response, rv)
+        ListableResource.list.assert_called_once_with(
+            self.session, paginated=True, prefetch=2, **self.args)
+
+    def test_list_raw(self):
+        rv = self.sot._list(ListableResource, paginated=True, raw=True,
+                            **self.args)
+
+        self.assertEqual(self.fake_response, rv)
+        ListableResource.list.assert_called_once_with(
+            self.session, paginated=True, raw=True, **self.args)
+
+    def test_list_compact(self):
+        rv = self.sot._list(ListableResource, paginated=True, compact=True,
+                            **self.args)
+
+        self.assertEqual(self.fake_response, rv)
+        ListableResource.list.assert_called_once_with(
+            self.session, paginated=True, compact=True, **self.args)
+
+    def test_list_stream(self):
+        rv = self.sot._list(ListableResource, paginated=True, stream=True,
+                            **self.args)
+
+        self.assertEqual(self.fake_response, rv)
+        ListableResource.list.assert_called_once_with(
+            self.session, paginated=True, stream=True, **self.args)
+
 
 class TestProxyHead(testtools.TestCase):
 
@@ -10,10 +10,17 @@
 # License for the specific language governing permissions and limitations
 # under the License.
 
+import inspect
+
 import mock
 
 from openstack.tests.unit import base
 
+try:
+    _getargspec = inspect.getfullargspec
+except AttributeError:
+    _getargspec = inspect.getargspec
+
 
 class TestProxyBase(base.TestCase):
     def setUp(self):
@@ -135,11 +142,22 @@ class TestProxyBase(base.TestCase):
             expected_kwargs["path_args"] = kwargs
         if not expected_args:
             expected_args = [resource_type] + the_value
+        # the getters taking raw forward it, see BaseProxy._get
+        forwards_raw = ("raw" in _getargspec(test_method).args and
+                        "raw" not in method_kwargs)
+        if forwards_raw:
+            expected_kwargs.setdefault("raw", False)
         self._verify2(mock_method, test_method,
                       method_args=the_value,
                       method_kwargs=method_kwargs or {},
                       expected_args=expected_args,
                       expected_kwargs=expected_kwargs)
+        if forwards_raw:
+            self._verify2(mock_method, test_method,
+                          method_args=the_value,
+                          method_kwargs=dict(method_kwargs, raw=True),
+                          expected_args=expected_args,
+                          expected_kwargs=dict(expected_kwargs, raw=True))
 
     def verify_head(self, test_method, resource_type,
                     mock_method="openstack.proxy2.BaseProxy._head",
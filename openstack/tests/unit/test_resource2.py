@@ -232,6 +232,79 @@ class TestComponent(base.TestCase):
         self.assertNotIn(name, instance._example)
 
 
+class NestedResource(resource2.Resource):
+    size = resource2.Body("size", type=int)
+
+
+class ParentResource(resource2.Resource):
+    size = resource2.Body("size", type=int)
+    nested = resource2.Body("nested", type=NestedResource)
+    etag = resource2.Header("etag", type=int)
+
+
+class TestComponentDecoded(base.TestCase):
+
+    def setUp(self):
+        super(TestComponentDecoded, self).setUp()
+        self.sot = ParentResource.existing(size="1", nested={"size": "2"})
+
+    def test_decoded_once(self):
+        nested = self.sot.nested
+
+        self.assertIs(nested, self.sot.nested)
+        self.assertEqual(2, nested.size)
+        self.assertEqual(1, self.sot.size)
+
+    def test_set(self):
+        nested = self.sot.nested
+
+        self.sot.nested = {"size": "3"}
+
+        self.assertIsNot(nested, self.sot.nested)
+        self.assertEqual(3, self.sot.nested.size)
+
+    def test_delete(self):
+        self.assertEqual(1, self.sot.size)
+
+        del self.sot.size
+
+        self.assertIsNone(self.sot.size)
+
+    def test_update(self):
+        nested = self.sot.nested
+
+        self.sot._update(nested={"size": "4"}, size="5")
+
+        self.assertIsNot(nested, self.sot.nested)
+        self.assertEqual((4, 5), (self.sot.nested.size, self.sot.size))
+
+    def test_translate_response(self):
+        nested = self.sot.nested
+        self.assertIsNone(self.sot.etag)
+        response = mock.Mock(headers={"etag": "7"})
+        response.json.return_value = {"nested": {"size": "6"}}
+
+        self.sot._translate_response(response)
+
+        self.assertIsNot(nested, self.sot.nested)
+        self.assertEqual((6, 7), (self.sot.nested.size, self.sot.etag))
+
+    def test_replaced_value(self):
+        self.assertEqual(1, self.sot.size)
+
+        # subclasses write some attributes directly
+        self.sot._body.attributes["size"] = "8"
+
+        self.assertEqual(8, self.sot.size)
+
+    def test_compact(self):
+        sot = resource2.CompactResource(ParentResource,
+                                        {"size": "1", "nested": {"size": 2}})
+
+        self.assertIs(sot.nested, sot.nested)
+        self.assertEqual(2, sot.nested.size)
+
+
 class TestComponentManager(base.TestCase):
     def test_create_basic(self):
         sot = resource2._ComponentManager()
@@ -568,6 +641,24 @@ class TestResource(base.TestCase):
         self.assertIn("y", Test._uri_mapping())
         self.assertIn("z", Test._uri_mapping())
 
+    def test__mapping_cached_per_class(self):
+        class Parent(resource2.Resource):
+            x = resource2.Body("x")
+
+        class Child(Parent):
+            y = resource2.Body("y", alternate_id=True)
+
+        self.assertNotIn("y", Parent._body_mapping())
+        self.assertIn("y", Child._body_mapping())
+        self.assertEqual("", Parent._alternate_id())
+        self.assertEqual("y", Child._alternate_id())
+        self.assertIs(Child._fields(resource2.Body),
+                      Child._fields(resource2.Body))
+
+        # the mapping is a copy, modifying it doesn't alter the class
+        Child._body_mapping()["z"] = "z"
+        self.assertNotIn("z", Child._body_mapping())
+
     def test__getattribute__id_in_body(self):
         id = "lol"
         sot = resource2.Resource(id=id)
@@ -1021,6 +1112,15 @@ class TestResourceActions(base.TestCase):
         self.sot._translate_response.assert_called_once_with(self.response)
         self.assertEqual(result, self.sot)
 
+    def test_get_raw(self):
+        self.sot.resource_key = "key"
+        self.response.json.return_value = {"key": {"id": "id", "a": 1}}
+
+        result = self.sot.get(self.session, raw=True)
+
+        self.assertEqual({"id": "id", "a": 1}, result)
+        self.sot._translate_response.assert_not_called()
+
     def test_get_not_requires_id(self):
         result = self.sot.get(self.session, False)
 
@@ -1334,6 +1434,173 @@ class TestResourceActions(base.TestCase):
         # Ensure we only made two calls to get this done
         self.assertEqual(2, len(self.session.get.call_args_list))
 
+    def test_list_multi_page_prefetch(self):
+        ids = [1, 2, 3]
+        resp1 = mock.Mock()
+        resp1.json.return_value = [{"id": ids[0]}, {"id": ids[1]}]
+        resp2 = mock.Mock()
+        resp2.json.return_value = [{"id": ids[2]}]
+
+        self.session.get.side_effect = [resp1, resp2]
+
+        results = self.sot.list(self.session, paginated=True, prefetch=2)
+
+        self.assertEqual(ids, [result.id for result in results])
+        self.assertEqual(2, len(self.session.get.call_args_list))
+        self.assertEqual({"limit": 2, "marker": 2},
+                         self.session.get.call_args_list[1][1]["params"])
+
+    def test_list_offset_pages_max_workers(self):
+        class Test(self.test_class):
+            query_marker_key = "offset"
+
+            @classmethod
+            def get_offset_queries(cls, response_json, yielded,
+                                   query_params):
+                return [{"offset": 1}, {"offset": 2}]
+
+        def get(uri, params=None, **kwargs):
+            response = mock.Mock()
+            response.json.return_value = [{"id": params.get("offset", 0)}]
+            return response
+
+        self.session.get.side_effect = get
+
+        results = Test.list(self.session, paginated=True, max_workers=2)
+
+        self.assertEqual([0, 1, 2], [result.id for result in results])
+        self.assertEqual(3, len(self.session.get.call_args_list))
+
+    def test_list_offset_pages_max_workers_not_paginated(self):
+        class Test(self.test_class):
+            get_offset_queries = mock.Mock()
+
+        resp = mock.Mock()
+        resp.json.return_value = [{"id": 1}]
+        self.session.get.return_value = resp
+
+        results = list(Test.list(self.session, max_workers=2))
+
+        self.assertEqual([1], [result.id for result in results])
+        Test.get_offset_queries.assert_not_called()
+
+    def test_list_prefetch_error(self):
+        resp1 = mock.Mock()
+        resp1.json.return_value = [{"id": 1}]
+
+        self.session.get.side_effect = [resp1,
+                                         exceptions.HttpException("boom")]
+
+        results = self.sot.list(self.session, paginated=True, prefetch=1)
+
+        self.assertEqual(1, next(results).id)
+        self.assertRaises(exceptions.HttpException, next, results)
+
+    def test_list_compact(self):
+        class Test(self.test_class):
+            attr = resource2.Body("attr_name", type=int)
+            other = resource2.Body("other")
+
+        mock_response = mock.Mock()
+        mock_response.json.return_value = [
+            {"id": 1, "attr_name": "2", "other": "x"},
+            {"id": 2}]
+        self.session.get.return_value = mock_response
+
+        results = list(Test.list(self.session, compact=True))
+
+        self.assertEqual([1, 2], [result.id for result in results])
+        sot = results[0]
+        self.assertIsInstance(sot, resource2.CompactResource)
+        self.assertNotIsInstance(sot, Test)
+        self.assertIs(Test, sot.resource_type)
+        self.assertFalse(hasattr(sot, "__dict__"))
+        self.assertIs(mock_response.json.return_value[0], sot._body)
+        self.assertEqual(1, resource2.Resource._get_id(sot))
+        self.assertEqual(2, sot.attr)
+        self.assertEqual("x", sot.other)
+        self.assertIsNone(results[1].attr)
+        self.assertIsNone(sot._resource)
+        full = Test.existing(id=1, attr_name="2", other="x")
+        self.assertTrue(full == sot)
+        self.assertTrue(sot == full)
+
+        sot.other = "y"
+
+        self.assertIsInstance(sot._resource, Test)
+        self.assertEqual("y", sot.other)
+        self.assertEqual({"other": "y"}, sot.to_resource()._body.dirty)
+        self.assertEqual("x", mock_response.json.return_value[0]["other"])
+
+    def test_list_raw_paginated(self):
+        class Test(self.test_class):
+            alt = resource2.Body("the_alt", alternate_id=True)
+
+        resp1 = mock.Mock()
+        resp1.json.return_value = [{"the_alt": "a"}, {"the_alt": "b"}]
+        resp2 = mock.Mock()
+        resp2.json.return_value = [{"the_alt": "c"}]
+        self.session.get.side_effect = [resp1, resp2]
+
+        results = list(Test.list(self.session, paginated=True, raw=True,
+                                 limit=2))
+
+        self.assertEqual([{"the_alt": "a"}, {"the_alt": "b"},
+                          {"the_alt": "c"}], results)
+        self.assertIs(resp1.json.return_value[0], results[0])
+        self.assertEqual({"limit": 2, "marker": "b"},
+                         self.session.get.call_args_list[1][1]["params"])
+
+    def test_list_stream(self):
+        received = []
+
+        def chunks():
+            for chunk in [b'[{"id": 1}, {"id"', b': 2}]']:
+                received.append(chunk)
+                yield chunk
+
+        resp1 = mock.Mock()
+        resp1.iter_content.return_value = chunks()
+        resp2 = mock.Mock()
+        resp2.iter_content.return_value = iter([b'[{"id": 3}]'])
+        self.session.get.side_effect = [resp1, resp2]
+
+        results = self.sot.list(self.session, paginated=True, stream=True,
+                                 limit=2)
+
+        self.assertEqual(1, next(results).id)
+        # the first item came before the whole page was received
+        self.assertEqual(1, len(received))
+        self.assertEqual([2, 3], [result.id for result in results])
+        self.assertEqual(2, len(self.session.get.call_args_list))
+        self.assertTrue(self.session.get.call_args_list[0][1]["stream"])
+        self.assertEqual({"limit": 2, "marker": 2},
+                         self.session.get.call_args_list[1][1]["params"])
+
+    def test_list_stream_abandoned(self):
+        resp = mock.Mock()
+        resp.iter_content.return_value = iter([b'[{"id": 1}, ', b'{"id": 2}]'])
+        self.session.get.return_value = resp
+
+        results = self.sot.list(self.session, stream=True)
+        self.assertEqual(1, next(results).id)
+        results.close()
+
+        resp.close.assert_called_once_with()
+
+    def test_list_compact_alternate_id(self):
+        class Test(self.test_class):
+            alt = resource2.Body("the_alt", alternate_id=True)
+
+        mock_response = mock.Mock()
+        mock_response.json.return_value = [{"the_alt": "lol"}]
+        self.session.get.return_value = mock_response
+
+        sot = next(Test.list(self.session, compact=True))
+
+        self.assertEqual("lol", sot.id)
+        self.assertEqual("lol", sot.alt)
+
 
 class TestResourceFind(base.TestCase):
     def setUp(self):
@@ -1377,6 +1644,38 @@ class TestResourceFind(base.TestCase):
 
         self.assertEqual(result, value)
 
+    def test_find_filtered_by_name(self):
+        class Test(resource2.Resource):
+            _query_mapping = resource2.QueryParameters("name")
+
+        existing = mock.Mock()
+        existing.get.side_effect = exceptions.NotFoundException
+        match = mock.Mock(id="1")
+        match.name = "web"
+        other = mock.Mock(id="2")
+        other.name = "web-2"
+        with mock.patch.object(Test, "existing", return_value=existing):
+            with mock.patch.object(Test, "list",
+                                   return_value=[match, other]) as mock_list:
+                result = Test.find("session", "web", project_id="p")
+
+        self.assertIs(match, result)
+        mock_list.assert_called_once_with("session", name="web",
+                                          project_id="p")
+
+    def test_find_not_filtered_by_name(self):
+        class Test(resource2.Resource):
+            pass
+
+        existing = mock.Mock()
+        existing.get.side_effect = exceptions.NotFoundException
+        with mock.patch.object(Test, "existing", return_value=existing):
+            with mock.patch.object(Test, "list",
+                                   return_value=[]) as mock_list:
+                Test.find("session", "web")
+
+        mock_list.assert_called_once_with("session")
+
     def test_no_match_raise(self):
         self.assertRaises(exceptions.ResourceNotFound, self.no_results.find,
                           "session", "name", ignore_missing=False)
@@ -1529,3 +1828,153 @@ class TestWaitForDelete(base.TestCase):
         self.assertRaises(exceptions.ResourceTimeout,
                           resource2.wait_for_delete,
                           "session", resource, 1, 3)
+
+
+class TestWaitForMany(base.TestCase):
+
+    def setUp(self):
+        super(TestWaitForMany, self).setUp()
+
+        class Test(resource2.Resource):
+            service = service_filter.ServiceFilter(service_type="service")
+            base_path = "/tests"
+            allow_get = True
+            allow_list = True
+            status = resource2.Body("status")
+
+        self.test_class = Test
+        self.session = mock.Mock(spec=session.Session)
+
+    def _response(self, body, status_code=200):
+        response = mock.Mock()
+        response.status_code = status_code
+        response.headers = {}
+        response.json.return_value = body
+        return response
+
+    @mock.patch("time.sleep", return_value=None)
+    def test_status(self, mock_sleep):
+        resources = [self.test_class(id=i, status="BUILD")
+                     for i in (1, 2, 3)]
+        self.session.get.side_effect = [
+            self._response([{"id": 1, "status": "ACTIVE"},
+                            {"id": 2, "status": "ERROR"},
+                            {"id": 3, "status": "BUILD"}]),
+            # only one is left, it's got on its own
+            self._response({"id": 3, "status": "ACTIVE"}),
+        ]
+
+        results = list(resource2.wait_for_many(
+            self.session, resources, "ACTIVE", ["ERROR"],
+            query={"limit": 10}))
+
+        self.assertEqual([1, 2, 3], [f.resource.id for f in results])
+        self.assertIs(resources[0], results[0].result())
+        self.assertRaises(exceptions.ResourceFailure, results[1].result)
+        self.assertEqual("ACTIVE", results[2].result().status)
+        self.assertEqual(2, self.session.get.call_count)
+        self.assertEqual({"limit": 10},
+                         self.session.get.call_args_list[0][1]["params"])
+        self.assertEqual("tests/3", self.session.get.call_args[0][0])
+        mock_sleep.assert_called_once_with(mock.ANY)
+        self.assertTrue(1 <= mock_sleep.call_args[0][0] <= 2)
+
+    def test_immediate_status(self):
+        resources = [self.test_class(id=1, status="ACTIVE")]
+
+        results = list(resource2.wait_for_many(self.session, resources,
+                                               "ACTIVE"))
+
+        self.assertIs(resources[0], results[0].result())
+        self.session.get.assert_not_called()
+
+    @mock.patch("time.sleep", return_value=None)
+    def test_delete(self, mock_sleep):
+        resources = [self.test_class(id=i) for i in (1, 2)]
+        self.session.get.side_effect = [
+            # less than the limit, the listing has no other page
+            self._response([{"id": 2}]),
+            # missing from the listing, confirmed with a get
+            exceptions.NotFoundException(),
+            exceptions.NotFoundException(),
+        ]
+
+        results = list(resource2.wait_for_many(self.session, resources))
+
+        self.assertEqual([1, 2], [f.resource.id for f in results])
+        self.assertEqual([resources[0], resources[1]],
+                         [f.result() for f in results])
+        self.assertEqual({"limit": 2 * resource2.LISTING_SHARE},
+                         self.session.get.call_args_list[0][1]["params"])
+
+    @mock.patch("time.sleep", return_value=None)
+    def test_listing_filtered_by_id(self, mock_sleep):
+        self.test_class._query_mapping = resource2.QueryParameters("id")
+        resources = [self.test_class(id=i, status="BUILD") for i in (2, 1)]
+        self.session.get.side_effect = [
+            self._response([{"id": 1, "status": "ACTIVE"},
+                            {"id": 2, "status": "ACTIVE"}]),
+            self._response([]),
+        ]
+
+        results = list(resource2.wait_for_many(self.session, resources,
+                                               "ACTIVE"))
+
+        self.assertEqual(["ACTIVE", "ACTIVE"],
+                         [f.result().status for f in results])
+        self.assertEqual({"id": [1, 2]},
+                         self.session.get.call_args_list[0][1]["params"])
+
+    @mock.patch("time.sleep", return_value=None)
+    def test_listing_cut(self, mock_sleep):
+        resources = [self.test_class(id=i, status="BUILD") for i in (1, 2)]
+        others = [{"id": i, "status": "BUILD"}
+                  for i in range(10, 10 + 2 * resource2.LISTING_SHARE)]
+        self.session.get.side_effect = [
+            self._response(others),
+            self._response({"id": 1, "status": "BUILD"}),
+            self._response({"id": 2, "status": "ACTIVE"}),
+            # the group is not listed again
+            self._response({"id": 1, "status": "ACTIVE"}),
+        ]
+
+        results = list(resource2.wait_for_many(self.session, resources,
+                                               "ACTIVE"))
+
+        self.assertEqual([2, 1], [f.resource.id for f in results])
+        self.assertEqual(["/tests", "tests/1", "tests/2", "tests/1"],
+                         [c[0][0] for c in
+                          self.session.get.call_args_list])
+
+    @mock.patch("time.sleep", return_value=None)
+    def test_listing_error(self, mock_sleep):
+        resources = [self.test_class(id=i, status="BUILD") for i in (1, 2)]
+        self.session.get.side_effect = [
+            exceptions.HttpException("Service Unavailable"),
+            self._response({"id": 1, "status": "ACTIVE"}),
+            exceptions.HttpException("Forbidden"),
+        ]
+
+        results = list(resource2.wait_for_many(self.session, resources,
+                                               "ACTIVE"))
+
+        self.assertEqual([1, 2], [f.resource.id for f in results])
+        self.assertEqual("ACTIVE", results[0].result().status)
+        self.assertRaises(exceptions.HttpException, results[1].result)
+        mock_sleep.assert_not_called()
+
+    @mock.patch("time.sleep", return_value=None)
+    @mock.patch("time.time")
+    def test_timeout(self, mock_time, mock_sleep):
+        mock_time.side_effect = [0, 1, 2, 3]
+        resources = [self.test_class(id=1, status="BUILD")]
+        self.session.get.return_value = self._response(
+            {"id": 1, "status": "BUILD"})
+
+        results = list(resource2.wait_for_many(
+            self.session, resources, "ACTIVE", interval=1, max_interval=4,
+            wait=3))
+
+        self.assertRaises(exceptions.ResourceTimeout, results[0].result)
+        self.assertEqual(3, self.session.get.call_count)
+        self.assertEqual(2, mock_sleep.call_count)
@@ -15,7 +15,10 @@ import testtools
 
 from keystoneauth1 import exceptions as _exceptions
 
+from openstack import discovery_cache
 from openstack import exceptions
+from openstack import instrumentation
+from openstack import json_codec
 from openstack import profile
 from openstack import session
 from openstack import utils
@@ -42,6 +45,15 @@ class TestSession(testtools.TestCase):
         sot = session.Session(None, user_agent="testing/123")
         self.assertTrue(sot.user_agent.startswith("testing/123 openstacksdk"))
 
+    def test_init_json_codec(self):
+        sot = session.Session(None)
+        self.assertIsInstance(sot.json_codec, json_codec.JSONCodec)
+        self.assertIs(sot.json_codec, sot._json)
+
+        codec = json_codec.JSONCodec("json")
+        sot = session.Session(None, json_codec=codec)
+        self.assertIs(codec, sot.json_codec)
+
     def test_init_with_single_api_request(self):
         prof = profile.Profile()
         prof.set_api_version('clustering', '1.2')
@@ -421,6 +433,74 @@ class TestSession(testtools.TestCase):
         match_endpoint = utils.urljoin(match, project_id)
         self.assertEqual(rv, match_endpoint)
 
+    def _instrumented_request(self, **kwargs):
+        instrument = mock.Mock(spec=instrumentation.Instrument)
+        sot = session.Session(None, instruments=[instrument])
+        with mock.patch("keystoneauth1.session.Session.request",
+                        **kwargs):
+            try:
+                sot.get("/servers", endpoint_filter={"service_type": "ecs"})
+            except exceptions.SDKException:
+                pass
+        return instrument
+
+    def test_request_instrumented(self):
+        response = mock.Mock(status_code=200, content=b"{}", headers={})
+
+        instrument = self._instrumented_request(return_value=response)
+
+        info = instrument.after_response.call_args[0][0]
+        self.assertEqual(("ecs", "GET", "/servers", 200),
+                         (info.service_type, info.method, info.url_template,
+                          info.status))
+        self.assertIn("send", info.timings)
+        instrument.before_request.assert_called_once_with(info)
+
+    def test_request_instrumented_http_error(self):
+        response = mock.Mock(status_code=404, content=b"", headers={})
+        error = _exceptions.NotFound(response=response)
+
+        instrument = self._instrumented_request(side_effect=error)
+
+        info = instrument.after_response.call_args[0][0]
+        self.assertEqual(404, info.status)
+        instrument.on_error.assert_not_called()
+
+    def test_request_instrumented_error(self):
+        error = _exceptions.ConnectFailure()
+
+        instrument = self._instrumented_request(side_effect=error)
+
+        info = instrument.on_error.call_args[0][0]
+        self.assertIs(error, info.error)
+
+    @mock.patch("time.sleep")
+    def test_request_retried_when_throttled(self, mock_sleep):
+        throttled = mock.Mock(status_code=429, headers={"Retry-After": "2"})
+        ok = mock.Mock(status_code=200, headers={})
+        sot = session.Session(None)
+        with mock.patch("keystoneauth1.session.Session.request",
+                        side_effect=[throttled, ok]) as mock_request:
+            rv = sot.get("/servers", endpoint_filter={"service_type": "ecs"})
+
+        self.assertIs(ok, rv)
+        self.assertEqual(2, mock_request.call_count)
+        self.assertFalse(mock_request.call_args[1]["raise_exc"])
+        mock_sleep.assert_called_once_with(2.0)
+
+    def test_request_throttled_not_retried(self):
+        throttled = mock.Mock(status_code=429, headers={"Retry-After": "2"},
+                              text="", content=b"")
+        sot = session.Session(None)
+        with mock.patch("keystoneauth1.session.Session.request",
+                        return_value=throttled) as mock_request:
+            error = self.assertRaises(exceptions.HttpException, sot.post,
+                                      "/servers", json={},
+                                      endpoint_filter={"service_type": "ecs"})
+
+        self.assertEqual(429, error.http_status)
+        mock_request.assert_called_once()
+
     def test_get_endpoint_cached(self):
         sot = session.Session(None)
         service_type = "compute"
@@ -430,3 +510,42 @@ class TestSession(testtools.TestCase):
         sot.endpoint_cache[(service_type, interface)] = endpoint
         rv = sot.get_endpoint(service_type=service_type, interface=interface)
         self.assertEqual(rv, endpoint)
+
+    def _get_endpoint(self, sot, sc_endpoint="https://compute.cloud/v2/p"):
+        sot.profile = mock.Mock()
+        sot.profile.get_filter.return_value = mock.Mock(
+            interface="public", version="v2", get_filter=dict)
+        with mock.patch("keystoneauth1.session.Session.get_endpoint",
+                        return_value=sc_endpoint):
+            return sot.get_endpoint(service_type="compute",
+                                    interface="public")
+
+    def test_get_endpoint_not_found_cached(self):
+        sot = session.Session(None)
+        sot._get_endpoint_versions = mock.Mock(
+            side_effect=exceptions.EndpointNotFound())
+
+        for _ in range(2):
+            rv = self._get_endpoint(sot)
+
+        self.assertEqual("https://compute.cloud/v2/p", rv)
+        sot._get_endpoint_versions.assert_called_once_with(
+            "compute", "https://compute.cloud/v2/p")
+        self.assertEqual({}, sot.endpoint_cache)
+
+    def test_get_endpoint_discovery_shared(self):
+        cache = discovery_cache.DiscoveryCache()
+        versions = [{"id": "v2.0", "links": [
+            {"href": "https://compute.cloud/v2", "rel": "self"}]}]
+        first = session.Session(None, discovery_cache=cache)
+        first.get_project_id = mock.Mock(return_value="p")
+        first._parse_versions_response = mock.Mock(
+            side_effect=lambda uri: session.Session._Endpoint(uri, versions))
+        second = session.Session(None, discovery_cache=cache)
+        second._get_endpoint_versions = mock.Mock()
+
+        self.assertEqual("https://compute.cloud/v2/p",
+                         self._get_endpoint(first))
+        self.assertEqual("https://compute.cloud/v2/p",
+                         self._get_endpoint(second))
+        second._get_endpoint_versions.assert_not_called()
@@ -0,0 +1,332 @@
+# Licensed under the Apache License, Version 2.0 (the "License"); you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+
+import email.utils
+import io
+import threading
+
+import mock
+from six.moves import BaseHTTPServer
+import testtools
+
+from openstack import aksksession
+from openstack import exceptions
+from openstack import service_filter
+from openstack import throttle
+
+
+def _response(status, **headers):
+    response = mock.Mock(status_code=status, headers=headers,
+                         url="http://a/v1/servers")
+    return response
+
+
+class TestRetryAfter(testtools.TestCase):
+
+    def test_seconds(self):
+        self.assertEqual(2.5, throttle.retry_after(
+            _response(429, **{"Retry-After": "2.5"})))
+
+    def test_date(self):
+        date = email.utils.formatdate(1030.0, usegmt=True)
+        with mock.patch("time.time", return_value=1000.0):
+            self.assertEqual(30.0, throttle.retry_after(
+                _response(503, **{"Retry-After": date})))
+
+    def test_missing_or_invalid(self):
+        self.assertIsNone(throttle.retry_after(_response(429)))
+        self.assertIsNone(throttle.retry_after(
+            _response(429, **{"Retry-After": "soon"})))
+
+
+class TestRetryPolicy(testtools.TestCase):
+
+    def test_allows(self):
+        sot = throttle.RetryPolicy()
+
+        self.assertTrue(sot.allows("get"))
+        self.assertTrue(sot.allows("DELETE"))
+        self.assertFalse(sot.allows("POST"))
+        self.assertTrue(sot.allows("POST", retry=True))
+        self.assertFalse(sot.allows("GET", retry=False))
+        self.assertFalse(throttle.RetryPolicy(max_retries=0).allows("GET"))
+
+    def test_delay_backoff(self):
+        sot = throttle.RetryPolicy(backoff=1, max_backoff=5)
+        response = _response(429)
+
+        for attempt, ceiling in ((0, 1), (1, 2), (2, 4), (3, 5)):
+            delay = sot.delay(attempt, response)
+            self.assertTrue(ceiling / 2.0 <= delay <= ceiling)
+        self.assertIsNone(sot.delay(4, response))
+
+    def test_delay_retry_after(self):
+        sot = throttle.RetryPolicy(max_backoff=10)
+
+        self.assertEqual(7.0, sot.delay(
+            0, _response(503, **{"Retry-After": "7"})))
+        self.assertIsNone(sot.delay(
+            0, _response(503, **{"Retry-After": "60"})))
+
+    def test_delay_other_status(self):
+        sot = throttle.RetryPolicy()
+
+        self.assertIsNone(sot.delay(0, _response(500)))
+        self.assertIsNone(sot.delay(0, _response(200)))
+
+
+class TestAdaptiveRateLimiter(testtools.TestCase):
+
+    def setUp(self):
+        super(TestAdaptiveRateLimiter, self).setUp()
+        self.now = 1000.0
+        patcher = mock.patch("time.time", lambda: self.now)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.sot = throttle.AdaptiveRateLimiter(min_rate=1, increase=2)
+        self.bucket = self.sot.bucket("ecs", "region")
+
+    def send(self, count, interval):
+        for _ in range(count):
+            self.bucket.reserve()
+            self.now += interval
+
+    def test_unlimited_until_throttled(self):
+        for _ in range(100):
+            self.assertEqual(0, self.bucket.reserve())
+        self.assertIsNone(self.sot.rate("ecs", "region"))
+
+    def test_throttled(self):
+        self.send(32, 0.0625)
+
+        self.bucket.record(429, self.now)
+
+        # half of the 16 requests per second measured
+        self.assertEqual(8, self.sot.rate("ecs", "region"))
+        self.assertEqual([0.125, 0.25, 0.375],
+                         [self.bucket.reserve() for _ in range(3)])
+
+    def test_throttled_in_flight(self):
+        self.send(32, 0.0625)
+        sent = self.now - 0.01
+
+        self.bucket.record(429, self.now)
+        self.bucket.record(503, sent)
+
+        self.assertEqual(8, self.sot.rate("ecs", "region"))
+        self.bucket.record(429, self.now)
+        self.assertEqual(4, self.sot.rate("ecs", "region"))
+
+    def test_min_rate(self):
+        for _ in range(5):
+            self.bucket.record(429, self.now)
+        self.assertEqual(1, self.sot.rate("ecs", "region"))
+
+    def test_ramp_up(self):
+        self.send(32, 0.0625)
+        self.bucket.record(429, self.now)
+
+        self.now += 3
+        self.bucket.record(200, self.now)
+
+        self.assertEqual(14, self.sot.rate("ecs", "region"))
+
+    def test_max_rate(self):
+        sot = throttle.AdaptiveRateLimiter(max_rate=3)
+        bucket = sot.bucket("ecs")
+        bucket.record(429, self.now)
+
+        self.now += 60
+        bucket.record(200, self.now)
+
+        self.assertEqual(3, sot.rate("ecs"))
+
+    def test_buckets(self):
+        self.bucket.record(429, self.now)
+
+        self.assertIs(self.bucket, self.sot.bucket("ecs", "region"))
+        self.assertIsNone(self.sot.rate("ecs", "other"))
+        self.assertIsNone(self.sot.rate("evs", "region"))
+
+
+class TestSend(testtools.TestCase):
+
+    def setUp(self):
+        super(TestSend, self).setUp()
+        patcher = mock.patch("time.sleep")
+        self.sleep = patcher.start()
+        self.addCleanup(patcher.stop)
+        self.policy = throttle.RetryPolicy(max_retries=2)
+
+    def send(self, statuses, method="GET", **kwargs):
+        responses = [_response(status, **{"Retry-After": "1"})
+                     for status in statuses]
+        request = mock.Mock(side_effect=responses)
+        result = throttle.send(request, method,
+                               retry_policy=self.policy, **kwargs)
+        return result, request
+
+    def test_retried(self):
+        info = mock.Mock(retries=0)
+
+        result, request = self.send([429, 503, 200], info=info)
+
+        self.assertEqual(200, result.status_code)
+        self.assertEqual(3, request.call_count)
+        self.assertEqual(2, info.retries)
+        self.sleep.assert_has_calls([mock.call(1.0), mock.call(1.0)])
+
+    def test_gives_up(self):
+        result, request = self.send([429, 429, 429, 200])
+
+        self.assertEqual(429, result.status_code)
+        self.assertEqual(3, request.call_count)
+
+    def test_not_idempotent(self):
+        result, request = self.send([429, 200], method="POST")
+
+        self.assertEqual(429, result.status_code)
+        self.assertEqual(1, request.call_count)
+
+        result, request = self.send([429, 200], method="POST", retry=True)
+
+        self.assertEqual(200, result.status_code)
+
+    def test_rewinds(self):
+        data = io.BytesIO(b"header body")
+        data.read(7)
+
+        def request():
+            body = data.read()
+            self.assertEqual(b"body", body)
+            return responses.pop(0)
+
+        responses = [_response(503), _response(200)]
+        result = throttle.send(request, "PUT", data=data,
+                               retry_policy=self.policy)
+
+        self.assertEqual(200, result.status_code)
+
+    def test_not_rewindable(self):
+        result, request = self.send([429, 200], method="PUT",
+                                    data=iter([b"chunk"]))
+
+        self.assertEqual(429, result.status_code)
+
+    def test_rate_limiter(self):
+        limiter = throttle.AdaptiveRateLimiter()
+
+        self.send([429, 200], rate_limiter=limiter, service_type="ecs",
+                  region="region")
+
+        self.assertIsNotNone(limiter.rate("ecs", "region"))
+
+
+class ThrottlingServer(BaseHTTPServer.HTTPServer):
+    """A local server throttling the first ``throttled`` requests"""
+
+    def __init__(self, throttled, retry_after="0"):
+        BaseHTTPServer.HTTPServer.__init__(self, ("127.0.0.1", 0),
+                                           ThrottlingHandler)
+        self.throttled = throttled
+        self.retry_after = retry_after
+        self.requests = []
+
+
+class ThrottlingHandler(BaseHTTPServer.BaseHTTPRequestHandler):
+
+    def _respond(self):
+        length = int(self.headers.get("Content-Length") or 0)
+        self.server.requests.append((self.command, self.rfile.read(length)))
+        if len(self.server.requests) <= self.server.throttled:
+            body = b'{"message": "Too many requests"}'
+            self.send_response(429)
+            self.send_header("Retry-After", self.server.retry_after)
+        else:
+            body = b'{"ok": true}'
+            self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    do_GET = do_POST = do_PUT = _respond
+
+    def log_message(self, *args):
+        pass
+
+
+class TestThrottledSession(testtools.TestCase):
+
+    def setUp(self):
+        super(TestThrottledSession, self).setUp()
+        self.limiter = throttle.AdaptiveRateLimiter(min_rate=20)
+        self.session = aksksession.ASKSession(
+            None, ak="ak", sk="sk", project_id="project", region="region",
+            domain="domain", rate_limiter=self.limiter,
+            retry_policy=throttle.RetryPolicy(backoff=0.01))
+        self.filter = service_filter.ServiceFilter(service_type="test")
+
+    def serve(self, throttled, retry_after="0"):
+        server = ThrottlingServer(throttled, retry_after)
+        self.addCleanup(server.server_close)
+        thread = threading.Thread(target=server.serve_forever, args=(0.05,))
+        thread.daemon = True
+        thread.start()
+        self.addCleanup(thread.join)
+        self.addCleanup(server.shutdown)
+        self.session.endpoint = {"TEST": {
+            "public": "http://127.0.0.1:%d/v1" % server.server_port}}
+        return server
+
+    def test_get_retried(self):
+        server = self.serve(throttled=2)
+
+        response = self.session.get("/servers", endpoint_filter=self.filter)
+
+        self.assertEqual({"ok": True}, response.json())
+        self.assertEqual(3, len(server.requests))
+        self.assertIsNotNone(self.limiter.rate("test", "region"))
+
+    def test_put_retried_with_body(self):
+        server = self.serve(throttled=1)
+
+        self.session.put("/servers/1", endpoint_filter=self.filter,
+                         data=io.BytesIO(b'{"name": "one"}'))
+
+        self.assertEqual([("PUT", b'{"name": "one"}')] * 2, server.requests)
+
+    def test_post_not_retried(self):
+        server = self.serve(throttled=1)
+
+        error = self.assertRaises(exceptions.HttpException,
+                                  self.session.post, "/servers",
+                                  endpoint_filter=self.filter,
+                                  json={"name": "one"})
+
+        self.assertEqual(429, error.http_status)
+        self.assertEqual(1, len(server.requests))
+
+    def test_post_retried_when_enabled(self):
+        server = self.serve(throttled=1)
+
+        self.session.post("/servers", endpoint_filter=self.filter,
+                          json={"name": "one"}, retry=True)
+
+        self.assertEqual(2, len(server.requests))
+
+    def test_retry_after_too_long(self):
+        server = self.serve(throttled=1, retry_after="120")
+
+        self.assertRaises(exceptions.HttpException, self.session.get,
+                          "/servers", endpoint_filter=self.filter)
+        self.assertEqual(1, len(server.requests))
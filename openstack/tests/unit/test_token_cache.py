@@ -0,0 +1,132 @@
+# Licensed under the Apache License, Version 2.0 (the "License"); you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+
+import datetime
+import os
+import shutil
+import stat
+import tempfile
+
+from keystoneauth1 import access
+from keystoneauth1 import exceptions as _ksa_exceptions
+from keystoneauth1 import fixture
+from keystoneauth1.identity import v3
+import mock
+import testtools
+
+from openstack import token_cache
+
+
+def make_token(name, seconds):
+    expires = datetime.datetime.utcnow() + datetime.timedelta(
+        seconds=seconds)
+    return access.create(body=fixture.V3Token(expires=expires),
+                         auth_token=name)
+
+
+class TestTokenCache(testtools.TestCase):
+
+    def setUp(self):
+        super(TestTokenCache, self).setUp()
+        self.directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.directory)
+        self.sot = token_cache.TokenCache(
+            os.path.join(self.directory, "tokens"), refresh_ahead=300)
+
+    def make_plugin(self, tokens=(), password="secret"):
+        plugin = v3.Password(auth_url="https://iam.cloud/v3",
+                             username="user", password=password,
+                             project_id="project",
+                             user_domain_name="domain")
+        plugin.get_auth_ref = plugin.authenticate = mock.Mock(
+            side_effect=tokens)
+        return self.sot.attach(plugin)
+
+    def test_shared(self):
+        first = self.make_plugin([make_token("a", 3600)])
+        second = self.make_plugin()
+
+        self.assertEqual("a", first.get_token(None))
+        self.assertEqual("a", second.get_token(None))
+
+        self.assertEqual(1, first.authenticate.call_count)
+        self.assertEqual(0, second.authenticate.call_count)
+
+    def test_other_credentials(self):
+        first = self.make_plugin([make_token("a", 3600)])
+        second = self.make_plugin([make_token("b", 3600)], password="other")
+
+        first.get_token(None)
+
+        self.assertEqual("b", second.get_token(None))
+
+    def test_refresh_ahead(self):
+        first = self.make_plugin([make_token("a", 200), make_token("b", 3600)])
+        second = self.make_plugin()
+
+        self.assertEqual("a", first.get_token(None))
+        # the token expires within refresh_ahead, it is refreshed
+        self.assertEqual("b", first.get_token(None))
+        self.assertEqual("b", second.get_token(None))
+        self.assertEqual("b", first.get_token(None))
+        self.assertEqual(2, first.authenticate.call_count)
+
+    def test_refreshing_elsewhere(self):
+        first = self.make_plugin([make_token("a", 200)])
+        first.get_token(None)
+        second = self.make_plugin()
+        lock = self.sot.backend.lock(first.get_cache_id())
+        self.assertTrue(lock.acquire())
+        self.addCleanup(lock.release)
+
+        # the current token is used while another process refreshes it
+        self.assertEqual("a", second.get_token(None))
+        self.assertEqual(0, second.authenticate.call_count)
+
+    def test_refresh_failed(self):
+        first = self.make_plugin([make_token("a", 200),
+                                  _ksa_exceptions.ConnectFailure()])
+
+        self.assertEqual("a", first.get_token(None))
+        self.assertEqual("a", first.get_token(None))
+
+    def test_expired_refresh_failed(self):
+        first = self.make_plugin([make_token("a", 60),
+                                  _ksa_exceptions.ConnectFailure()])
+        first.get_token(None)
+
+        self.assertRaises(_ksa_exceptions.ConnectFailure, first.get_token,
+                          None)
+
+    def test_invalid_state(self):
+        plugin = self.make_plugin([make_token("a", 3600)])
+        self.sot.backend.store(plugin.get_cache_id(), "{not json")
+
+        self.assertEqual("a", plugin.get_token(None))
+
+    def test_not_identified(self):
+        plugin = mock.Mock()
+        plugin.get_cache_id.return_value = None
+
+        self.assertIs(plugin, self.sot.attach(plugin))
+        self.assertIsInstance(plugin.get_auth_ref, mock.Mock)
+
+    def test_private_files(self):
+        plugin = self.make_plugin([make_token("a", 3600)])
+        plugin.get_token(None)
+
+        directory = self.sot.backend.directory
+        self.assertEqual(0o700, stat.S_IMODE(os.stat(directory).st_mode))
+        for name in os.listdir(directory):
+            if name.endswith(".json"):
+                self.assertEqual(0o600, stat.S_IMODE(os.stat(
+                    os.path.join(directory, name)).st_mode))
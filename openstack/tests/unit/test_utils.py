@@ -10,10 +10,15 @@
 # License for the specific language governing permissions and limitations
 # under the License.
 
+import hashlib
+import os
+
+import fixtures
 import mock
 import sys
 import testtools
 
+from openstack import exceptions
 from openstack import utils
 
 
@@ -88,3 +93,97 @@ class Test_urljoin(testtools.TestCase):
 
         result = utils.urljoin(root, *leaves)
         self.assertEqual(result, "http://www.example.com/foo/")
+
+
+class Test_prefetch(testtools.TestCase):
+
+    def test_order(self):
+        self.assertEqual(list(range(10)),
+                         list(utils.prefetch(iter(range(10)), depth=3)))
+
+    def test_error(self):
+        def produce():
+            yield 1
+            raise ValueError("boom")
+
+        results = utils.prefetch(produce())
+        self.assertEqual(1, next(results))
+        self.assertRaises(ValueError, next, results)
+
+    def test_invalid_depth(self):
+        self.assertRaises(ValueError, list, utils.prefetch([1], depth=0))
+
+
+class Test_map_ordered(testtools.TestCase):
+
+    def test_order(self):
+        result = utils.map_ordered(lambda x: x * 2, range(10), max_workers=3)
+        self.assertEqual([x * 2 for x in range(10)], list(result))
+
+    def test_error(self):
+        def func(x):
+            if x == 2:
+                raise ValueError("boom")
+            return x
+
+        results = utils.map_ordered(func, range(5), max_workers=2)
+        self.assertEqual(0, next(results))
+        self.assertEqual(1, next(results))
+        self.assertRaises(ValueError, next, results)
+
+
+class Test_merge_concurrently(testtools.TestCase):
+
+    def test_merge(self):
+        result = utils.merge_concurrently(
+            [range(0, 5), range(5, 10), range(10, 12)], max_workers=2)
+
+        result = list(result)
+        self.assertEqual(list(range(12)), sorted(result))
+        self.assertEqual([0, 1, 2, 3, 4], [x for x in result if x < 5])
+
+    def test_error(self):
+        def failing():
+            yield 1
+            raise ValueError("boom")
+
+        result = utils.merge_concurrently([failing(), range(3)], 2)
+
+        self.assertRaises(ValueError, list, result)
+
+    def test_close(self):
+        result = utils.merge_concurrently([iter(range(1000))], 1)
+
+        self.assertEqual(0, next(result))
+        result.close()
+
+
+class Test_download_ranges(testtools.TestCase):
+
+    def setUp(self):
+        super(Test_download_ranges, self).setUp()
+        self.path = os.path.join(self.useFixture(fixtures.TempDir()).path,
+                                 "content")
+        self.content = b"0123456789"
+
+    def get_range(self, start, end):
+        content = self.content[start:end + 1]
+        return mock.Mock(status_code=206,
+                         iter_content=lambda size: iter([content]))
+
+    def test_download(self):
+        digest = hashlib.md5()
+
+        utils.download_ranges(self.get_range, self.path, 10, 3, 2, 2,
+                              digest)
+
+        with open(self.path, "rb") as result:
+            self.assertEqual(self.content, result.read())
+        self.assertEqual(hashlib.md5(self.content).hexdigest(),
+                         digest.hexdigest())
+
+    def test_short_range(self):
+        self.content = b"012345678"
+
+        self.assertRaises(exceptions.InvalidResponse, utils.download_ranges,
+                          self.get_range, self.path, 10, 3, 2, 2)
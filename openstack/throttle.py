@@ -0,0 +1,311 @@
+# Licensed under the Apache License, Version 2.0 (the "License"); you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+
+"""
+The sessions retry the requests which the services throttled, answering
+them with a ``429 Too Many Requests`` or a ``503 Service Unavailable``
+status, after the delay of their ``Retry-After`` header or an exponential
+backoff with jitter. Only the idempotent requests are retried, unless a
+request is sent with ``retry=True``::
+
+    conn = connection.Connection(
+        retry_policy=throttle.RetryPolicy(max_retries=6),
+        rate_limiter=throttle.AdaptiveRateLimiter(), **auth_args)
+
+    conn.session.post(url, json=body, endpoint_filter=service, retry=True)
+
+The :class:`AdaptiveRateLimiter` paces the requests of each service and
+region so that they stay under the quotas of the cloud: it does not limit
+them until they are throttled, then halves their rate at each throttling
+and raises it again steadily while they are not.
+"""
+
+import email.utils
+import logging
+import random
+import threading
+import time
+
+import six
+
+_logger = logging.getLogger(__name__)
+
+#: The methods whose requests are retried by default, sending them twice
+#: having the same effect as sending them once.
+IDEMPOTENT_METHODS = frozenset(["GET", "HEAD", "OPTIONS", "PUT", "DELETE"])
+#: The statuses of the responses to throttled requests.
+THROTTLE_STATUSES = frozenset([429, 503])
+#: The times a throttled request is retried by default.
+DEFAULT_MAX_RETRIES = 4
+
+
+def retry_after(response):
+    """Return the seconds to wait according to a ``Retry-After`` header
+
+    :param response: A response, with a ``headers`` mapping.
+    :returns: The seconds, or None without a valid header.
+    """
+    value = response.headers.get("Retry-After")
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    date = email.utils.parsedate_tz(value)
+    if date is None:
+        return None
+    return max(0.0, email.utils.mktime_tz(date) - time.time())
+
+
+def _rewinder(data):
+    """Return a function rewinding a request body to send it again
+
+    :returns: The function, or None for bodies which can only be read
+              once, like the iterators.
+    """
+    if data is None or isinstance(data, six.string_types +
+                                  (six.binary_type, bytearray, dict)):
+        return lambda: None
+    if hasattr(data, "read"):
+        try:
+            position = data.tell()
+        except (AttributeError, IOError, OSError):
+            return None
+        return lambda: data.seek(position)
+    if isinstance(data, (list, tuple)):
+        return lambda: None
+    return None
+
+
+class RetryPolicy(object):
+
+    def __init__(self, max_retries=DEFAULT_MAX_RETRIES, backoff=0.5,
+                 max_backoff=30, statuses=THROTTLE_STATUSES,
+                 methods=IDEMPOTENT_METHODS):
+        """Retry the throttled requests
+
+        The delay before the ``n``-th retry is taken from the
+        ``Retry-After`` header of the response, or else drawn between
+        half and all of ``backoff * 2 ** n`` seconds, so that the clients
+        throttled together do not retry together.
+
+        :param int max_retries: The times a request is retried.
+        :param float backoff: The seconds before the first retry.
+        :param float max_backoff: The most seconds waited before a retry.
+                                  The requests which their ``Retry-After``
+                                  header would delay more are not retried.
+        :param statuses: The statuses of the responses which are retried.
+        :param methods: The methods whose requests are retried unless
+                        sent with ``retry=False``, the others are only
+                        retried when sent with ``retry=True``.
+        """
+        self.max_retries = max_retries
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.statuses = frozenset(statuses)
+        self.methods = frozenset(method.upper() for method in methods)
+
+    def allows(self, method, retry=None):
+        """Return whether the requests of a method may be retried
+
+        :param str method: The method of the request.
+        :param retry: True or False to override the default of the method.
+        """
+        if retry is not None:
+            return bool(retry) and self.max_retries > 0
+        return self.max_retries > 0 and method.upper() in self.methods
+
+    def delay(self, attempt, response):
+        """Return the seconds to wait before retrying a request
+
+        :param int attempt: The retries of the request made so far.
+        :param response: The response to the last attempt.
+        :returns: The seconds, or None when the request is not retried.
+        """
+        if (response.status_code not in self.statuses or
+                attempt >= self.max_retries):
+            return None
+        after = retry_after(response)
+        if after is not None:
+            return after if after <= self.max_backoff else None
+        ceiling = float(min(self.max_backoff, self.backoff * 2 ** attempt))
+        return random.uniform(ceiling / 2, ceiling)
+
+
+class _TokenBucket(object):
+    """The pace of the requests to a service in a region"""
+
+    def __init__(self, limiter):
+        self.limiter = limiter
+        #: The requests per second, None until throttled.
+        self.rate = None
+        self._tokens = 0.0
+        self._updated = self._adjusted = time.time()
+        self._lock = threading.Lock()
+        # the rate of the requests, measured over periods of a second
+        self._measured = 0.0
+        self._period = self._updated
+        self._count = 0
+
+    def _measure(self, now):
+        elapsed = now - self._period
+        if elapsed >= 1.0:
+            rate = self._count / elapsed
+            self._measured = (rate if not self._measured else
+                              (self._measured + rate) / 2)
+            self._period = now
+            self._count = 0
+        return max(self._measured, self._count / max(elapsed, 1.0))
+
+    def reserve(self):
+        """Take a token for a request
+
+        :returns: The seconds to wait before sending the request.
+        """
+        with self._lock:
+            now = time.time()
+            self._measure(now)
+            self._count += 1
+            if self.rate is None:
+                return 0.0
+            # a second of requests may be sent at once
+            capacity = max(1.0, self.rate)
+            self._tokens = min(capacity, self._tokens +
+                               (now - self._updated) * self.rate)
+            self._updated = now
+            self._tokens -= 1
+            return max(0.0, -self._tokens / self.rate)
+
+    def acquire(self):
+        """Wait until a request may be sent"""
+        wait = self.reserve()
+        if wait:
+            time.sleep(wait)
+        return wait
+
+    def record(self, status, sent):
+        """Adjust the rate to the status of a response
+
+        :param int status: The status of the response.
+        :param float sent: The time the request was sent at. The responses
+                           to requests sent before the rate was last
+                           lowered do not lower it again.
+        """
+        limiter = self.limiter
+        with self._lock:
+            now = time.time()
+            if status in limiter.statuses:
+                if sent < self._adjusted and self.rate is not None:
+                    return
+                current = (self.rate if self.rate is not None
+                           else self._measure(now))
+                self.rate = max(limiter.min_rate, current * limiter.decrease)
+                self._tokens = min(self._tokens, 0.0)
+                self._updated = self._adjusted = now
+                _logger.debug("Throttled, limiting the requests to %.2f/s",
+                              self.rate)
+            elif self.rate is not None:
+                self.rate += limiter.increase * (now - self._adjusted)
+                if limiter.max_rate is not None:
+                    self.rate = min(self.rate, limiter.max_rate)
+                self._adjusted = now
+
+
+class AdaptiveRateLimiter(object):
+
+    def __init__(self, min_rate=0.5, max_rate=None, decrease=0.5,
+                 increase=1.0, statuses=THROTTLE_STATUSES):
+        """Pace the requests of each service and region
+
+        The requests are not paced until they are throttled. The rate is
+        then the one measured multiplied by ``decrease``, and it is raised
+        by ``increase`` requests per second every second without
+        throttling, so that it settles under the quota of the service.
+
+        :param float min_rate: The fewest requests per second.
+        :param float max_rate: The most requests per second, after being
+                               throttled.
+        :param float decrease: The factor applied to the rate when
+                               throttled.
+        :param float increase: The requests per second added to the rate
+                               every second without throttling.
+        :param statuses: The statuses of the throttled responses.
+        """
+        self.min_rate = min_rate
+        self.max_rate = max_rate
+        self.decrease = decrease
+        self.increase = increase
+        self.statuses = frozenset(statuses)
+        self._buckets = {}
+        self._lock = threading.Lock()
+
+    def bucket(self, service_type, region=None):
+        """Return the token bucket of a service in a region"""
+        key = (service_type, region)
+        with self._lock:
+            bucket = self._buckets.get(key)
+            if bucket is None:
+                bucket = self._buckets[key] = _TokenBucket(self)
+            return bucket
+
+    def rate(self, service_type, region=None):
+        """Return the requests per second of a service, None if unlimited"""
+        return self.bucket(service_type, region).rate
+
+
+def send(request, method, data=None, retry_policy=None, rate_limiter=None,
+         service_type=None, region=None, retry=None, info=None):
+    """Send a request, retrying it while it is throttled
+
+    :param request: A function sending the request and returning its
+                    response, whatever its status.
+    :param str method: The method of the request.
+    :param data: The body of the request, rewound before retrying it. The
+                 requests whose body cannot be rewound are not retried.
+    :param retry_policy: The :class:`RetryPolicy`, or None not to retry.
+    :param rate_limiter: The :class:`AdaptiveRateLimiter` pacing the
+                         requests, or None.
+    :param str service_type: The service the request is sent to.
+    :param str region: The region the request is sent to.
+    :param retry: True or False to override whether the request is
+                  retried according to its method.
+    :param info: The :class:`~openstack.instrumentation.RequestInfo` of
+                 the request, counting its retries.
+    :returns: The last response.
+    """
+    bucket = None
+    if rate_limiter is not None:
+        bucket = rate_limiter.bucket(service_type, region)
+    rewind = _rewinder(data)
+    retries = (retry_policy is not None and rewind is not None and
+               retry_policy.allows(method, retry))
+    attempt = 0
+    while True:
+        if bucket is not None:
+            bucket.acquire()
+        sent = time.time()
+        response = request()
+        if bucket is not None:
+            bucket.record(response.status_code, sent)
+        delay = retry_policy.delay(attempt, response) if retries else None
+        if delay is None:
+            return response
+        _logger.info("%s %s was throttled with status %s, retrying in "
+                     "%.1fs", method, response.url, response.status_code,
+                     delay)
+        response.close()
+        time.sleep(delay)
+        rewind()
+        attempt += 1
+        if info is not None:
+            info.retries += 1
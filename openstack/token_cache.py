@@ -0,0 +1,238 @@
+# Licensed under the Apache License, Version 2.0 (the "License"); you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+
+"""
+The :class:`~openstack.token_cache.TokenCache` shares the tokens and
+service catalogs of the authentication plugins between processes, so that
+the workers authenticating with the same credentials only get a token
+from the identity service once, until it is about to expire::
+
+    cache = token_cache.TokenCache("/var/cache/myapp/tokens")
+    conn = connection.Connection(token_cache=cache, **auth_args)
+
+The tokens are refreshed ahead of their expiry by one process at a time,
+the others keep using the current token meanwhile. The files are only
+readable by their owner, since the tokens grant access to the cloud.
+"""
+
+import errno
+import hashlib
+import json
+import logging
+import os
+import tempfile
+
+try:
+    import fcntl
+except ImportError:
+    # no locking on platforms without fcntl, every process whose token
+    # expires then authenticates
+    fcntl = None
+
+from keystoneauth1 import access
+from keystoneauth1 import exceptions as _ksa_exceptions
+import six
+
+_logger = logging.getLogger(__name__)
+
+#: Seconds before the expiry of a token when it gets refreshed by default.
+DEFAULT_REFRESH_AHEAD = 300
+
+
+class _FileLock(object):
+    """An exclusive lock on a file, held by one process at a time"""
+
+    def __init__(self, path):
+        self.path = path
+        self._file = None
+
+    def acquire(self, blocking=True):
+        """Acquire the lock, return whether it was acquired"""
+        self._file = open(self.path, "a")
+        if fcntl is None:
+            return True
+        flags = fcntl.LOCK_EX if blocking else fcntl.LOCK_EX | fcntl.LOCK_NB
+        try:
+            fcntl.flock(self._file.fileno(), flags)
+        except IOError as e:
+            self._file.close()
+            self._file = None
+            if e.errno in (errno.EAGAIN, errno.EACCES):
+                return False
+            raise
+        return True
+
+    def release(self):
+        if self._file is not None:
+            # closing the file releases the lock
+            self._file.close()
+            self._file = None
+
+
+class FileTokenBackend(object):
+
+    def __init__(self, directory):
+        """Keep the authentication states in the files of a directory
+
+        A backend has the ``load``, ``store`` and ``lock`` methods of this
+        one, other backends may share the tokens between hosts.
+
+        :param str directory: The directory of the files, created only
+                              accessible to its owner if missing.
+        """
+        self.directory = directory
+        if not os.path.isdir(directory):
+            os.makedirs(directory, 0o700)
+
+    def _path(self, key, suffix):
+        name = hashlib.sha256(key.encode("utf-8")).hexdigest()
+        return os.path.join(self.directory, name + suffix)
+
+    def load(self, key):
+        """Return the authentication state stored for a key, or None"""
+        try:
+            with open(self._path(key, ".json")) as f:
+                return f.read()
+        except (IOError, OSError):
+            return None
+
+    def store(self, key, state):
+        """Store the authentication state of a key
+
+        The file is written aside and renamed, so it is never read
+        partially written.
+        """
+        fd, temp = tempfile.mkstemp(dir=self.directory, prefix=".token")
+        try:
+            with os.fdopen(fd, "w") as f:
+                f.write(state)
+            os.rename(temp, self._path(key, ".json"))
+        except Exception:
+            os.remove(temp)
+            raise
+
+    def lock(self, key):
+        """Return the lock of a key, held while refreshing its token
+
+        :returns: An object with ``acquire(blocking=True)``, returning
+                  whether it acquired the lock, and ``release()``.
+        """
+        return _FileLock(self._path(key, ".lock"))
+
+
+def _dump(auth_ref):
+    """Serialize an access like ``get_auth_state`` of the plugins"""
+    return json.dumps({"auth_token": auth_ref.auth_token,
+                       "body": auth_ref._data})
+
+
+def _load(state):
+    try:
+        data = json.loads(state)
+        return access.create(body=data["body"],
+                             auth_token=data["auth_token"])
+    except Exception as e:
+        _logger.debug("Ignoring a cached token: %s", e)
+        return None
+
+
+class TokenCache(object):
+
+    def __init__(self, backend, refresh_ahead=DEFAULT_REFRESH_AHEAD):
+        """Share the tokens of the authentication plugins
+
+        :param backend: The :class:`FileTokenBackend` keeping the tokens, or
+                        the path of its directory.
+        :param int refresh_ahead: The seconds before the expiry of a token
+                                  when it gets refreshed.
+        """
+        if isinstance(backend, six.string_types):
+            backend = FileTokenBackend(backend)
+        self.backend = backend
+        self.refresh_ahead = refresh_ahead
+
+    def attach(self, plugin):
+        """Make an authentication plugin use this cache
+
+        The plugin then takes its tokens from the cache, and stores the
+        tokens it gets in it. Plugins whose options cannot be identified,
+        see ``get_cache_id``, are left untouched.
+
+        :param plugin: A keystoneauth identity plugin.
+        :returns: The plugin.
+        """
+        key = plugin.get_cache_id()
+        if key is None:
+            _logger.debug("Not caching the tokens of %s", plugin)
+            return plugin
+
+        get_auth_ref = plugin.get_auth_ref
+        needs_reauthenticate = plugin._needs_reauthenticate
+
+        def _needs_reauthenticate():
+            if needs_reauthenticate():
+                return True
+            return (plugin.reauthenticate and
+                    not self._fresh(plugin.auth_ref))
+
+        def _get_auth_ref(session, **kwargs):
+            return self._get_auth_ref(plugin, key, get_auth_ref, session,
+                                      **kwargs)
+
+        plugin._needs_reauthenticate = _needs_reauthenticate
+        plugin.get_auth_ref = _get_auth_ref
+        return plugin
+
+    def _fresh(self, auth_ref):
+        return (auth_ref is not None and
+                not auth_ref.will_expire_soon(self.refresh_ahead))
+
+    def _cached(self, key):
+        state = self.backend.load(key)
+        return _load(state) if state else None
+
+    def _get_auth_ref(self, plugin, key, get_auth_ref, session, **kwargs):
+        """Return a token from the cache, or refresh it
+
+        A process refreshing a token holds the lock of its key. The other
+        processes keep using a token which did not expire yet, or wait
+        for the new one otherwise.
+        """
+        cached = self._cached(key)
+        if self._fresh(cached):
+            return cached
+
+        refs = [ref for ref in (cached, plugin.auth_ref) if ref is not None]
+        current = max(refs, key=lambda ref: ref.expires) if refs else None
+        usable = (current is not None and
+                  not current.will_expire_soon(plugin.MIN_TOKEN_LIFE_SECONDS))
+        lock = self.backend.lock(key)
+        if not lock.acquire(blocking=not usable):
+            # another process is refreshing it
+            return current
+        try:
+            # it may have been refreshed while waiting for the lock
+            cached = self._cached(key)
+            if self._fresh(cached):
+                return cached
+            try:
+                auth_ref = get_auth_ref(session, **kwargs)
+            except _ksa_exceptions.ClientException as e:
+                if not usable:
+                    raise
+                _logger.warning("Unable to refresh the token, using the "
+                                "current one until it expires: %s", e)
+                return current
+            self.backend.store(key, _dump(auth_ref))
+            return auth_ref
+        finally:
+            lock.release()
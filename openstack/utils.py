@@ -10,13 +10,19 @@
 # License for the specific language governing permissions and limitations
 # under the License.
 import base64
+import collections
 import functools
 import logging
+import sys
+import threading
 import time
 
+from concurrent import futures
 import deprecation
 import six
+from six.moves import queue
 
+from openstack import exceptions
 from openstack import version
 
 
@@ -113,3 +119,231 @@ def b64encode(source):
         source = source.encode('utf-8')
     content = base64.b64encode(source).decode('utf-8')
     return content
+
+
+_PREFETCH_DONE = object()
+
+
+def prefetch(iterable, depth=1):
+    """Consume an iterable in a background thread
+
+    Items produced by ``iterable`` are handed to the caller through a
+    queue holding at most ``depth`` items, so the producer never runs more
+    than ``depth`` items ahead of the consumer. Exceptions raised while
+    producing are re-raised in the caller when the failed item is reached.
+    Closing the returned generator stops the producer thread.
+
+    :param iterable: The iterable to consume in the background.
+    :param int depth: The number of items that may be buffered ahead of
+                      the caller. Must be at least 1.
+
+    :return: A generator yielding the items of ``iterable`` in order.
+    """
+    if depth < 1:
+        raise ValueError("depth must be at least 1")
+
+    buf = queue.Queue(maxsize=depth)
+    stop = threading.Event()
+
+    def put(item):
+        # Never block forever, the consumer may have gone away.
+        while not stop.is_set():
+            try:
+                buf.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                pass
+        return False
+
+    def produce():
+        try:
+            for item in iterable:
+                if not put((item, None)):
+                    return
+        except Exception:
+            put((None, sys.exc_info()))
+        else:
+            put((_PREFETCH_DONE, None))
+
+    worker = threading.Thread(target=produce)
+    worker.daemon = True
+    worker.start()
+
+    try:
+        while True:
+            item, exc_info = buf.get()
+            if exc_info is not None:
+                six.reraise(*exc_info)
+            if item is _PREFETCH_DONE:
+                return
+            yield item
+    finally:
+        stop.set()
+
+
+def merge_concurrently(iterables, max_workers, depth=None):
+    """Consume several iterables in concurrent background threads
+
+    Up to ``max_workers`` of the ``iterables`` are consumed at once, and
+    their items are yielded as they are produced: in the order of each
+    iterable, but interleaved with the items of the others. An exception
+    raised by an iterable is re-raised in the caller when reached. Closing
+    the returned generator stops the threads.
+
+    :param iterables: The iterables to consume.
+    :param int max_workers: The number of iterables consumed at once.
+    :param int depth: The number of items that may be buffered ahead of
+                      the caller, ``max_workers`` by default.
+
+    :return: A generator yielding the items of all the ``iterables``.
+    """
+    iterables = list(iterables)
+    buf = queue.Queue(maxsize=depth or max_workers)
+    stop = threading.Event()
+
+    def put(item):
+        # Never block forever, the consumer may have gone away.
+        while not stop.is_set():
+            try:
+                buf.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                pass
+        return False
+
+    def produce(iterable):
+        if stop.is_set():
+            return
+        try:
+            for item in iterable:
+                if not put((item, None)):
+                    return
+        except Exception:
+            put((None, sys.exc_info()))
+        else:
+            put((_PREFETCH_DONE, None))
+
+    executor = futures.ThreadPoolExecutor(max_workers=max_workers)
+    try:
+        for iterable in iterables:
+            executor.submit(produce, iterable)
+        remaining = len(iterables)
+        while remaining:
+            item, exc_info = buf.get()
+            if exc_info is not None:
+                six.reraise(*exc_info)
+            if item is _PREFETCH_DONE:
+                remaining -= 1
+                continue
+            yield item
+    finally:
+        stop.set()
+        executor.shutdown(wait=False)
+
+
+def map_ordered(func, iterable, max_workers):
+    """Call a function concurrently over an iterable, in order
+
+    At most ``max_workers`` calls are running or waiting to be collected
+    at any time. Results are yielded in the order of ``iterable``, and an
+    exception raised by a call is re-raised when its result is reached.
+
+    :param func: The callable to apply to each item.
+    :param iterable: The items to apply ``func`` to.
+    :param int max_workers: The number of concurrent calls.
+
+    :return: A generator of the results of ``func``.
+    """
+    pending = collections.deque()
+    with futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+        try:
+            for item in iterable:
+                pending.append(executor.submit(func, item))
+                if len(pending) >= max_workers:
+                    yield pending.popleft().result()
+            while pending:
+                yield pending.popleft().result()
+        finally:
+            for future in pending:
+                future.cancel()
+
+
+def save_response(response, path, chunk_size, digest=None):
+    """Write the body of a streamed response to a file, chunk by chunk
+
+    :param response: The response, requested with ``stream=True``. It is
+                     closed once read.
+    :param str path: The file to write, replaced if it exists.
+    :param int chunk_size: The size of the chunks read and written.
+    :param digest: A ``hashlib`` hash updated with the body, or None.
+    """
+    try:
+        with open(path, "wb") as out:
+            for chunk in response.iter_content(chunk_size):
+                if digest is not None:
+                    digest.update(chunk)
+                out.write(chunk)
+    finally:
+        response.close()
+
+
+def download_ranges(get_range, path, length, range_size, max_workers,
+                    chunk_size, digest=None):
+    """Download content to a file with concurrent range requests
+
+    The file is first extended to ``length`` bytes, then each range is
+    written at its offset as it is received. Since a hash cannot be
+    computed out of order, ``digest`` is updated with each range read back
+    from the file once the ranges before it are written, while the next
+    ones are still being received.
+
+    :param get_range: The callable requesting a range, given the offsets of
+                      its first and last bytes, and returning the streamed
+                      response.
+    :param str path: The file to write, replaced if it exists.
+    :param int length: The size of the content.
+    :param int range_size: The size of the ranges.
+    :param int max_workers: The number of ranges requested at once.
+    :param int chunk_size: The size of the chunks read and written.
+    :param digest: A ``hashlib`` hash updated with the content, or None.
+
+    :raises: :class:`~openstack.exceptions.InvalidResponse` when a range is
+             not returned whole.
+    """
+    with open(path, "wb") as out:
+        out.truncate(length)
+
+    def download(start):
+        end = min(start + range_size, length) - 1
+        response = get_range(start, end)
+        try:
+            if response.status_code != 206:
+                raise exceptions.InvalidResponse(
+                    "range %d-%d was not returned" % (start, end))
+            position = start
+            with open(path, "r+b") as out:
+                out.seek(start)
+                for chunk in response.iter_content(chunk_size):
+                    out.write(chunk)
+                    position += len(chunk)
+        finally:
+            response.close()
+        if position != end + 1:
+            raise exceptions.InvalidResponse(
+                "range %d-%d ended at %d" % (start, end, position))
+        return start, end
+
+    starts = six.moves.range(0, length, range_size)
+    for start, end in map_ordered(download, starts, max_workers):
+        if digest is None:
+            continue
+        # a new file object, a buffered read may hold older content
+        with open(path, "rb") as written:
+            written.seek(start)
+            remaining = end + 1 - start
+            while remaining:
+                chunk = written.read(min(chunk_size, remaining))
+                if not chunk:
+                    break
+                digest.update(chunk)
+                remaining -= len(chunk)
@@ -16,12 +16,14 @@ from openstack.volume_backup.v1 import job as _job
 
 class Proxy(proxy2.BaseProxy):
 
-    def get_job(self, job):
+    def get_job(self, job, raw=False):
         """Get a job detail
 
         :param job: The value can be the ID of a job
              or a :class:`~openstack.volume_backup.v1.job.Job` instance.
+        :param bool raw: When set to ``True``, return the decoded body of
+                         the response instead of a resource.
         :returns: Backup instance
         :rtype: :class:`~openstack.volume_backup.v1.job.Job`
         """
-        return self._get(_job.Job, job)
+        return self._get(_job.Job, job, raw=raw)
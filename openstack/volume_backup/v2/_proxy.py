@@ -113,15 +113,17 @@ class Proxy(proxy2.BaseProxy):
         resource_clazz = _backup.BackupDetail if details else _backup.Backup
         return self._list(resource_clazz, paginated=True, **query)
 
-    def get_backup(self, backup):
+    def get_backup(self, backup, raw=False):
         """Get a backup
 
         :param backup: The value can be the ID of a backup
              or a :class:`~openstack.volume_backup.v2.backup.Backup` instance.
+        :param bool raw: When set to ``True``, return the decoded body of
+                         the response instead of a resource.
         :returns: Backup instance
         :rtype: :class:`~openstack.volume_backup.v2.backup.Backup`
         """
-        return self._get(_backup.Backup, backup)
+        return self._get(_backup.Backup, backup, raw=raw)
 
     def backup_policies(self):
         """Retrieve a generator of backup_policys
@@ -301,12 +303,14 @@ class Proxy(proxy2.BaseProxy):
         query["policy_id"] = backup_policy.id
         return self._list(_backup_task.BackupTask, paginated=True, **query)
 
-    def get_job(self, job):
+    def get_job(self, job, raw=False):
         """Get a job detail
 
         :param job: The value can be the ID of a job
              or a :class:`~openstack.volume_backup.v1.job.Job` instance.
+        :param bool raw: When set to ``True``, return the decoded body of
+                         the response instead of a resource.
         :returns: Backup instance
         :rtype: :class:`~openstack.volume_backup.v1.job.Job`
         """
-        return self._get(_job.Job, job)
+        return self._get(_job.Job, job, raw=raw)
@@ -23,6 +23,7 @@ class Job(resource.Resource):
 
     # capabilities
     allow_list = True
+    allow_get = True
 
     #: Properties
     id = resource.Body("job_id")
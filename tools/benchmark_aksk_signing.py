@@ -0,0 +1,58 @@
+# Licensed under the Apache License, Version 2.0 (the "License"); you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+
+"""
+Measure how many requests per second AkSksignature can sign on one core.
+
+The "uncached" run drops the per signer signing context before every
+request, which is what every request paid before the signing key chain
+was memoized.
+
+    python tools/benchmark_aksk_signing.py [number]
+"""
+
+from __future__ import print_function
+
+import sys
+import timeit
+
+from openstack import aksksession
+
+URL = "https://ecs.cn-north-1.myhuaweicloud.com/v1/project/cloudservers"
+HEADERS = {"Host": "ecs.cn-north-1.myhuaweicloud.com",
+           "X-Sdk-Date": "20180101T000000Z"}
+PARAMS = {"limit": 10, "offset": 1}
+
+
+def run(number, cached):
+    signer = aksksession.AkSksignature("ak", "sk", "cn-north-1")
+
+    def sign():
+        if not cached:
+            signer._signing_date = None
+        signer.signature(url=URL, method="GET", headers=HEADERS,
+                         params=PARAMS, svr="ecs")
+
+    return number / timeit.timeit(sign, number=number)
+
+
+def main():
+    number = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+    uncached = run(number, cached=False)
+    cached = run(number, cached=True)
+    print("uncached: %8.0f signed requests/s" % uncached)
+    print("cached:   %8.0f signed requests/s (x%.2f)" %
+          (cached, cached / uncached))
+
+
+if __name__ == "__main__":
+    main()
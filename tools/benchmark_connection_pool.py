@@ -0,0 +1,108 @@
+# Licensed under the Apache License, Version 2.0 (the "License"); you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+
+"""
+Measure the throughput of one ASKSession shared by several threads.
+
+A local HTTP server answering every request after a fixed latency stands
+in for a cloud endpoint. The throughput should grow linearly with the
+number of threads up to ``pool_maxsize`` and stay flat past it, as the
+session is created with ``pool_block``.
+
+    python tools/benchmark_connection_pool.py [pool_maxsize] [latency]
+"""
+
+from __future__ import print_function
+
+import sys
+import threading
+import time
+
+import mock
+from six.moves import BaseHTTPServer
+from six.moves import socketserver
+
+from openstack import aksksession
+
+REQUESTS_PER_THREAD = 20
+
+
+class Server(socketserver.ThreadingMixIn, BaseHTTPServer.HTTPServer):
+    daemon_threads = True
+
+
+def make_handler(latency):
+
+    class Handler(BaseHTTPServer.BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def do_GET(self):
+            time.sleep(latency)
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", "2")
+            self.end_headers()
+            self.wfile.write(b"{}")
+
+        def log_message(self, *args):
+            pass
+
+    return Handler
+
+
+def run(session, url, threads):
+    endpoint_filter = mock.Mock(service_type="ecs", interface="public")
+
+    def worker():
+        for _ in range(REQUESTS_PER_THREAD):
+            session.get(url, endpoint_filter=endpoint_filter, log=False)
+
+    workers = [threading.Thread(target=worker) for _ in range(threads)]
+    start = time.time()
+    for thread in workers:
+        thread.start()
+    for thread in workers:
+        thread.join()
+    return threads * REQUESTS_PER_THREAD / (time.time() - start)
+
+
+def main():
+    pool_maxsize = int(sys.argv[1]) if len(sys.argv) > 1 else 8
+    latency = float(sys.argv[2]) if len(sys.argv) > 2 else 0.02
+    server = Server(("127.0.0.1", 0), make_handler(latency))
+    server_thread = threading.Thread(target=server.serve_forever)
+    server_thread.daemon = True
+    server_thread.start()
+    url = "http://127.0.0.1:%d/v1/project/cloudservers" % server.server_port
+
+    session = aksksession.ASKSession(None, ak="ak", sk="sk",
+                                     project_id="project",
+                                     region="region", domain="domain",
+                                     pool_maxsize=pool_maxsize,
+                                     pool_block=True)
+    threads = 1
+    single = None
+    while threads <= pool_maxsize * 2:
+        rate = run(session, url, threads)
+        single = single or rate
+        print("%3d threads: %8.1f requests/s (x%.2f)" %
+              (threads, rate, rate / single))
+        threads *= 2
+    # close the pooled connections before their handlers go away
+    session.session.close()
+    server.shutdown()
+    server.server_close()
+    time.sleep(latency * 2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+# Licensed under the Apache License, Version 2.0 (the "License"); you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+
+"""
+Measure the cold start of a script which uses a single service.
+
+Each sample runs in a fresh interpreter, which imports
+openstack.connection, builds a Connection and gets its cloud_eye proxy.
+The "all services" run touches every proxy of the profile afterwards,
+which is what every Connection paid when the proxies were loaded
+eagerly. The times of the import, of the Connection construction and of
+the proxy accesses are reported separately, as medians.
+
+    python tools/benchmark_connection_startup.py [samples]
+"""
+
+from __future__ import print_function
+
+import json
+import os
+import subprocess
+import sys
+
+SCRIPT = """
+import json
+import time
+start = time.time()
+from openstack import connection
+from openstack import profile
+imported = time.time()
+conn = connection.Connection(authenticator=object(),
+                             profile=profile.Profile())
+created = time.time()
+conn.cloud_eye
+if %(all)s:
+    for service in conn.profile.get_services():
+        getattr(conn, service.get_service_module(), None)
+done = time.time()
+print(json.dumps([imported - start, created - imported, done - created]))
+"""
+
+
+def sample(all_services):
+    env = dict(os.environ)
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    env["PYTHONPATH"] = os.pathsep.join(
+        filter(None, [root, env.get("PYTHONPATH")]))
+    output = subprocess.check_output(
+        [sys.executable, "-c", SCRIPT % {"all": all_services}], env=env)
+    return json.loads(output.decode().strip().splitlines()[-1])
+
+
+def median(values):
+    values = sorted(values)
+    return values[len(values) // 2]
+
+
+def run(samples, all_services):
+    timings = [sample(all_services) for _ in range(samples)]
+    return [median(column) * 1000 for column in zip(*timings)]
+
+
+def main():
+    samples = int(sys.argv[1]) if len(sys.argv) > 1 else 5
+    for label, all_services in (("cloud_eye only", False),
+                                ("all services", True)):
+        imported, created, accessed = run(samples, all_services)
+        print("%-15s import %6.1fms  Connection %6.1fms  proxies %6.1fms  "
+              "total %6.1fms" % (label, imported, created, accessed,
+                                 imported + created + accessed))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+# Licensed under the Apache License, Version 2.0 (the "License"); you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+
+"""
+Measure the throughput of Resource.list over one synthetic response.
+
+The response lists servers and is decoded once, so only the work done by
+Resource.list on the items is measured, in object, compact and raw mode.
+
+    python tools/benchmark_list_raw.py [number]
+"""
+
+from __future__ import print_function
+
+import sys
+import time
+
+from openstack.compute.v2 import server
+
+
+class Response(object):
+
+    def __init__(self, body):
+        self.body = body
+
+    def json(self):
+        return self.body
+
+
+class Session(object):
+
+    def __init__(self, body):
+        self.response = Response(body)
+
+    def get(self, uri, **kwargs):
+        return self.response
+
+
+def item(index):
+    return {
+        "id": "server-%d" % index,
+        "name": "server",
+        "status": "ACTIVE",
+        "created": "2018-01-01T00:00:00Z",
+        "updated": "2018-01-01T00:00:00Z",
+        "hostId": "host",
+        "tenant_id": "project",
+        "user_id": "user",
+        "flavor": {"id": "1"},
+        "image": {"id": "2"},
+        "metadata": {"key": "value"},
+        "key_name": "key",
+        "OS-EXT-AZ:availability_zone": "az1",
+        "OS-EXT-STS:vm_state": "active",
+    }
+
+
+def run(session, number, **kwargs):
+    start = time.time()
+    for value in server.Server.list(session, **kwargs):
+        pass
+    return number / (time.time() - start)
+
+
+def main():
+    number = int(sys.argv[1]) if len(sys.argv) > 1 else 50000
+    session = Session({"servers": [item(index) for index in range(number)]})
+    objects = run(session, number)
+    print("objects: %8.0f items/s" % objects)
+    for mode in ("compact", "raw"):
+        rate = run(session, number, **{mode: True})
+        print("%-8s %8.0f items/s (x%.1f)" % (mode + ":", rate,
+                                             rate / objects))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,131 @@
+# Licensed under the Apache License, Version 2.0 (the "License"); you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+
+"""
+Measure the time to the first item and the peak memory of Resource.list
+over one large page, with and without ``stream``.
+
+The page is received in chunks with a fixed delay between them, like a
+slow network would deliver it. Each mode runs in a fresh interpreter so
+its peak resident memory can be compared.
+
+    python tools/benchmark_list_stream.py [number] [delay]
+"""
+
+from __future__ import print_function
+
+import json
+import os
+import resource
+import subprocess
+import sys
+import time
+
+from openstack.compute.v2 import server
+from openstack import json_codec
+
+
+class Response(object):
+
+    def __init__(self, number, delay):
+        self.number = number
+        self.delay = delay
+
+    def _chunks(self):
+        yield b'{"servers": ['
+        for index in range(self.number):
+            if index and index % 1000 == 0:
+                time.sleep(self.delay)
+            yield (b", " if index else b"") + json.dumps(
+                item(index)).encode("utf-8")
+        yield b"]}"
+
+    def iter_content(self, chunk_size):
+        buffered = b""
+        for chunk in self._chunks():
+            buffered += chunk
+            if len(buffered) >= chunk_size:
+                yield buffered
+                buffered = b""
+        yield buffered
+
+    @property
+    def content(self):
+        return b"".join(self.iter_content(json_codec.CHUNK_SIZE))
+
+    def close(self):
+        pass
+
+
+class Session(object):
+
+    def __init__(self, number, delay):
+        self.number = number
+        self.delay = delay
+        self.json_codec = json_codec.get_codec()
+
+    def get(self, uri, **kwargs):
+        return Response(self.number, self.delay)
+
+
+def item(index):
+    return {
+        "id": "server-%d" % index,
+        "name": "server",
+        "status": "ACTIVE",
+        "created": "2018-01-01T00:00:00Z",
+        "hostId": "host",
+        "tenant_id": "project",
+        "flavor": {"id": "1"},
+        "image": {"id": "2"},
+        "metadata": {"key": "value"},
+    }
+
+
+def sample(number, delay, stream):
+    session = Session(number, delay)
+    start = time.time()
+    first = None
+    count = 0
+    for value in server.Server.list(session, stream=stream):
+        if first is None:
+            first = time.time() - start
+        count += 1
+    total = time.time() - start
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024.0
+    print(json.dumps([first, total, peak, count]))
+
+
+def main():
+    if len(sys.argv) > 1 and sys.argv[1] == "--sample":
+        sample(int(sys.argv[2]), float(sys.argv[3]), sys.argv[4] == "True")
+        return
+    number = int(sys.argv[1]) if len(sys.argv) > 1 else 50000
+    delay = float(sys.argv[2]) if len(sys.argv) > 2 else 0.01
+    env = dict(os.environ)
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    env["PYTHONPATH"] = os.pathsep.join(
+        filter(None, [root, env.get("PYTHONPATH")]))
+    print("codec: %r" % json_codec.get_codec())
+    for stream in (False, True):
+        output = subprocess.check_output(
+            [sys.executable, os.path.abspath(__file__), "--sample",
+             str(number), str(delay), str(stream)], env=env)
+        first, total, peak, count = json.loads(
+            output.decode().strip().splitlines()[-1])
+        print("stream=%-5s %d items, first after %7.1fms, all after "
+              "%7.1fms, peak RSS %6.1fMB" % (stream, count, first * 1000,
+                                             total * 1000, peak))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,167 @@
+# Licensed under the Apache License, Version 2.0 (the "License"); you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+
+"""
+Measure how long listing and purging a large container takes.
+
+A local HTTP server answering every request after a fixed latency, with
+pages of 1000 objects, stands in for an object store holding a container
+of objects spread over 16 pseudo-directories. The container is listed
+with objects, page after page, then with objects_by_prefix. The objects
+are then deleted one by one, with delete_objects and no bulk delete, and
+with delete_objects through the bulk delete middleware.
+
+    python tools/benchmark_object_bulk.py [number] [latency]
+"""
+
+from __future__ import print_function
+
+import bisect
+import itertools
+import json
+import sys
+import threading
+import time
+
+from six.moves import BaseHTTPServer
+from six.moves import socketserver
+from six.moves.urllib import parse
+
+from openstack import aksksession
+from openstack.object_store.v1 import _proxy
+
+PAGE_SIZE = 1000
+
+
+class Server(socketserver.ThreadingMixIn, BaseHTTPServer.HTTPServer):
+    daemon_threads = True
+
+
+def make_handler(names, latency):
+    lock = threading.Lock()
+    listing = []
+
+    class Handler(BaseHTTPServer.BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+        # send the small responses at once
+        disable_nagle_algorithm = True
+
+        def _respond(self, status, body=None):
+            body = json.dumps(body).encode("utf-8") if body is not None \
+                else b""
+            time.sleep(latency)
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def do_GET(self):
+            query = dict(parse.parse_qsl(parse.urlparse(self.path).query))
+            prefix = query.get("prefix", "")
+            delimiter = query.get("delimiter")
+            marker = query.get("marker", "")
+            entries = []
+            with lock:
+                if len(listing) != len(names):
+                    listing[:] = sorted(names)
+                listed = listing
+            start = bisect.bisect_right(listed, max(marker, prefix))
+            for name in itertools.islice(listed, start, None):
+                if not name.startswith(prefix):
+                    break
+                rest = name[len(prefix):]
+                if delimiter and delimiter in rest:
+                    subdir = prefix + rest[:rest.index(delimiter) + 1]
+                    if subdir > marker and (not entries or
+                                            entries[-1] != {"subdir":
+                                                            subdir}):
+                        entries.append({"subdir": subdir})
+                else:
+                    entries.append({"name": name, "bytes": 1})
+                if len(entries) >= PAGE_SIZE:
+                    break
+            self._respond(200, entries)
+
+        def do_POST(self):
+            length = int(self.headers.get("Content-Length") or 0)
+            paths = self.rfile.read(length).decode("utf-8").split("\n")
+            with lock:
+                for path in paths:
+                    names.discard(parse.unquote(path).split("/", 2)[2])
+            self._respond(200, {"Number Deleted": len(paths),
+                                "Number Not Found": 0, "Errors": [],
+                                "Response Status": "200 OK"})
+
+        def do_DELETE(self):
+            name = parse.unquote(self.path).split("/", 4)[4]
+            with lock:
+                names.discard(name)
+            self._respond(204)
+
+        def log_message(self, *args):
+            pass
+
+    return Handler
+
+
+def timed(name, func, number):
+    start = time.time()
+    result = func()
+    print("%-34s %7.2fs for %d objects" % (name, time.time() - start,
+                                          number))
+    return result
+
+
+def main():
+    number = int(sys.argv[1]) if len(sys.argv) > 1 else 32000
+    latency = float(sys.argv[2]) if len(sys.argv) > 2 else 0.02
+    names = set("dir%02d/object%06d" % (i % 16, i) for i in range(number))
+    server = Server(("127.0.0.1", 0), make_handler(names, latency))
+    server_thread = threading.Thread(target=server.serve_forever)
+    server_thread.daemon = True
+    server_thread.start()
+
+    session = aksksession.ASKSession(None, ak="ak", sk="sk",
+                                     project_id="project",
+                                     region="region", domain="domain",
+                                     pool_maxsize=16)
+    session.endpoint = {"OBJECT_STORE": {
+        "public": "http://127.0.0.1:%d/v1/AUTH_project" %
+                  server.server_port}}
+    proxy = _proxy.Proxy(session)
+    listed = sorted(names)
+    sample = listed[:number // 32]
+
+    timed("objects", lambda: list(proxy.objects(
+        "benchmark", paginated=True)), number)
+    timed("objects_by_prefix, 8 workers", lambda: list(
+        proxy.objects_by_prefix("benchmark", workers=8)), number)
+
+    def delete_one_by_one():
+        for name in sample:
+            proxy.delete_object(name, container="benchmark")
+
+    timed("delete_object", delete_one_by_one, len(sample))
+    names.update(sample)
+    timed("delete_objects, 8 workers, no bulk", lambda: proxy.delete_objects(
+        "benchmark", sample, bulk=False), len(sample))
+    names.update(sample)
+    timed("delete_objects, bulk", lambda: proxy.delete_objects(
+        "benchmark", sample), len(sample))
+    session.session.close()
+    server.shutdown()
+    server.server_close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,138 @@
+# Licensed under the Apache License, Version 2.0 (the "License"); you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+
+"""
+Measure the throughput and peak memory of downloading an object to disk.
+
+A local HTTP server sending every response body at a fixed bandwidth
+stands in for an object store whose connections are each limited. The
+object is downloaded as a stream, then with more and more range workers,
+and last read whole in memory with get_object, as download_object used
+to. The peak memory of the process only grows with the last one.
+
+    python tools/benchmark_object_download.py [megabytes] [bandwidth]
+"""
+
+from __future__ import division
+from __future__ import print_function
+
+import hashlib
+import os
+import resource
+import sys
+import tempfile
+import threading
+import time
+
+from six.moves import BaseHTTPServer
+from six.moves import socketserver
+
+from openstack import aksksession
+from openstack.object_store.v1 import _proxy
+
+CHUNK_SIZE = 64 * 1024
+RANGE_SIZE = 4 * 1024 * 1024
+
+
+class Server(socketserver.ThreadingMixIn, BaseHTTPServer.HTTPServer):
+    daemon_threads = True
+
+
+def make_handler(content, bandwidth):
+    etag = hashlib.md5(content).hexdigest()
+
+    class Handler(BaseHTTPServer.BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def _headers(self, status, length):
+            self.send_response(status)
+            self.send_header("Etag", etag)
+            self.send_header("Content-Type", "application/octet-stream")
+            self.send_header("Content-Length", str(length))
+            self.end_headers()
+
+        def do_HEAD(self):
+            self._headers(200, len(content))
+
+        def do_GET(self):
+            start, end, status = 0, len(content) - 1, 200
+            if self.headers.get("Range"):
+                start, end = self.headers["Range"][6:].split("-")
+                start, end, status = int(start), int(end), 206
+            self._headers(status, end + 1 - start)
+            for offset in range(start, end + 1, CHUNK_SIZE):
+                chunk = content[offset:min(offset + CHUNK_SIZE, end + 1)]
+                self.wfile.write(chunk)
+                time.sleep(len(chunk) / bandwidth)
+
+        def log_message(self, *args):
+            pass
+
+    return Handler
+
+
+def peak_memory():
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def run(name, download, megabytes):
+    start = time.time()
+    download()
+    rate = megabytes / (time.time() - start)
+    print("%-12s %7.1f MB/s, peak memory %6.1f MB" %
+          (name, rate, peak_memory()))
+
+
+def main():
+    megabytes = int(sys.argv[1]) if len(sys.argv) > 1 else 64
+    bandwidth = float(sys.argv[2]) if len(sys.argv) > 2 else 32.0
+    content = os.urandom(megabytes * 1024 * 1024)
+    server = Server(("127.0.0.1", 0),
+                    make_handler(content, bandwidth * 1024 * 1024))
+    del content
+    server_thread = threading.Thread(target=server.serve_forever)
+    server_thread.daemon = True
+    server_thread.start()
+
+    session = aksksession.ASKSession(None, ak="ak", sk="sk",
+                                     project_id="project",
+                                     region="region", domain="domain",
+                                     pool_maxsize=16)
+    session.endpoint = {"OBJECT_STORE": {
+        "public": "http://127.0.0.1:%d/v1/AUTH_project" %
+                  server.server_port}}
+    proxy = _proxy.Proxy(session)
+    fd, path = tempfile.mkstemp()
+    os.close(fd)
+
+    print("%-12s %7s       peak memory %6.1f MB" % ("before", "",
+                                                  peak_memory()))
+    try:
+        run("stream", lambda: proxy.download_object(
+            "object", container="benchmark", path=path), megabytes)
+        workers = 2
+        while workers <= 16:
+            run("%d workers" % workers, lambda: proxy.download_object(
+                "object", container="benchmark", path=path,
+                workers=workers, range_size=RANGE_SIZE), megabytes)
+            workers *= 2
+        run("get_object", lambda: proxy.get_object(
+            "object", container="benchmark"), megabytes)
+    finally:
+        os.remove(path)
+        session.session.close()
+        server.shutdown()
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
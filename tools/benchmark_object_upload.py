@@ -0,0 +1,113 @@
+# Licensed under the Apache License, Version 2.0 (the "License"); you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+
+"""
+Measure the throughput of uploading a large object in segments.
+
+A local HTTP server receiving every request body at a fixed bandwidth
+stands in for an object store whose connections are each limited, as
+single TCP streams are over long distances. The object is uploaded with
+one request, then as a static large object with more and more workers,
+whose throughput should grow with their number.
+
+    python tools/benchmark_object_upload.py [megabytes] [bandwidth]
+"""
+
+from __future__ import division
+from __future__ import print_function
+
+import hashlib
+import io
+import sys
+import threading
+import time
+
+from six.moves import BaseHTTPServer
+from six.moves import socketserver
+
+from openstack import aksksession
+from openstack.object_store.v1 import _proxy
+
+SEGMENT_SIZE = 1024 * 1024
+CHUNK_SIZE = 64 * 1024
+
+
+class Server(socketserver.ThreadingMixIn, BaseHTTPServer.HTTPServer):
+    daemon_threads = True
+
+
+def make_handler(bandwidth):
+
+    class Handler(BaseHTTPServer.BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def do_PUT(self):
+            remaining = int(self.headers.get("Content-Length") or 0)
+            digest = hashlib.md5()
+            while remaining:
+                chunk = self.rfile.read(min(CHUNK_SIZE, remaining))
+                digest.update(chunk)
+                remaining -= len(chunk)
+                time.sleep(len(chunk) / bandwidth)
+            self.send_response(201)
+            self.send_header("Etag", digest.hexdigest())
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+
+        def log_message(self, *args):
+            pass
+
+    return Handler
+
+
+def run(proxy, data, segment_size=None, workers=1):
+    start = time.time()
+    proxy.upload_object(container="benchmark", name="object",
+                        data=io.BytesIO(data), segment_size=segment_size,
+                        workers=workers)
+    return len(data) / (time.time() - start) / 1024 / 1024
+
+
+def main():
+    megabytes = int(sys.argv[1]) if len(sys.argv) > 1 else 32
+    bandwidth = float(sys.argv[2]) if len(sys.argv) > 2 else 16.0
+    server = Server(("127.0.0.1", 0),
+                    make_handler(bandwidth * 1024 * 1024))
+    server_thread = threading.Thread(target=server.serve_forever)
+    server_thread.daemon = True
+    server_thread.start()
+
+    session = aksksession.ASKSession(None, ak="ak", sk="sk",
+                                     project_id="project",
+                                     region="region", domain="domain",
+                                     pool_maxsize=16)
+    session.endpoint = {"OBJECT_STORE": {
+        "public": "http://127.0.0.1:%d/v1/AUTH_project" %
+                  server.server_port}}
+    proxy = _proxy.Proxy(session)
+    data = b"x" * megabytes * 1024 * 1024
+
+    single = run(proxy, data)
+    print("one request: %7.1f MB/s" % single)
+    workers = 1
+    while workers <= 16:
+        rate = run(proxy, data, SEGMENT_SIZE, workers)
+        print("%2d workers:  %7.1f MB/s (x%.2f)" %
+              (workers, rate, rate / single))
+        workers *= 2
+    session.session.close()
+    server.shutdown()
+    server.server_close()
+
+
+if __name__ == "__main__":
+    main()
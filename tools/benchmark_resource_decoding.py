@@ -0,0 +1,104 @@
+# Licensed under the Apache License, Version 2.0 (the "License"); you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+
+"""
+Measure how long reading typed attributes of listed resources takes.
+
+The volumes of a listing, as resources and as compact views, are sorted
+by comparing their bootable flag, a "true" or "false" string decoded by
+format.BoolStr, and their size, which reads the flag of each volume about
+log2(number) times. The limits of as many projects, as their get requests
+return them, are sorted the same way by the instances left in their
+nested absolute limits, which used to build a new AbsoluteLimits
+resource at each read.
+
+The "uncached" runs remove the cache of the decoded values from the
+resources, so that every read decodes the value again, as every read did
+before the decoded values were memoized.
+
+    python tools/benchmark_resource_decoding.py [number]
+"""
+
+from __future__ import print_function
+
+import functools
+import sys
+import time
+
+from openstack.block_store.v2 import volume
+from openstack.compute.v2 import limits
+from openstack import resource2
+
+
+def _compare(left, right):
+    return (left > right) - (left < right)
+
+
+def _compare_volumes(a, b):
+    return _compare((a.is_bootable, a.size), (b.is_bootable, b.size))
+
+
+def _compare_limits(a, b):
+    return _compare(a.absolute.instances - a.absolute.instances_used,
+                    b.absolute.instances - b.absolute.instances_used)
+
+
+def _volume_bodies(number):
+    return [{"id": str(i), "size": i % 100,
+             "bootable": "true" if i % 3 else "false"}
+            for i in range(number)]
+
+
+def _volumes(number):
+    return [volume.Volume.existing(**body) for body in _volume_bodies(number)]
+
+
+def _compact_volumes(number):
+    return [resource2.CompactResource(volume.Volume, body)
+            for body in _volume_bodies(number)]
+
+
+def _limits(number):
+    result = []
+    for i in range(number):
+        item = limits.Limits.existing(id=str(i))
+        item._update_from_body({"absolute": {"maxTotalInstances": 100,
+                                             "totalInstancesUsed": i % 100}})
+        result.append(item)
+    return result
+
+
+def run(items, compare, cached):
+    if not cached:
+        for item in items:
+            object.__delattr__(item, "_decoded")
+    started = time.time()
+    sorted(items, key=functools.cmp_to_key(compare))
+    return time.time() - started
+
+
+def main():
+    number = int(sys.argv[1]) if len(sys.argv) > 1 else 50000
+    for name, build, compare in (
+            ("volumes", _volumes, _compare_volumes),
+            ("compact volumes", _compact_volumes, _compare_volumes),
+            ("limits", _limits, _compare_limits)):
+        uncached = run(build(number), compare, cached=False)
+        cached = run(build(number), compare, cached=True)
+        print("%-16s uncached: %7.3fs to sort %d" %
+              (name, uncached, number))
+        print("%-16s cached:   %7.3fs to sort %d (x%.2f)" %
+              (name, cached, number, uncached / cached))
+
+
+if __name__ == "__main__":
+    main()
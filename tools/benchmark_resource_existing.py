@@ -0,0 +1,65 @@
+# Licensed under the Apache License, Version 2.0 (the "License"); you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+
+"""
+Measure how many resources per second Resource.existing materializes.
+
+Each item is built from a dict shaped like a server of a list response,
+then its id is read once, as Resource.list does for the markers.
+
+    python tools/benchmark_resource_existing.py [number]
+"""
+
+from __future__ import print_function
+
+import sys
+import timeit
+
+from openstack.compute.v2 import server
+
+ITEM = {
+    "id": "6f2c6c67-5b34-4bd5-8bb9-3a4a5f4d1a51",
+    "name": "server",
+    "status": "ACTIVE",
+    "created": "2018-01-01T00:00:00Z",
+    "updated": "2018-01-01T00:00:00Z",
+    "hostId": "host",
+    "tenant_id": "project",
+    "user_id": "user",
+    "flavor": {"id": "1"},
+    "image": {"id": "2"},
+    "addresses": {"private": [{"addr": "10.0.0.2", "version": 4}]},
+    "metadata": {"key": "value"},
+    "key_name": "key",
+    "accessIPv4": "",
+    "accessIPv6": "",
+    "progress": 0,
+    "OS-EXT-AZ:availability_zone": "az1",
+    "OS-EXT-STS:power_state": 1,
+    "OS-EXT-STS:task_state": None,
+    "OS-EXT-STS:vm_state": "active",
+    "links": [],
+}
+
+
+def main():
+    number = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+
+    def existing():
+        server.Server.existing(**ITEM).id
+
+    rate = number / timeit.timeit(existing, number=number)
+    print("Server.existing: %8.0f resources/s" % rate)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,102 @@
+# Licensed under the Apache License, Version 2.0 (the "License"); you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+
+"""
+Measure the memory held by listed servers, full or compact.
+
+Each mode runs in a fresh interpreter which decodes a JSON listing of
+servers, keeps what Resource.list yields for each item and reports the
+growth of its resident set size. The overhead is what each mode holds
+on top of the decoded dicts alone. Linux only, as it reads /proc.
+
+    python tools/benchmark_resource_memory.py [number]
+"""
+
+from __future__ import print_function
+
+import os
+import subprocess
+import sys
+
+SCRIPT = """
+import functools
+import gc
+import json
+import os
+
+from openstack.compute.v2 import server
+from openstack import resource2
+
+ITEM = json.dumps({
+    "id": "6f2c6c67-5b34-4bd5-8bb9-3a4a5f4d1a51",
+    "name": "server",
+    "status": "ACTIVE",
+    "created": "2018-01-01T00:00:00Z",
+    "updated": "2018-01-01T00:00:00Z",
+    "hostId": "host",
+    "tenant_id": "project",
+    "user_id": "user",
+    "flavor": {"id": "1"},
+    "image": {"id": "2"},
+    "metadata": {"key": "value"},
+    "key_name": "key",
+    "OS-EXT-AZ:availability_zone": "az1",
+    "OS-EXT-STS:vm_state": "active",
+})
+
+
+def rss():
+    with open("/proc/self/statm") as statm:
+        return int(statm.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+
+
+if "%(mode)s" == "compact":
+    build = functools.partial(resource2.CompactResource, server.Server)
+elif "%(mode)s" == "full":
+    build = lambda data: server.Server.existing(**data)
+else:
+    build = lambda data: data
+build(json.loads(ITEM))
+gc.collect()
+before = rss()
+kept = [build(json.loads(ITEM)) for _ in range(%(number)d)]
+gc.collect()
+print(rss() - before)
+"""
+
+
+def sample(number, mode):
+    env = dict(os.environ)
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    env["PYTHONPATH"] = os.pathsep.join(
+        filter(None, [root, env.get("PYTHONPATH")]))
+    output = subprocess.check_output(
+        [sys.executable, "-c",
+         SCRIPT % {"number": number, "mode": mode}], env=env)
+    return int(output.decode().strip().splitlines()[-1])
+
+
+def main():
+    number = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    raw = sample(number, "raw") // number
+    full = sample(number, "full") // number
+    compact = sample(number, "compact") // number
+    print("dicts:           %6d bytes per server" % raw)
+    print("Resource:        %6d bytes per server, overhead %6d" %
+          (full, full - raw))
+    print("CompactResource: %6d bytes per server, overhead %6d (x%.1f "
+          "smaller)" % (compact, compact - raw,
+                        float(full - raw) / max(compact - raw, 1)))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,129 @@
+# Licensed under the Apache License, Version 2.0 (the "License"); you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+
+"""
+Compare the requests made waiting for many servers to become ACTIVE with
+wait_for_status, one server after the other or all at once from as many
+threads, and with wait_for_many.
+
+The servers become ACTIVE at random times. The clock is simulated: the
+sleeps advance it, as does every request by a fixed latency, so the wall
+times reported are the ones a real run would take. The threaded run is
+computed rather than simulated, assuming the requests don't slow down.
+
+    python tools/benchmark_wait_for_many.py [servers] [latency]
+"""
+
+from __future__ import print_function
+
+import math
+import random
+import sys
+
+import mock
+
+from openstack.compute.v2 import server
+from openstack import resource2
+
+
+class Clock(object):
+
+    def __init__(self):
+        self.now = 0.0
+
+    def time(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.now += seconds
+
+
+class Response(object):
+
+    def __init__(self, body):
+        self.body = body
+        self.headers = {}
+
+    def json(self):
+        return self.body
+
+
+class Session(object):
+
+    def __init__(self, clock, ready, latency):
+        self.clock = clock
+        self.ready = ready
+        self.latency = latency
+        self.requests = 0
+
+    def _server(self, server_id):
+        status = "ACTIVE" if self.clock.now >= self.ready[server_id] else \
+            "BUILD"
+        return {"id": server_id, "status": status}
+
+    def get(self, uri, params=None, **kwargs):
+        self.requests += 1
+        self.clock.sleep(self.latency)
+        if uri.rstrip("/").endswith("servers"):
+            if params.get("marker"):
+                return Response({"servers": []})
+            return Response({"servers": [self._server(server_id)
+                                         for server_id in self.ready]})
+        return Response({"server": self._server(uri.rsplit("/", 1)[-1])})
+
+
+def make_ready(number):
+    random.seed(0)
+    return dict(("server-%d" % index, random.uniform(30, 90))
+                for index in range(number))
+
+
+def run_threads(number, latency, interval=2):
+    rounds = [int(math.ceil(ready / (interval + latency))) + 1
+              for ready in make_ready(number).values()]
+    return max(rounds) * (interval + latency), sum(rounds)
+
+
+def run(number, latency, many):
+    clock = Clock()
+    ready = make_ready(number)
+    session = Session(clock, ready, latency)
+    servers = [server.Server(id=server_id, status="BUILD")
+               for server_id in ready]
+    with mock.patch("time.time", clock.time), \
+            mock.patch("time.sleep", clock.sleep):
+        if many:
+            for future in resource2.wait_for_many(session, servers,
+                                                  "ACTIVE", wait=600):
+                future.result()
+        else:
+            for value in servers:
+                resource2.wait_for_status(session, value, "ACTIVE",
+                                          interval=2, wait=600)
+    return clock.now, session.requests
+
+
+def main():
+    number = int(sys.argv[1]) if len(sys.argv) > 1 else 500
+    latency = float(sys.argv[2]) if len(sys.argv) > 2 else 0.1
+    results = [
+        ("wait_for_status", run(number, latency, False)),
+        ("  in threads", run_threads(number, latency)),
+        ("wait_for_many", run(number, latency, True)),
+    ]
+    for label, (seconds, requests) in results:
+        print("%-16s %5d servers: %7.1fs, %6d requests" %
+              (label, number, seconds, requests))
+
+
+if __name__ == "__main__":
+    main()